@@ -0,0 +1,76 @@
+"""Measure the latency of constructing models with ``AIFactory.create_*``.
+
+Construction resolves configuration only; HTTP clients and their SSL contexts
+are created on first use. The "construct" column is the mean cost of
+``AIFactory.create_*`` alone, "+ sync client" adds the first access of
+``model.client`` and "first" is the very first construction in the process,
+which includes importing the provider module. No requests are sent.
+
+Serverless handlers and per-request model construction pay this cost on
+every invocation.
+
+Usage:
+    python benchmarks/construction.py
+    python benchmarks/construction.py --runs 500
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Callable, List, Tuple
+
+from esperanto import AIFactory
+
+# Fake credentials so providers can be constructed without a real account
+for _env_var in (
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "GOOGLE_API_KEY",
+    "MISTRAL_API_KEY",
+    "GROQ_API_KEY",
+    "JINA_API_KEY",
+    "VOYAGE_API_KEY",
+    "ELEVENLABS_API_KEY",
+):
+    os.environ.setdefault(_env_var, "bench-key")
+
+CASES: List[Tuple[str, Callable[[], Any]]] = [
+    ("language/openai", lambda: AIFactory.create_language("openai", "gpt-4o-mini")),
+    ("language/anthropic", lambda: AIFactory.create_language("anthropic", "claude-3-5-haiku-latest")),
+    ("language/google", lambda: AIFactory.create_language("google", "gemini-2.0-flash")),
+    ("language/ollama", lambda: AIFactory.create_language("ollama", "llama3")),
+    ("embedding/openai", lambda: AIFactory.create_embedding("openai", "text-embedding-3-small")),
+    ("embedding/voyage", lambda: AIFactory.create_embedding("voyage", "voyage-3")),
+    ("reranker/jina", lambda: AIFactory.create_reranker("jina", "jina-reranker-v2-base-multilingual")),
+    ("stt/openai", lambda: AIFactory.create_speech_to_text("openai", "whisper-1")),
+    ("tts/elevenlabs", lambda: AIFactory.create_text_to_speech("elevenlabs")),
+]
+
+
+def measure(call: Callable[[], Any], runs: int) -> float:
+    """Return mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        call()
+    return (time.perf_counter() - start) / runs * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"mean over {args.runs} constructions")
+    print(f"{'model':<22}{'first':>12}{'construct':>12}{'+ sync client':>15}")
+    for name, create in CASES:
+        start = time.perf_counter()
+        create()
+        first_us = (time.perf_counter() - start) * 1_000_000
+
+        construct_us = measure(create, args.runs)
+        with_client_us = measure(lambda: create().client, args.runs)
+        print(f"{name:<22}{first_us:>10.0f}µs{construct_us:>10.1f}µs{with_client_us:>13.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
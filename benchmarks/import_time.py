@@ -0,0 +1,70 @@
+"""Measure the cold-start cost of ``import esperanto``.
+
+Each run imports the package in a fresh interpreter with ``-X importtime``
+and reports the median total plus the slowest modules by self time, so a
+regression can be traced to the import that caused it. Serverless functions
+pay this cost on every cold start.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 20 --top 15
+    python benchmarks/import_time.py --module "from esperanto import OpenAILanguageModel"
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+def measure(statement: str) -> Dict[str, Tuple[int, int]]:
+    """Import in a fresh interpreter; map module to (self, cumulative) µs."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--module", default="import esperanto", help="statement to time")
+    args = parser.parse_args()
+
+    runs: List[Dict[str, Tuple[int, int]]] = [measure(args.module) for _ in range(args.runs)]
+    totals = [sum(self_us for self_us, _ in run.values()) for run in runs]
+    esperanto = [
+        sum(t[0] for name, t in run.items() if name.split(".")[0] == "esperanto")
+        for run in runs
+    ]
+    last = runs[-1]
+    providers = sorted(
+        name for name in last
+        if name.startswith("esperanto.providers.") and name.count(".") >= 3
+    )
+
+    print(f"{args.module!r} over {args.runs} runs")
+    print(f"  total imports:   {statistics.median(totals) / 1000:8.1f} ms (median)")
+    print(f"  esperanto.* own: {statistics.median(esperanto) / 1000:8.1f} ms (median)")
+    print(f"  modules loaded:  {len(last)}")
+    print(f"  provider modules: {', '.join(providers) or '-'}")
+    print(f"\nSlowest {args.top} modules by self time (last run):")
+    for name, (self_us, cumulative_us) in sorted(
+        last.items(), key=lambda item: item[1][0], reverse=True
+    )[: args.top]:
+        print(f"  {self_us / 1000:7.1f} ms  (cumulative {cumulative_us / 1000:7.1f} ms)  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Measure JSON encoding and decoding of large provider payloads per backend.
+
+Providers encode request bodies and decode responses and stream events
+through ``esperanto.utils.json_codec``. This times each installed backend
+(the standard library, orjson, msgspec) on payloads where JSON shows up in
+profiles: a chat request with a long history and many tool schemas, an
+embeddings response, and the events of a streamed completion. "request"
+times building the httpx request itself, where the stdlib column is httpx's
+own ``json=`` encoding and the others go through ``JSONClient``.
+
+Usage:
+    python benchmarks/json_codec.py
+    python benchmarks/json_codec.py --messages 500 --vectors 512 --calls 50
+"""
+
+import argparse
+import importlib.util
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+
+from esperanto.utils import json_codec
+from esperanto.utils.json_codec import JSONClient, set_json_codec
+
+BACKENDS = ["json"] + [name for name in ("orjson", "msgspec") if importlib.util.find_spec(name)]
+
+
+def chat_payload(messages: int, tools: int) -> Dict[str, Any]:
+    sentence = "The quick brown fox jumps over the lazy dog, naïvely. "
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": sentence * 20}
+            for i in range(messages)
+        ],
+        "tools": [
+            {
+                "type": "function",
+                "function": {
+                    "name": f"tool_{i}",
+                    "description": "Look something up. " * 5,
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            f"arg_{j}": {"type": "string", "description": "An argument"}
+                            for j in range(8)
+                        },
+                        "required": ["arg_0"],
+                    },
+                },
+            }
+            for i in range(tools)
+        ],
+        "temperature": 0.7,
+        "stream": False,
+    }
+
+
+def embedding_response(vectors: int, dimensions: int) -> bytes:
+    return json_codec.STDLIB_CODEC.dumps(
+        {
+            "object": "list",
+            "data": [
+                {
+                    "object": "embedding",
+                    "index": i,
+                    "embedding": [((i * dimensions + j) % 1000) / 997 - 0.5 for j in range(dimensions)],
+                }
+                for i in range(vectors)
+            ],
+            "model": "text-embedding-3-small",
+            "usage": {"prompt_tokens": vectors * 8, "total_tokens": vectors * 8},
+        }
+    )
+
+
+def stream_events(count: int) -> List[str]:
+    return [
+        json_codec.STDLIB_CODEC.dumps(
+            {
+                "id": "chatcmpl-1",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [{"index": 0, "delta": {"content": f" token{i}"}, "finish_reason": None}],
+            }
+        ).decode()
+        for i in range(count)
+    ]
+
+
+def measure(call: Callable[[], Any], calls: int) -> float:
+    """Return mean milliseconds per call after a short warmup."""
+    for _ in range(max(calls // 10, 1)):
+        call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def cases(args: argparse.Namespace) -> List[Tuple[str, Callable[[str], Callable[[], Any]]]]:
+    payload = chat_payload(args.messages, args.tools)
+    embeddings = embedding_response(args.vectors, args.dimensions)
+    events = stream_events(args.events)
+    httpx_client = httpx.Client()
+    json_client = JSONClient()
+
+    def request(backend: str) -> Callable[[], Any]:
+        client = httpx_client if backend == "json" else json_client
+        return lambda: client.build_request("POST", "https://api.test.com/v1/chat", json=payload)
+
+    def decode_events() -> None:
+        for event in events:
+            json_codec.loads(event)
+
+    payload_kib = len(json_codec.STDLIB_CODEC.dumps(payload)) // 1024
+    return [
+        (f"encode chat ({payload_kib} KiB)", lambda _: lambda: json_codec.dumps(payload)),
+        ("request", request),
+        (
+            f"decode embeddings ({len(embeddings) // 1024} KiB)",
+            lambda _: lambda: json_codec.loads(embeddings),
+        ),
+        (f"decode {args.events} events", lambda _: decode_events),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--tools", type=int, default=20)
+    parser.add_argument("--vectors", type=int, default=256)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"mean over {args.calls} calls, milliseconds (speedup over json)")
+    print(f"{'case':<30}" + "".join(f"{backend:>19}" for backend in BACKENDS))
+    for name, make_call in cases(args):
+        row = f"{name:<30}"
+        baseline = 0.0
+        for backend in BACKENDS:
+            set_json_codec(backend)
+            ms = measure(make_call(backend), args.calls)
+            baseline = baseline or ms
+            row += f"{ms:>9.2f}ms ({baseline / ms:>4.1f}x)"
+        print(row)
+    set_json_codec(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,477 @@
+"""Local stand-in for provider APIs, for benchmarks.
+
+``MockProviderServer`` answers the endpoints Esperanto calls in the wire
+formats of OpenAI, Anthropic, Gemini, Ollama, Jina and Voyage, so providers
+can be benchmarked end to end (payload building, httpx, the socket, parsing
+and normalization) without network variance or API costs. Each provider is
+served under its own path prefix; point a model at it with
+``base_url=server.base_url("anthropic")``.
+
+Responses are synthetic. ``latency`` delays the response headers, streamed
+responses are written in ``chunks`` pieces of ``chunk_size`` characters with
+``chunk_interval`` seconds between them, embeddings have ``dimensions``
+values and speech responses are ``audio_size`` bytes.
+
+Usage:
+    with MockProviderServer(latency=0.05, chunks=32) as server:
+        model = OpenAILanguageModel(api_key="x", base_url=server.base_url("openai"))
+        model.chat_complete(messages)
+
+    python benchmarks/mock_server.py --port 8080 --latency 20  # until interrupted
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+PROVIDERS = ("openai", "anthropic", "gemini", "ollama", "jina", "voyage")
+
+
+def _sse(data: Any, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+def base_url(server_url: str, provider: str) -> str:
+    """Base URL to configure on a model of the given provider."""
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown provider {provider!r}; expected one of {PROVIDERS}")
+    if provider in ("openai", "anthropic", "jina", "voyage"):
+        return f"{server_url}/{provider}/v1"
+    return f"{server_url}/{provider}"
+
+
+class MockProviderServer:
+    """HTTP server speaking several provider wire formats, on its own thread.
+
+    Args:
+        latency: Seconds to wait before sending each response.
+        chunks: Number of content chunks in streamed chat responses.
+        chunk_size: Characters per streamed chunk; non-streamed completions
+            contain ``chunks * chunk_size`` characters.
+        chunk_interval: Seconds to wait between streamed chunks.
+        dimensions: Values per embedding.
+        audio_size: Bytes of audio returned by text-to-speech.
+        host: Interface to bind.
+        port: Port to bind; 0 picks a free one.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        chunks: int = 16,
+        chunk_size: int = 8,
+        chunk_interval: float = 0.0,
+        dimensions: int = 1024,
+        audio_size: int = 32_000,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.chunks = chunks
+        self.chunk_size = chunk_size
+        self.chunk_interval = chunk_interval
+        self.dimensions = dimensions
+        self.audio_size = audio_size
+        self._socket = socket.create_server((host, port), backlog=1024)
+        self._loop = asyncio.new_event_loop()
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._vectors: Dict[int, str] = {}
+        self._connections: Set[asyncio.StreamWriter] = set()
+
+    @property
+    def url(self) -> str:
+        host, port = self._socket.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def base_url(self, provider: str) -> str:
+        """Base URL to configure on a model of the given provider."""
+        return base_url(self.url, provider)
+
+    def start(self) -> "MockProviderServer":
+        # One event loop thread serves every connection, so the server stays
+        # cheap under concurrency and does not skew the numbers it produces
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._handle, sock=self._socket), self._loop
+        ).result()
+        return self
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+        self._loop.close()
+
+    async def _shutdown(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        # Closing the connections ends their handlers
+        for writer in list(self._connections):
+            writer.close()
+        while self._connections:
+            await asyncio.sleep(0)
+
+    def __enter__(self) -> "MockProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    # HTTP/1.1 with keep-alive, as real APIs serve
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        # Headers and chunks are written separately; avoid delayed-ACK stalls
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                raw = await reader.readexactly(length) if length else b""
+                await self._reply(writer, method, target, raw)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _reply(
+        self, writer: asyncio.StreamWriter, method: str, target: str, raw: bytes
+    ) -> None:
+        try:
+            body = json.loads(raw) if raw[:1] in (b"{", b"[") else {}
+        except ValueError:
+            body = {}
+        provider, _, path = target.split("?", 1)[0].lstrip("/").partition("/")
+        try:
+            if method != "POST":
+                raise LookupError(target)
+            result = self.respond(provider, "/" + path, body)
+        except LookupError:
+            content = b'{"error": {"message": "not found"}}'
+            _write_response(writer, "404 Not Found", content, head=method == "HEAD")
+            await writer.drain()
+            return
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if isinstance(result, bytes):
+            _write_response(writer, "200 OK", result, "audio/mpeg")
+        elif isinstance(result, (dict, str)):
+            text = result if isinstance(result, str) else json.dumps(result)
+            _write_response(writer, "200 OK", text.encode())
+        else:
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                b"Transfer-Encoding: chunked\r\n\r\n"
+            )
+            for i, line in enumerate(result):
+                if self.chunk_interval and i:
+                    await asyncio.sleep(self.chunk_interval)
+                data = line.encode()
+                writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                await writer.drain()
+            writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    # Synthetic payloads
+
+    def pieces(self) -> List[str]:
+        return [("lorem ipsum " * self.chunk_size)[: self.chunk_size]] * self.chunks
+
+    def vector(self, seed: int) -> str:
+        """JSON array of an embedding, cached so the server stays cheap."""
+        if seed not in self._vectors:
+            values = [((seed + i) % 97) / 97 for i in range(self.dimensions)]
+            self._vectors[seed] = json.dumps(values)
+        return self._vectors[seed]
+
+    def respond(self, provider: str, path: str, body: Dict[str, Any]) -> Any:
+        """Return a JSON-able body, encoded JSON text, audio bytes, or an
+        iterator of stream lines."""
+        if provider == "openai" or (provider in ("jina", "voyage") and path.endswith("/embeddings")):
+            return self._openai(path, body)
+        if provider == "anthropic":
+            return self._anthropic(body)
+        if provider == "gemini":
+            return self._gemini(path, body)
+        if provider == "ollama":
+            return self._ollama(path, body)
+        if path.endswith("/rerank"):
+            return self._rerank(provider, body)
+        raise LookupError(path)
+
+    def _openai(self, path: str, body: Dict[str, Any]) -> Any:
+        if path.endswith("/chat/completions"):
+            model = body.get("model", "mock")
+            if body.get("stream"):
+                return self._openai_stream(model)
+            return {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": 0,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "".join(self.pieces())},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 16,
+                    "completion_tokens": self.chunks,
+                    "total_tokens": 16 + self.chunks,
+                },
+            }
+        if path.endswith("/embeddings"):
+            texts = body.get("input", [])
+            texts = [texts] if isinstance(texts, str) else texts
+            data = ",".join(
+                f'{{"object": "embedding", "index": {i}, "embedding": {self.vector(i)}}}'
+                for i in range(len(texts))
+            )
+            usage = {"prompt_tokens": len(texts), "total_tokens": len(texts)}
+            return (
+                f'{{"object": "list", "model": {json.dumps(body.get("model", "mock"))}, '
+                f'"data": [{data}], "usage": {json.dumps(usage)}}}'
+            )
+        if path.endswith("/audio/transcriptions"):
+            return {"text": "".join(self.pieces())}
+        if path.endswith("/audio/speech"):
+            return b"\0" * self.audio_size
+        raise LookupError(path)
+
+    def _openai_stream(self, model: str) -> Iterator[str]:
+        for i, text in enumerate(self.pieces()):
+            yield _sse(
+                {
+                    "id": "chatcmpl-mock",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": {"role": "assistant", "content": text} if i == 0 else {"content": text},
+                            "finish_reason": None,
+                        }
+                    ],
+                }
+            )
+        yield _sse(
+            {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            }
+        )
+        yield "data: [DONE]\n\n"
+
+    def _anthropic(self, body: Dict[str, Any]) -> Any:
+        model = body.get("model", "mock")
+        if body.get("stream"):
+            return self._anthropic_stream(model)
+        return {
+            "id": "msg_mock",
+            "type": "message",
+            "role": "assistant",
+            "model": model,
+            "content": [{"type": "text", "text": "".join(self.pieces())}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": 16, "output_tokens": self.chunks},
+        }
+
+    def _anthropic_stream(self, model: str) -> Iterator[str]:
+        yield _sse(
+            {
+                "type": "message_start",
+                "message": {
+                    "id": "msg_mock",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": model,
+                    "content": [],
+                    "usage": {"input_tokens": 16, "output_tokens": 0},
+                },
+            },
+            "message_start",
+        )
+        yield _sse(
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+            "content_block_start",
+        )
+        for text in self.pieces():
+            yield _sse(
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": text},
+                },
+                "content_block_delta",
+            )
+        yield _sse({"type": "content_block_stop", "index": 0}, "content_block_stop")
+        yield _sse(
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn"},
+                "usage": {"output_tokens": self.chunks},
+            },
+            "message_delta",
+        )
+        yield _sse({"type": "message_stop"}, "message_stop")
+
+    def _gemini(self, path: str, body: Dict[str, Any]) -> Any:
+        if ":embedContent" in path:
+            return f'{{"embedding": {{"values": {self.vector(0)}}}}}'
+        usage = {
+            "promptTokenCount": 16,
+            "candidatesTokenCount": self.chunks,
+            "totalTokenCount": 16 + self.chunks,
+        }
+        if ":streamGenerateContent" in path:
+            return self._gemini_stream(usage)
+        if ":generateContent" in path:
+            return {
+                "candidates": [
+                    {
+                        "content": {"role": "model", "parts": [{"text": "".join(self.pieces())}]},
+                        "finishReason": "STOP",
+                        "index": 0,
+                    }
+                ],
+                "usageMetadata": usage,
+            }
+        raise LookupError(path)
+
+    def _gemini_stream(self, usage: Dict[str, int]) -> Iterator[str]:
+        pieces = self.pieces()
+        for i, text in enumerate(pieces):
+            candidate: Dict[str, Any] = {
+                "content": {"role": "model", "parts": [{"text": text}]},
+                "index": 0,
+            }
+            event: Dict[str, Any] = {"candidates": [candidate]}
+            if i == len(pieces) - 1:
+                candidate["finishReason"] = "STOP"
+                event["usageMetadata"] = usage
+            yield _sse(event)
+
+    def _ollama(self, path: str, body: Dict[str, Any]) -> Any:
+        model = body.get("model", "mock")
+        if path.endswith("/api/embed"):
+            texts = body.get("input", [])
+            texts = [texts] if isinstance(texts, str) else texts
+            vectors = ",".join(self.vector(i) for i in range(len(texts)))
+            return f'{{"model": {json.dumps(model)}, "embeddings": [{vectors}]}}'
+        if path.endswith("/api/chat"):
+            done = {
+                "model": model,
+                "created_at": "2024-01-01T00:00:00Z",
+                "message": {"role": "assistant", "content": ""},
+                "done": True,
+                "done_reason": "stop",
+                "prompt_eval_count": 16,
+                "eval_count": self.chunks,
+            }
+            if body.get("stream", True):
+                return self._ollama_stream(model, done)
+            done["message"]["content"] = "".join(self.pieces())
+            return done
+        raise LookupError(path)
+
+    def _ollama_stream(self, model: str, done: Dict[str, Any]) -> Iterator[str]:
+        for text in self.pieces():
+            chunk = {
+                "model": model,
+                "created_at": "2024-01-01T00:00:00Z",
+                "message": {"role": "assistant", "content": text},
+                "done": False,
+            }
+            yield json.dumps(chunk) + "\n"
+        yield json.dumps(done) + "\n"
+
+    def _rerank(self, provider: str, body: Dict[str, Any]) -> Any:
+        documents = body.get("documents", [])
+        results = sorted(
+            (
+                {"index": i, "relevance_score": 1 / (i + 1), "document": {"text": doc}}
+                for i, doc in enumerate(documents)
+            ),
+            key=lambda r: -r["relevance_score"],
+        )[: body.get("top_n") or body.get("top_k") or len(documents)]
+        usage = {"total_tokens": len(documents)}
+        if provider == "voyage":
+            for result in results:
+                result["document"] = result["document"]["text"]
+            return {"object": "list", "data": results, "model": body.get("model"), "usage": usage}
+        return {"model": body.get("model"), "results": results, "usage": usage}
+
+
+def _write_response(
+    writer: asyncio.StreamWriter,
+    status: str,
+    content: bytes,
+    content_type: str = "application/json",
+    head: bool = False,
+) -> None:
+    # Responses to HEAD requests (connection warmups) have headers only
+    writer.write(
+        f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(content)}\r\n\r\n".encode()
+        + (b"" if head else content)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="ms before each response")
+    parser.add_argument("--chunks", type=int, default=16, help="chunks per streamed response")
+    parser.add_argument("--chunk-size", type=int, default=8, help="characters per chunk")
+    parser.add_argument("--chunk-interval", type=float, default=0.0, help="ms between chunks")
+    parser.add_argument("--dimensions", type=int, default=1024, help="values per embedding")
+    parser.add_argument("--audio-size", type=int, default=32_000, help="bytes of speech audio")
+    args = parser.parse_args()
+
+    server = MockProviderServer(
+        latency=args.latency / 1000,
+        chunks=args.chunks,
+        chunk_size=args.chunk_size,
+        chunk_interval=args.chunk_interval / 1000,
+        dimensions=args.dimensions,
+        audio_size=args.audio_size,
+        port=args.port,
+    )
+    with server:
+        print(f"serving on {server.url}")
+        for provider in PROVIDERS:
+            print(f"  {provider:<10}{server.base_url(provider)}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""Measure end-to-end latency and throughput of provider calls.
+
+Every model talks to a local ``MockProviderServer`` (see mock_server.py), so a
+call goes through the full stack: building the payload, httpx, a loopback
+socket, parsing and normalization. Only the provider's own processing time is
+replaced by ``--latency``. The "baseline/httpx" case sends an OpenAI request
+with a bare httpx client, as a floor for the other cases.
+
+Sync cases run calls one after another; async cases keep ``--concurrency``
+calls in flight. Streamed cases consume the whole stream, and their "first ms"
+column is the median time to the first chunk.
+
+By default the server runs in a thread of the benchmark process and competes
+with it for the GIL. For steadier numbers run ``python benchmarks/mock_server.py``
+separately and pass its URL with ``--server``; the response shape options then
+belong to that command.
+
+With ``--latency 0`` the numbers are Esperanto's and httpx's overhead per
+call, which is what regresses when a hot path gets slower.
+
+Usage:
+    python benchmarks/providers.py
+    python benchmarks/providers.py --calls 500 --latency 20 --chunks 64
+    python benchmarks/providers.py --only chat/anthropic embed
+    python benchmarks/providers.py --server http://127.0.0.1:8080
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from mock_server import MockProviderServer, base_url
+
+from esperanto import AIFactory
+
+MESSAGES = [
+    {"role": "system", "content": "You are a helpful assistant."},
+    {"role": "user", "content": "Hello"},
+]
+
+# Provider names in Esperanto and on the mock server, with a model name
+LANGUAGE = [
+    ("openai", "openai", "gpt-4o-mini"),
+    ("anthropic", "anthropic", "claude-3-5-haiku-latest"),
+    ("google", "gemini", "gemini-2.0-flash"),
+    ("ollama", "ollama", "llama3"),
+]
+EMBEDDING = [
+    ("openai", "openai", "text-embedding-3-small"),
+    ("google", "gemini", "text-embedding-004"),
+    ("ollama", "ollama", "nomic-embed-text"),
+    ("jina", "jina", "jina-embeddings-v3"),
+    ("voyage", "voyage", "voyage-3"),
+]
+RERANKER = [
+    ("jina", "jina", "jina-reranker-v2-base-multilingual"),
+    ("voyage", "voyage", "rerank-2"),
+]
+
+# (name, sync call, async call, whether the calls return streams)
+Case = Tuple[str, Callable[[], Any], Callable[[], Awaitable[Any]], bool]
+
+
+def build_cases(server_url: str, args: argparse.Namespace) -> List[Case]:
+    """Return the cases for every benchmarked operation."""
+    # Google reads its endpoint from the environment only
+    os.environ["GEMINI_API_BASE_URL"] = base_url(server_url, "gemini")
+    texts = ["The quick brown fox jumps over the lazy dog. " * args.text_size] * args.batch
+    audio = b"\0" * args.audio_size
+    cases: List[Case] = []
+
+    # The same request with bare httpx, to separate Esperanto's cost from the client's
+    url = f"{base_url(server_url, 'openai')}/chat/completions"
+    payload = {"model": "gpt-4o-mini", "messages": MESSAGES}
+    client, async_client = httpx.Client(), httpx.AsyncClient()
+
+    async def raw_async() -> Any:
+        return (await async_client.post(url, json=payload)).json()
+
+    cases.append(
+        ("baseline/httpx", lambda: client.post(url, json=payload).json(), raw_async, False)
+    )
+
+    for provider, mock, model_name in LANGUAGE:
+        model = AIFactory.create_language(provider, model_name, _config(server_url, mock))
+        cases += [
+            (f"chat/{provider}", lambda m=model: m.chat_complete(MESSAGES),
+             lambda m=model: m.achat_complete(MESSAGES), False),
+            (f"chat-stream/{provider}", lambda m=model: m.chat_complete(MESSAGES, stream=True),
+             lambda m=model: m.achat_complete(MESSAGES, stream=True), True),
+        ]
+    for provider, mock, model_name in EMBEDDING:
+        model = AIFactory.create_embedding(provider, model_name, _config(server_url, mock))
+        if provider == "jina":
+            model.base_url = f"{base_url(server_url, 'jina')}/embeddings"
+        cases.append(
+            (f"embed/{provider}", lambda m=model: m.embed(texts), lambda m=model: m.aembed(texts), False)
+        )
+    for provider, mock, model_name in RERANKER:
+        model = AIFactory.create_reranker(provider, model_name, _config(server_url, mock))
+        cases.append(
+            (f"rerank/{provider}", lambda m=model: m.rerank("fox", texts),
+             lambda m=model: m.arerank("fox", texts), False)
+        )
+
+    stt = AIFactory.create_speech_to_text("openai", "whisper-1", _config(server_url, "openai"))
+    cases.append(
+        ("transcribe/openai", lambda: stt.transcribe(_audio_file(audio)),
+         lambda: stt.atranscribe(_audio_file(audio)), False)
+    )
+    tts = AIFactory.create_text_to_speech("openai", "tts-1", _config(server_url, "openai"))
+    cases.append(
+        ("speech/openai", lambda: tts.generate_speech("Hello there"),
+         lambda: tts.agenerate_speech("Hello there"), False)
+    )
+    return cases
+
+
+def _config(server_url: str, mock: str) -> Dict[str, Any]:
+    return {"api_key": "bench-key", "base_url": base_url(server_url, mock)}
+
+
+def _audio_file(audio: bytes) -> io.BytesIO:
+    file = io.BytesIO(audio)
+    file.name = "audio.mp3"
+    return file
+
+
+def run_sync(
+    call: Callable[[], Any], calls: int, stream: bool
+) -> Tuple[List[float], List[float], float]:
+    """Return per-call seconds, seconds to first chunk and calls/s, one call at a time."""
+    latencies: List[float] = []
+    firsts: List[float] = []
+    start = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        result = call()
+        if stream:
+            for i, _chunk in enumerate(result):
+                if not i:
+                    firsts.append(time.perf_counter() - t0)
+        latencies.append(time.perf_counter() - t0)
+    return latencies, firsts, calls / (time.perf_counter() - start)
+
+
+async def run_async(
+    call: Callable[[], Awaitable[Any]], calls: int, stream: bool, concurrency: int
+) -> Tuple[List[float], List[float], float]:
+    """Like run_sync, with up to ``concurrency`` calls in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    firsts: List[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            t0 = time.perf_counter()
+            result = await call()
+            if stream:
+                i = 0
+                async for _chunk in result:
+                    if not i:
+                        firsts.append(time.perf_counter() - t0)
+                    i += 1
+            latencies.append(time.perf_counter() - t0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return latencies, firsts, calls / (time.perf_counter() - start)
+
+
+def row(name: str, latencies: List[float], throughput: float, firsts: Optional[List[float]] = None) -> str:
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered) * 1000
+    p95 = ordered[min(int(0.95 * len(ordered)), len(ordered) - 1)] * 1000
+    first = f"{statistics.median(firsts) * 1000:>10.2f}" if firsts else f"{'-':>10}"
+    return f"{name:<28}{p50:>10.2f}{p95:>10.2f}{first}{throughput:>12.0f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200, help="calls per case")
+    parser.add_argument("--concurrency", type=int, default=16, help="async calls in flight")
+    parser.add_argument("--latency", type=float, default=0.0, help="server latency in ms")
+    parser.add_argument("--chunks", type=int, default=16, help="chunks per streamed response")
+    parser.add_argument("--chunk-size", type=int, default=8, help="characters per chunk")
+    parser.add_argument("--chunk-interval", type=float, default=0.0, help="ms between chunks")
+    parser.add_argument("--batch", type=int, default=8, help="texts per embed/rerank call")
+    parser.add_argument("--text-size", type=int, default=4, help="sentences per text")
+    parser.add_argument("--dimensions", type=int, default=1024, help="values per embedding")
+    parser.add_argument("--audio-size", type=int, default=32_000, help="audio bytes per call")
+    parser.add_argument("--only", nargs="+", help="run cases whose name contains any of these")
+    parser.add_argument("--server", help="URL of a separately started mock_server.py")
+    args = parser.parse_args()
+
+    if args.server:
+        asyncio.run(run(args.server.rstrip("/"), args))
+        return
+    server = MockProviderServer(
+        latency=args.latency / 1000,
+        chunks=args.chunks,
+        chunk_size=args.chunk_size,
+        chunk_interval=args.chunk_interval / 1000,
+        dimensions=args.dimensions,
+        audio_size=args.audio_size,
+    )
+    with server:
+        # One event loop for all cases, since async clients are bound to it
+        asyncio.run(run(server.url, args))
+
+
+async def run(server_url: str, args: argparse.Namespace) -> None:
+    cases = build_cases(server_url, args)
+    if args.only:
+        cases = [c for c in cases if any(pattern in c[0] for pattern in args.only)]
+
+    print(
+        f"{args.calls} calls per case, latency {args.latency:g}ms, "
+        f"{args.chunks}x{args.chunk_size} chunks, async concurrency {args.concurrency}"
+    )
+    print(f"{'case':<28}{'p50 ms':>10}{'p95 ms':>10}{'first ms':>10}{'calls/s':>12}")
+    for name, sync_call, async_call, stream in cases:
+        # Warm up connections and caches
+        run_sync(sync_call, 1, stream)
+        await run_async(async_call, 1, stream, 1)
+
+        latencies, firsts, throughput = run_sync(sync_call, args.calls, stream)
+        print(row(name, latencies, throughput, firsts))
+        latencies, firsts, throughput = await run_async(
+            async_call, args.calls, stream, args.concurrency
+        )
+        print(row(f"{name} (async)", latencies, throughput, firsts))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Measure per-call Python overhead of chat completion requests.
+
+Each provider's HTTP client is replaced with a stub that returns a canned
+response without touching the network or httpx's request machinery, so the
+numbers cover only Esperanto's own work: resolving configuration, building
+the payload and normalizing the response. The "template" column reuses the
+cached request template; the "rebuild" column invalidates it before every call
+to show the cost of recomputing headers, default kwargs and converted tools on
+each request.
+
+At 10k requests per second a single core has a budget of 100µs per call.
+
+Usage:
+    python benchmarks/request_overhead.py
+    python benchmarks/request_overhead.py --calls 20000 --tools 8
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+from esperanto.common_types import Tool
+from esperanto.providers.llm.anthropic import AnthropicLanguageModel
+from esperanto.providers.llm.base import LanguageModel
+from esperanto.providers.llm.google import GoogleLanguageModel
+from esperanto.providers.llm.mistral import MistralLanguageModel
+from esperanto.providers.llm.openai import OpenAILanguageModel
+
+BUDGET_US = 1_000_000 / 10_000
+
+OPENAI_RESPONSE = {
+    "id": "chatcmpl-1",
+    "created": 0,
+    "model": "bench",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "ok"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+ANTHROPIC_RESPONSE = {
+    "id": "msg_1",
+    "model": "bench",
+    "content": [{"type": "text", "text": "ok"}],
+    "stop_reason": "end_turn",
+    "usage": {"input_tokens": 1, "output_tokens": 1},
+}
+
+GOOGLE_RESPONSE = {
+    "candidates": [
+        {"content": {"parts": [{"text": "ok"}]}, "finishReason": "STOP"}
+    ],
+    "usageMetadata": {"promptTokenCount": 1, "candidatesTokenCount": 1},
+}
+
+PROVIDERS: Dict[str, Any] = {
+    "openai": (OpenAILanguageModel, OPENAI_RESPONSE),
+    "anthropic": (AnthropicLanguageModel, ANTHROPIC_RESPONSE),
+    "google": (GoogleLanguageModel, GOOGLE_RESPONSE),
+    "mistral": (MistralLanguageModel, OPENAI_RESPONSE),
+}
+
+MESSAGES = [
+    {"role": "system", "content": "You are a helpful assistant."},
+    {"role": "user", "content": "Hello"},
+]
+
+
+def make_tools(count: int) -> List[Tool]:
+    return [
+        Tool.model_validate(
+            {
+                "type": "function",
+                "function": {
+                    "name": f"tool_{i}",
+                    "description": f"Benchmark tool {i}",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {"query": {"type": "string"}},
+                        "required": ["query"],
+                    },
+                },
+            }
+        )
+        for i in range(count)
+    ]
+
+
+class StubClient:
+    """Stand-in for ``httpx.Client`` that answers every POST with one body."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return httpx.Response(200, content=self.body)
+
+
+def make_model(name: str, tools: List[Tool]) -> LanguageModel:
+    model_class, response = PROVIDERS[name]
+    model = model_class(api_key="bench-key", tools=tools or None)
+    model.client = StubClient(json.dumps(response).encode())
+    return model
+
+
+def measure(call: Callable[[], Any], calls: int) -> float:
+    """Return mean microseconds per call after a short warmup."""
+    for _ in range(min(calls, 200)):
+        call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--tools", type=int, default=4)
+    parser.add_argument(
+        "--providers", nargs="+", default=list(PROVIDERS), choices=list(PROVIDERS)
+    )
+    args = parser.parse_args()
+
+    tools = make_tools(args.tools)
+    print(f"{args.calls} calls, {args.tools} tools, budget {BUDGET_US:.0f}µs/call")
+    print(f"{'provider':<12}{'template':>12}{'rebuild':>12}{'fits 10k/s':>12}")
+
+    for name in args.providers:
+        model = make_model(name, tools)
+
+        def cached() -> Any:
+            return model.chat_complete(MESSAGES)
+
+        def rebuild() -> Any:
+            model._invalidate_request_template()
+            return model.chat_complete(MESSAGES)
+
+        cached_us = measure(cached, args.calls)
+        rebuild_us = measure(rebuild, args.calls)
+        fits = "yes" if cached_us <= BUDGET_US else "no"
+        print(f"{name:<12}{cached_us:>10.1f}µs{rebuild_us:>10.1f}µs{fits:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,12 @@ Esperanto: A unified interface for language models.
 This module exports all public components of the library.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from esperanto.common_types import (
+    AllProvidersFailedError,
+    CircuitOpenError,
     FunctionCall,
     Tool,
     ToolCall,
@@ -13,143 +18,105 @@ from esperanto.common_types import (
     validate_tool_call,
     validate_tool_calls,
 )
+from esperanto.factory import AIFactory
 from esperanto.providers.embedding.base import EmbeddingModel
 from esperanto.providers.llm.base import LanguageModel
+from esperanto.providers.llm.failover import FailoverLanguageModel
 from esperanto.providers.llm.profiles import OpenAICompatibleProfile
 from esperanto.providers.stt.base import SpeechToTextModel
 from esperanto.providers.tts.base import TextToSpeechModel
+from esperanto.utils.audio_cache import clear_audio_caches
+from esperanto.utils.circuit_breaker import (
+    get_circuit_breaker_states,
+    reset_circuit_breakers,
+)
+from esperanto.utils.instrumentation import (
+    CallEvent,
+    CallMetrics,
+    add_call_hook,
+    enable_tracing,
+    remove_call_hook,
+)
+from esperanto.utils.profiling import (
+    ProfileReport,
+    disable_profiling,
+    enable_profiling,
+    get_profile_report,
+    profile,
+)
 
-# Import providers conditionally to handle optional dependencies
-try:
-    from esperanto.providers.llm.anthropic import AnthropicLanguageModel
-except ImportError:
-    AnthropicLanguageModel = None  # type: ignore[assignment,misc]
+# Provider classes exported at the top level, by module. They are imported
+# on first attribute access (PEP 562) so that ``import esperanto`` only loads
+# the factory and base types; AIFactory imports providers lazily as well.
+_PROVIDER_MODULES = {
+    "AnthropicLanguageModel": "esperanto.providers.llm.anthropic",
+    "GoogleLanguageModel": "esperanto.providers.llm.google",
+    "OpenAILanguageModel": "esperanto.providers.llm.openai",
+    "OpenAICompatibleLanguageModel": "esperanto.providers.llm.openai_compatible",
+    "OpenRouterLanguageModel": "esperanto.providers.llm.openrouter",
+    "XAILanguageModel": "esperanto.providers.llm.xai",
+    "OpenAIEmbeddingModel": "esperanto.providers.embedding.openai",
+    "GoogleEmbeddingModel": "esperanto.providers.embedding.google",
+    "AzureEmbeddingModel": "esperanto.providers.embedding.azure",
+    "OllamaEmbeddingModel": "esperanto.providers.embedding.ollama",
+    "OllamaLanguageModel": "esperanto.providers.llm.ollama",
+    "AzureLanguageModel": "esperanto.providers.llm.azure",
+    "MistralLanguageModel": "esperanto.providers.llm.mistral",
+    "DeepSeekLanguageModel": "esperanto.providers.llm.deepseek",
+    "GroqLanguageModel": "esperanto.providers.llm.groq",
+    "VertexLanguageModel": "esperanto.providers.llm.vertex",
+    "VertexEmbeddingModel": "esperanto.providers.embedding.vertex",
+    "VertexTextToSpeechModel": "esperanto.providers.tts.vertex",
+    "MistralTextToSpeechModel": "esperanto.providers.tts.mistral",
+    "MistralSpeechToTextModel": "esperanto.providers.stt.mistral",
+}
 
-try:
+if TYPE_CHECKING:
+    from esperanto.providers.embedding.azure import AzureEmbeddingModel
+    from esperanto.providers.embedding.google import GoogleEmbeddingModel
+    from esperanto.providers.embedding.ollama import OllamaEmbeddingModel
+    from esperanto.providers.embedding.openai import OpenAIEmbeddingModel
+    from esperanto.providers.embedding.vertex import VertexEmbeddingModel
+    from esperanto.providers.llm.anthropic import AnthropicLanguageModel
+    from esperanto.providers.llm.azure import AzureLanguageModel
+    from esperanto.providers.llm.deepseek import DeepSeekLanguageModel
     from esperanto.providers.llm.google import GoogleLanguageModel
-except ImportError:
-    GoogleLanguageModel = None  # type: ignore[assignment,misc]
-
-try:
+    from esperanto.providers.llm.groq import GroqLanguageModel
+    from esperanto.providers.llm.mistral import MistralLanguageModel
     from esperanto.providers.llm.ollama import OllamaLanguageModel
-except ImportError:
-    OllamaLanguageModel = None  # type: ignore[assignment,misc]
-
-
-try:
     from esperanto.providers.llm.openai import OpenAILanguageModel
-except ImportError:
-    OpenAILanguageModel = None  # type: ignore[assignment,misc]
-
-try:
     from esperanto.providers.llm.openai_compatible import OpenAICompatibleLanguageModel
-except ImportError:
-    OpenAICompatibleLanguageModel = None  # type: ignore[assignment,misc]
-
-try:
     from esperanto.providers.llm.openrouter import OpenRouterLanguageModel
-except ImportError:
-    OpenRouterLanguageModel = None  # type: ignore[assignment,misc]
-
-try:
+    from esperanto.providers.llm.vertex import VertexLanguageModel
     from esperanto.providers.llm.xai import XAILanguageModel
-except ImportError:
-    XAILanguageModel = None  # type: ignore[assignment,misc]
-
-try:
-    from esperanto.providers.embedding.openai import OpenAIEmbeddingModel
-except ImportError:
-    OpenAIEmbeddingModel = None  # type: ignore[assignment,misc]
-
-try:
-    from esperanto.providers.embedding.google import GoogleEmbeddingModel
-except ImportError:
-    GoogleEmbeddingModel = None  # type: ignore[assignment,misc]
-
-try:
-    from esperanto.providers.embedding.ollama import OllamaEmbeddingModel
-except ImportError:
-    OllamaEmbeddingModel = None  # type: ignore[assignment,misc]
-
-try:
-    from esperanto.providers.embedding.azure import AzureEmbeddingModel
-except ImportError:
-    AzureEmbeddingModel = None  # type: ignore[assignment,misc]
-
-try:
-    from esperanto.providers.llm.azure import AzureLanguageModel
-except ImportError:
-    AzureLanguageModel = None  # type: ignore[assignment,misc]
-
-try:
-    from esperanto.providers.llm.mistral import MistralLanguageModel
-except ImportError:
-    MistralLanguageModel = None  # type: ignore[assignment,misc]
-
-try:
-    from esperanto.providers.llm.deepseek import DeepSeekLanguageModel
-except ImportError:
-    DeepSeekLanguageModel = None  # type: ignore[assignment,misc]
-
-try:
-    from esperanto.providers.llm.groq import GroqLanguageModel
-except ImportError:
-    GroqLanguageModel = None  # type: ignore[assignment,misc]
-
-try:
-    from esperanto.providers.embedding.vertex import VertexEmbeddingModel
-except ImportError:
-    VertexEmbeddingModel = None  # type: ignore[assignment,misc]
+    from esperanto.providers.stt.mistral import MistralSpeechToTextModel
+    from esperanto.providers.tts.mistral import MistralTextToSpeechModel
+    from esperanto.providers.tts.vertex import VertexTextToSpeechModel
 
-try:
-    from esperanto.providers.llm.vertex import VertexLanguageModel
-except ImportError:
-    VertexLanguageModel = None  # type: ignore[assignment,misc]
 
-try:
-    from esperanto.providers.tts.vertex import VertexTextToSpeechModel
-except ImportError:
-    VertexTextToSpeechModel = None  # type: ignore[assignment,misc]
+def _import_provider(name: str) -> Any:
+    """Import a provider class, or None if its dependencies are missing."""
+    try:
+        return getattr(importlib.import_module(_PROVIDER_MODULES[name]), name)
+    except ImportError:
+        return None
 
-try:
-    from esperanto.providers.tts.mistral import MistralTextToSpeechModel
-except ImportError:
-    MistralTextToSpeechModel = None  # type: ignore[assignment,misc]
 
-try:
-    from esperanto.providers.stt.mistral import MistralSpeechToTextModel
-except ImportError:
-    MistralSpeechToTextModel = None  # type: ignore[assignment,misc]
+def __getattr__(name: str) -> Any:
+    if name in _PROVIDER_MODULES:
+        value = _import_provider(name)
+    elif name == "provider_classes":
+        # Names of the provider classes whose dependencies are installed
+        value = [n for n in _PROVIDER_MODULES if __getattr__(n) is not None]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-# Store all provider classes
-__provider_classes = {
-    'AnthropicLanguageModel': AnthropicLanguageModel,
-    'GoogleLanguageModel': GoogleLanguageModel,
-    'OpenAILanguageModel': OpenAILanguageModel,
-    'OpenAICompatibleLanguageModel': OpenAICompatibleLanguageModel,
-    'OpenRouterLanguageModel': OpenRouterLanguageModel,
-    'XAILanguageModel': XAILanguageModel,
-    'OpenAIEmbeddingModel': OpenAIEmbeddingModel,
-    'GoogleEmbeddingModel': GoogleEmbeddingModel,
-    "AzureEmbeddingModel": AzureEmbeddingModel,
-    "OllamaEmbeddingModel": OllamaEmbeddingModel,
-    "OllamaLanguageModel": OllamaLanguageModel,
-    "AzureLanguageModel": AzureLanguageModel,
-    "MistralLanguageModel": MistralLanguageModel,
-    "DeepSeekLanguageModel": DeepSeekLanguageModel,
-    "GroqLanguageModel": GroqLanguageModel,
-    "VertexLanguageModel": VertexLanguageModel,
-    "VertexEmbeddingModel": VertexEmbeddingModel,
-    "VertexTextToSpeechModel": VertexTextToSpeechModel,
-    "MistralTextToSpeechModel": MistralTextToSpeechModel,
-    "MistralSpeechToTextModel": MistralSpeechToTextModel,
-}
 
-# Get list of available provider classes (excluding None values)
-provider_classes = [name for name, cls in __provider_classes.items() if cls is not None]
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_PROVIDER_MODULES) | {"provider_classes"})
 
-# Import factory after defining providers
-from esperanto.factory import AIFactory  # noqa: E402
 
 __all__ = [
     # Factory
@@ -168,9 +135,48 @@ __all__ = [
     "validate_tool_call",
     "validate_tool_calls",
     "find_tool_by_name",
+    # Failover
+    "FailoverLanguageModel",
+    "AllProvidersFailedError",
+    # Circuit breakers
+    "CircuitOpenError",
+    "get_circuit_breaker_states",
+    "reset_circuit_breakers",
+    # Audio cache
+    "clear_audio_caches",
+    # Instrumentation
+    "CallEvent",
+    "CallMetrics",
+    "add_call_hook",
+    "remove_call_hook",
+    "enable_tracing",
+    # Profiling
+    "profile",
+    "ProfileReport",
+    "enable_profiling",
+    "disable_profiling",
+    "get_profile_report",
     # Profiles
     "OpenAICompatibleProfile",
-] + provider_classes
-
-# Make provider classes available at module level
-globals().update({k: v for k, v in __provider_classes.items() if v is not None})
\ No newline at end of file
+    # Providers (imported on first access)
+    "AnthropicLanguageModel",
+    "AzureLanguageModel",
+    "DeepSeekLanguageModel",
+    "GoogleLanguageModel",
+    "GroqLanguageModel",
+    "MistralLanguageModel",
+    "OllamaLanguageModel",
+    "OpenAILanguageModel",
+    "OpenAICompatibleLanguageModel",
+    "OpenRouterLanguageModel",
+    "VertexLanguageModel",
+    "XAILanguageModel",
+    "AzureEmbeddingModel",
+    "GoogleEmbeddingModel",
+    "OllamaEmbeddingModel",
+    "OpenAIEmbeddingModel",
+    "VertexEmbeddingModel",
+    "MistralSpeechToTextModel",
+    "MistralTextToSpeechModel",
+    "VertexTextToSpeechModel",
+]
\ No newline at end of file
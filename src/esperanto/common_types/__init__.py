@@ -1,6 +1,10 @@
 """Types module for Esperanto."""
 
-from .exceptions import ToolCallValidationError
+from .exceptions import (
+    AllProvidersFailedError,
+    CircuitOpenError,
+    ToolCallValidationError,
+)
 from .model import Model
 from .reranker import RerankResponse, RerankResult
 from .response import (
@@ -16,6 +20,7 @@ from .response import (
     ToolFunction,
     Usage,
 )
+from .stream import ChatCompletionAccumulator, ThinkingSplitter
 from .stt import TranscriptionResponse
 from .task_type import EmbeddingTaskType
 from .tts import AudioResponse
@@ -30,6 +35,8 @@ __all__ = [
     "StreamChoice",
     "ChatCompletion",
     "ChatCompletionChunk",
+    "ChatCompletionAccumulator",
+    "ThinkingSplitter",
     # Tool types
     "Tool",
     "ToolFunction",
@@ -40,6 +47,9 @@ __all__ = [
     "validate_tool_call",
     "validate_tool_calls",
     "find_tool_by_name",
+    # Failover
+    "AllProvidersFailedError",
+    "CircuitOpenError",
     # Other types
     "TranscriptionResponse",
     "AudioResponse",
@@ -1,6 +1,6 @@
 """Exceptions for Esperanto common types."""
 
-from typing import List
+from typing import List, Tuple
 
 
 class ToolCallValidationError(Exception):
@@ -16,3 +16,32 @@ class ToolCallValidationError(Exception):
         self.errors = errors
         error_msg = "; ".join(errors)
         super().__init__(f"Tool '{tool_name}' validation failed: {error_msg}")
+
+
+class AllProvidersFailedError(RuntimeError):
+    """Raised when every model in a failover chain failed to serve a request.
+
+    Attributes:
+        errors: List of (provider, exception) pairs in the order they were tried.
+    """
+
+    def __init__(self, errors: List[Tuple[str, BaseException]]):
+        self.errors = errors
+        error_msg = "; ".join(f"{provider}: {error}" for provider, error in errors)
+        super().__init__(f"All providers failed: {error_msg}")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is rejected because the endpoint's circuit is open.
+
+    Attributes:
+        key: Circuit breaker key (provider and base URL) that rejected the call.
+        retry_after: Seconds until the circuit allows a probe request.
+    """
+
+    def __init__(self, key: str, retry_after: float):
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit open for '{key}': failing fast, retry in {retry_after:.1f}s"
+        )
@@ -1,12 +1,14 @@
 """Response types for Esperanto."""
 
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 # Regex pattern to match <think>...</think> blocks (including multiline)
 _THINK_PATTERN = re.compile(r"<think>(.*?)</think>", re.DOTALL)
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
 
 
 # =============================================================================
@@ -77,6 +79,69 @@ def to_dict(obj: Any) -> Dict[str, Any]:
     return {"content": str(obj)}
 
 
+@lru_cache(maxsize=256)
+def _split_thinking(content: str) -> Tuple[Optional[str], str]:
+    """Return the thinking and the cleaned content of message content.
+
+    Cached by content, so reading Message.thinking and
+    Message.cleaned_content parses a message once. The cache is not kept on
+    the frozen instance because model_copy(update=...) copies instance state
+    and would return values of the old content.
+    """
+    if "<think>" in content:
+        matches = _THINK_PATTERN.findall(content)
+        content = _THINK_PATTERN.sub("", content)
+    else:
+        matches = []
+    # Concatenate all thinking blocks, stripping whitespace
+    non_empty = [match.strip() for match in matches if match.strip()]
+    thinking = "\n\n".join(non_empty) if non_empty else None
+    # Clean up extra whitespace/newlines left behind
+    return thinking, _BLANK_LINES_PATTERN.sub("\n\n", content).strip()
+
+
+# =============================================================================
+# Trusted construction
+# =============================================================================
+
+_M = TypeVar("_M", bound=BaseModel)
+
+# Slots of every pydantic model instance, set directly by _new_model
+_set_dict = object.__setattr__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+# Field defaults in declaration order (None for required fields), by model
+_model_defaults: Dict[type, Dict[str, Any]] = {}
+
+
+def _new_model(cls: Type[_M], data: Dict[str, Any]) -> _M:
+    """Create a model instance from field values without validation.
+
+    Provider normalizers create a message, choice and chunk per streamed
+    token, and validating them costs more than the rest of the chunk's
+    handling. Like ``model_construct`` (which is slower than validation for
+    these small models), field types and constraints are not checked, so the
+    ``_construct`` classmethods that call this are for trusted internal
+    callers only.
+    """
+    defaults = _model_defaults.get(cls)
+    if defaults is None:
+        defaults = _model_defaults[cls] = {
+            name: None if info.is_required() else info.get_default(call_default_factory=True)
+            for name, info in cls.model_fields.items()
+        }
+    values = defaults.copy()
+    values.update(data)
+    instance = object.__new__(cls)
+    _set_dict(instance, "__dict__", values)
+    _set_fields_set(instance, set(data))
+    _set_extra(instance, None)
+    _set_private(instance, None)
+    return instance
+
+
 class Usage(BaseModel):
     """Usage statistics for a completion."""
 
@@ -88,6 +153,11 @@ class Usage(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    @classmethod
+    def _construct(cls, **data: Any) -> "Usage":
+        """Create usage without validation, for provider normalizers."""
+        return _new_model(cls, data)
+
 
 class Message(BaseModel):
     """A message in a chat completion."""
@@ -111,6 +181,26 @@ class Message(BaseModel):
         """Enable dict-like access for backward compatibility."""
         return getattr(self, key)
 
+    @classmethod
+    def _construct(cls: Type[_M], **data: Any) -> _M:
+        """Create a message without validation, for provider normalizers.
+
+        Data that normalize_message_data would change (non-string content,
+        ``thinking`` text or tool calls given as dicts) is validated as usual.
+        """
+        if "thinking" in data:
+            if data["thinking"]:
+                return cls(**data)
+            del data["thinking"]
+        content = data.get("content")
+        tool_calls = data.get("tool_calls")
+        if (
+            (content is not None and content.__class__ is not str)
+            or (tool_calls and any(tc.__class__ is not ToolCall for tc in tool_calls))
+        ):
+            return cls(**data)
+        return _new_model(cls, data)
+
     @property
     def thinking(self) -> Optional[str]:
         """Extract content inside <think> tags (reasoning trace).
@@ -124,14 +214,7 @@ class Message(BaseModel):
         """
         if not self.content:
             return None
-        matches = _THINK_PATTERN.findall(self.content)
-        if not matches:
-            return None
-        # Concatenate all thinking blocks, stripping whitespace
-        non_empty = [match.strip() for match in matches if match.strip()]
-        if not non_empty:
-            return None
-        return "\n\n".join(non_empty)
+        return _split_thinking(self.content)[0]
 
     @property
     def cleaned_content(self) -> str:
@@ -145,11 +228,7 @@ class Message(BaseModel):
         """
         if not self.content:
             return ""
-        # Remove all <think>...</think> blocks and clean up whitespace
-        cleaned = _THINK_PATTERN.sub("", self.content)
-        # Clean up extra whitespace/newlines left behind
-        cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
-        return cleaned.strip()
+        return _split_thinking(self.content)[1]
 
     @model_validator(mode="before")
     @classmethod
@@ -224,6 +303,16 @@ class Choice(BaseModel):
         description="Reason why the model stopped generating (e.g., 'stop', 'length')",
     )
 
+    @classmethod
+    def _construct(cls, **data: Any) -> "Choice":
+        """Create a choice without validation, for provider normalizers."""
+        finish_reason = data.get("finish_reason")
+        if not isinstance(data.get("message"), Message) or (
+            finish_reason is not None and finish_reason.__class__ is not str
+        ):
+            return cls(**data)
+        return _new_model(cls, data)
+
     @model_validator(mode="before")
     @classmethod
     def ensure_message_type(cls, data: Any) -> Any:
@@ -233,7 +322,7 @@ class Choice(BaseModel):
         if "message" in data:
             if not isinstance(data["message"], Message):
                 data["message"] = Message(**to_dict(data["message"]))
-        if "finish_reason" in data:
+        if data.get("finish_reason") is not None:
             try:
                 data["finish_reason"] = str(data["finish_reason"])
             except Exception:
@@ -257,6 +346,16 @@ class StreamChoice(BaseModel):
         description="Reason why the model stopped generating (e.g., 'stop', 'length')",
     )
 
+    @classmethod
+    def _construct(cls, **data: Any) -> "StreamChoice":
+        """Create a stream choice without validation, for provider normalizers."""
+        finish_reason = data.get("finish_reason")
+        if not isinstance(data.get("delta"), DeltaMessage) or (
+            finish_reason is not None and finish_reason.__class__ is not str
+        ):
+            return cls(**data)
+        return _new_model(cls, data)
+
     @model_validator(mode="before")
     @classmethod
     def ensure_delta_type(cls, data: Any) -> Any:
@@ -266,7 +365,7 @@ class StreamChoice(BaseModel):
         if "delta" in data:
             if not isinstance(data["delta"], DeltaMessage):
                 data["delta"] = DeltaMessage(**to_dict(data["delta"]))
-        if "finish_reason" in data:
+        if data.get("finish_reason") is not None:
             try:
                 data["finish_reason"] = str(data["finish_reason"])
             except Exception:
@@ -306,6 +405,13 @@ class ChatCompletion(BaseModel):
             return ""
         return self.choices[0].message.content or ""
 
+    @classmethod
+    def _construct(cls, **data: Any) -> "ChatCompletion":
+        """Create a completion without validation, for provider normalizers."""
+        if any(choice.__class__ is not Choice for choice in data.get("choices", ())):
+            return cls(**data)
+        return _new_model(cls, data)
+
     @model_validator(mode="before")
     @classmethod
     def ensure_choice_types(cls, data: Any) -> Any:
@@ -346,6 +452,13 @@ class ChatCompletionChunk(BaseModel):
         description="Object type, always 'chat.completion.chunk'",
     )
 
+    @classmethod
+    def _construct(cls, **data: Any) -> "ChatCompletionChunk":
+        """Create a chunk without validation, for provider normalizers."""
+        if any(choice.__class__ is not StreamChoice for choice in data.get("choices", ())):
+            return cls(**data)
+        return _new_model(cls, data)
+
     @model_validator(mode="before")
     @classmethod
     def ensure_choice_types(cls, data: Any) -> Any:
@@ -0,0 +1,252 @@
+"""Helpers for consuming streamed chat completions."""
+
+from typing import (
+    AsyncGenerator,
+    AsyncIterable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .response import (
+    ChatCompletion,
+    ChatCompletionChunk,
+    Choice,
+    FunctionCall,
+    Message,
+    Tool,
+    ToolCall,
+)
+from .validation import validate_tool_calls
+
+
+class _ToolCallBuilder:
+    """A tool call assembled from its streamed deltas."""
+
+    __slots__ = ("id", "type", "name", "arguments")
+
+    def __init__(self, tool_call: ToolCall):
+        self.id = tool_call.id
+        self.type = tool_call.type
+        self.name = tool_call.function.name
+        self.arguments: List[str] = []
+
+    def build(self) -> ToolCall:
+        return ToolCall(
+            id=self.id,
+            type=self.type,
+            function=FunctionCall(name=self.name, arguments="".join(self.arguments)),
+        )
+
+
+class _ChoiceBuilder:
+    """A choice assembled from its streamed deltas."""
+
+    __slots__ = ("role", "content", "tool_calls", "open_tool_calls", "finish_reason")
+
+    def __init__(self) -> None:
+        self.role: Optional[str] = None
+        self.content: List[str] = []
+        # Every tool call in order, and the latest one started at each index
+        self.tool_calls: List[_ToolCallBuilder] = []
+        self.open_tool_calls: Dict[int, _ToolCallBuilder] = {}
+        self.finish_reason: Optional[str] = None
+
+    def add_tool_call(self, position: int, delta: ToolCall) -> None:
+        key = delta.index if delta.index is not None else position
+        builder = self.open_tool_calls.get(key)
+        # A new id at a known index starts another call (Google sends each call
+        # whole, numbered from 0 in every chunk); deltas without an id continue it
+        if builder is None or (delta.id and builder.id and delta.id != builder.id):
+            builder = self.open_tool_calls[key] = _ToolCallBuilder(delta)
+            self.tool_calls.append(builder)
+        else:
+            if delta.id:
+                builder.id = delta.id
+            if delta.function.name:
+                builder.name = delta.function.name
+        if delta.function.arguments:
+            builder.arguments.append(delta.function.arguments)
+
+    def build(self, index: int) -> Choice:
+        return Choice(
+            index=index,
+            message=Message(
+                role=self.role or "assistant",
+                content="".join(self.content) if self.content else None,
+                tool_calls=[tc.build() for tc in self.tool_calls] or None,
+            ),
+            finish_reason=self.finish_reason,
+        )
+
+
+class ChatCompletionAccumulator:
+    """Assemble a streamed chat completion into a ``ChatCompletion``.
+
+    Works with the chunks of any provider: content deltas are joined, tool
+    call deltas are merged by their index (so partial arguments, as OpenAI and
+    Anthropic stream them, are concatenated), and the last finish reason of
+    each choice is kept. Text is collected in lists and joined once at the
+    end, so accumulating a stream is linear in its length.
+
+    Pass chunks through ``iter()`` (or ``aiter()``) to consume a stream and
+    build the completion when it ends::
+
+        accumulator = ChatCompletionAccumulator(provider=model.provider)
+        for chunk in accumulator.iter(model.chat_complete(messages, stream=True)):
+            print(chunk.choices[0].delta.content or "", end="")
+        completion = accumulator.completion
+
+    Streamed chunks carry no token usage, so ``completion.usage`` is None.
+
+    Args:
+        provider: Provider name set on the completion.
+        tools: If given, tool calls of the completion are validated against
+            these tools when it is built, raising ToolCallValidationError.
+    """
+
+    def __init__(self, provider: str = "", tools: Optional[List[Tool]] = None):
+        self.provider = provider
+        self.tools = tools
+        self.completion: Optional[ChatCompletion] = None
+        self._id = ""
+        self._model = ""
+        self._created: Optional[int] = None
+        self._choices: Dict[int, _ChoiceBuilder] = {}
+
+    def add(self, chunk: ChatCompletionChunk) -> None:
+        """Add a chunk to the completion."""
+        if not self._id:
+            self._id = chunk.id
+            self._model = chunk.model
+            self._created = chunk.created
+        for stream_choice in chunk.choices:
+            choice = self._choices.get(stream_choice.index)
+            if choice is None:
+                choice = self._choices[stream_choice.index] = _ChoiceBuilder()
+            delta = stream_choice.delta
+            if delta.role:
+                choice.role = delta.role
+            if delta.content:
+                choice.content.append(delta.content)
+            if delta.tool_calls:
+                for position, tool_call in enumerate(delta.tool_calls):
+                    choice.add_tool_call(position, tool_call)
+            if stream_choice.finish_reason is not None:
+                choice.finish_reason = stream_choice.finish_reason
+
+    def build(self) -> ChatCompletion:
+        """Return the completion of the chunks added so far.
+
+        Raises:
+            ToolCallValidationError: If tools were given and a tool call does
+                not match its schema.
+        """
+        completion = self._assemble()
+        self._validate(completion)
+        return completion
+
+    def iter(
+        self, chunks: Iterable[ChatCompletionChunk]
+    ) -> Generator[ChatCompletionChunk, None, None]:
+        """Yield each chunk, then set ``completion`` once the stream ends.
+
+        Raises:
+            ToolCallValidationError: After the last chunk, if tools were given
+                and a tool call does not match its schema. ``completion`` is
+                set before the error is raised.
+        """
+        for chunk in chunks:
+            self.add(chunk)
+            yield chunk
+        self.completion = self._assemble()
+        self._validate(self.completion)
+
+    async def aiter(
+        self, chunks: AsyncIterable[ChatCompletionChunk]
+    ) -> AsyncGenerator[ChatCompletionChunk, None]:
+        """Async version of ``iter()``."""
+        async for chunk in chunks:
+            self.add(chunk)
+            yield chunk
+        self.completion = self._assemble()
+        self._validate(self.completion)
+
+    def _assemble(self) -> ChatCompletion:
+        return ChatCompletion(
+            id=self._id,
+            choices=[
+                self._choices[index].build(index) for index in sorted(self._choices)
+            ],
+            model=self._model,
+            provider=self.provider,
+            created=self._created,
+        )
+
+    def _validate(self, completion: ChatCompletion) -> None:
+        if self.tools:
+            for choice in completion.choices:
+                if choice.message.tool_calls:
+                    validate_tool_calls(choice.message.tool_calls, self.tools)
+
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+
+class ThinkingSplitter:
+    """Separate reasoning from answer text in streamed content.
+
+    Models such as Qwen3 and DeepSeek R1 stream their reasoning inside
+    ``<think>...</think>`` before the answer. Feed each delta's content and
+    get back the part of it that is reasoning and the part that is answer,
+    with the tags removed::
+
+        splitter = ThinkingSplitter()
+        for chunk in model.chat_complete(messages, stream=True):
+            thinking, answer = splitter.feed(chunk.choices[0].delta.content or "")
+            ...
+        thinking, answer = splitter.flush()
+
+    Tags split across chunks are recognized: text that could be the start of
+    a tag is held back until the next chunk shows whether it is one. Unlike
+    Message.thinking, text is passed on as it arrives, so whitespace around
+    blocks is kept.
+    """
+
+    def __init__(self) -> None:
+        self.in_thinking = False
+        self._pending = ""
+
+    def feed(self, text: str) -> Tuple[str, str]:
+        """Return the reasoning and answer text of the next piece of content."""
+        if self._pending:
+            text = self._pending + text
+            self._pending = ""
+        thinking: List[str] = []
+        answer: List[str] = []
+        tag = _THINK_CLOSE if self.in_thinking else _THINK_OPEN
+        start = text.find(tag)
+        while start != -1:
+            (thinking if self.in_thinking else answer).append(text[:start])
+            text = text[start + len(tag):]
+            self.in_thinking = not self.in_thinking
+            tag = _THINK_CLOSE if self.in_thinking else _THINK_OPEN
+            start = text.find(tag)
+
+        # Hold back a trailing "<", "<th", "</thin"... that may complete a tag.
+        # Such a suffix starts at the last "<", since tags contain only one.
+        held = text.rfind("<", max(len(text) - len(tag) + 1, 0))
+        if held != -1 and tag.startswith(text[held:]):
+            self._pending = text[held:]
+            text = text[:held]
+        (thinking if self.in_thinking else answer).append(text)
+        return "".join(thinking), "".join(answer)
+
+    def flush(self) -> Tuple[str, str]:
+        """Return the text held back at the end of the stream."""
+        text, self._pending = self._pending, ""
+        return (text, "") if self.in_thinking else ("", text)
@@ -29,5 +29,10 @@ class TranscriptionResponse(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(
         default=None, description="Additional metadata from the provider"
     )
+    is_final: Optional[bool] = Field(
+        default=None,
+        description="For streamed transcriptions, whether this segment is final; "
+        "None for whole-file transcriptions",
+    )
 
     model_config = ConfigDict(frozen=True)
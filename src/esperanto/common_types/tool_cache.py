@@ -0,0 +1,69 @@
+"""Per-tool cache for derived tool artifacts."""
+
+import threading
+import weakref
+from functools import partial
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from .response import Tool
+
+T = TypeVar("T")
+
+
+class ToolCache:
+    """Thread-safe cache of values derived from ``Tool`` objects.
+
+    ``Tool`` is a frozen model, so anything computed from it (a provider-format
+    payload, a compiled JSON schema validator) stays valid for the tool's
+    lifetime. Entries are keyed by tool identity and a kind string, and are
+    dropped when the tool is garbage collected. Identity is used instead of
+    equality because tools hold unhashable schema dicts.
+    """
+
+    def __init__(self):
+        """Initialize the tool cache."""
+        self._entries: Dict[int, Tuple["weakref.ref[Tool]", Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, tool: Tool, kind: str, factory: Callable[[Tool], T]) -> T:
+        """Get the cached value for a tool, computing it on first use.
+
+        Args:
+            tool: The tool the value is derived from.
+            kind: Name of the derived value, e.g. "openai" or "validator".
+            factory: Function computing the value from the tool.
+
+        Returns:
+            The cached or newly computed value.
+        """
+        key = id(tool)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is tool and kind in entry[1]:
+            return entry[1][kind]
+
+        value = factory(tool)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0]() is not tool:
+                ref = weakref.ref(tool, partial(self._evict, key))
+                entry = (ref, {})
+                self._entries[key] = entry
+            return entry[1].setdefault(kind, value)
+
+    def _evict(self, key: int, ref: "weakref.ref[Tool]") -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+tool_cache = ToolCache()
@@ -1,8 +1,21 @@
 """Text-to-speech type definitions for Esperanto."""
 
-from typing import Any, Dict, Optional
+import mmap
+import os
+import shutil
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Union, cast
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    computed_field,
+)
 
 from esperanto.common_types.response import Usage
 
@@ -35,10 +48,148 @@ class Voice(BaseModel):
     model_config = ConfigDict(frozen=True)
 
 
+AudioBuffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+_BYTES_ADAPTER: TypeAdapter[bytes] = TypeAdapter(bytes)
+
+# Read size used when streaming file- or stream-backed audio
+_CHUNK_SIZE = 64 * 1024
+
+
+def _audio_buffer(value: Any) -> Union[bytes, memoryview]:
+    """Keep bytes and zero-copy buffers as-is; validate anything else as bytes."""
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, (memoryview, mmap.mmap)):
+        view = memoryview(value)
+        return view if view.format == "B" and view.ndim == 1 else view.cast("B")
+    return _BYTES_ADAPTER.validate_python(value)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _AudioParts:
+    """Audio made of consecutive buffers, e.g. a WAV header and its PCM."""
+
+    def __init__(self, parts: Iterable[AudioBuffer]):
+        self.parts = [_audio_buffer(part) for part in parts]
+
+    def size(self) -> int:
+        return sum(len(part) for part in self.parts)
+
+    def buffer(self) -> Union[bytes, memoryview]:
+        if len(self.parts) == 1:
+            return self.parts[0]
+        return b"".join(self.parts)
+
+    def iter_bytes(self, chunk_size: int) -> Iterator[bytes]:
+        for part in self.parts:
+            view = memoryview(part)
+            for offset in range(0, len(view), chunk_size):
+                yield bytes(view[offset:offset + chunk_size])
+
+    def write_to(self, file: BinaryIO) -> None:
+        for part in self.parts:
+            file.write(part)
+
+
+class _AudioFile:
+    """Audio stored in a file, memory-mapped on first contiguous access."""
+
+    def __init__(self, path: Union[str, Path], delete: bool = False):
+        self.path = str(path)
+        if delete:
+            weakref.finalize(self, _remove_file, self.path)
+
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
+    def buffer(self) -> Union[bytes, memoryview]:
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def iter_bytes(self, chunk_size: int) -> Iterator[bytes]:
+        with open(self.path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def write_to(self, file: BinaryIO) -> None:
+        with open(self.path, "rb") as f:
+            shutil.copyfileobj(f, file, _CHUNK_SIZE)
+
+
+class _AudioStream:
+    """Audio arriving as an iterator of chunks.
+
+    The first ``iter_bytes`` passes chunks through as they arrive. Every chunk
+    is also spooled to a temporary file, which backs all later access, so the
+    stream is only consumed once and never held in memory as a whole.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Optional[Iterator[bytes]] = iter(chunks)
+        self._spool: Optional[BinaryIO] = None
+        self._file: Optional[_AudioFile] = None
+
+    def _spool_chunks(self) -> Iterator[bytes]:
+        if self._spool is None:
+            spool = tempfile.NamedTemporaryFile(prefix="esperanto-audio-", delete=False)
+            self._spool = cast(BinaryIO, spool)
+            self._file = _AudioFile(spool.name, delete=True)
+        assert self._chunks is not None
+        for chunk in self._chunks:
+            self._spool.write(chunk)
+            yield chunk
+        self._chunks = None
+        self._spool.close()
+
+    def _complete(self) -> _AudioFile:
+        if self._chunks is not None:
+            for _ in self._spool_chunks():
+                pass
+        assert self._file is not None
+        return self._file
+
+    def size(self) -> int:
+        return self._complete().size()
+
+    def buffer(self) -> Union[bytes, memoryview]:
+        return self._complete().buffer()
+
+    def iter_bytes(self, chunk_size: int) -> Iterator[bytes]:
+        if self._spool is None:
+            yield from self._spool_chunks()
+        else:
+            yield from self._complete().iter_bytes(chunk_size)
+
+    def write_to(self, file: BinaryIO) -> None:
+        self._complete().write_to(file)
+
+
+_AudioSource = Union[_AudioParts, _AudioFile, _AudioStream]
+
+
 class AudioResponse(BaseModel):
-    """Response from text-to-speech generation."""
+    """Response from text-to-speech generation.
+
+    ``audio_data`` may be given as ``bytes`` or as a buffer such as a
+    ``memoryview`` or ``mmap``, which is kept without copying. Responses can
+    also be backed by several buffers (``from_parts``), a file
+    (``from_file``) or a chunk iterator (``from_stream``). Such audio is only
+    loaded when needed: ``iter_bytes`` and ``save`` stream it, ``buffer``
+    gives a contiguous view (memory-mapping files), and ``audio_data``
+    converts it to ``bytes`` on first access.
+    """
+
+    _audio: Union[bytes, memoryview, _AudioSource] = PrivateAttr(default=b"")
 
-    audio_data: bytes = Field(description="The generated audio data")
     duration: Optional[float] = Field(
         default=None, description="Duration of the audio in seconds"
     )
@@ -62,3 +213,98 @@ class AudioResponse(BaseModel):
     )
 
     model_config = ConfigDict(frozen=True)
+
+    def __init__(self, audio_data: AudioBuffer, **data: Any) -> None:
+        super().__init__(**data)
+        self._audio = _audio_buffer(audio_data)
+
+    @classmethod
+    def _from_source(cls, source: _AudioSource, **data: Any) -> "AudioResponse":
+        response = cls(audio_data=b"", **data)
+        response._audio = source
+        return response
+
+    @classmethod
+    def from_parts(cls, parts: Iterable[AudioBuffer], **data: Any) -> "AudioResponse":
+        """Create a response from consecutive buffers without joining them.
+
+        Args:
+            parts: Buffers that make up the audio, in order.
+            **data: Other AudioResponse fields.
+        """
+        return cls._from_source(_AudioParts(parts), **data)
+
+    @classmethod
+    def from_file(
+        cls, path: Union[str, Path], *, delete: bool = False, **data: Any
+    ) -> "AudioResponse":
+        """Create a response backed by an audio file.
+
+        Args:
+            path: Path of the audio file.
+            delete: Remove the file once the response is garbage collected,
+                e.g. for temporary files.
+            **data: Other AudioResponse fields.
+        """
+        return cls._from_source(_AudioFile(path, delete), **data)
+
+    @classmethod
+    def from_stream(cls, chunks: Iterable[bytes], **data: Any) -> "AudioResponse":
+        """Create a response from an iterator of audio chunks.
+
+        The iterator is consumed at most once. Chunks are spooled to a
+        temporary file as they are read, so the audio can be accessed again
+        without keeping it in memory.
+
+        Args:
+            chunks: Audio chunks in order.
+            **data: Other AudioResponse fields.
+        """
+        return cls._from_source(_AudioStream(chunks), **data)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def audio_data(self) -> bytes:
+        """The generated audio data."""
+        if not isinstance(self._audio, bytes):
+            self._audio = bytes(self.buffer)
+        return self._audio
+
+    @property
+    def buffer(self) -> memoryview:
+        """Contiguous view of the audio data, without copying where possible."""
+        if not isinstance(self._audio, (bytes, memoryview)):
+            self._audio = self._audio.buffer()
+        return memoryview(self._audio)
+
+    @property
+    def size(self) -> int:
+        """Size of the audio data in bytes."""
+        if isinstance(self._audio, (bytes, memoryview)):
+            return len(self._audio)
+        return self._audio.size()
+
+    def iter_bytes(self, chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over the audio data in chunks of at most ``chunk_size`` bytes."""
+        if isinstance(self._audio, (bytes, memoryview)):
+            return _AudioParts([self._audio]).iter_bytes(chunk_size)
+        return self._audio.iter_bytes(chunk_size)
+
+    def write_to(self, file: BinaryIO) -> None:
+        """Write the audio data to an open binary file."""
+        if isinstance(self._audio, (bytes, memoryview)):
+            file.write(self._audio)
+        else:
+            self._audio.write_to(file)
+
+    def save(self, output_file: Union[str, Path]) -> str:
+        """Write the audio data to a file, creating parent directories.
+
+        Returns:
+            Absolute path of the written file.
+        """
+        output_path = Path(output_file).absolute()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as f:
+            self.write_to(f)
+        return str(output_path)
@@ -1,10 +1,25 @@
 """Validation utilities for tool calls."""
 
 import json
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from .exceptions import ToolCallValidationError
 from .response import Tool, ToolCall
+from .tool_cache import tool_cache
+
+
+def _compile_validator(tool: Tool) -> Any:
+    """Build a jsonschema validator for the tool's parameters schema.
+
+    The schema itself is checked once here, so invalid schemas raise
+    ``jsonschema.SchemaError`` just as ``jsonschema.validate`` does.
+    """
+    import jsonschema
+
+    schema = tool.function.parameters
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
 
 
 def validate_tool_call(tool_call: ToolCall, tool: Tool) -> None:
@@ -34,11 +49,11 @@ def validate_tool_call(tool_call: ToolCall, tool: Tool) -> None:
             tool_call.function.name, [f"Invalid JSON in arguments: {e}"]
         )
 
-    # Validate against the schema
-    try:
-        jsonschema.validate(arguments, tool.function.parameters)
-    except jsonschema.ValidationError as e:
-        raise ToolCallValidationError(tool_call.function.name, [e.message])
+    # Validate against the schema with a validator compiled once per tool
+    validator = tool_cache.get(tool, "validator", _compile_validator)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+    if error is not None:
+        raise ToolCallValidationError(tool_call.function.name, [error.message])
 
 
 def validate_tool_calls(
@@ -1,12 +1,13 @@
 """Azure OpenAI embedding model provider."""
 
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import httpx
 
 from esperanto.providers.embedding.base import EmbeddingModel, Model
 from esperanto.utils import validate_and_decode_embedding
+from esperanto.utils.timeout import TimeoutValue
 
 
 class AzureEmbeddingModel(EmbeddingModel):
@@ -97,11 +98,19 @@ class AzureEmbeddingModel(EmbeddingModel):
                 error_message = f"HTTP {response.status_code}: {response.text}"
             raise RuntimeError(f"Azure OpenAI API error: {error_message}")
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -126,7 +135,8 @@ class AzureEmbeddingModel(EmbeddingModel):
         response = self.client.post(
             url,
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -138,11 +148,19 @@ class AzureEmbeddingModel(EmbeddingModel):
             results.append(validate_and_decode_embedding(idx, raw))
         return results
 
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts asynchronously.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -167,7 +185,8 @@ class AzureEmbeddingModel(EmbeddingModel):
         response = await self.async_client.post(
             url,
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional
 from esperanto.common_types import Model
 from esperanto.common_types.task_type import EmbeddingTaskType
 from esperanto.utils.connect import HttpConnectionMixin
+from esperanto.utils.instrumentation import instrument_methods
+from esperanto.utils.timeout import TimeoutValue
 
 
 @dataclass
@@ -22,6 +24,11 @@ class EmbeddingModel(HttpConnectionMixin, ABC):
     config: Optional[Dict[str, Any]] = None
     _config: Dict[str, Any] = field(default_factory=dict)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Route provider calls through the metrics and tracing hooks."""
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, ("embed", "aembed"))
+
     def __post_init__(self):
         """Initialize configuration after dataclass initialization."""
         # Initialize config with default values
@@ -58,11 +65,24 @@ class EmbeddingModel(HttpConnectionMixin, ABC):
                     self.task_type = None
 
     @abstractmethod
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -71,11 +91,24 @@ class EmbeddingModel(HttpConnectionMixin, ABC):
         pass
 
     @abstractmethod
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts asynchronously.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
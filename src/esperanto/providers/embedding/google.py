@@ -7,6 +7,7 @@ import httpx
 
 from esperanto.common_types.task_type import EmbeddingTaskType
 from esperanto.providers.embedding.base import EmbeddingModel, Model
+from esperanto.utils.timeout import TimeoutValue
 
 
 class GoogleEmbeddingModel(EmbeddingModel):
@@ -97,11 +98,19 @@ class GoogleEmbeddingModel(EmbeddingModel):
             return None
         return self.GEMINI_TASK_MAPPING.get(self.task_type)
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -140,7 +149,8 @@ class GoogleEmbeddingModel(EmbeddingModel):
             response = self.client.post(
                 f"{self.base_url}/{model_name}:embedContent?key={self.api_key}",
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
             
@@ -150,11 +160,19 @@ class GoogleEmbeddingModel(EmbeddingModel):
 
         return results
 
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts asynchronously.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -193,7 +211,8 @@ class GoogleEmbeddingModel(EmbeddingModel):
             response = await self.async_client.post(
                 f"{self.base_url}/{model_name}:embedContent?key={self.api_key}",
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
             
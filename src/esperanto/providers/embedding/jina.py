@@ -8,6 +8,7 @@ import httpx
 from esperanto.common_types import Model
 from esperanto.common_types.task_type import EmbeddingTaskType
 from esperanto.utils import validate_and_decode_embedding
+from esperanto.utils.timeout import TimeoutValue
 
 from .base import EmbeddingModel
 
@@ -135,11 +136,19 @@ class JinaEmbeddingModel(EmbeddingModel):
         except (KeyError, ValueError):
             raise RuntimeError(f"Jina API error: {response.status_code} - {response.text}")
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments (not used for Jina).
 
         Returns:
@@ -154,7 +163,8 @@ class JinaEmbeddingModel(EmbeddingModel):
             response = self.client.post(
                 self.base_url or "",
                 json=payload,
-                headers=self._get_headers()
+                headers=self._get_headers(),
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
             if response.status_code != 200:
@@ -177,11 +187,19 @@ class JinaEmbeddingModel(EmbeddingModel):
         finally:
             pass  # Client is reused, don't close
 
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts asynchronously.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments (not used for Jina).
 
         Returns:
@@ -196,7 +214,8 @@ class JinaEmbeddingModel(EmbeddingModel):
             response = await self.async_client.post(
                 self.base_url or "",
                 json=payload,
-                headers=self._get_headers()
+                headers=self._get_headers(),
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
             if response.status_code != 200:
@@ -1,11 +1,12 @@
 """Mistral embedding model provider."""
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import httpx
 
 from esperanto.providers.embedding.base import EmbeddingModel, Model
 from esperanto.utils import validate_and_decode_embedding
+from esperanto.utils.timeout import TimeoutValue
 
 
 class MistralEmbeddingModel(EmbeddingModel):
@@ -45,7 +46,14 @@ class MistralEmbeddingModel(EmbeddingModel):
     # Mistral doesn't support any advanced features, so we can use the base implementation
     # which will automatically filter them out
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts."""
         # Clean texts using enhanced text cleaning
         texts = [self._clean_text(text) for text in texts]
@@ -62,7 +70,8 @@ class MistralEmbeddingModel(EmbeddingModel):
         response = self.client.post(
             f"{self.base_url}/embeddings",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
@@ -73,7 +82,14 @@ class MistralEmbeddingModel(EmbeddingModel):
             results.append(validate_and_decode_embedding(idx, raw))
         return results
 
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts asynchronously."""
         # Clean texts using enhanced text cleaning
         texts = [self._clean_text(text) for text in texts]
@@ -90,7 +106,8 @@ class MistralEmbeddingModel(EmbeddingModel):
         response = await self.async_client.post(
             f"{self.base_url}/embeddings",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
@@ -1,12 +1,13 @@
 """Ollama embedding model provider."""
 
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from esperanto.providers.embedding.base import EmbeddingModel, Model
 from esperanto.utils import validate_and_decode_embedding
+from esperanto.utils.timeout import TimeoutValue
 
 
 class OllamaEmbeddingModel(EmbeddingModel):
@@ -46,11 +47,19 @@ class OllamaEmbeddingModel(EmbeddingModel):
         # Use base class implementation which handles filtering of unsupported features
         return super()._get_api_kwargs()
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
                      Supports: truncate, dimensions, keep_alive, options
 
@@ -86,7 +95,8 @@ class OllamaEmbeddingModel(EmbeddingModel):
             response = self.client.post(
                 f"{self.base_url}/api/embed",
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -98,11 +108,19 @@ class OllamaEmbeddingModel(EmbeddingModel):
         except Exception as e:
             raise RuntimeError(f"Failed to get embeddings: {str(e)}") from e
 
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts asynchronously.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
                      Supports: truncate, dimensions, keep_alive, options
 
@@ -138,7 +156,8 @@ class OllamaEmbeddingModel(EmbeddingModel):
             response = await self.async_client.post(
                 f"{self.base_url}/api/embed",
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -8,6 +8,7 @@ import httpx
 from esperanto.common_types import Model
 from esperanto.utils import validate_and_decode_embedding
 from esperanto.utils.logging import logger
+from esperanto.utils.timeout import TimeoutValue
 
 from .base import EmbeddingModel
 
@@ -182,11 +183,19 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel):
         """Get the provider name."""
         return "openai-compatible"
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts using OpenAI-compatible Embedding API.
 
         Args:
             texts: List of texts to create embeddings for
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -209,7 +218,8 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel):
 
             # Generate embeddings
             response = self.client.post(
-                f"{self.base_url}/embeddings", headers=self._get_headers(), json=payload
+                f"{self.base_url}/embeddings", headers=self._get_headers(), json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -224,11 +234,19 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel):
         except Exception as e:
             raise RuntimeError(f"Failed to generate embeddings: {str(e)}") from e
 
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts using OpenAI-compatible Embedding API asynchronously.
 
         Args:
             texts: List of texts to create embeddings for
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -251,7 +269,8 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel):
 
             # Generate embeddings
             response = await self.async_client.post(
-                f"{self.base_url}/embeddings", headers=self._get_headers(), json=payload
+                f"{self.base_url}/embeddings", headers=self._get_headers(), json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
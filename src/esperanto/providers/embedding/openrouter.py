@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 from esperanto.common_types import Model
 from esperanto.providers.embedding.openai import OpenAIEmbeddingModel
+from esperanto.utils.timeout import TimeoutValue
 
 
 @dataclass
@@ -59,11 +60,19 @@ class OpenRouterEmbeddingModel(OpenAIEmbeddingModel):
                 error_message = f"HTTP {response.status_code}: {response.text}"
             raise RuntimeError(f"OpenRouter API error: {error_message}")
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -82,7 +91,8 @@ class OpenRouterEmbeddingModel(OpenAIEmbeddingModel):
         response = self.client.post(
             f"{self.base_url}/embeddings",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -90,11 +100,19 @@ class OpenRouterEmbeddingModel(OpenAIEmbeddingModel):
         response_data = response.json()
         return [[float(value) for value in data["embedding"]] for data in response_data["data"]]
 
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts asynchronously.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -113,7 +131,8 @@ class OpenRouterEmbeddingModel(OpenAIEmbeddingModel):
         response = await self.async_client.post(
             f"{self.base_url}/embeddings",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -1,12 +1,12 @@
 """Google Vertex AI embedding model provider."""
 import os
-import subprocess
-import time
 from typing import Any, Dict, List, Optional
 
 import httpx
 
 from esperanto.providers.embedding.base import EmbeddingModel, Model
+from esperanto.utils.google_auth import google_credentials
+from esperanto.utils.timeout import TimeoutValue
 
 
 class VertexEmbeddingModel(EmbeddingModel):
@@ -30,38 +30,17 @@ class VertexEmbeddingModel(EmbeddingModel):
         # Initialize HTTP clients with configurable timeout
         self._create_http_clients()
         
-        # Cache for access token
-        self._access_token: Optional[str] = None
-        self._token_expiry: float = 0
-        
         # Update config with model_name if provided
         if "model_name" in kwargs:
             self._config["model_name"] = kwargs["model_name"]
 
     def _get_access_token(self) -> str:
-        """Get OAuth 2.0 access token for Google Cloud APIs."""
-        current_time = time.time()
-        
-        # Check if token is still valid (with 5-minute buffer)
-        if self._access_token and current_time < (self._token_expiry - 300):
-            return self._access_token
-            
-        try:
-            # Use gcloud to get access token
-            result = subprocess.run(
-                ["gcloud", "auth", "application-default", "print-access-token"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            self._access_token = result.stdout.strip()
-            # Tokens typically expire in 1 hour
-            self._token_expiry = current_time + 3600
-            return self._access_token
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(
-                f"Failed to get access token. Make sure you're authenticated with 'gcloud auth application-default login': {e}"
-            )
+        """Get OAuth 2.0 access token for Google Cloud APIs via the gcloud CLI."""
+        return google_credentials.access_token().token()
+
+    async def _aget_access_token(self) -> str:
+        """Get OAuth 2.0 access token without blocking the event loop."""
+        return await google_credentials.access_token().atoken()
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for Vertex AI API requests."""
@@ -70,6 +49,13 @@ class VertexEmbeddingModel(EmbeddingModel):
             "Content-Type": "application/json",
         }
 
+    async def _aget_headers(self) -> Dict[str, str]:
+        """Get headers for Vertex AI API requests from async code."""
+        return {
+            "Authorization": f"Bearer {await self._aget_access_token()}",
+            "Content-Type": "application/json",
+        }
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle HTTP error responses."""
         if response.status_code >= 400:
@@ -90,11 +76,19 @@ class VertexEmbeddingModel(EmbeddingModel):
         # Use base class implementation which handles filtering of unsupported features
         return super()._get_api_kwargs()
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -118,7 +112,8 @@ class VertexEmbeddingModel(EmbeddingModel):
             response = self.client.post(
                 f"{self.base_url}/{model_path}:predict",
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
             
@@ -129,11 +124,19 @@ class VertexEmbeddingModel(EmbeddingModel):
         
         return results
 
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts asynchronously.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -156,8 +159,9 @@ class VertexEmbeddingModel(EmbeddingModel):
             # Make async HTTP request
             response = await self.async_client.post(
                 f"{self.base_url}/{model_path}:predict",
-                headers=self._get_headers(),
-                json=payload
+                headers=await self._aget_headers(),
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
             
@@ -1,12 +1,13 @@
 """Voyage AI embedding model provider."""
 
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import httpx
 
 from esperanto.providers.embedding.base import EmbeddingModel, Model
 from esperanto.utils import validate_and_decode_embedding
+from esperanto.utils.timeout import TimeoutValue
 
 
 class VoyageEmbeddingModel(EmbeddingModel):
@@ -54,11 +55,19 @@ class VoyageEmbeddingModel(EmbeddingModel):
     # Voyage doesn't support advanced features, so we can use the base implementation
     # which will automatically filter them out
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -79,7 +88,8 @@ class VoyageEmbeddingModel(EmbeddingModel):
         response = self.client.post(
             f"{self.base_url}/embeddings",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
@@ -90,11 +100,19 @@ class VoyageEmbeddingModel(EmbeddingModel):
             results.append(validate_and_decode_embedding(idx, raw))
         return results
 
-    async def aembed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    async def aembed(
+        self,
+        texts: List[str],
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> List[List[float]]:
         """Create embeddings for the given texts asynchronously.
 
         Args:
             texts: List of texts to create embeddings for.
+            timeout, deadline: See ``EmbeddingModel.embed``.
             **kwargs: Additional arguments to pass to the embedding API.
 
         Returns:
@@ -115,7 +133,8 @@ class VoyageEmbeddingModel(EmbeddingModel):
         response = await self.async_client.post(
             f"{self.base_url}/embeddings",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
@@ -6,6 +6,7 @@ import os
 import time
 import uuid
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -32,10 +33,13 @@ from esperanto.common_types import (
     ToolCall,
     Usage,
 )
+from esperanto.common_types.tool_cache import tool_cache
 from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
-from esperanto.providers.llm.base import LanguageModel
+from esperanto.providers.llm.base import LanguageModel, RequestTemplate
+from esperanto.utils import json_codec
+from esperanto.utils.timeout import TimeoutValue
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +47,15 @@ if TYPE_CHECKING:
     from langchain_anthropic import ChatAnthropic
 
 
+def _tool_to_anthropic(tool: Tool) -> Dict[str, Any]:
+    """Convert a single Esperanto tool to Anthropic format."""
+    return {
+        "name": tool.function.name,
+        "description": tool.function.description,
+        "input_schema": tool.function.parameters,
+    }
+
+
 @dataclass
 class AnthropicLanguageModel(LanguageModel):
     """Anthropic language model implementation."""
@@ -94,14 +107,7 @@ class AnthropicLanguageModel(LanguageModel):
         """
         if not tools:
             return None
-        return [
-            {
-                "name": tool.function.name,
-                "description": tool.function.description,
-                "input_schema": tool.function.parameters,
-            }
-            for tool in tools
-        ]
+        return [tool_cache.get(tool, "anthropic", _tool_to_anthropic) for tool in tools]
 
     def _convert_tool_choice_to_anthropic(
         self,
@@ -320,12 +326,12 @@ class AnthropicLanguageModel(LanguageModel):
         else:
             finish_reason = stop_reason
 
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=response_data.get("id", str(uuid.uuid4())),
             choices=[
-                Choice(
+                Choice._construct(
                     index=0,
-                    message=Message(
+                    message=Message._construct(
                         content=content_text,
                         role="assistant",
                         tool_calls=tool_calls if tool_calls else None,
@@ -336,7 +342,7 @@ class AnthropicLanguageModel(LanguageModel):
             created=created,
             model=response_data.get("model", self.get_model_name()),
             provider=self.provider,
-            usage=Usage(
+            usage=Usage._construct(
                 completion_tokens=response_data.get("usage", {}).get("output_tokens", 0),
                 prompt_tokens=response_data.get("usage", {}).get("input_tokens", 0),
                 total_tokens=response_data.get("usage", {}).get("input_tokens", 0) + response_data.get("usage", {}).get("output_tokens", 0),
@@ -355,7 +361,7 @@ class AnthropicLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         break
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -371,7 +377,7 @@ class AnthropicLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         return
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -394,12 +400,12 @@ class AnthropicLanguageModel(LanguageModel):
             if block_type == "tool_use":
                 # Start of a tool call - emit the tool call info
                 block_index = event_data.get("index", 0)
-                return ChatCompletionChunk(
+                return ChatCompletionChunk._construct(
                     id=str(uuid.uuid4()),
                     choices=[
-                        StreamChoice(
+                        StreamChoice._construct(
                             index=0,
-                            delta=DeltaMessage(
+                            delta=DeltaMessage._construct(
                                 content=None,
                                 role="assistant",
                                 tool_calls=[ToolCall(
@@ -427,12 +433,12 @@ class AnthropicLanguageModel(LanguageModel):
             if delta_type == "text_delta" or "text" in delta:
                 # Text content delta
                 text_content = delta.get("text", "")
-                return ChatCompletionChunk(
+                return ChatCompletionChunk._construct(
                     id=str(uuid.uuid4()),
                     choices=[
-                        StreamChoice(
+                        StreamChoice._construct(
                             index=0,
-                            delta=DeltaMessage(
+                            delta=DeltaMessage._construct(
                                 content=text_content,
                                 role="assistant",
                             ),
@@ -452,12 +458,12 @@ class AnthropicLanguageModel(LanguageModel):
                 # We need to include all required fields for ToolCall validation.
                 # Use empty id/name for delta updates - these are only valid as
                 # incremental updates to be accumulated by the client.
-                return ChatCompletionChunk(
+                return ChatCompletionChunk._construct(
                     id=str(uuid.uuid4()),
                     choices=[
-                        StreamChoice(
+                        StreamChoice._construct(
                             index=0,
-                            delta=DeltaMessage(
+                            delta=DeltaMessage._construct(
                                 content=None,
                                 role="assistant",
                                 tool_calls=[ToolCall(
@@ -489,12 +495,12 @@ class AnthropicLanguageModel(LanguageModel):
             else:
                 finish_reason = stop_reason
 
-            return ChatCompletionChunk(
+            return ChatCompletionChunk._construct(
                 id=str(uuid.uuid4()),
                 choices=[
-                    StreamChoice(
+                    StreamChoice._construct(
                         index=0,
-                        delta=DeltaMessage(
+                        delta=DeltaMessage._construct(
                             content=None,
                             role="assistant",
                         ),
@@ -553,6 +559,52 @@ class AnthropicLanguageModel(LanguageModel):
         """Get the provider name."""
         return "anthropic"
 
+    def _get_sampling_params(
+        self,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Resolve max_tokens, temperature and top_p for a request.
+
+        Args:
+            max_tokens: Per-call override for max_tokens.
+            temperature: Per-call override for temperature.
+            top_p: Per-call override for top_p.
+
+        Returns:
+            Sampling parameters for the Anthropic request payload.
+        """
+        effective_max_tokens = max_tokens if max_tokens is not None else self.max_tokens
+        effective_temperature = temperature if temperature is not None else self.temperature
+        effective_top_p = top_p if top_p is not None else self.top_p
+
+        params: Dict[str, Any] = {"max_tokens": effective_max_tokens or 1024}
+
+        # Anthropic does not allow both temperature and top_p to be set
+        # Prioritize temperature if both are provided
+        if effective_temperature is not None:
+            if effective_top_p is not None:
+                logger.debug(
+                    "Dropping top_p — Anthropic recommends setting only temperature OR top_p, not both."
+                )
+            params["temperature"] = max(0.0, min(1.0, float(effective_temperature)))
+        elif effective_top_p is not None:
+            params["top_p"] = float(effective_top_p)
+
+        return params
+
+    def _build_request_template(self) -> RequestTemplate:
+        """Precompute headers, default sampling params and instance tools."""
+        tools = self._convert_tools_to_anthropic(self.tools)
+        return RequestTemplate(
+            model_name=self.get_model_name(),
+            url=f"{self.base_url}/messages",
+            headers=MappingProxyType(self._get_headers()),
+            params=MappingProxyType(self._get_sampling_params()),
+            tools=tuple(tools) if tools else None,
+        )
+
     def _create_request_payload(
         self,
         messages: List[Dict[str, Any]],
@@ -580,37 +632,32 @@ class AnthropicLanguageModel(LanguageModel):
             Request payload dict for Anthropic API.
         """
         system_message, formatted_messages = self._prepare_messages(messages)
+        template = self._get_request_template()
 
-        effective_max_tokens = max_tokens if max_tokens is not None else self.max_tokens
-        effective_temperature = temperature if temperature is not None else self.temperature
-        effective_top_p = top_p if top_p is not None else self.top_p
+        if max_tokens is None and temperature is None and top_p is None:
+            sampling_params = template.params
+        else:
+            sampling_params = self._get_sampling_params(max_tokens, temperature, top_p)
 
         payload: Dict[str, Any] = {
-            "model": self.get_model_name(),
+            "model": template.model_name,
             "messages": formatted_messages,
-            "max_tokens": effective_max_tokens or 1024,
+            **sampling_params,
         }
 
         if system_message:
             payload["system"] = system_message
 
-        # Anthropic does not allow both temperature and top_p to be set
-        # Prioritize temperature if both are provided
-        if effective_temperature is not None:
-            if effective_top_p is not None:
-                logger.debug(
-                    "Dropping top_p — Anthropic recommends setting only temperature OR top_p, not both."
-                )
-            payload["temperature"] = max(0.0, min(1.0, float(effective_temperature)))
-        elif effective_top_p is not None:
-            payload["top_p"] = float(effective_top_p)
-
         if stream:
             payload["stream"] = True
 
         # Add tools if provided
         if tools:
-            payload["tools"] = self._convert_tools_to_anthropic(tools)
+            payload["tools"] = (
+                list(template.tools or ())
+                if tools is self.tools
+                else self._convert_tools_to_anthropic(tools)
+            )
 
         # Add tool_choice if provided
         anthropic_tool_choice = self._convert_tool_choice_to_anthropic(
@@ -632,6 +679,8 @@ class AnthropicLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -665,22 +714,15 @@ class AnthropicLanguageModel(LanguageModel):
                 to use ``top_p`` exclusively, construct the model without
                 ``temperature`` (or set ``model.temperature = None``) before
                 calling chat_complete.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         should_stream = stream if stream is not None else self.streaming
 
-        # Resolve per-call overrides
-        effective_max_tokens = self._resolve_max_tokens(max_tokens)
-        effective_temperature = self._resolve_temperature(temperature)
-        effective_top_p = self._resolve_top_p(top_p)
-
         # Resolve tool configuration
         resolved_tools = self._resolve_tools(tools)
         resolved_tool_choice = self._resolve_tool_choice(tool_choice)
@@ -692,16 +734,18 @@ class AnthropicLanguageModel(LanguageModel):
             tools=resolved_tools,
             tool_choice=resolved_tool_choice,
             parallel_tool_calls=resolved_parallel,
-            max_tokens=effective_max_tokens,
-            temperature=effective_temperature,
-            top_p=effective_top_p,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
         )
 
         # Make HTTP request
+        template = self._get_request_template()
         response = self.client.post(
-            f"{self.base_url}/messages",
-            headers=self._get_headers(),
-            json=payload
+            template.url,
+            headers=template.headers,
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -711,7 +755,7 @@ class AnthropicLanguageModel(LanguageModel):
                     chunk = self._normalize_stream_event(event_data)
                     if chunk:
                         yield chunk
-            return generate()
+            return self._validate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -735,6 +779,8 @@ class AnthropicLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -768,22 +814,15 @@ class AnthropicLanguageModel(LanguageModel):
                 to use ``top_p`` exclusively, construct the model without
                 ``temperature`` (or set ``model.temperature = None``) before
                 calling chat_complete.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         should_stream = stream if stream is not None else self.streaming
 
-        # Resolve per-call overrides
-        effective_max_tokens = self._resolve_max_tokens(max_tokens)
-        effective_temperature = self._resolve_temperature(temperature)
-        effective_top_p = self._resolve_top_p(top_p)
-
         # Resolve tool configuration
         resolved_tools = self._resolve_tools(tools)
         resolved_tool_choice = self._resolve_tool_choice(tool_choice)
@@ -795,16 +834,18 @@ class AnthropicLanguageModel(LanguageModel):
             tools=resolved_tools,
             tool_choice=resolved_tool_choice,
             parallel_tool_calls=resolved_parallel,
-            max_tokens=effective_max_tokens,
-            temperature=effective_temperature,
-            top_p=effective_top_p,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
         )
 
         # Make async HTTP request
+        template = self._get_request_template()
         response = await self.async_client.post(
-            f"{self.base_url}/messages",
-            headers=self._get_headers(),
-            json=payload
+            template.url,
+            headers=template.headers,
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -814,7 +855,7 @@ class AnthropicLanguageModel(LanguageModel):
                     chunk = self._normalize_stream_event(event_data)
                     if chunk:
                         yield chunk
-            return generate()
+            return self._avalidate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
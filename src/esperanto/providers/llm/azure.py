@@ -29,15 +29,34 @@ from esperanto.common_types import (
     ToolCall,
     Usage,
 )
+from esperanto.common_types.tool_cache import tool_cache
 from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
 from esperanto.providers.llm.base import LanguageModel
+from esperanto.utils import json_codec
+from esperanto.utils.timeout import TimeoutValue
 
 if TYPE_CHECKING:
     from langchain_openai import AzureChatOpenAI
 
 
+def _tool_to_openai(tool: Tool) -> Dict[str, Any]:
+    """Convert a single Esperanto tool to OpenAI format."""
+    tool_dict: Dict[str, Any] = {
+        "type": tool.type,
+        "function": {
+            "name": tool.function.name,
+            "description": tool.function.description,
+            "parameters": tool.function.parameters,
+        },
+    }
+    # Add strict mode if specified
+    if tool.function.strict is not None:
+        tool_dict["function"]["strict"] = tool.function.strict
+    return tool_dict
+
+
 class AzureLanguageModel(LanguageModel):
     """Azure OpenAI language model implementation using direct HTTP."""
 
@@ -140,21 +159,7 @@ class AzureLanguageModel(LanguageModel):
         """
         if not tools:
             return None
-        result = []
-        for tool in tools:
-            tool_dict: Dict[str, Any] = {
-                "type": tool.type,
-                "function": {
-                    "name": tool.function.name,
-                    "description": tool.function.description,
-                    "parameters": tool.function.parameters,
-                },
-            }
-            # Add strict mode if specified
-            if tool.function.strict is not None:
-                tool_dict["function"]["strict"] = tool.function.strict
-            result.append(tool_dict)
-        return result
+        return [tool_cache.get(tool, "openai", _tool_to_openai) for tool in tools]
 
     def _normalize_response(self, response_data: Dict[str, Any]) -> ChatCompletion:
         """Normalize Azure response to our format."""
@@ -178,9 +183,9 @@ class AzureLanguageModel(LanguageModel):
                 ]
 
             choices.append(
-                Choice(
+                Choice._construct(
                     index=choice["index"],
-                    message=Message(
+                    message=Message._construct(
                         content=message_data.get("content") or "",
                         role=message_data.get("role", "assistant"),
                         tool_calls=tool_calls,
@@ -189,13 +194,13 @@ class AzureLanguageModel(LanguageModel):
                 )
             )
 
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=response_data["id"],
             choices=choices,
             created=response_data["created"],
             model=response_data["model"],
             provider=self.provider,
-            usage=Usage(
+            usage=Usage._construct(
                 completion_tokens=response_data.get("usage", {}).get("completion_tokens", 0),
                 prompt_tokens=response_data.get("usage", {}).get("prompt_tokens", 0),
                 total_tokens=response_data.get("usage", {}).get("total_tokens", 0),
@@ -204,12 +209,12 @@ class AzureLanguageModel(LanguageModel):
 
     def _normalize_chunk(self, chunk_data: Dict[str, Any]) -> ChatCompletionChunk:
         """Normalize Azure stream chunk to our format."""
-        return ChatCompletionChunk(
+        return ChatCompletionChunk._construct(
             id=chunk_data["id"],
             choices=[
-                StreamChoice(
+                StreamChoice._construct(
                     index=choice["index"],
-                    delta=DeltaMessage(
+                    delta=DeltaMessage._construct(
                         content=choice.get("delta", {}).get("content", ""),
                         role=choice.get("delta", {}).get("role", "assistant"),
                         function_call=choice.get("delta", {}).get("function_call"),
@@ -235,7 +240,7 @@ class AzureLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         break
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -251,7 +256,7 @@ class AzureLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         return
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -332,7 +337,8 @@ class AzureLanguageModel(LanguageModel):
         return {k: v for k, v in effective_kwargs.items() if v is not None}
 
     def _chat_complete_streaming(
-        self, messages: List[Dict[str, Any]], api_kwargs: Dict[str, Any]
+        self, messages: List[Dict[str, Any]], api_kwargs: Dict[str, Any],
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
     ) -> Generator[ChatCompletionChunk, None, None]:
         """Handle streaming chat completion."""
         url = self._build_url("chat/completions")
@@ -341,6 +347,7 @@ class AzureLanguageModel(LanguageModel):
             url,
             headers=self._get_headers(),
             json={"messages": messages, "stream": True, **api_kwargs},
+            timeout=timeout,
         ) as response:
             self._handle_error(response)
             for chunk_data in self._parse_sse_stream(response):
@@ -365,6 +372,8 @@ class AzureLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -388,15 +397,13 @@ class AzureLanguageModel(LanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         call_override_kwargs: Dict[str, Any] = {}
         if stream is not None:
             call_override_kwargs["stream"] = stream
@@ -428,7 +435,13 @@ class AzureLanguageModel(LanguageModel):
 
         if effective_stream_setting:
             # Return streaming generator
-            return self._chat_complete_streaming(messages, api_kwargs)
+            return self._validate_stream(
+                self._chat_complete_streaming(
+                    messages, api_kwargs, timeout=self._get_request_timeout(timeout, deadline)
+                ),
+                validate_tool_calls,
+                resolved_tools,
+            )
         else:
             # Non-streaming request
             url = self._build_url("chat/completions")
@@ -436,6 +449,7 @@ class AzureLanguageModel(LanguageModel):
                 url,
                 headers=self._get_headers(),
                 json={"messages": messages, "stream": False, **api_kwargs},
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
             result = self._normalize_response(response.json())
@@ -449,7 +463,8 @@ class AzureLanguageModel(LanguageModel):
             return result
 
     async def _achat_complete_streaming(
-        self, messages: List[Dict[str, Any]], api_kwargs: Dict[str, Any]
+        self, messages: List[Dict[str, Any]], api_kwargs: Dict[str, Any],
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
     ) -> AsyncGenerator[ChatCompletionChunk, None]:
         """Handle async streaming chat completion."""
         url = self._build_url("chat/completions")
@@ -458,6 +473,7 @@ class AzureLanguageModel(LanguageModel):
             url,
             headers=self._get_headers(),
             json={"messages": messages, "stream": True, **api_kwargs},
+            timeout=timeout,
         ) as response:
             self._handle_error(response)
             async for chunk_data in self._parse_sse_stream_async(response):
@@ -478,6 +494,8 @@ class AzureLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -501,15 +519,13 @@ class AzureLanguageModel(LanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         call_override_kwargs: Dict[str, Any] = {}
         if stream is not None:
             call_override_kwargs["stream"] = stream
@@ -541,7 +557,13 @@ class AzureLanguageModel(LanguageModel):
 
         if effective_stream_setting:
             # Return async streaming generator
-            return self._achat_complete_streaming(messages, api_kwargs)
+            return self._avalidate_stream(
+                self._achat_complete_streaming(
+                    messages, api_kwargs, timeout=self._get_request_timeout(timeout, deadline)
+                ),
+                validate_tool_calls,
+                resolved_tools,
+            )
         else:
             # Non-streaming async request
             url = self._build_url("chat/completions")
@@ -549,6 +571,7 @@ class AzureLanguageModel(LanguageModel):
                 url,
                 headers=self._get_headers(),
                 json={"messages": messages, "stream": False, **api_kwargs},
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
             result = self._normalize_response(response.json())
@@ -3,10 +3,55 @@
 import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Union
-
-from esperanto.common_types import ChatCompletion, ChatCompletionChunk, Model, Tool
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from esperanto.common_types import (
+    ChatCompletion,
+    ChatCompletionAccumulator,
+    ChatCompletionChunk,
+    Model,
+    Tool,
+)
 from esperanto.utils.connect import HttpConnectionMixin
+from esperanto.utils.instrumentation import instrument_methods
+from esperanto.utils.timeout import TimeoutValue
+
+
+@dataclass(frozen=True)
+class RequestTemplate:
+    """Per-instance parts of a chat completion request, computed once.
+
+    Providers build a template from their configuration the first time a
+    request is made and reuse it until the configuration changes, so each call
+    only merges its per-call overrides and messages.
+
+    Attributes:
+        model_name: Resolved model name sent with the request.
+        url: Endpoint URL for chat completion requests.
+        headers: Request headers, or None when they must be built per call
+            (for example when they carry a refreshing access token).
+        params: Request parameters derived from instance configuration.
+        tools: Instance tools already converted to the provider format.
+        extras: Provider-specific precomputed values.
+    """
+
+    model_name: str
+    url: str
+    headers: Optional[Mapping[str, str]] = None
+    params: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    tools: Optional[Tuple[Dict[str, Any], ...]] = None
+    extras: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
 
 
 @dataclass
@@ -62,6 +107,11 @@ class LanguageModel(HttpConnectionMixin, ABC):
         """
         pass
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Route provider calls through the metrics and tracing hooks."""
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, ("chat_complete", "achat_complete"))
+
     def __post_init__(self):
         """Initialize configuration after dataclass initialization."""
         # Initialize config with default values
@@ -86,6 +136,45 @@ class LanguageModel(HttpConnectionMixin, ABC):
                 if hasattr(self, key):
                     setattr(self, key, value)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any change to public configuration invalidates the request template
+        if not name.startswith("_"):
+            self.__dict__.pop("_request_template", None)
+        super().__setattr__(name, value)
+
+    def _get_request_template(self) -> RequestTemplate:
+        """Get the cached request template, building it on first use.
+
+        The template is rebuilt when a public attribute is reassigned or the
+        resolved model name changes. In-place mutation of configuration
+        containers (e.g. appending to ``tools``) is not tracked; call
+        ``_invalidate_request_template`` after such changes.
+
+        Returns:
+            RequestTemplate: The request template for the current configuration.
+        """
+        template = self.__dict__.get("_request_template")
+        if template is None or template.model_name != self.get_model_name():
+            template = self._build_request_template()
+            self.__dict__["_request_template"] = template
+        return template
+
+    def _invalidate_request_template(self) -> None:
+        """Drop the cached request template so the next call rebuilds it."""
+        self.__dict__.pop("_request_template", None)
+
+    def _build_request_template(self) -> RequestTemplate:
+        """Build the request template for the current configuration.
+
+        Providers that precompute their requests override this method.
+
+        Raises:
+            NotImplementedError: If the provider does not use request templates.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support request templates"
+        )
+
     def _clean_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Remove None values from config dictionary."""
         return {k: v for k, v in config.items() if v is not None}
@@ -187,30 +276,37 @@ class LanguageModel(HttpConnectionMixin, ABC):
             return top_p
         return self.top_p
 
-    def _warn_if_validate_with_streaming(
+    def _validate_stream(
         self,
+        chunks: Generator[ChatCompletionChunk, None, None],
         validate_tool_calls: bool,
-        stream: Optional[bool],
-    ) -> None:
-        """Emit a warning if validate_tool_calls is used with streaming.
+        tools: Optional[List[Tool]],
+    ) -> Generator[ChatCompletionChunk, None, None]:
+        """Validate the tool calls of a stream once it ends, if requested.
 
-        Tool call validation requires the complete response to validate arguments
-        against the tool schema. With streaming, we receive partial chunks and
-        cannot validate until all chunks are collected. This method warns users
-        that their validate_tool_calls flag will be ignored.
+        Tool call arguments are only complete after the last chunk, so the
+        chunks are passed through a ChatCompletionAccumulator, which raises
+        ToolCallValidationError when the stream is exhausted.
 
         Args:
+            chunks: The normalized chunks of the stream.
             validate_tool_calls: Whether validation was requested.
-            stream: The stream parameter passed to chat_complete.
+            tools: The tools of the request.
         """
-        should_stream = stream if stream is not None else self.streaming
-        if validate_tool_calls and should_stream:
-            warnings.warn(
-                "validate_tool_calls=True is ignored when streaming is enabled. "
-                "Tool call validation requires the complete response.",
-                UserWarning,
-                stacklevel=3,
-            )
+        if not (validate_tool_calls and tools):
+            return chunks
+        return ChatCompletionAccumulator(self.provider, tools).iter(chunks)
+
+    def _avalidate_stream(
+        self,
+        chunks: AsyncGenerator[ChatCompletionChunk, None],
+        validate_tool_calls: bool,
+        tools: Optional[List[Tool]],
+    ) -> AsyncGenerator[ChatCompletionChunk, None]:
+        """Async version of ``_validate_stream``."""
+        if not (validate_tool_calls and tools):
+            return chunks
+        return ChatCompletionAccumulator(self.provider, tools).aiter(chunks)
 
     @abstractmethod
     def chat_complete(
@@ -224,6 +320,8 @@ class LanguageModel(HttpConnectionMixin, ABC):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -243,10 +341,17 @@ class LanguageModel(HttpConnectionMixin, ABC):
                 tool call per response.
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
-                failure. Requires jsonschema package.
+                failure, after the last chunk when streaming. Requires jsonschema
+                package.
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
@@ -267,6 +372,8 @@ class LanguageModel(HttpConnectionMixin, ABC):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -286,10 +393,17 @@ class LanguageModel(HttpConnectionMixin, ABC):
                 tool call per response.
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
-                failure. Requires jsonschema package.
+                failure, after the last chunk when streaming. Requires jsonschema
+                package.
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
@@ -0,0 +1,330 @@
+"""Failover language model with hedged requests."""
+
+import asyncio
+import concurrent.futures
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Tuple, Union
+
+from esperanto.common_types import ChatCompletion, ChatCompletionChunk, Model, Tool
+from esperanto.common_types.exceptions import AllProvidersFailedError
+from esperanto.providers.llm.base import LanguageModel
+from esperanto.utils.logging import logger
+from esperanto.utils.timeout import TimeoutValue
+
+
+@dataclass
+class FailoverLanguageModel(LanguageModel):
+    """Composite language model that fails over across an ordered list of models.
+
+    Requests go to the first model. If it raises (including ``CircuitOpenError``
+    from an open circuit breaker), the next model is tried, and so on until one
+    succeeds. When ``hedge_delay`` is set, a non-streaming call
+    that has not completed within ``hedge_delay`` seconds triggers a backup
+    request to the next model, and the first successful response wins.
+
+    Every provider normalizes to ``ChatCompletion``, so callers see the same
+    response type regardless of which model served the request. The
+    ``provider`` field of the response names the model that actually answered.
+
+    Streaming calls use sequential failover only: once chunks have been handed
+    to the caller the stream cannot be transparently switched to another model.
+
+    Example:
+        >>> model = FailoverLanguageModel(
+        ...     language_models=[
+        ...         AIFactory.create_language("openai", "gpt-4o-mini"),
+        ...         AIFactory.create_language("anthropic", "claude-3-5-haiku-latest"),
+        ...     ],
+        ...     hedge_delay=2.0,
+        ... )
+        >>> response = model.chat_complete(messages)
+
+    Attributes:
+        language_models: Ordered list of language models, primary first.
+        hedge_delay: Seconds to wait for an in-flight request before firing a
+            backup request. None disables hedging (pure sequential failover).
+        max_hedges: Maximum number of backup requests fired by the hedge timer
+            for a single call. Failures always fail over regardless of this limit.
+    """
+
+    language_models: List[LanguageModel] = field(default_factory=list)
+    hedge_delay: Optional[float] = None
+    max_hedges: int = 1
+
+    def __post_init__(self):
+        """Validate the failover chain."""
+        super().__post_init__()
+
+        if not self.language_models:
+            raise ValueError("FailoverLanguageModel requires at least one model")
+        if self.hedge_delay is not None and self.hedge_delay < 0:
+            raise ValueError(
+                f"hedge_delay must be non-negative, got {self.hedge_delay}"
+            )
+        if self.max_hedges < 0:
+            raise ValueError(f"max_hedges must be non-negative, got {self.max_hedges}")
+
+    @property
+    def primary(self) -> LanguageModel:
+        """The first model in the failover chain."""
+        return self.language_models[0]
+
+    def _build_call_kwargs(
+        self,
+        stream: Optional[bool],
+        tools: Optional[List[Tool]],
+        tool_choice: Optional[Union[str, Dict[str, Any]]],
+        parallel_tool_calls: Optional[bool],
+        validate_tool_calls: bool,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        top_p: Optional[float],
+        timeout: Optional[TimeoutValue],
+        deadline: Optional[float],
+    ) -> Dict[str, Any]:
+        """Collect per-call arguments forwarded unchanged to each model."""
+        return {
+            "stream": stream if stream is not None else self.streaming,
+            "tools": tools,
+            "tool_choice": tool_choice,
+            "parallel_tool_calls": parallel_tool_calls,
+            "validate_tool_calls": validate_tool_calls,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "timeout": timeout,
+            "deadline": deadline,
+        }
+
+    def _use_hedging(self, call_kwargs: Dict[str, Any]) -> bool:
+        """Whether this call should fire hedged backup requests."""
+        return (
+            self.hedge_delay is not None
+            and len(self.language_models) > 1
+            and not call_kwargs["stream"]
+        )
+
+    def _log_failure(self, model: LanguageModel, error: BaseException) -> None:
+        logger.debug(
+            f"Failover: {model.provider}/{model.get_model_name()} failed: {error}"
+        )
+
+    def chat_complete(
+        self,
+        messages: List[Dict[str, Any]],
+        stream: Optional[bool] = None,
+        tools: Optional[List[Tool]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        parallel_tool_calls: Optional[bool] = None,
+        validate_tool_calls: bool = False,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+    ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
+        """Send a chat completion request, failing over across models.
+
+        Accepts the same arguments as ``LanguageModel.chat_complete`` and
+        forwards them to each model in the chain. ``timeout`` and ``deadline``
+        apply to each attempt individually.
+
+        Raises:
+            AllProvidersFailedError: If every model in the chain failed.
+        """
+        call_kwargs = self._build_call_kwargs(
+            stream, tools, tool_choice, parallel_tool_calls,
+            validate_tool_calls, max_tokens, temperature, top_p, timeout, deadline,
+        )
+        if self._use_hedging(call_kwargs):
+            return self._hedged_chat_complete(messages, call_kwargs)
+
+        errors: List[Tuple[str, BaseException]] = []
+        for model in self.language_models:
+            try:
+                return model.chat_complete(messages, **call_kwargs)
+            except Exception as e:
+                self._log_failure(model, e)
+                errors.append((model.provider, e))
+        raise AllProvidersFailedError(errors)
+
+    def _hedged_chat_complete(
+        self, messages: List[Dict[str, Any]], call_kwargs: Dict[str, Any]
+    ) -> ChatCompletion:
+        """Run a sync chat completion with hedged backup requests on threads.
+
+        Losing requests are abandoned rather than interrupted; their threads
+        finish in the background and their results are discarded. Each call
+        gets its own pool, so a request still hanging from an earlier call
+        never delays this one.
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.language_models),
+            thread_name_prefix="esperanto-hedge",
+        )
+        try:
+            return self._run_hedged(executor, messages, call_kwargs)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_hedged(
+        self,
+        executor: concurrent.futures.ThreadPoolExecutor,
+        messages: List[Dict[str, Any]],
+        call_kwargs: Dict[str, Any],
+    ) -> ChatCompletion:
+        remaining = iter(self.language_models)
+        in_flight: Dict[concurrent.futures.Future, LanguageModel] = {}
+        errors: List[Tuple[str, BaseException]] = []
+        hedges_left = self.max_hedges
+
+        def launch() -> bool:
+            model = next(remaining, None)
+            if model is None:
+                return False
+            future = executor.submit(model.chat_complete, messages, **call_kwargs)
+            in_flight[future] = model
+            return True
+
+        launch()
+        while in_flight:
+            timeout = self.hedge_delay if hedges_left > 0 else None
+            done, _ = concurrent.futures.wait(
+                in_flight, timeout=timeout,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            if not done:
+                # Hedge timer fired: fire a backup request alongside the others
+                hedges_left -= 1
+                if not launch():
+                    hedges_left = 0
+                continue
+
+            for future in done:
+                model = in_flight.pop(future)
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                self._log_failure(model, error)
+                errors.append((model.provider, error))
+                # Replace the failed request now instead of waiting on the others
+                launch()
+
+        raise AllProvidersFailedError(errors)
+
+    async def achat_complete(
+        self,
+        messages: List[Dict[str, Any]],
+        stream: Optional[bool] = None,
+        tools: Optional[List[Tool]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        parallel_tool_calls: Optional[bool] = None,
+        validate_tool_calls: bool = False,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+    ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
+        """Send an async chat completion request, failing over across models.
+
+        Accepts the same arguments as ``LanguageModel.achat_complete`` and
+        forwards them to each model in the chain. ``timeout`` and ``deadline``
+        apply to each attempt individually.
+
+        Raises:
+            AllProvidersFailedError: If every model in the chain failed.
+        """
+        call_kwargs = self._build_call_kwargs(
+            stream, tools, tool_choice, parallel_tool_calls,
+            validate_tool_calls, max_tokens, temperature, top_p, timeout, deadline,
+        )
+        if self._use_hedging(call_kwargs):
+            return await self._ahedged_chat_complete(messages, call_kwargs)
+
+        errors: List[Tuple[str, BaseException]] = []
+        for model in self.language_models:
+            try:
+                return await model.achat_complete(messages, **call_kwargs)
+            except Exception as e:
+                self._log_failure(model, e)
+                errors.append((model.provider, e))
+        raise AllProvidersFailedError(errors)
+
+    async def _ahedged_chat_complete(
+        self, messages: List[Dict[str, Any]], call_kwargs: Dict[str, Any]
+    ) -> ChatCompletion:
+        """Run an async chat completion with hedged backup requests.
+
+        Losing requests are cancelled as soon as a winner is found.
+        """
+        remaining = iter(self.language_models)
+        in_flight: Dict[asyncio.Task, LanguageModel] = {}
+        errors: List[Tuple[str, BaseException]] = []
+        hedges_left = self.max_hedges
+
+        def launch() -> bool:
+            model = next(remaining, None)
+            if model is None:
+                return False
+            task = asyncio.ensure_future(model.achat_complete(messages, **call_kwargs))
+            in_flight[task] = model
+            return True
+
+        launch()
+        try:
+            while in_flight:
+                timeout = self.hedge_delay if hedges_left > 0 else None
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Hedge timer fired: fire a backup request alongside the others
+                    hedges_left -= 1
+                    if not launch():
+                        hedges_left = 0
+                    continue
+
+                for task in done:
+                    model = in_flight.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    self._log_failure(model, error)
+                    errors.append((model.provider, error))
+                    # Replace the failed request now instead of waiting on the others
+                    launch()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        raise AllProvidersFailedError(errors)
+
+    def _get_models(self) -> List[Model]:
+        """List models available from the primary model's provider."""
+        return self.primary._get_models()
+
+    def _get_default_model(self) -> str:
+        """Get the primary model's name."""
+        return self.primary.get_model_name()
+
+    @property
+    def provider(self) -> str:
+        """Get the provider name."""
+        return "failover"
+
+    def to_langchain(self) -> Any:
+        """Convert to a LangChain chat model with fallbacks.
+
+        Returns the primary model's LangChain chat model wrapped with
+        ``with_fallbacks`` over the remaining models, preserving the failover
+        order. Hedging is not applied on the LangChain side.
+
+        Raises:
+            ImportError: If the LangChain integration of any model is not installed.
+        """
+        primary = self.primary.to_langchain()
+        fallbacks = [model.to_langchain() for model in self.language_models[1:]]
+        if not fallbacks:
+            return primary
+        return primary.with_fallbacks(fallbacks)
@@ -4,6 +4,7 @@ import json
 import os
 import time
 import uuid
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -30,15 +31,27 @@ from esperanto.common_types import (
     ToolCall,
     Usage,
 )
+from esperanto.common_types.tool_cache import tool_cache
 from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
-from esperanto.providers.llm.base import LanguageModel
+from esperanto.providers.llm.base import LanguageModel, RequestTemplate
+from esperanto.utils import json_codec
+from esperanto.utils.timeout import TimeoutValue
 
 if TYPE_CHECKING:
     pass  # Removed unused import
 
 
+def _tool_to_function_declaration(tool: Tool) -> Dict[str, Any]:
+    """Convert a single Esperanto tool to a Google function declaration."""
+    return {
+        "name": tool.function.name,
+        "description": tool.function.description,
+        "parameters": tool.function.parameters,
+    }
+
+
 class GoogleLanguageModel(LanguageModel):
     """Google GenAI language model implementation."""
 
@@ -278,6 +291,22 @@ class GoogleLanguageModel(LanguageModel):
 
         return config
 
+    def _build_request_template(self) -> RequestTemplate:
+        """Precompute endpoint URLs, generation config and instance tools."""
+        model_name = self.get_model_name()
+        model_url = f"{self.base_url}/models/{model_name}"
+        tools = self._convert_tools_to_google(self.tools)
+        return RequestTemplate(
+            model_name=model_name,
+            url=f"{model_url}:generateContent?key={self.api_key}",
+            headers=MappingProxyType(self._get_headers()),
+            params=MappingProxyType(self._create_generation_config()),
+            tools=tuple(tools) if tools else None,
+            extras=MappingProxyType(
+                {"stream_url": f"{model_url}:streamGenerateContent?alt=sse&key={self.api_key}"}
+            ),
+        )
+
     def _convert_tools_to_google(
         self, tools: Optional[List[Tool]]
     ) -> Optional[List[Dict[str, Any]]]:
@@ -296,11 +325,7 @@ class GoogleLanguageModel(LanguageModel):
             return None
         return [{
             "function_declarations": [
-                {
-                    "name": tool.function.name,
-                    "description": tool.function.description,
-                    "parameters": tool.function.parameters,
-                }
+                tool_cache.get(tool, "google", _tool_to_function_declaration)
                 for tool in tools
             ]
         }]
@@ -349,7 +374,7 @@ class GoogleLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         break
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -365,7 +390,7 @@ class GoogleLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         return
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -380,6 +405,8 @@ class GoogleLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -403,21 +430,16 @@ class GoogleLanguageModel(LanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         should_stream = stream if stream is not None else self.streaming
 
-        # Resolve per-call overrides
-        effective_max_tokens = self._resolve_max_tokens(max_tokens)
-        effective_temperature = self._resolve_temperature(temperature)
-        effective_top_p = self._resolve_top_p(top_p)
+        template = self._get_request_template()
 
         # Resolve tool configuration
         resolved_tools = self._resolve_tools(tools)
@@ -430,19 +452,28 @@ class GoogleLanguageModel(LanguageModel):
         # Prepare request payload
         payload: Dict[str, Any] = {
             "contents": formatted_messages,
-            "generationConfig": self._create_generation_config(
-                max_tokens=effective_max_tokens,
-                temperature=effective_temperature,
-                top_p=effective_top_p,
-            ),
         }
 
+        # Per-call overrides rebuild the generation config; otherwise reuse the template
+        if max_tokens is None and temperature is None and top_p is None:
+            payload["generationConfig"] = dict(template.params)
+        else:
+            payload["generationConfig"] = self._create_generation_config(
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+            )
+
         if system_instruction:
             payload["system_instruction"] = system_instruction
 
         # Add tools if provided
         if resolved_tools:
-            payload["tools"] = self._convert_tools_to_google(resolved_tools)
+            payload["tools"] = (
+                list(template.tools or ())
+                if tools is None
+                else self._convert_tools_to_google(resolved_tools)
+            )
 
         # Add tool_config if tool_choice is specified
         if resolved_tool_choice is not None:
@@ -450,19 +481,14 @@ class GoogleLanguageModel(LanguageModel):
             if tool_config:
                 payload["tool_config"] = tool_config
 
-        model_name = self.get_model_name()
-        if should_stream:
-            endpoint = "streamGenerateContent"
-            url = f"{self.base_url}/models/{model_name}:{endpoint}?alt=sse&key={self.api_key}"
-        else:
-            endpoint = "generateContent"
-            url = f"{self.base_url}/models/{model_name}:{endpoint}?key={self.api_key}"
+        url = template.extras["stream_url"] if should_stream else template.url
 
         # Make HTTP request
         response = self.client.post(
             url,
-            headers=self._get_headers(),
-            json=payload
+            headers=template.headers,
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -472,7 +498,7 @@ class GoogleLanguageModel(LanguageModel):
                     chunk = self._normalize_chunk(chunk_data)
                     if chunk:  # Only yield if chunk is not None
                         yield chunk
-            return generate()
+            return self._validate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -539,12 +565,12 @@ class GoogleLanguageModel(LanguageModel):
         if tool_calls:
             finish_reason = "tool_calls"
 
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=str(uuid.uuid4()),
             choices=[
-                Choice(
+                Choice._construct(
                     index=0,
-                    message=Message(
+                    message=Message._construct(
                         role="assistant",
                         content=text_content,
                         tool_calls=tool_calls if tool_calls else None,
@@ -555,7 +581,7 @@ class GoogleLanguageModel(LanguageModel):
             created=int(time.time()),
             model=self.get_model_name(),
             provider=self.provider,
-            usage=Usage(
+            usage=Usage._construct(
                 completion_tokens=response_data.get("usageMetadata", {}).get("candidatesTokenCount", 0),
                 prompt_tokens=response_data.get("usageMetadata", {}).get("promptTokenCount", 0),
                 total_tokens=response_data.get("usageMetadata", {}).get("totalTokenCount", 0),
@@ -615,12 +641,12 @@ class GoogleLanguageModel(LanguageModel):
             if tool_calls_data:
                 finish_reason = "tool_calls"
 
-        return ChatCompletionChunk(
+        return ChatCompletionChunk._construct(
             id=str(uuid.uuid4()),
             choices=[
-                StreamChoice(
+                StreamChoice._construct(
                     index=0,
-                    delta=DeltaMessage(
+                    delta=DeltaMessage._construct(
                         role="assistant",
                         content=text_content,
                         tool_calls=tool_calls_data if tool_calls_data else None,
@@ -643,6 +669,8 @@ class GoogleLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -666,21 +694,16 @@ class GoogleLanguageModel(LanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         should_stream = stream if stream is not None else self.streaming
 
-        # Resolve per-call overrides
-        effective_max_tokens = self._resolve_max_tokens(max_tokens)
-        effective_temperature = self._resolve_temperature(temperature)
-        effective_top_p = self._resolve_top_p(top_p)
+        template = self._get_request_template()
 
         # Resolve tool configuration
         resolved_tools = self._resolve_tools(tools)
@@ -693,19 +716,28 @@ class GoogleLanguageModel(LanguageModel):
         # Prepare request payload
         payload: Dict[str, Any] = {
             "contents": formatted_messages,
-            "generationConfig": self._create_generation_config(
-                max_tokens=effective_max_tokens,
-                temperature=effective_temperature,
-                top_p=effective_top_p,
-            ),
         }
 
+        # Per-call overrides rebuild the generation config; otherwise reuse the template
+        if max_tokens is None and temperature is None and top_p is None:
+            payload["generationConfig"] = dict(template.params)
+        else:
+            payload["generationConfig"] = self._create_generation_config(
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+            )
+
         if system_instruction:
             payload["system_instruction"] = system_instruction
 
         # Add tools if provided
         if resolved_tools:
-            payload["tools"] = self._convert_tools_to_google(resolved_tools)
+            payload["tools"] = (
+                list(template.tools or ())
+                if tools is None
+                else self._convert_tools_to_google(resolved_tools)
+            )
 
         # Add tool_config if tool_choice is specified
         if resolved_tool_choice is not None:
@@ -713,19 +745,14 @@ class GoogleLanguageModel(LanguageModel):
             if tool_config:
                 payload["tool_config"] = tool_config
 
-        model_name = self.get_model_name()
-        if should_stream:
-            endpoint = "streamGenerateContent"
-            url = f"{self.base_url}/models/{model_name}:{endpoint}?alt=sse&key={self.api_key}"
-        else:
-            endpoint = "generateContent"
-            url = f"{self.base_url}/models/{model_name}:{endpoint}?key={self.api_key}"
+        url = template.extras["stream_url"] if should_stream else template.url
 
         # Make async HTTP request
         response = await self.async_client.post(
             url,
-            headers=self._get_headers(),
-            json=payload
+            headers=template.headers,
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -736,7 +763,7 @@ class GoogleLanguageModel(LanguageModel):
                     if chunk:  # Only yield if chunk is not None
                         yield chunk
 
-            return generate()
+            return self._avalidate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -28,15 +28,34 @@ from esperanto.common_types import (
     ToolCall,
     Usage,
 )
+from esperanto.common_types.tool_cache import tool_cache
 from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
 from esperanto.providers.llm.base import LanguageModel
+from esperanto.utils import json_codec
+from esperanto.utils.timeout import TimeoutValue
 
 if TYPE_CHECKING:
     from langchain_groq import ChatGroq
 
 
+def _tool_to_openai(tool: Tool) -> Dict[str, Any]:
+    """Convert a single Esperanto tool to OpenAI format."""
+    tool_dict: Dict[str, Any] = {
+        "type": tool.type,
+        "function": {
+            "name": tool.function.name,
+            "description": tool.function.description,
+            "parameters": tool.function.parameters,
+        },
+    }
+    # Add strict mode if specified (OpenAI-specific, but include for compat)
+    if tool.function.strict is not None:
+        tool_dict["function"]["strict"] = tool.function.strict
+    return tool_dict
+
+
 class GroqLanguageModel(LanguageModel):
     """Groq language model implementation."""
 
@@ -104,21 +123,7 @@ class GroqLanguageModel(LanguageModel):
         """
         if not tools:
             return None
-        result = []
-        for tool in tools:
-            tool_dict: Dict[str, Any] = {
-                "type": tool.type,
-                "function": {
-                    "name": tool.function.name,
-                    "description": tool.function.description,
-                    "parameters": tool.function.parameters,
-                },
-            }
-            # Add strict mode if specified (OpenAI-specific, but include for compat)
-            if tool.function.strict is not None:
-                tool_dict["function"]["strict"] = tool.function.strict
-            result.append(tool_dict)
-        return result
+        return [tool_cache.get(tool, "openai", _tool_to_openai) for tool in tools]
 
     def _normalize_response(self, response_data: Dict[str, Any]) -> ChatCompletion:
         """Normalize Groq response to our format."""
@@ -142,9 +147,9 @@ class GroqLanguageModel(LanguageModel):
                 ]
 
             choices.append(
-                Choice(
+                Choice._construct(
                     index=choice["index"],
-                    message=Message(
+                    message=Message._construct(
                         content=message_data.get("content") or "",
                         role=message_data.get("role", "assistant"),
                         tool_calls=tool_calls,
@@ -153,13 +158,13 @@ class GroqLanguageModel(LanguageModel):
                 )
             )
 
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=response_data["id"],
             choices=choices,
             created=response_data["created"],
             model=response_data["model"],
             provider=self.provider,
-            usage=Usage(
+            usage=Usage._construct(
                 completion_tokens=response_data.get("usage", {}).get("completion_tokens", 0),
                 prompt_tokens=response_data.get("usage", {}).get("prompt_tokens", 0),
                 total_tokens=response_data.get("usage", {}).get("total_tokens", 0),
@@ -168,12 +173,12 @@ class GroqLanguageModel(LanguageModel):
 
     def _normalize_chunk(self, chunk_data: Dict[str, Any]) -> ChatCompletionChunk:
         """Normalize Groq stream chunk to our format."""
-        return ChatCompletionChunk(
+        return ChatCompletionChunk._construct(
             id=chunk_data["id"],
             choices=[
-                StreamChoice(
+                StreamChoice._construct(
                     index=choice["index"],
-                    delta=DeltaMessage(
+                    delta=DeltaMessage._construct(
                         content=choice.get("delta", {}).get("content", ""),
                         role=choice.get("delta", {}).get("role", "assistant"),
                         function_call=choice.get("delta", {}).get("function_call"),
@@ -199,7 +204,7 @@ class GroqLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         break
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -215,7 +220,7 @@ class GroqLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         return
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -287,6 +292,8 @@ class GroqLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -307,15 +314,13 @@ class GroqLanguageModel(LanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         # Per-call values flow raw into _get_api_kwargs which tracks
         # explicit-ness for the magic-default skip (issue #102 + cubic feedback).
 
@@ -351,12 +356,17 @@ class GroqLanguageModel(LanguageModel):
         response = self.client.post(
             f"{self.base_url}/chat/completions",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
         if should_stream:
-            return (self._normalize_chunk(chunk_data) for chunk_data in self._parse_sse_stream(response))
+            return self._validate_stream(
+                (self._normalize_chunk(chunk_data) for chunk_data in self._parse_sse_stream(response)),
+                validate_tool_calls,
+                resolved_tools,
+            )
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -380,6 +390,8 @@ class GroqLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -400,15 +412,13 @@ class GroqLanguageModel(LanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         # Per-call values flow raw into _get_api_kwargs which tracks
         # explicit-ness for the magic-default skip (issue #102 + cubic feedback).
 
@@ -444,7 +454,8 @@ class GroqLanguageModel(LanguageModel):
         response = await self.async_client.post(
             f"{self.base_url}/chat/completions",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -453,7 +464,7 @@ class GroqLanguageModel(LanguageModel):
                 async for chunk_data in self._parse_sse_stream_async(response):
                     yield self._normalize_chunk(chunk_data)
 
-            return generate()
+            return self._avalidate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -2,6 +2,7 @@
 
 import json
 import os
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -32,14 +33,29 @@ from esperanto.common_types import (
     ToolCall,
     Usage,
 )
+from esperanto.common_types.tool_cache import tool_cache
 from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
-from esperanto.providers.llm.base import LanguageModel
+from esperanto.providers.llm.base import LanguageModel, RequestTemplate
+from esperanto.utils import json_codec
+from esperanto.utils.timeout import TimeoutValue
 
 MISTRAL_DEFAULT_MODEL_NAME = "mistral-large-latest"
 
 
+def _tool_to_mistral(tool: Tool) -> Dict[str, Any]:
+    """Convert a single Esperanto tool to Mistral format."""
+    return {
+        "type": tool.type,
+        "function": {
+            "name": tool.function.name,
+            "description": tool.function.description,
+            "parameters": tool.function.parameters,
+        },
+    }
+
+
 class MistralLanguageModel(LanguageModel):
     """Mistral language model implementation."""
 
@@ -131,18 +147,7 @@ class MistralLanguageModel(LanguageModel):
         """
         if not tools:
             return None
-        result = []
-        for tool in tools:
-            tool_dict: Dict[str, Any] = {
-                "type": tool.type,
-                "function": {
-                    "name": tool.function.name,
-                    "description": tool.function.description,
-                    "parameters": tool.function.parameters,
-                },
-            }
-            result.append(tool_dict)
-        return result
+        return [tool_cache.get(tool, "mistral", _tool_to_mistral) for tool in tools]
 
     def _normalize_response(self, response_data: Dict[str, Any]) -> ChatCompletion:
         """Normalize Mistral response to our format."""
@@ -166,9 +171,9 @@ class MistralLanguageModel(LanguageModel):
                 ]
 
             choices.append(
-                Choice(
+                Choice._construct(
                     index=choice["index"],
-                    message=Message(
+                    message=Message._construct(
                         content=message_data.get("content") or "",
                         role=message_data.get("role", "assistant"),
                         tool_calls=tool_calls,
@@ -177,13 +182,13 @@ class MistralLanguageModel(LanguageModel):
                 )
             )
 
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=response_data["id"],
             choices=choices,
             created=response_data["created"],
             model=response_data["model"],
             provider=self.provider,
-            usage=Usage(
+            usage=Usage._construct(
                 completion_tokens=response_data.get("usage", {}).get("completion_tokens", 0),
                 prompt_tokens=response_data.get("usage", {}).get("prompt_tokens", 0),
                 total_tokens=response_data.get("usage", {}).get("total_tokens", 0),
@@ -192,12 +197,12 @@ class MistralLanguageModel(LanguageModel):
 
     def _normalize_chunk(self, chunk_data: Dict[str, Any]) -> ChatCompletionChunk:
         """Normalize Mistral stream chunk to our format."""
-        return ChatCompletionChunk(
+        return ChatCompletionChunk._construct(
             id=chunk_data["id"],
             choices=[
-                StreamChoice(
+                StreamChoice._construct(
                     index=choice["index"],
-                    delta=DeltaMessage(
+                    delta=DeltaMessage._construct(
                         content=choice.get("delta", {}).get("content", ""),
                         role=choice.get("delta", {}).get("role", "assistant"),
                         function_call=choice.get("delta", {}).get("function_call"),
@@ -223,7 +228,7 @@ class MistralLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         break
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -239,7 +244,7 @@ class MistralLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         return
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -279,6 +284,16 @@ class MistralLanguageModel(LanguageModel):
 
         return kwargs
 
+    def _build_request_template(self) -> RequestTemplate:
+        """Precompute headers, default kwargs and instance tools."""
+        tools = self._convert_tools_to_openai(self.tools)
+        return RequestTemplate(
+            model_name=self.get_model_name(),
+            url=f"{self.base_url}/chat/completions",
+            headers=MappingProxyType(self._get_headers()),
+            params=MappingProxyType(self._get_api_kwargs(exclude_stream=True)),
+            tools=tuple(tools) if tools else None,
+        )
 
     def chat_complete(
         self,
@@ -291,6 +306,8 @@ class MistralLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -311,18 +328,23 @@ class MistralLanguageModel(LanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
-        effective_max_tokens = self._resolve_max_tokens(max_tokens)
-        effective_temperature = self._resolve_temperature(temperature)
-        effective_top_p = self._resolve_top_p(top_p)
+        template = self._get_request_template()
+        if max_tokens is None and temperature is None and top_p is None:
+            api_kwargs = template.params
+        else:
+            api_kwargs = self._get_api_kwargs(
+                exclude_stream=True,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+            )
 
         should_stream = stream if stream is not None else self.streaming
 
@@ -333,20 +355,19 @@ class MistralLanguageModel(LanguageModel):
 
         # Prepare request payload
         payload: Dict[str, Any] = {
-            "model": self.get_model_name(),
+            "model": template.model_name,
             "messages": messages,
             "stream": should_stream,
-            **self._get_api_kwargs(
-                exclude_stream=True,
-                max_tokens=effective_max_tokens,
-                temperature=effective_temperature,
-                top_p=effective_top_p,
-            ),
+            **api_kwargs,
         }
 
         # Add tool-related parameters if configured
         if resolved_tools:
-            payload["tools"] = self._convert_tools_to_openai(resolved_tools)
+            payload["tools"] = (
+                list(template.tools or ())
+                if tools is None
+                else self._convert_tools_to_openai(resolved_tools)
+            )
         if resolved_tool_choice is not None:
             payload["tool_choice"] = resolved_tool_choice
         if resolved_parallel is not None:
@@ -354,14 +375,19 @@ class MistralLanguageModel(LanguageModel):
 
         # Make HTTP request
         response = self.client.post(
-            f"{self.base_url}/chat/completions",
-            headers=self._get_headers(),
-            json=payload
+            template.url,
+            headers=template.headers,
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
         if should_stream:
-            return (self._normalize_chunk(chunk_data) for chunk_data in self._parse_sse_stream(response))
+            return self._validate_stream(
+                (self._normalize_chunk(chunk_data) for chunk_data in self._parse_sse_stream(response)),
+                validate_tool_calls,
+                resolved_tools,
+            )
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -385,6 +411,8 @@ class MistralLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -405,18 +433,23 @@ class MistralLanguageModel(LanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
-        effective_max_tokens = self._resolve_max_tokens(max_tokens)
-        effective_temperature = self._resolve_temperature(temperature)
-        effective_top_p = self._resolve_top_p(top_p)
+        template = self._get_request_template()
+        if max_tokens is None and temperature is None and top_p is None:
+            api_kwargs = template.params
+        else:
+            api_kwargs = self._get_api_kwargs(
+                exclude_stream=True,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+            )
 
         should_stream = stream if stream is not None else self.streaming
 
@@ -427,20 +460,19 @@ class MistralLanguageModel(LanguageModel):
 
         # Prepare request payload
         payload: Dict[str, Any] = {
-            "model": self.get_model_name(),
+            "model": template.model_name,
             "messages": messages,
             "stream": should_stream,
-            **self._get_api_kwargs(
-                exclude_stream=True,
-                max_tokens=effective_max_tokens,
-                temperature=effective_temperature,
-                top_p=effective_top_p,
-            ),
+            **api_kwargs,
         }
 
         # Add tool-related parameters if configured
         if resolved_tools:
-            payload["tools"] = self._convert_tools_to_openai(resolved_tools)
+            payload["tools"] = (
+                list(template.tools or ())
+                if tools is None
+                else self._convert_tools_to_openai(resolved_tools)
+            )
         if resolved_tool_choice is not None:
             payload["tool_choice"] = resolved_tool_choice
         if resolved_parallel is not None:
@@ -448,9 +480,10 @@ class MistralLanguageModel(LanguageModel):
 
         # Make async HTTP request
         response = await self.async_client.post(
-            f"{self.base_url}/chat/completions",
-            headers=self._get_headers(),
-            json=payload
+            template.url,
+            headers=template.headers,
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -459,7 +492,7 @@ class MistralLanguageModel(LanguageModel):
                 async for chunk_data in self._parse_sse_stream_async(response):
                     yield self._normalize_chunk(chunk_data)
 
-            return generate()
+            return self._avalidate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -30,15 +30,30 @@ from esperanto.common_types import (
     ToolCall,
     Usage,
 )
+from esperanto.common_types.tool_cache import tool_cache
 from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
 from esperanto.providers.llm.base import LanguageModel
+from esperanto.utils import json_codec
+from esperanto.utils.timeout import TimeoutValue
 
 if TYPE_CHECKING:
     from langchain_ollama import ChatOllama
 
 
+def _tool_to_ollama(tool: Tool) -> Dict[str, Any]:
+    """Convert a single Esperanto tool to Ollama format."""
+    return {
+        "type": tool.type,
+        "function": {
+            "name": tool.function.name,
+            "description": tool.function.description,
+            "parameters": tool.function.parameters,
+        },
+    }
+
+
 class OllamaLanguageModel(LanguageModel):
     """Ollama language model implementation."""
 
@@ -149,18 +164,7 @@ class OllamaLanguageModel(LanguageModel):
         """
         if not tools:
             return None
-        result = []
-        for tool in tools:
-            tool_dict: Dict[str, Any] = {
-                "type": tool.type,
-                "function": {
-                    "name": tool.function.name,
-                    "description": tool.function.description,
-                    "parameters": tool.function.parameters,
-                },
-            }
-            result.append(tool_dict)
-        return result
+        return [tool_cache.get(tool, "ollama", _tool_to_ollama) for tool in tools]
 
     def _convert_messages_for_ollama(
         self, messages: List[Dict[str, Any]]
@@ -227,7 +231,7 @@ class OllamaLanguageModel(LanguageModel):
         for line in response.iter_lines():
             if line.strip():
                 try:
-                    yield json.loads(line)
+                    yield json_codec.loads(line)
                 except json.JSONDecodeError:
                     continue
 
@@ -236,7 +240,7 @@ class OllamaLanguageModel(LanguageModel):
         async for line in response.aiter_lines():
             if line.strip():
                 try:
-                    yield json.loads(line)
+                    yield json_codec.loads(line)
                 except json.JSONDecodeError:
                     continue
 
@@ -251,6 +255,8 @@ class OllamaLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -277,15 +283,13 @@ class OllamaLanguageModel(LanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         should_stream = stream if stream is not None else self.streaming
 
         if not messages:
@@ -335,12 +339,17 @@ class OllamaLanguageModel(LanguageModel):
         response = self.client.post(
             f"{self.base_url}/api/chat",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
         if should_stream:
-            return (self._normalize_chunk(chunk) for chunk in self._parse_stream(response))
+            return self._validate_stream(
+                (self._normalize_chunk(chunk) for chunk in self._parse_stream(response)),
+                validate_tool_calls,
+                resolved_tools,
+            )
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -364,6 +373,8 @@ class OllamaLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -390,15 +401,13 @@ class OllamaLanguageModel(LanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         should_stream = stream if stream is not None else self.streaming
 
         if not messages:
@@ -438,7 +447,8 @@ class OllamaLanguageModel(LanguageModel):
         response = await self.async_client.post(
             f"{self.base_url}/api/chat",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -447,7 +457,7 @@ class OllamaLanguageModel(LanguageModel):
                 async for chunk in self._parse_stream_async(response):
                     yield self._normalize_chunk(chunk)
 
-            return generate()
+            return self._avalidate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -495,12 +505,12 @@ class OllamaLanguageModel(LanguageModel):
         if tool_calls:
             finish_reason = "tool_calls"
 
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=str(uuid.uuid4()),
             choices=[
-                Choice(
+                Choice._construct(
                     index=0,
-                    message=Message(  # type: ignore[call-arg]  # `thinking` consumed by model_validator (response.py)
+                    message=Message._construct(  # `thinking` is merged into content by validation (response.py)
                         role=message.get("role", "assistant"),
                         content=message.get("content") or "",
                         thinking=message.get("thinking"),
@@ -512,7 +522,7 @@ class OllamaLanguageModel(LanguageModel):
             model=response.get("model", self.get_model_name()),
             provider=self.provider,
             created=int(time.time()),
-            usage=Usage(
+            usage=Usage._construct(
                 completion_tokens=response.get("eval_count", 0),
                 prompt_tokens=response.get("prompt_eval_count", 0),
                 total_tokens=response.get("eval_count", 0) + response.get("prompt_eval_count", 0),
@@ -550,12 +560,12 @@ class OllamaLanguageModel(LanguageModel):
         if chunk.get("done", False):
             finish_reason = "tool_calls" if tool_calls_data else "stop"
 
-        return ChatCompletionChunk(
+        return ChatCompletionChunk._construct(
             id=str(uuid.uuid4()),
             choices=[
-                StreamChoice(
+                StreamChoice._construct(
                     index=0,
-                    delta=DeltaMessage(  # type: ignore[call-arg]  # `thinking` consumed by model_validator (response.py)
+                    delta=DeltaMessage._construct(  # `thinking` is merged into content by validation (response.py)
                         role=message.get("role", "assistant"),
                         content=message.get("content") or "",
                         thinking=message.get("thinking"),
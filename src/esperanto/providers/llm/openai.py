@@ -2,6 +2,7 @@
 
 import json
 import os
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -28,15 +29,34 @@ from esperanto.common_types import (
     ToolCall,
     Usage,
 )
+from esperanto.common_types.tool_cache import tool_cache
 from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
-from esperanto.providers.llm.base import LanguageModel
+from esperanto.providers.llm.base import LanguageModel, RequestTemplate
+from esperanto.utils import json_codec
+from esperanto.utils.timeout import TimeoutValue
 
 if TYPE_CHECKING:
     from langchain_openai import ChatOpenAI
 
 
+def _tool_to_openai(tool: Tool) -> Dict[str, Any]:
+    """Convert a single Esperanto tool to OpenAI format."""
+    tool_dict: Dict[str, Any] = {
+        "type": tool.type,
+        "function": {
+            "name": tool.function.name,
+            "description": tool.function.description,
+            "parameters": tool.function.parameters,
+        },
+    }
+    # Add strict mode if specified
+    if tool.function.strict is not None:
+        tool_dict["function"]["strict"] = tool.function.strict
+    return tool_dict
+
+
 class OpenAILanguageModel(LanguageModel):
     """OpenAI language model implementation."""
 
@@ -89,21 +109,7 @@ class OpenAILanguageModel(LanguageModel):
         """
         if not tools:
             return None
-        result = []
-        for tool in tools:
-            tool_dict: Dict[str, Any] = {
-                "type": tool.type,
-                "function": {
-                    "name": tool.function.name,
-                    "description": tool.function.description,
-                    "parameters": tool.function.parameters,
-                },
-            }
-            # Add strict mode if specified
-            if tool.function.strict is not None:
-                tool_dict["function"]["strict"] = tool.function.strict
-            result.append(tool_dict)
-        return result
+        return [tool_cache.get(tool, "openai", _tool_to_openai) for tool in tools]
 
     def _get_models(self) -> List[Model]:
         """List all available models for this provider."""
@@ -146,9 +152,9 @@ class OpenAILanguageModel(LanguageModel):
                 ]
 
             choices.append(
-                Choice(
+                Choice._construct(
                     index=choice["index"],
-                    message=Message(
+                    message=Message._construct(
                         content=message_data.get("content") or "",
                         role=message_data.get("role", "assistant"),
                         tool_calls=tool_calls,
@@ -157,13 +163,13 @@ class OpenAILanguageModel(LanguageModel):
                 )
             )
 
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=response_data["id"],
             choices=choices,
             created=response_data["created"],
             model=response_data["model"],
             provider=self.provider,
-            usage=Usage(
+            usage=Usage._construct(
                 completion_tokens=response_data.get("usage", {}).get("completion_tokens", 0),
                 prompt_tokens=response_data.get("usage", {}).get("prompt_tokens", 0),
                 total_tokens=response_data.get("usage", {}).get("total_tokens", 0),
@@ -172,12 +178,12 @@ class OpenAILanguageModel(LanguageModel):
 
     def _normalize_chunk(self, chunk_data: Dict[str, Any]) -> ChatCompletionChunk:
         """Normalize OpenAI stream chunk to our format."""
-        return ChatCompletionChunk(
+        return ChatCompletionChunk._construct(
             id=chunk_data["id"],
             choices=[
-                StreamChoice(
+                StreamChoice._construct(
                     index=choice["index"],
-                    delta=DeltaMessage(
+                    delta=DeltaMessage._construct(
                         content=choice.get("delta", {}).get("content", ""),
                         role=choice.get("delta", {}).get("role", "assistant"),
                         function_call=choice.get("delta", {}).get("function_call"),
@@ -204,7 +210,7 @@ class OpenAILanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         break
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -221,7 +227,7 @@ class OpenAILanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         return
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -306,8 +312,20 @@ class OpenAILanguageModel(LanguageModel):
         return kwargs
 
     def _is_reasoning_model(self) -> bool:
-        return self.get_model_name().startswith("o1") or self.get_model_name().startswith("o3") or self.get_model_name().startswith("o4") or self.get_model_name().startswith("gpt-5")
-    
+        return self.get_model_name().startswith(("o1", "o3", "o4", "gpt-5"))
+
+    def _build_request_template(self) -> RequestTemplate:
+        """Precompute headers, default kwargs and instance tools."""
+        tools = self._convert_tools_to_openai(self.tools)
+        return RequestTemplate(
+            model_name=self.get_model_name(),
+            url=f"{self.base_url}/chat/completions",
+            headers=MappingProxyType(self._get_headers()),
+            params=MappingProxyType(self._get_api_kwargs(exclude_stream=True)),
+            tools=tuple(tools) if tools else None,
+            extras=MappingProxyType({"is_reasoning_model": self._is_reasoning_model()}),
+        )
+
     def chat_complete(
         self,
         messages: List[Dict[str, Any]],
@@ -319,6 +337,8 @@ class OpenAILanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -342,22 +362,29 @@ class OpenAILanguageModel(LanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         should_stream = stream if stream is not None else self.streaming
-        model_name = self.get_model_name()
-        is_reasoning_model = self._is_reasoning_model()
+        template = self._get_request_template()
+        is_reasoning_model = template.extras["is_reasoning_model"]
 
         # Resolve per-call overrides
         # Per-call values flow raw into _get_api_kwargs which tracks
         # explicit-ness for the magic-default skip (issue #102 + cubic feedback).
+        if max_tokens is None and temperature is None and top_p is None:
+            api_kwargs = template.params
+        else:
+            api_kwargs = self._get_api_kwargs(
+                exclude_stream=True,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+            )
 
         # Resolve tool configuration
         resolved_tools = self._resolve_tools(tools)
@@ -372,20 +399,19 @@ class OpenAILanguageModel(LanguageModel):
 
         # Prepare request payload
         payload: Dict[str, Any] = {
-            "model": model_name,
+            "model": template.model_name,
             "messages": messages,
             "stream": should_stream,
-            **self._get_api_kwargs(
-                exclude_stream=True,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                top_p=top_p,
-            ),
+            **api_kwargs,
         }
 
         # Add tool-related parameters if configured
         if resolved_tools:
-            payload["tools"] = self._convert_tools_to_openai(resolved_tools)
+            payload["tools"] = (
+                list(template.tools or ())
+                if tools is None
+                else self._convert_tools_to_openai(resolved_tools)
+            )
         if resolved_tool_choice is not None:
             payload["tool_choice"] = resolved_tool_choice
         if resolved_parallel is not None:
@@ -393,16 +419,21 @@ class OpenAILanguageModel(LanguageModel):
 
         # Make HTTP request
         response = self.client.post(
-            f"{self.base_url}/chat/completions",
-            headers=self._get_headers(),
+            template.url,
+            headers=template.headers,
             json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
         if should_stream:
-            return (
-                self._normalize_chunk(chunk_data)
-                for chunk_data in self._parse_sse_stream(response)
+            return self._validate_stream(
+                (
+                    self._normalize_chunk(chunk_data)
+                    for chunk_data in self._parse_sse_stream(response)
+                ),
+                validate_tool_calls,
+                resolved_tools,
             )
 
         response_data = response.json()
@@ -427,6 +458,8 @@ class OpenAILanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -450,22 +483,29 @@ class OpenAILanguageModel(LanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         should_stream = stream if stream is not None else self.streaming
-        model_name = self.get_model_name()
-        is_reasoning_model = self._is_reasoning_model()
+        template = self._get_request_template()
+        is_reasoning_model = template.extras["is_reasoning_model"]
 
         # Resolve per-call overrides
         # Per-call values flow raw into _get_api_kwargs which tracks
         # explicit-ness for the magic-default skip (issue #102 + cubic feedback).
+        if max_tokens is None and temperature is None and top_p is None:
+            api_kwargs = template.params
+        else:
+            api_kwargs = self._get_api_kwargs(
+                exclude_stream=True,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+            )
 
         # Resolve tool configuration
         resolved_tools = self._resolve_tools(tools)
@@ -480,20 +520,19 @@ class OpenAILanguageModel(LanguageModel):
 
         # Prepare request payload
         payload: Dict[str, Any] = {
-            "model": model_name,
+            "model": template.model_name,
             "messages": messages,
             "stream": should_stream,
-            **self._get_api_kwargs(
-                exclude_stream=True,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                top_p=top_p,
-            ),
+            **api_kwargs,
         }
 
         # Add tool-related parameters if configured
         if resolved_tools:
-            payload["tools"] = self._convert_tools_to_openai(resolved_tools)
+            payload["tools"] = (
+                list(template.tools or ())
+                if tools is None
+                else self._convert_tools_to_openai(resolved_tools)
+            )
         if resolved_tool_choice is not None:
             payload["tool_choice"] = resolved_tool_choice
         if resolved_parallel is not None:
@@ -501,9 +540,10 @@ class OpenAILanguageModel(LanguageModel):
 
         # Make async HTTP request
         response = await self.async_client.post(
-            f"{self.base_url}/chat/completions",
-            headers=self._get_headers(),
+            template.url,
+            headers=template.headers,
             json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -512,7 +552,7 @@ class OpenAILanguageModel(LanguageModel):
                 async for chunk_data in self._parse_sse_stream_async(response):
                     yield self._normalize_chunk(chunk_data)
 
-            return generate()
+            return self._avalidate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -17,6 +17,7 @@ from esperanto.common_types import ChatCompletion, ChatCompletionChunk, Model, T
 from esperanto.providers.llm.openai import OpenAILanguageModel
 from esperanto.providers.llm.profiles import OpenAICompatibleProfile, get_profile
 from esperanto.utils.logging import logger
+from esperanto.utils.timeout import TimeoutValue
 
 if TYPE_CHECKING:
     from langchain_openai import ChatOpenAI
@@ -184,9 +185,9 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
                     for tc in message["tool_calls"]
                 ]
 
-            normalized_choice = Choice(
+            normalized_choice = Choice._construct(
                 index=choice.get("index", 0),
-                message=Message(
+                message=Message._construct(
                     content=message.get("content", "") if not tool_calls else message.get("content"),
                     role=message.get("role", "assistant"),
                     tool_calls=tool_calls,
@@ -197,21 +198,21 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
         
         # If no choices, create a default one
         if not normalized_choices:
-            normalized_choices = [Choice(
+            normalized_choices = [Choice._construct(
                 index=0,
-                message=Message(content="", role="assistant"),
+                message=Message._construct(content="", role="assistant"),
                 finish_reason="stop"
             )]
         
         # Handle usage information
         usage_data = response_data.get("usage", {})
-        usage = Usage(
+        usage = Usage._construct(
             completion_tokens=usage_data.get("completion_tokens", 0),
             prompt_tokens=usage_data.get("prompt_tokens", 0),
             total_tokens=usage_data.get("total_tokens", 0),
         )
         
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=response_id,
             choices=normalized_choices,
             created=created,
@@ -239,9 +240,9 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
         
         for choice in choices:
             delta = choice.get("delta", {})
-            normalized_choice = StreamChoice(
+            normalized_choice = StreamChoice._construct(
                 index=choice.get("index", 0),
-                delta=DeltaMessage(
+                delta=DeltaMessage._construct(
                     content=delta.get("content", ""),
                     role=delta.get("role", "assistant"),
                     function_call=delta.get("function_call"),
@@ -253,13 +254,13 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
         
         # If no choices, create a default one
         if not normalized_choices:
-            normalized_choices = [StreamChoice(
+            normalized_choices = [StreamChoice._construct(
                 index=0,
-                delta=DeltaMessage(content="", role="assistant"),
+                delta=DeltaMessage._construct(content="", role="assistant"),
                 finish_reason=None
             )]
         
-        return ChatCompletionChunk(
+        return ChatCompletionChunk._construct(
             id=chunk_id,
             choices=normalized_choices,
             created=created,
@@ -328,6 +329,8 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request with retry for unsupported response_format.
 
@@ -352,6 +355,7 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
@@ -362,6 +366,7 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
             return super().chat_complete(
                 messages, stream, tools, tool_choice, parallel_tool_calls, validate_tool_calls,
                 max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+                timeout=timeout, deadline=deadline,
             )
         except RuntimeError as e:
             # Check if it's a response_format error and we haven't already disabled it
@@ -371,10 +376,12 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
                 )
                 # Mark this endpoint as not supporting response_format
                 self._response_format_unsupported = True
+                self._invalidate_request_template()
                 # Retry without response_format
                 return super().chat_complete(
                     messages, stream, tools, tool_choice, parallel_tool_calls, validate_tool_calls,
                     max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+                    timeout=timeout, deadline=deadline,
                 )
             raise
 
@@ -389,6 +396,8 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request with retry for unsupported response_format.
 
@@ -413,6 +422,7 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
             max_tokens: Per-call override for max_tokens. If None, uses instance value.
             temperature: Per-call override for temperature. If None, uses instance value.
             top_p: Per-call override for top_p. If None, uses instance value.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
@@ -423,6 +433,7 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
             return await super().achat_complete(
                 messages, stream, tools, tool_choice, parallel_tool_calls, validate_tool_calls,
                 max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+                timeout=timeout, deadline=deadline,
             )
         except RuntimeError as e:
             # Check if it's a response_format error and we haven't already disabled it
@@ -432,10 +443,12 @@ class OpenAICompatibleLanguageModel(OpenAILanguageModel):
                 )
                 # Mark this endpoint as not supporting response_format
                 self._response_format_unsupported = True
+                self._invalidate_request_template()
                 # Retry without response_format
                 return await super().achat_complete(
                     messages, stream, tools, tool_choice, parallel_tool_calls, validate_tool_calls,
                     max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+                    timeout=timeout, deadline=deadline,
                 )
             raise
 
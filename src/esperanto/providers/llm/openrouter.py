@@ -13,6 +13,8 @@ from typing import (
     Union,
 )
 
+import httpx
+
 from esperanto.common_types import (
     ChatCompletion,
     ChatCompletionChunk,
@@ -23,6 +25,7 @@ from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
 from esperanto.providers.llm.openai import OpenAILanguageModel
+from esperanto.utils.timeout import TimeoutValue
 
 if TYPE_CHECKING:
     from langchain_openai import ChatOpenAI
@@ -77,24 +80,30 @@ class OpenRouterLanguageModel(OpenAILanguageModel):
                 error_message = f"HTTP {response.status_code}: {response.text}"
             raise RuntimeError(f"OpenAI API error: {error_message}")
 
-    def _make_http_request(self, payload: Dict[str, Any]) -> Any:
+    def _make_http_request(
+        self, payload: Dict[str, Any], timeout: Any = httpx.USE_CLIENT_DEFAULT
+    ) -> Any:
         """Make HTTP request in OpenRouter's expected format."""
         headers = self._get_headers()
 
         response = self.client.post(
             f"{self.base_url}/chat/completions",
             headers=headers,
-            json=payload
+            json=payload,
+            timeout=timeout,
         )
         self._handle_error(response)
         return response
 
-    async def _make_async_http_request(self, payload: Dict[str, Any]) -> Any:
+    async def _make_async_http_request(
+        self, payload: Dict[str, Any], timeout: Any = httpx.USE_CLIENT_DEFAULT
+    ) -> Any:
         """Make async HTTP request in OpenRouter's expected format."""
         response = await self.async_client.post(
             f"{self.base_url}/chat/completions",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=timeout,
         )
         self._handle_error(response)
         return response
@@ -135,6 +144,8 @@ class OpenRouterLanguageModel(OpenAILanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request using OpenRouter-specific HTTP format.
 
@@ -156,15 +167,13 @@ class OpenRouterLanguageModel(OpenAILanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         # Per-call values flow raw into _get_api_kwargs which tracks
         # explicit-ness for the magic-default skip (issue #102 + cubic feedback).
 
@@ -205,10 +214,16 @@ class OpenRouterLanguageModel(OpenAILanguageModel):
             payload["parallel_tool_calls"] = resolved_parallel
 
         # Make HTTP request using OpenRouter format
-        response = self._make_http_request(payload)
+        response = self._make_http_request(
+            payload, timeout=self._get_request_timeout(timeout, deadline)
+        )
 
         if should_stream:
-            return (self._normalize_chunk(chunk_data) for chunk_data in self._parse_sse_stream(response))
+            return self._validate_stream(
+                (self._normalize_chunk(chunk_data) for chunk_data in self._parse_sse_stream(response)),
+                validate_tool_calls,
+                resolved_tools,
+            )
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -232,6 +247,8 @@ class OpenRouterLanguageModel(OpenAILanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request using OpenRouter-specific HTTP format.
 
@@ -253,15 +270,13 @@ class OpenRouterLanguageModel(OpenAILanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         # Per-call values flow raw into _get_api_kwargs which tracks
         # explicit-ness for the magic-default skip (issue #102 + cubic feedback).
 
@@ -302,14 +317,16 @@ class OpenRouterLanguageModel(OpenAILanguageModel):
             payload["parallel_tool_calls"] = resolved_parallel
 
         # Make async HTTP request using OpenRouter format
-        response = await self._make_async_http_request(payload)
+        response = await self._make_async_http_request(
+            payload, timeout=self._get_request_timeout(timeout, deadline)
+        )
 
         if should_stream:
             async def generate():
                 async for chunk_data in self._parse_sse_stream_async(response):
                     yield self._normalize_chunk(chunk_data)
 
-            return generate()
+            return self._avalidate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
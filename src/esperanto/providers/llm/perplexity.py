@@ -29,15 +29,30 @@ from esperanto.common_types import (
     ToolCall,
     Usage,
 )
+from esperanto.common_types.tool_cache import tool_cache
 from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
 from esperanto.providers.llm.base import LanguageModel
+from esperanto.utils import json_codec
+from esperanto.utils.timeout import TimeoutValue
 
 if TYPE_CHECKING:
     from langchain_openai import ChatOpenAI
 
 
+def _tool_to_perplexity(tool: Tool) -> Dict[str, Any]:
+    """Convert a single Esperanto tool to Perplexity format."""
+    return {
+        "type": tool.type,
+        "function": {
+            "name": tool.function.name,
+            "description": tool.function.description,
+            "parameters": tool.function.parameters,
+        },
+    }
+
+
 @dataclass
 class PerplexityLanguageModel(LanguageModel):
     """Perplexity AI language model implementation using httpx."""
@@ -102,7 +117,7 @@ class PerplexityLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         break
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -118,7 +133,7 @@ class PerplexityLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         return
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -195,18 +210,7 @@ class PerplexityLanguageModel(LanguageModel):
         """
         if not tools:
             return None
-        result = []
-        for tool in tools:
-            tool_dict: Dict[str, Any] = {
-                "type": tool.type,
-                "function": {
-                    "name": tool.function.name,
-                    "description": tool.function.description,
-                    "parameters": tool.function.parameters,
-                },
-            }
-            result.append(tool_dict)
-        return result
+        return [tool_cache.get(tool, "perplexity", _tool_to_perplexity) for tool in tools]
 
     def _get_perplexity_params(self) -> Dict[str, Any]:
         """Get Perplexity-specific parameters."""
@@ -245,9 +249,9 @@ class PerplexityLanguageModel(LanguageModel):
                 ]
 
             choices.append(
-                Choice(
+                Choice._construct(
                     index=choice["index"],
-                    message=Message(
+                    message=Message._construct(
                         content=message_data.get("content") or "",
                         role=message_data.get("role", "assistant"),
                         tool_calls=tool_calls,
@@ -256,13 +260,13 @@ class PerplexityLanguageModel(LanguageModel):
                 )
             )
 
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=response_data["id"],
             choices=choices,
             created=response_data["created"],
             model=response_data["model"],
             provider=self.provider,
-            usage=Usage(
+            usage=Usage._construct(
                 completion_tokens=response_data.get("usage", {}).get("completion_tokens", 0),
                 prompt_tokens=response_data.get("usage", {}).get("prompt_tokens", 0),
                 total_tokens=response_data.get("usage", {}).get("total_tokens", 0),
@@ -271,12 +275,12 @@ class PerplexityLanguageModel(LanguageModel):
 
     def _normalize_chunk(self, chunk_data: Dict[str, Any]) -> ChatCompletionChunk:
         """Normalize Perplexity stream chunk to our format."""
-        return ChatCompletionChunk(
+        return ChatCompletionChunk._construct(
             id=chunk_data["id"],
             choices=[
-                StreamChoice(
+                StreamChoice._construct(
                     index=choice["index"],
-                    delta=DeltaMessage(
+                    delta=DeltaMessage._construct(
                         content=choice.get("delta", {}).get("content", ""),
                         role=choice.get("delta", {}).get("role", "assistant"),
                         function_call=choice.get("delta", {}).get("function_call"),
@@ -301,6 +305,8 @@ class PerplexityLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -324,15 +330,13 @@ class PerplexityLanguageModel(LanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         # Per-call values flow raw into _get_api_kwargs which tracks
         # explicit-ness for the magic-default skip (issue #102 + cubic feedback).
 
@@ -372,12 +376,17 @@ class PerplexityLanguageModel(LanguageModel):
         response = self.client.post(
             f"{self.base_url}/chat/completions",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
         if should_stream:
-            return (self._normalize_chunk(chunk_data) for chunk_data in self._parse_sse_stream(response))
+            return self._validate_stream(
+                (self._normalize_chunk(chunk_data) for chunk_data in self._parse_sse_stream(response)),
+                validate_tool_calls,
+                resolved_tools,
+            )
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -401,6 +410,8 @@ class PerplexityLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -424,15 +435,13 @@ class PerplexityLanguageModel(LanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
         # Per-call values flow raw into _get_api_kwargs which tracks
         # explicit-ness for the magic-default skip (issue #102 + cubic feedback).
 
@@ -472,7 +481,8 @@ class PerplexityLanguageModel(LanguageModel):
         response = await self.async_client.post(
             f"{self.base_url}/chat/completions",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -481,7 +491,7 @@ class PerplexityLanguageModel(LanguageModel):
                 async for chunk_data in self._parse_sse_stream_async(response):
                     yield self._normalize_chunk(chunk_data)
 
-            return generate()
+            return self._avalidate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
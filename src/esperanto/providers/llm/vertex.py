@@ -2,10 +2,10 @@
 
 import json
 import os
-import subprocess
 import time
 import uuid
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import (
     Any,
     AsyncGenerator,
@@ -31,10 +31,23 @@ from esperanto.common_types import (
     ToolCall,
     Usage,
 )
+from esperanto.common_types.tool_cache import tool_cache
 from esperanto.common_types.validation import (
     validate_tool_calls as _validate_tool_calls,
 )
-from esperanto.providers.llm.base import LanguageModel
+from esperanto.providers.llm.base import LanguageModel, RequestTemplate
+from esperanto.utils import json_codec
+from esperanto.utils.google_auth import CLOUD_PLATFORM_SCOPE, google_credentials
+from esperanto.utils.timeout import TimeoutValue
+
+
+def _tool_to_function_declaration(tool: Tool) -> Dict[str, Any]:
+    """Convert a single Esperanto tool to a Vertex AI function declaration."""
+    return {
+        "name": tool.function.name,
+        "description": tool.function.description,
+        "parameters": tool.function.parameters,
+    }
 
 
 @dataclass
@@ -67,10 +80,6 @@ class VertexLanguageModel(LanguageModel):
         # Initialize HTTP clients with configurable timeout
         self._create_http_clients()
 
-        # Cache for access token (used when no google-auth credentials)
-        self._access_token = None
-        self._token_expiry = 0
-
         # Cache for LangChain model
         self._langchain_model = None
 
@@ -82,77 +91,55 @@ class VertexLanguageModel(LanguageModel):
         2. GOOGLE_APPLICATION_CREDENTIALS environment variable
         3. Application Default Credentials (google.auth.default)
         4. None (falls back to gcloud CLI in _get_access_token)
+
+        Credentials are shared by every Vertex model with the same identity.
         """
-        self._credentials = None
         creds_path = self.credentials_file or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
 
         if creds_path:
             # Explicit credentials file — errors must propagate so the user
             # doesn't silently fall back to a different identity.
-            try:
-                from google.oauth2 import service_account
-            except ImportError:
-                raise ImportError(
-                    "credentials_file requires the google-auth package. "
-                    "Install with: uv add google-auth or pip install google-auth"
+            def load_service_account():
+                try:
+                    from google.oauth2 import service_account
+                except ImportError:
+                    raise ImportError(
+                        "credentials_file requires the google-auth package. "
+                        "Install with: uv add google-auth or pip install google-auth"
+                    )
+
+                return service_account.Credentials.from_service_account_file(
+                    creds_path, scopes=[CLOUD_PLATFORM_SCOPE]
                 )
 
-            scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-            self._credentials = service_account.Credentials.from_service_account_file(
-                creds_path, scopes=scopes
+            self._credentials = google_credentials.load(
+                ("service_account", os.path.abspath(creds_path)), load_service_account
             )
         else:
             # ADC — best-effort; fall back to gcloud CLI if unavailable.
-            try:
-                import google.auth
+            def load_adc():
+                try:
+                    import google.auth
+                except ImportError:
+                    # Cached: google-auth stays missing for the process
+                    return None
 
-                self._credentials, _ = google.auth.default(
-                    scopes=["https://www.googleapis.com/auth/cloud-platform"]
-                )
-            except ImportError:
-                self._credentials = None
+                credentials, _ = google.auth.default(scopes=[CLOUD_PLATFORM_SCOPE])
+                return credentials
+
+            try:
+                self._credentials = google_credentials.load(("adc",), load_adc)
             except Exception:
+                # Not cached, so the next model tries ADC again
                 self._credentials = None
 
     def _get_access_token(self) -> str:
         """Get OAuth 2.0 access token for Google Cloud APIs."""
-        # Use google-auth credentials if available
-        if self._credentials is not None:
-            try:
-                from google.auth.transport.requests import Request
-
-                if not self._credentials.valid:
-                    self._credentials.refresh(Request())
-                return self._credentials.token
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to refresh credentials: {e}"
-                )
-
-        current_time = time.time()
+        return google_credentials.access_token(self._credentials).token()
 
-        # Check if cached token is still valid (with 5-minute buffer)
-        if self._access_token and current_time < (self._token_expiry - 300):
-            return self._access_token
-
-        try:
-            # Fall back to gcloud CLI
-            result = subprocess.run(
-                ["gcloud", "auth", "application-default", "print-access-token"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            self._access_token = result.stdout.strip()
-            # Tokens typically expire in 1 hour
-            self._token_expiry = current_time + 3600
-            return self._access_token
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(
-                "Failed to get access token. Either set credentials_file / "
-                "GOOGLE_APPLICATION_CREDENTIALS, install google-auth for ADC, "
-                f"or authenticate with 'gcloud auth application-default login': {e}"
-            )
+    async def _aget_access_token(self) -> str:
+        """Get OAuth 2.0 access token without blocking the event loop."""
+        return await google_credentials.access_token(self._credentials).atoken()
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for Vertex AI API requests."""
@@ -161,6 +148,13 @@ class VertexLanguageModel(LanguageModel):
             "Content-Type": "application/json",
         }
 
+    async def _aget_headers(self) -> Dict[str, str]:
+        """Get headers for Vertex AI API requests from async code."""
+        return {
+            "Authorization": f"Bearer {await self._aget_access_token()}",
+            "Content-Type": "application/json",
+        }
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle HTTP error responses."""
         if response.status_code >= 400:
@@ -330,6 +324,19 @@ class VertexLanguageModel(LanguageModel):
 
         return config
 
+    def _build_request_template(self) -> RequestTemplate:
+        """Precompute the endpoint URL, generation config and instance tools.
+
+        Headers carry a refreshing access token and are built per call.
+        """
+        tools = self._convert_tools_to_vertex(self.tools)
+        return RequestTemplate(
+            model_name=self.get_model_name(),
+            url=f"{self.base_url}/{self._get_model_path()}:generateContent",
+            params=MappingProxyType(self._create_generation_config()),
+            tools=tuple(tools) if tools else None,
+        )
+
     def _convert_tools_to_vertex(
         self, tools: Optional[List[Tool]]
     ) -> Optional[List[Dict[str, Any]]]:
@@ -348,11 +355,7 @@ class VertexLanguageModel(LanguageModel):
             return None
         return [{
             "function_declarations": [
-                {
-                    "name": tool.function.name,
-                    "description": tool.function.description,
-                    "parameters": tool.function.parameters,
-                }
+                tool_cache.get(tool, "vertex", _tool_to_function_declaration)
                 for tool in tools
             ]
         }]
@@ -401,7 +404,7 @@ class VertexLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         break
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -417,7 +420,7 @@ class VertexLanguageModel(LanguageModel):
                     if data.strip() == "[DONE]":
                         return
                     try:
-                        yield json.loads(data)
+                        yield json_codec.loads(data)
                     except json.JSONDecodeError:
                         continue
 
@@ -474,12 +477,12 @@ class VertexLanguageModel(LanguageModel):
             if tool_calls_data:
                 finish_reason = "tool_calls"
 
-        return ChatCompletionChunk(
+        return ChatCompletionChunk._construct(
             id=str(uuid.uuid4()),
             choices=[
-                StreamChoice(
+                StreamChoice._construct(
                     index=0,
-                    delta=DeltaMessage(
+                    delta=DeltaMessage._construct(
                         role="assistant",
                         content=text_content,
                         tool_calls=tool_calls_data if tool_calls_data else None,
@@ -502,6 +505,8 @@ class VertexLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """Send a chat completion request.
 
@@ -522,18 +527,14 @@ class VertexLanguageModel(LanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or a Generator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
-        effective_max_tokens = self._resolve_max_tokens(max_tokens)
-        effective_temperature = self._resolve_temperature(temperature)
-        effective_top_p = self._resolve_top_p(top_p)
+        template = self._get_request_template()
 
         should_stream = stream if stream is not None else self.streaming
 
@@ -551,11 +552,14 @@ class VertexLanguageModel(LanguageModel):
         }
 
         # Add generation config if provided
-        generation_config = self._create_generation_config(
-            max_tokens=effective_max_tokens,
-            temperature=effective_temperature,
-            top_p=effective_top_p,
-        )
+        if max_tokens is None and temperature is None and top_p is None:
+            generation_config = dict(template.params)
+        else:
+            generation_config = self._create_generation_config(
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+            )
         if generation_config:
             payload["generationConfig"] = generation_config
 
@@ -564,7 +568,11 @@ class VertexLanguageModel(LanguageModel):
 
         # Add tools if provided
         if resolved_tools:
-            payload["tools"] = self._convert_tools_to_vertex(resolved_tools)
+            payload["tools"] = (
+                list(template.tools or ())
+                if tools is None
+                else self._convert_tools_to_vertex(resolved_tools)
+            )
 
         # Add tool_config if tool_choice is specified
         if resolved_tool_choice is not None:
@@ -572,17 +580,16 @@ class VertexLanguageModel(LanguageModel):
             if tool_config:
                 payload["tool_config"] = tool_config
 
-        model_path = self._get_model_path()
-
         # Use regular endpoint for both streaming and non-streaming
         # Vertex AI REST API streaming may not be supported the same way
-        url = f"{self.base_url}/{model_path}:generateContent"
+        url = template.url
 
         # Make HTTP request
         response = self.client.post(
             url,
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -595,7 +602,7 @@ class VertexLanguageModel(LanguageModel):
                 if chunk:
                     yield chunk
 
-            return generate()
+            return self._validate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -662,12 +669,12 @@ class VertexLanguageModel(LanguageModel):
         if tool_calls:
             finish_reason = "tool_calls"
 
-        return ChatCompletion(
+        return ChatCompletion._construct(
             id=str(uuid.uuid4()),
             choices=[
-                Choice(
+                Choice._construct(
                     index=0,
-                    message=Message(
+                    message=Message._construct(
                         role="assistant",
                         content=text_content,
                         tool_calls=tool_calls if tool_calls else None,
@@ -678,7 +685,7 @@ class VertexLanguageModel(LanguageModel):
             created=int(time.time()),
             model=self.get_model_name(),
             provider=self.provider,
-            usage=Usage(
+            usage=Usage._construct(
                 completion_tokens=response_data.get("usageMetadata", {}).get("candidatesTokenCount", 0),
                 prompt_tokens=response_data.get("usageMetadata", {}).get("promptTokenCount", 0),
                 total_tokens=response_data.get("usageMetadata", {}).get("totalTokenCount", 0),
@@ -696,6 +703,8 @@ class VertexLanguageModel(LanguageModel):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
         """Send an async chat completion request.
 
@@ -716,18 +725,14 @@ class VertexLanguageModel(LanguageModel):
             validate_tool_calls: If True, validate tool call arguments against the
                 tool's JSON schema. Raises ToolCallValidationError on validation
                 failure. Requires jsonschema package.
+            timeout, deadline: See ``LanguageModel.chat_complete``.
 
         Returns:
             Either a ChatCompletion or an AsyncGenerator yielding ChatCompletionChunks
             if streaming. When the model calls tools, the response message will
             have tool_calls populated.
         """
-        # Warn if validate_tool_calls is used with streaming
-        self._warn_if_validate_with_streaming(validate_tool_calls, stream)
-
-        effective_max_tokens = self._resolve_max_tokens(max_tokens)
-        effective_temperature = self._resolve_temperature(temperature)
-        effective_top_p = self._resolve_top_p(top_p)
+        template = self._get_request_template()
 
         should_stream = stream if stream is not None else self.streaming
 
@@ -745,11 +750,14 @@ class VertexLanguageModel(LanguageModel):
         }
 
         # Add generation config if provided
-        generation_config = self._create_generation_config(
-            max_tokens=effective_max_tokens,
-            temperature=effective_temperature,
-            top_p=effective_top_p,
-        )
+        if max_tokens is None and temperature is None and top_p is None:
+            generation_config = dict(template.params)
+        else:
+            generation_config = self._create_generation_config(
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+            )
         if generation_config:
             payload["generationConfig"] = generation_config
 
@@ -758,7 +766,11 @@ class VertexLanguageModel(LanguageModel):
 
         # Add tools if provided
         if resolved_tools:
-            payload["tools"] = self._convert_tools_to_vertex(resolved_tools)
+            payload["tools"] = (
+                list(template.tools or ())
+                if tools is None
+                else self._convert_tools_to_vertex(resolved_tools)
+            )
 
         # Add tool_config if tool_choice is specified
         if resolved_tool_choice is not None:
@@ -766,17 +778,16 @@ class VertexLanguageModel(LanguageModel):
             if tool_config:
                 payload["tool_config"] = tool_config
 
-        model_path = self._get_model_path()
-
         # Use regular endpoint for both streaming and non-streaming
         # Vertex AI REST API streaming may not be supported the same way
-        url = f"{self.base_url}/{model_path}:generateContent"
+        url = template.url
 
         # Make async HTTP request
         response = await self.async_client.post(
             url,
-            headers=self._get_headers(),
-            json=payload
+            headers=await self._aget_headers(),
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -789,7 +800,7 @@ class VertexLanguageModel(LanguageModel):
                 if chunk:
                     yield chunk
 
-            return generate()
+            return self._avalidate_stream(generate(), validate_tool_calls, resolved_tools)
 
         response_data = response.json()
         result = self._normalize_response(response_data)
@@ -1,13 +1,38 @@
 """Reranker providers for Esperanto."""
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .base import RerankerModel
-from .jina import JinaRerankerModel
-from .transformers import TransformersRerankerModel
-from .voyage import VoyageRerankerModel
+
+# Provider classes are imported on first access, so importing the base class
+# (as AIFactory does) does not load torch/transformers.
+_PROVIDER_MODULES = {
+    "JinaRerankerModel": ".jina",
+    "VoyageRerankerModel": ".voyage",
+    "TransformersRerankerModel": ".transformers",
+}
+
+if TYPE_CHECKING:
+    from .jina import JinaRerankerModel
+    from .transformers import TransformersRerankerModel
+    from .voyage import VoyageRerankerModel
 
 __all__ = [
     "RerankerModel",
     "JinaRerankerModel",
     "VoyageRerankerModel",
     "TransformersRerankerModel",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _PROVIDER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_PROVIDER_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_PROVIDER_MODULES))
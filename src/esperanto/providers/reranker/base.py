@@ -8,6 +8,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from esperanto.common_types import Model
 from esperanto.common_types.reranker import RerankResponse
 from esperanto.utils.connect import HttpConnectionMixin
+from esperanto.utils.instrumentation import instrument_methods
+from esperanto.utils.timeout import TimeoutValue
 
 
 @dataclass
@@ -20,6 +22,11 @@ class RerankerModel(HttpConnectionMixin, ABC):
     config: Optional[Dict[str, Any]] = None
     _config: Dict[str, Any] = field(default_factory=dict)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Route provider calls through the metrics and tracing hooks."""
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, ("rerank", "arerank"))
+
     def __post_init__(self):
         """Initialize configuration after dataclass initialization."""
         # Initialize config with default values
@@ -98,6 +105,9 @@ class RerankerModel(HttpConnectionMixin, ABC):
         query: str,
         documents: List[str],
         top_k: Optional[int] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> RerankResponse:
         """Rerank documents based on relevance to query.
@@ -106,6 +116,12 @@ class RerankerModel(HttpConnectionMixin, ABC):
             query: The search query to rank documents against.
             documents: List of documents to rerank.
             top_k: Maximum number of results to return. If None, returns all.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
             **kwargs: Additional arguments specific to the provider.
 
         Returns:
@@ -119,6 +135,9 @@ class RerankerModel(HttpConnectionMixin, ABC):
         query: str,
         documents: List[str],
         top_k: Optional[int] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> RerankResponse:
         """Async rerank documents based on relevance to query.
@@ -127,6 +146,12 @@ class RerankerModel(HttpConnectionMixin, ABC):
             query: The search query to rank documents against.
             documents: List of documents to rerank.
             top_k: Maximum number of results to return. If None, returns all.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
             **kwargs: Additional arguments specific to the provider.
 
         Returns:
@@ -9,6 +9,7 @@ import httpx
 from esperanto.common_types import Model
 from esperanto.common_types.reranker import RerankResponse, RerankResult
 from esperanto.common_types.response import Usage
+from esperanto.utils.timeout import TimeoutValue
 
 from .base import RerankerModel
 
@@ -158,6 +159,9 @@ class JinaRerankerModel(RerankerModel):
         query: str,
         documents: List[str],
         top_k: Optional[int] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> RerankResponse:
         """Rerank documents using Jina API.
@@ -166,6 +170,7 @@ class JinaRerankerModel(RerankerModel):
             query: The search query to rank documents against.
             documents: List of documents to rerank.
             top_k: Maximum number of results to return.
+            timeout, deadline: See ``RerankerModel.rerank``.
             **kwargs: Additional arguments.
 
         Returns:
@@ -181,7 +186,8 @@ class JinaRerankerModel(RerankerModel):
             response = self.client.post(
                 f"{self.base_url}/rerank",
                 json=payload,
-                headers=self._get_headers()
+                headers=self._get_headers(),
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
             if response.status_code != 200:
@@ -200,6 +206,9 @@ class JinaRerankerModel(RerankerModel):
         query: str,
         documents: List[str],
         top_k: Optional[int] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> RerankResponse:
         """Async rerank documents using Jina API.
@@ -208,6 +217,7 @@ class JinaRerankerModel(RerankerModel):
             query: The search query to rank documents against.
             documents: List of documents to rerank.
             top_k: Maximum number of results to return.
+            timeout, deadline: See ``RerankerModel.rerank``.
             **kwargs: Additional arguments.
 
         Returns:
@@ -223,7 +233,8 @@ class JinaRerankerModel(RerankerModel):
             response = await self.async_client.post(
                 f"{self.base_url}/rerank",
                 json=payload,
-                headers=self._get_headers()
+                headers=self._get_headers(),
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
             if response.status_code != 200:
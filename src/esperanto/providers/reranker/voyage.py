@@ -9,6 +9,7 @@ import httpx
 from esperanto.common_types import Model
 from esperanto.common_types.reranker import RerankResponse, RerankResult
 from esperanto.common_types.response import Usage
+from esperanto.utils.timeout import TimeoutValue
 
 from .base import RerankerModel
 
@@ -140,6 +141,9 @@ class VoyageRerankerModel(RerankerModel):
         query: str,
         documents: List[str],
         top_k: Optional[int] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> RerankResponse:
         """Rerank documents using Voyage API.
@@ -148,6 +152,7 @@ class VoyageRerankerModel(RerankerModel):
             query: The search query to rank documents against.
             documents: List of documents to rerank.
             top_k: Maximum number of results to return.
+            timeout, deadline: See ``RerankerModel.rerank``.
             **kwargs: Additional arguments.
 
         Returns:
@@ -163,7 +168,8 @@ class VoyageRerankerModel(RerankerModel):
             response = self.client.post(
                 f"{self.base_url}/rerank",
                 json=payload,
-                headers=self._get_headers()
+                headers=self._get_headers(),
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
             if response.status_code != 200:
@@ -182,6 +188,9 @@ class VoyageRerankerModel(RerankerModel):
         query: str,
         documents: List[str],
         top_k: Optional[int] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> RerankResponse:
         """Async rerank documents using Voyage API.
@@ -190,6 +199,7 @@ class VoyageRerankerModel(RerankerModel):
             query: The search query to rank documents against.
             documents: List of documents to rerank.
             top_k: Maximum number of results to return.
+            timeout, deadline: See ``RerankerModel.rerank``.
             **kwargs: Additional arguments.
 
         Returns:
@@ -205,7 +215,8 @@ class VoyageRerankerModel(RerankerModel):
             response = await self.async_client.post(
                 f"{self.base_url}/rerank",
                 json=payload,
-                headers=self._get_headers()
+                headers=self._get_headers(),
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
             if response.status_code != 200:
@@ -3,8 +3,9 @@ Speech-to-Text providers for Esperanto.
 This module exports the base speech-to-text model class.
 """
 
-from esperanto.providers.stt.base import SpeechToTextModel
+from esperanto.providers.stt.base import BatchTranscription, SpeechToTextModel
 
 __all__ = [
+    "BatchTranscription",
     "SpeechToTextModel",
 ]
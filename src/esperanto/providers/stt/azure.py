@@ -7,7 +7,12 @@ from typing import Any, BinaryIO, Dict, List, Optional, Union
 import httpx
 
 from esperanto.common_types import Model, TranscriptionResponse
-from esperanto.providers.stt.base import SpeechToTextModel, _guess_audio_content_type
+from esperanto.providers.stt.base import (
+    SpeechToTextModel,
+    _audio_upload,
+    _guess_audio_content_type,
+)
+from esperanto.utils.timeout import TimeoutValue
 
 
 @dataclass
@@ -112,6 +117,9 @@ class AzureSpeechToTextModel(SpeechToTextModel):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Transcribe audio using Azure OpenAI."""
         url = self._build_url("audio/transcriptions")
@@ -132,7 +140,8 @@ class AzureSpeechToTextModel(SpeechToTextModel):
                     url,
                     headers=self._get_headers(),
                     files=files,
-                    data=data
+                    data=data,
+                    timeout=self._get_request_timeout(timeout, deadline),
                 )
         else:
             # For BinaryIO, send the file object directly
@@ -142,7 +151,8 @@ class AzureSpeechToTextModel(SpeechToTextModel):
                 url,
                 headers=self._get_headers(),
                 files=files,
-                data=data
+                data=data,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
         self._handle_error(response)
@@ -160,6 +170,9 @@ class AzureSpeechToTextModel(SpeechToTextModel):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Async transcribe audio using Azure OpenAI."""
         url = self._build_url("audio/transcriptions")
@@ -171,27 +184,13 @@ class AzureSpeechToTextModel(SpeechToTextModel):
         if prompt:
             data["prompt"] = prompt
 
-        # Handle file input
-        if isinstance(audio_file, str):
-            # For file path, open and send as multipart form data
-            with open(audio_file, "rb") as f:
-                files: Dict[str, Any] = {"file": (audio_file, f, _guess_audio_content_type(audio_file))}
-                response = await self.async_client.post(
-                    url,
-                    headers=self._get_headers(),
-                    files=files,
-                    data=data
-                )
-        else:
-            # For BinaryIO, send the file object directly
-            filename = getattr(audio_file, 'name', 'audio.mp3')
-            files = {"file": (filename, audio_file, _guess_audio_content_type(filename))}
-            response = await self.async_client.post(
-                url,
-                headers=self._get_headers(),
-                files=files,
-                data=data
-            )
+        upload = _audio_upload(audio_file, data)
+        response = await self.async_client.post(
+            url,
+            headers={**self._get_headers(), **upload.headers},
+            content=upload,
+            timeout=self._get_request_timeout(timeout, deadline),
+        )
 
         self._handle_error(response)
         response_data = response.json()
@@ -1,14 +1,50 @@
 """Base speech-to-text model interface."""
 
+import asyncio
+import concurrent.futures
 import mimetypes
+import os
 import pathlib
+import time
 import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, BinaryIO, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from esperanto.common_types import Model, TranscriptionResponse
+from esperanto.utils.audio import (
+    DEFAULT_CHUNK_SECONDS,
+    DEFAULT_MAX_CHUNK_BYTES,
+    DEFAULT_OVERLAP_SECONDS,
+    DEFAULT_STREAM_SAMPLE_RATE,
+    AudioChunk,
+    SpeechSegment,
+    SpeechSegmenter,
+    WavSource,
+    offset_segments,
+    open_audio_source,
+    pcm_to_wav,
+    plan_chunks,
+    stitch_transcripts,
+)
 from esperanto.utils.connect import HttpConnectionMixin
+from esperanto.utils.instrumentation import instrument_methods
+from esperanto.utils.multipart import AsyncMultipartUpload
+from esperanto.utils.timeout import TimeoutValue
 
 _AUDIO_CONTAINER_EXTENSIONS = {
     ".webm": "audio/webm",
@@ -36,6 +72,49 @@ def _guess_audio_content_type(filename: Optional[str]) -> str:
     return "audio/mpeg"
 
 
+def _audio_upload(
+    audio_file: Union[str, BinaryIO],
+    data: Dict[str, Any],
+    content_type: Optional[str] = None,
+) -> AsyncMultipartUpload:
+    """Build a streaming multipart body for an async transcription request.
+
+    The file is read in bounded chunks from a worker thread while the request
+    is sent, instead of with blocking reads on the event loop.
+    """
+    name = audio_file if isinstance(audio_file, str) else getattr(audio_file, "name", None)
+    filename = name if isinstance(name, str) and name else "audio.mp3"
+    return AsyncMultipartUpload(
+        audio_file,
+        data,
+        filename=os.path.basename(filename),
+        content_type=content_type or _guess_audio_content_type(filename),
+    )
+
+
+@dataclass(frozen=True)
+class BatchTranscription:
+    """Outcome of one input of ``transcribe_many`` or ``atranscribe_many``.
+
+    Attributes:
+        index: Position of the input in the batch.
+        input: The audio file as it was passed in.
+        result: The transcription, or the exception raised for this input.
+        elapsed: Seconds spent transcribing this input, excluding time spent
+            waiting for a free slot.
+    """
+
+    index: int
+    input: Union[str, BinaryIO]
+    result: Union[TranscriptionResponse, Exception]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        """Whether the input was transcribed successfully."""
+        return isinstance(self.result, TranscriptionResponse)
+
+
 @dataclass
 class SpeechToTextModel(HttpConnectionMixin, ABC):
     """Base class for speech-to-text models.
@@ -55,6 +134,11 @@ class SpeechToTextModel(HttpConnectionMixin, ABC):
     timeout: Optional[float] = None
     _config: Dict[str, Any] = field(init=False, repr=False)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Route provider calls through the metrics and tracing hooks."""
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, ("transcribe", "atranscribe"))
+
     def __post_init__(self):
         """Initialize configuration after dataclass initialization."""
         # Initialize config with default values
@@ -81,6 +165,9 @@ class SpeechToTextModel(HttpConnectionMixin, ABC):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Transcribe audio to text.
 
@@ -89,6 +176,12 @@ class SpeechToTextModel(HttpConnectionMixin, ABC):
             language: Optional language code (e.g., 'en', 'es'). If not provided,
                      the model will try to detect the language.
             prompt: Optional text to guide the transcription.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
 
         Returns:
             TranscriptionResponse containing the transcribed text and metadata.
@@ -101,6 +194,9 @@ class SpeechToTextModel(HttpConnectionMixin, ABC):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Async transcribe audio to text.
 
@@ -109,12 +205,455 @@ class SpeechToTextModel(HttpConnectionMixin, ABC):
             language: Optional language code (e.g., 'en', 'es'). If not provided,
                      the model will try to detect the language.
             prompt: Optional text to guide the transcription.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
 
         Returns:
             TranscriptionResponse containing the transcribed text and metadata.
         """
         pass
 
+    def transcribe_long(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        *,
+        chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+        overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        max_concurrency: int = 4,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+    ) -> TranscriptionResponse:
+        """Transcribe a long recording by splitting it into chunks.
+
+        The audio is cut at silence into overlapping chunks that fit the
+        provider's upload limit, the chunks are transcribed concurrently on a
+        thread pool, and the transcripts are stitched back together with the
+        repeated overlap removed. Non-WAV input requires ``ffmpeg`` on PATH.
+
+        Args:
+            audio_file: Path to audio file or file-like object.
+            language: Optional language code passed to every chunk.
+            prompt: Optional text to guide the transcription of every chunk.
+            chunk_seconds: Maximum chunk duration in seconds.
+            overlap_seconds: Audio shared by consecutive chunks, in seconds.
+            max_chunk_bytes: Maximum size of a chunk uploaded as WAV.
+            max_concurrency: Maximum number of chunks transcribed at once.
+            timeout: Per-call HTTP timeout override applied to each chunk.
+            deadline: Time budget in seconds applied to each chunk request.
+
+        Returns:
+            TranscriptionResponse with the combined text. ``metadata["chunks"]``
+            lists each chunk's start and end time in seconds and its text.
+            When the provider reports segment timestamps (OpenAI and Groq
+            Whisper models), ``metadata["segments"]`` lists them on the
+            timeline of the whole recording.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        source = open_audio_source(audio_file)
+        try:
+            chunks = plan_chunks(source, chunk_seconds, overlap_seconds, max_chunk_bytes)
+            if len(chunks) == 1 and isinstance(audio_file, str):
+                return self._transcribe_chunk(audio_file, language, prompt, timeout, deadline)
+
+            def run(chunk: AudioChunk) -> TranscriptionResponse:
+                return self._transcribe_chunk(
+                    source.export(chunk), language, prompt, timeout, deadline
+                )
+
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(chunks)),
+                thread_name_prefix="esperanto-stt",
+            )
+            try:
+                results = list(executor.map(run, chunks))
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            source.close()
+
+        return self._combine_chunk_transcriptions(source, chunks, results, language)
+
+    async def atranscribe_long(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        *,
+        chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+        overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        max_concurrency: int = 4,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+    ) -> TranscriptionResponse:
+        """Async transcribe a long recording by splitting it into chunks.
+
+        Accepts the same arguments as ``transcribe_long``. Chunks are sent
+        through ``atranscribe`` with at most ``max_concurrency`` requests in
+        flight. Decoding and chunk extraction run in a worker thread so the
+        event loop is not blocked.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        source = await asyncio.to_thread(open_audio_source, audio_file)
+        try:
+            chunks = await asyncio.to_thread(
+                plan_chunks, source, chunk_seconds, overlap_seconds, max_chunk_bytes
+            )
+            if len(chunks) == 1 and isinstance(audio_file, str):
+                return await self._atranscribe_chunk(
+                    audio_file, language, prompt, timeout, deadline
+                )
+
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def run(chunk: AudioChunk) -> TranscriptionResponse:
+                async with semaphore:
+                    data = await asyncio.to_thread(source.export, chunk)
+                    return await self._atranscribe_chunk(
+                        data, language, prompt, timeout, deadline
+                    )
+
+            tasks = [asyncio.ensure_future(run(chunk)) for chunk in chunks]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        finally:
+            source.close()
+
+        return self._combine_chunk_transcriptions(source, chunks, results, language)
+
+    def transcribe_many(
+        self,
+        audio_files: Iterable[Union[str, BinaryIO]],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        *,
+        max_concurrency: int = 4,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[BatchTranscription]:
+        """Transcribe many files concurrently, yielding each as it finishes.
+
+        Inputs are read from ``audio_files`` lazily, so at most
+        ``max_concurrency`` files are open or in flight at any time, even for
+        very large batches. A failing file does not stop the batch: its
+        exception is returned in ``BatchTranscription.result``.
+
+        Args:
+            audio_files: Paths or file-like objects to transcribe.
+            language: Optional language code passed to every request.
+            prompt: Optional text to guide the transcription of every file.
+            max_concurrency: Maximum number of files transcribed at once.
+            timeout: Per-call HTTP timeout override for each request.
+            deadline: Time budget in seconds for each request.
+
+        Yields:
+            BatchTranscription for every input, in completion order.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        def run(audio_file: Union[str, BinaryIO]) -> "tuple[Any, float]":
+            start = time.perf_counter()
+            try:
+                result: Any = self.transcribe(
+                    audio_file, language, prompt, timeout=timeout, deadline=deadline
+                )
+            except Exception as e:
+                result = e
+            return result, time.perf_counter() - start
+
+        inputs = enumerate(audio_files)
+        pending: Dict[concurrent.futures.Future, "tuple[int, Any]"] = {}
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="esperanto-stt"
+        )
+        try:
+            while True:
+                for index, audio_file in inputs:
+                    pending[executor.submit(run, audio_file)] = (index, audio_file)
+                    if len(pending) >= max_concurrency:
+                        break
+                if not pending:
+                    return
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    index, audio_file = pending.pop(future)
+                    result, elapsed = future.result()
+                    yield BatchTranscription(index, audio_file, result, elapsed)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def atranscribe_many(
+        self,
+        audio_files: Union[Iterable[Union[str, BinaryIO]], AsyncIterable[Union[str, BinaryIO]]],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        *,
+        max_concurrency: int = 4,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[BatchTranscription]:
+        """Async transcribe many files concurrently, yielding each as it finishes.
+
+        Accepts the same arguments as ``transcribe_many``; ``audio_files`` may
+        also be an async iterable. Requests go through ``atranscribe`` on the
+        shared async client, which streams each upload in bounded chunks.
+        Closing the iterator early cancels the requests still in flight.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        async def inputs() -> AsyncGenerator[Union[str, BinaryIO], None]:
+            if isinstance(audio_files, AsyncIterable):
+                async for audio_file in audio_files:
+                    yield audio_file
+            else:
+                for audio_file in audio_files:
+                    yield audio_file
+
+        async def run(index: int, audio_file: Union[str, BinaryIO]) -> BatchTranscription:
+            start = time.perf_counter()
+            try:
+                result: Union[TranscriptionResponse, Exception] = await self.atranscribe(
+                    audio_file, language, prompt, timeout=timeout, deadline=deadline
+                )
+            except Exception as e:
+                result = e
+            return BatchTranscription(index, audio_file, result, time.perf_counter() - start)
+
+        source = inputs()
+        pending: Set["asyncio.Future[BatchTranscription]"] = set()
+        index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max_concurrency:
+                    try:
+                        audio_file = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.ensure_future(run(index, audio_file)))
+                    index += 1
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await source.aclose()
+
+    def _transcribe_chunk(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str],
+        prompt: Optional[str],
+        timeout: Optional[TimeoutValue],
+        deadline: Optional[float],
+    ) -> TranscriptionResponse:
+        """Transcribe one chunk for ``transcribe_long``.
+
+        The default sends the chunk to ``transcribe``. Providers that can
+        report segment timestamps override this to request them and return
+        them as ``metadata["segments"]`` with ``start``, ``end`` and ``text``.
+        """
+        return self.transcribe(audio_file, language, prompt, timeout=timeout, deadline=deadline)
+
+    async def _atranscribe_chunk(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str],
+        prompt: Optional[str],
+        timeout: Optional[TimeoutValue],
+        deadline: Optional[float],
+    ) -> TranscriptionResponse:
+        """Transcribe one chunk for ``atranscribe_long``. See ``_transcribe_chunk``."""
+        return await self.atranscribe(
+            audio_file, language, prompt, timeout=timeout, deadline=deadline
+        )
+
+    def _combine_chunk_transcriptions(
+        self,
+        source: WavSource,
+        chunks: Sequence[AudioChunk],
+        results: Sequence[TranscriptionResponse],
+        language: Optional[str],
+    ) -> TranscriptionResponse:
+        """Stitch chunk transcriptions into one response.
+
+        Segment timestamps reported by the provider in ``metadata["segments"]``
+        are shifted onto the recording timeline, dropping segments that fall
+        inside an overlap already covered by the previous chunk.
+        """
+        segments: List[Dict[str, Any]] = []
+        previous_end = 0.0
+        for chunk, result in zip(chunks, results):
+            chunk_segments = (result.metadata or {}).get("segments")
+            if chunk_segments:
+                segments.extend(offset_segments(chunk_segments, chunk.start, previous_end))
+            previous_end = chunk.end
+
+        metadata: Dict[str, Any] = {
+            "chunks": [
+                {"index": chunk.index, "start": chunk.start, "end": chunk.end, "text": result.text}
+                for chunk, result in zip(chunks, results)
+            ]
+        }
+        if segments:
+            metadata["segments"] = segments
+
+        return TranscriptionResponse(
+            text=stitch_transcripts([result.text for result in results]),
+            language=next((r.language for r in results if r.language), language),
+            duration=source.duration,
+            model=self.get_model_name(),
+            provider=self.provider,
+            metadata=metadata,
+        )
+
+    async def atranscribe_stream(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        *,
+        sample_rate: int = DEFAULT_STREAM_SAMPLE_RATE,
+        sample_width: int = 2,
+        channels: int = 1,
+        partial_interval: Optional[float] = 1.0,
+        min_silence: float = 0.6,
+        max_segment: float = 15.0,
+        silence_threshold: float = 0.01,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[TranscriptionResponse]:
+        """Transcribe live audio, yielding partial and final segments.
+
+        ``audio_chunks`` yields raw little-endian PCM in any chunk size. Speech
+        is detected with an energy-based voice activity detector. Each
+        utterance produces non-final responses (``is_final=False``) while it
+        is still going on and one final response (``is_final=True``) once it
+        ends. Providers with streaming transcription endpoints also stream
+        partial text for each utterance as it is decoded.
+
+        Audio keeps being read while earlier segments are transcribed. A
+        non-final snapshot that is superseded before its request starts is
+        skipped.
+
+        Args:
+            audio_chunks: Async iterator of raw PCM bytes.
+            language: Optional language code passed to every request.
+            prompt: Optional text to guide the transcription.
+            sample_rate: Frames per second of the input.
+            sample_width: Bytes per sample.
+            channels: Number of interleaved channels.
+            partial_interval: Seconds of speech between non-final snapshots,
+                or None to transcribe final segments only.
+            min_silence: Seconds of quiet that end an utterance.
+            max_segment: Maximum utterance length in seconds.
+            silence_threshold: RMS level, as a fraction of full scale, below
+                which audio counts as silence.
+            timeout: Per-call HTTP timeout override for each request.
+            deadline: Time budget in seconds for each request.
+
+        Yields:
+            TranscriptionResponse for each segment snapshot. ``metadata``
+            holds the segment ``index`` and its ``start`` and ``end`` in
+            seconds from the beginning of the stream.
+        """
+        segmenter = SpeechSegmenter(
+            sample_rate,
+            sample_width,
+            channels,
+            silence_threshold=silence_threshold,
+            min_silence_seconds=min_silence,
+            max_segment_seconds=max_segment,
+            partial_interval_seconds=partial_interval,
+        )
+        queue: "asyncio.Queue[Union[SpeechSegment, BaseException, None]]" = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async for data in audio_chunks:
+                    for segment in segmenter.feed(data):
+                        queue.put_nowait(segment)
+                for segment in segmenter.flush():
+                    queue.put_nowait(segment)
+            except Exception as e:
+                queue.put_nowait(e)
+            finally:
+                queue.put_nowait(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                if not item.is_final and not queue.empty():
+                    continue
+
+                metadata = {"index": item.index, "start": item.start, "end": item.end}
+                wav = pcm_to_wav(
+                    item.audio, sample_rate, sample_width, channels,
+                    name=f"segment_{item.index:04d}.wav",
+                )
+                async for response in self._astream_segment(
+                    wav, item.is_final, language, prompt, timeout, deadline
+                ):
+                    yield response.model_copy(
+                        update={"metadata": {**(response.metadata or {}), **metadata}}
+                    )
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+    async def _astream_segment(
+        self,
+        audio: BinaryIO,
+        is_final: bool,
+        language: Optional[str],
+        prompt: Optional[str],
+        timeout: Optional[TimeoutValue],
+        deadline: Optional[float],
+    ) -> AsyncIterator[TranscriptionResponse]:
+        """Transcribe one speech segment for ``atranscribe_stream``.
+
+        The default sends the segment to ``atranscribe``. Providers with a
+        streaming transcription endpoint override this to yield partial text
+        before the final response.
+        """
+        response = await self.atranscribe(
+            audio, language, prompt, timeout=timeout, deadline=deadline
+        )
+        yield response.model_copy(update={"is_final": is_final})
+
     @property
     @abstractmethod
     def provider(self) -> str:
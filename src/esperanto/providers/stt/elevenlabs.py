@@ -10,8 +10,10 @@ from esperanto.common_types import TranscriptionResponse
 from esperanto.providers.stt.base import (
     Model,
     SpeechToTextModel,
+    _audio_upload,
     _guess_audio_content_type,
 )
+from esperanto.utils.timeout import TimeoutValue
 
 
 @dataclass
@@ -92,6 +94,9 @@ class ElevenLabsSpeechToTextModel(SpeechToTextModel):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Transcribe audio to text using ElevenLabs' model."""
         kwargs = self._get_api_kwargs(language, prompt)
@@ -105,7 +110,8 @@ class ElevenLabsSpeechToTextModel(SpeechToTextModel):
                     f"{self.base_url}/speech-to-text",
                     headers=self._get_headers(),
                     files=files,
-                    data=kwargs
+                    data=kwargs,
+                    timeout=self._get_request_timeout(timeout, deadline),
                 )
         else:
             # For BinaryIO, send the file object directly
@@ -115,7 +121,8 @@ class ElevenLabsSpeechToTextModel(SpeechToTextModel):
                 f"{self.base_url}/speech-to-text",
                 headers=self._get_headers(),
                 files=files,
-                data=kwargs
+                data=kwargs,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
         self._handle_error(response)
@@ -133,31 +140,20 @@ class ElevenLabsSpeechToTextModel(SpeechToTextModel):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Async transcribe audio to text using ElevenLabs' model."""
         kwargs = self._get_api_kwargs(language, prompt)
 
-        # Handle file input
-        if isinstance(audio_file, str):
-            # For file path, open and send as multipart form data
-            with open(audio_file, "rb") as f:
-                files: Dict[str, Any] = {"file": (audio_file, f, _guess_audio_content_type(audio_file))}
-                response = await self.async_client.post(
-                    f"{self.base_url}/speech-to-text",
-                    headers=self._get_headers(),
-                    files=files,
-                    data=kwargs
-                )
-        else:
-            # For BinaryIO, send the file object directly
-            filename = getattr(audio_file, 'name', 'audio.mp3')
-            files = {"file": (filename, audio_file, _guess_audio_content_type(filename))}
-            response = await self.async_client.post(
-                f"{self.base_url}/speech-to-text",
-                headers=self._get_headers(),
-                files=files,
-                data=kwargs
-            )
+        upload = _audio_upload(audio_file, kwargs)
+        response = await self.async_client.post(
+            f"{self.base_url}/speech-to-text",
+            headers={**self._get_headers(), **upload.headers},
+            content=upload,
+            timeout=self._get_request_timeout(timeout, deadline),
+        )
 
         self._handle_error(response)
         response_data = response.json()
@@ -1,15 +1,148 @@
 """Google GenAI speech-to-text provider implementation."""
 
+import asyncio
 import base64
+import json
 import os
+import shutil
+import tempfile
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 import httpx
 
 from esperanto.common_types import TranscriptionResponse
 from esperanto.providers.stt.base import Model, SpeechToTextModel
+from esperanto.utils.timeout import TimeoutValue
+
+# generateContent requests above 20 MB are rejected; larger audio is sent
+# through the Files API instead of inline.
+MAX_INLINE_REQUEST_BYTES = 20 * 1024 * 1024
+
+# Multiple of 3 so base64 output of consecutive chunks concatenates cleanly.
+_ENCODE_CHUNK_SIZE = 3 * 64 * 1024
+
+_FILE_POLL_INTERVAL = 1.0
+_FILE_POLL_ATTEMPTS = 60
+
+
+class _AudioSource:
+    """Audio input with a known size that can be read in chunks.
+
+    Paths and seekable streams are read in place. Non-seekable streams are
+    first copied to a spooled temporary file so their size is known.
+    """
+
+    def __init__(self, audio_file: Union[str, BinaryIO]):
+        self._spool: Optional[BinaryIO] = None
+        if isinstance(audio_file, str):
+            self.name = audio_file
+            self._file: Optional[BinaryIO] = None
+            self._start = 0
+            self.size = os.path.getsize(audio_file)
+            return
+
+        self.name = getattr(audio_file, "name", None) or "audio_input.mp3"
+        if not audio_file.seekable():
+            spool = tempfile.SpooledTemporaryFile(max_size=_ENCODE_CHUNK_SIZE)
+            shutil.copyfileobj(audio_file, spool, _ENCODE_CHUNK_SIZE)
+            audio_file = self._spool = spool  # type: ignore[assignment]
+            audio_file.seek(0)
+        self._file = audio_file
+        self._start = audio_file.tell()
+        self.size = audio_file.seek(0, os.SEEK_END) - self._start
+        audio_file.seek(self._start)
+
+    def iter_bytes(self) -> Generator[bytes, None, None]:
+        """Yield the raw audio in fixed-size chunks."""
+        if self._file is None:
+            with open(self.name, "rb") as f:
+                while chunk := f.read(_ENCODE_CHUNK_SIZE):
+                    yield chunk
+            return
+        self._file.seek(self._start)
+        while chunk := self._file.read(_ENCODE_CHUNK_SIZE):
+            yield chunk
+
+    def iter_base64(self) -> Generator[bytes, None, None]:
+        """Yield the audio base64-encoded, one chunk at a time."""
+        remainder = b""
+        for chunk in self.iter_bytes():
+            data = remainder + chunk if remainder else chunk
+            cut = len(data) - len(data) % 3
+            remainder = data[cut:]
+            if cut:
+                yield base64.b64encode(data[:cut])
+        if remainder:
+            yield base64.b64encode(remainder)
+
+    @property
+    def base64_size(self) -> int:
+        return (self.size + 2) // 3 * 4
+
+    def close(self) -> None:
+        if self._spool is not None:
+            self._spool.close()
+
+
+async def _aiter_in_thread(iterator: Generator[bytes, None, None]) -> AsyncIterator[bytes]:
+    """Drive a blocking chunk generator from a worker thread."""
+    try:
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, None)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        iterator.close()
+
+
+class _InlineAudioBody:
+    """generateContent JSON body with the audio base64-encoded as it is sent.
+
+    Only the JSON envelope is held in memory; the audio is read and encoded
+    chunk by chunk, so the request never holds a full copy of the file.
+    """
+
+    def __init__(self, source: _AudioSource, text_prompt: str, mime_type: str):
+        envelope = json.dumps({
+            "contents": [{
+                "parts": [
+                    {"text": text_prompt},
+                    {"inline_data": {"mime_type": mime_type, "data": ""}},
+                ]
+            }]
+        })
+        split = envelope.rindex('""') + 1
+        self.head = envelope[:split].encode()
+        self.tail = envelope[split:].encode()
+        self.source = source
+
+    def __len__(self) -> int:
+        return len(self.head) + self.source.base64_size + len(self.tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.head
+        yield from self.source.iter_base64()
+        yield self.tail
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.head
+        async for chunk in _aiter_in_thread(self.source.iter_base64()):
+            yield chunk
+        yield self.tail
 
 
 @dataclass
@@ -37,6 +170,7 @@ class GoogleSpeechToTextModel(SpeechToTextModel):
         # Set base URL - consistent with other Google providers
         base_host = (os.getenv("GEMINI_API_BASE_URL") or "https://generativelanguage.googleapis.com").rstrip("/")
         self.base_url = f"{base_host}/v1beta"
+        self._upload_url = f"{base_host}/upload/v1beta/files"
 
         # Initialize HTTP clients with configurable timeout
         self._create_http_clients()
@@ -114,26 +248,6 @@ class GoogleSpeechToTextModel(SpeechToTextModel):
 
         return mime_types[extension]
 
-    def _encode_audio(self, audio_file: Union[str, BinaryIO]) -> Tuple[bytes, str]:
-        """Read and base64 encode audio file.
-
-        Args:
-            audio_file: Path to audio file or file-like object
-
-        Returns:
-            Tuple of (audio_bytes, file_path_or_name)
-        """
-        if isinstance(audio_file, str):
-            # File path
-            with open(audio_file, "rb") as f:
-                audio_bytes = f.read()
-            return audio_bytes, audio_file
-        else:
-            # BinaryIO
-            audio_bytes = audio_file.read()
-            filename = getattr(audio_file, 'name', 'audio_input.mp3')
-            return audio_bytes, filename
-
     def _build_prompt(
         self,
         language: Optional[str] = None,
@@ -181,75 +295,150 @@ class GoogleSpeechToTextModel(SpeechToTextModel):
                 f"Response structure: {list(response_data.keys())}"
             )
 
-    def _prepare_request_payload(
-        self,
-        audio_file: Union[str, BinaryIO],
-        language: Optional[str] = None,
-        prompt: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], str]:
-        """Prepare request payload for transcription.
-
-        Args:
-            audio_file: Path to audio file or file-like object
-            language: Optional language code
-            prompt: Optional text to guide transcription
-
-        Returns:
-            Tuple of (payload dict, model_name)
-        """
-        # Encode audio
-        audio_bytes, file_identifier = self._encode_audio(audio_file)
-        audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
-
-        # Get MIME type
-        mime_type = self._get_mime_type(file_identifier)
-
-        # Build prompt
-        text_prompt = self._build_prompt(language, prompt)
-
-        # Construct request payload
-        model_name = self.get_model_name()
-        payload = {
+    def _file_payload(self, text_prompt: str, mime_type: str, file_uri: str) -> Dict[str, Any]:
+        """Build a generateContent payload referencing an uploaded file."""
+        return {
             "contents": [{
                 "parts": [
                     {"text": text_prompt},
-                    {
-                        "inline_data": {
-                            "mime_type": mime_type,
-                            "data": audio_base64
-                        }
-                    }
+                    {"file_data": {"mime_type": mime_type, "file_uri": file_uri}},
                 ]
             }]
         }
 
-        return payload, model_name
+    def _upload_start_request(self, source: _AudioSource, mime_type: str) -> Dict[str, Any]:
+        """Build kwargs for starting a resumable Files API upload."""
+        return {
+            "headers": {
+                "X-Goog-Upload-Protocol": "resumable",
+                "X-Goog-Upload-Command": "start",
+                "X-Goog-Upload-Header-Content-Length": str(source.size),
+                "X-Goog-Upload-Header-Content-Type": mime_type,
+                "Content-Type": "application/json",
+            },
+            "json": {"file": {"display_name": Path(source.name).name}},
+        }
+
+    def _upload_finalize_headers(self, source: _AudioSource) -> Dict[str, str]:
+        return {
+            "Content-Length": str(source.size),
+            "X-Goog-Upload-Offset": "0",
+            "X-Goog-Upload-Command": "upload, finalize",
+        }
+
+    def _uploaded_file(self, response: httpx.Response) -> Dict[str, Any]:
+        """Extract file metadata from a Files API response."""
+        self._handle_error(response)
+        data = response.json()
+        file_info = data.get("file", data)
+        if file_info.get("state") == "FAILED":
+            raise RuntimeError(f"Google API error: processing of {file_info.get('name')} failed")
+        return file_info
+
+    def _upload_file(
+        self, source: _AudioSource, mime_type: str, timeout: Any
+    ) -> Dict[str, Any]:
+        """Upload audio through the Files API and wait until it is active."""
+        response = self.client.post(
+            f"{self._upload_url}?key={self._api_key}",
+            timeout=timeout,
+            **self._upload_start_request(source, mime_type),
+        )
+        self._handle_error(response)
+        response = self.client.post(
+            response.headers["x-goog-upload-url"],
+            headers=self._upload_finalize_headers(source),
+            content=source.iter_bytes(),
+            timeout=timeout,
+        )
+        file_info = self._uploaded_file(response)
+
+        for _ in range(_FILE_POLL_ATTEMPTS):
+            if file_info.get("state", "ACTIVE") == "ACTIVE":
+                return file_info
+            time.sleep(_FILE_POLL_INTERVAL)
+            file_info = self._uploaded_file(self.client.get(
+                f"{self.base_url}/{file_info['name']}?key={self._api_key}", timeout=timeout
+            ))
+        raise RuntimeError(f"Google API error: {file_info.get('name')} is still processing")
+
+    async def _aupload_file(
+        self, source: _AudioSource, mime_type: str, timeout: Any
+    ) -> Dict[str, Any]:
+        """Async upload audio through the Files API and wait until it is active."""
+        response = await self.async_client.post(
+            f"{self._upload_url}?key={self._api_key}",
+            timeout=timeout,
+            **self._upload_start_request(source, mime_type),
+        )
+        self._handle_error(response)
+        response = await self.async_client.post(
+            response.headers["x-goog-upload-url"],
+            headers=self._upload_finalize_headers(source),
+            content=_aiter_in_thread(source.iter_bytes()),
+            timeout=timeout,
+        )
+        file_info = self._uploaded_file(response)
+
+        for _ in range(_FILE_POLL_ATTEMPTS):
+            if file_info.get("state", "ACTIVE") == "ACTIVE":
+                return file_info
+            await asyncio.sleep(_FILE_POLL_INTERVAL)
+            file_info = self._uploaded_file(await self.async_client.get(
+                f"{self.base_url}/{file_info['name']}?key={self._api_key}", timeout=timeout
+            ))
+        raise RuntimeError(f"Google API error: {file_info.get('name')} is still processing")
 
     def transcribe(
         self,
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Transcribe audio to text using Google Gemini API.
 
+        Audio is base64-encoded into the request while it is sent. When the
+        request would exceed ``MAX_INLINE_REQUEST_BYTES`` the audio is uploaded
+        through the Files API and referenced by URI instead.
+
         Args:
             audio_file: Path to audio file or file-like object
             language: Optional language code (e.g., 'en', 'es', 'pt')
             prompt: Optional text to guide the transcription
+            timeout, deadline: See ``SpeechToTextModel.transcribe``.
 
         Returns:
             TranscriptionResponse containing the transcribed text and metadata
         """
-        # Prepare request
-        payload, model_name = self._prepare_request_payload(audio_file, language, prompt)
+        model_name = self.get_model_name()
+        url = f"{self.base_url}/models/{model_name}:generateContent?key={self._api_key}"
+        request_timeout = self._get_request_timeout(timeout, deadline)
+        text_prompt = self._build_prompt(language, prompt)
 
-        # Make HTTP request
-        response = self.client.post(
-            f"{self.base_url}/models/{model_name}:generateContent?key={self._api_key}",
-            headers=self._get_headers(),
-            json=payload
-        )
+        source = _AudioSource(audio_file)
+        try:
+            mime_type = self._get_mime_type(source.name)
+            body = _InlineAudioBody(source, text_prompt, mime_type)
+            if len(body) <= MAX_INLINE_REQUEST_BYTES:
+                response = self.client.post(
+                    url,
+                    headers={**self._get_headers(), "Content-Length": str(len(body))},
+                    content=iter(body),
+                    timeout=request_timeout,
+                )
+            else:
+                file_info = self._upload_file(source, mime_type, request_timeout)
+                response = self.client.post(
+                    url,
+                    headers=self._get_headers(),
+                    json=self._file_payload(text_prompt, mime_type, file_info["uri"]),
+                    timeout=request_timeout,
+                )
+        finally:
+            source.close()
 
         # Handle errors
         self._handle_error(response)
@@ -269,26 +458,50 @@ class GoogleSpeechToTextModel(SpeechToTextModel):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Async transcribe audio to text using Google Gemini API.
 
+        Reading and encoding the audio happens in a worker thread, chunk by
+        chunk, while the request is sent.
+
         Args:
             audio_file: Path to audio file or file-like object
             language: Optional language code (e.g., 'en', 'es', 'pt')
             prompt: Optional text to guide the transcription
+            timeout, deadline: See ``SpeechToTextModel.transcribe``.
 
         Returns:
             TranscriptionResponse containing the transcribed text and metadata
         """
-        # Prepare request
-        payload, model_name = self._prepare_request_payload(audio_file, language, prompt)
+        model_name = self.get_model_name()
+        url = f"{self.base_url}/models/{model_name}:generateContent?key={self._api_key}"
+        request_timeout = self._get_request_timeout(timeout, deadline)
+        text_prompt = self._build_prompt(language, prompt)
 
-        # Make async HTTP request
-        response = await self.async_client.post(
-            f"{self.base_url}/models/{model_name}:generateContent?key={self._api_key}",
-            headers=self._get_headers(),
-            json=payload
-        )
+        source = await asyncio.to_thread(_AudioSource, audio_file)
+        try:
+            mime_type = self._get_mime_type(source.name)
+            body = _InlineAudioBody(source, text_prompt, mime_type)
+            if len(body) <= MAX_INLINE_REQUEST_BYTES:
+                response = await self.async_client.post(
+                    url,
+                    headers={**self._get_headers(), "Content-Length": str(len(body))},
+                    content=body.__aiter__(),
+                    timeout=request_timeout,
+                )
+            else:
+                file_info = await self._aupload_file(source, mime_type, request_timeout)
+                response = await self.async_client.post(
+                    url,
+                    headers=self._get_headers(),
+                    json=self._file_payload(text_prompt, mime_type, file_info["uri"]),
+                    timeout=request_timeout,
+                )
+        finally:
+            source.close()
 
         # Handle errors
         self._handle_error(response)
@@ -10,8 +10,10 @@ from esperanto.common_types import TranscriptionResponse
 from esperanto.providers.stt.base import (
     Model,
     SpeechToTextModel,
+    _audio_upload,
     _guess_audio_content_type,
 )
+from esperanto.utils.timeout import TimeoutValue
 
 
 @dataclass
@@ -76,6 +78,9 @@ class MistralSpeechToTextModel(SpeechToTextModel):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Transcribe audio to text using Mistral's Voxtral model."""
         data = self._build_request_data(language, prompt)
@@ -88,6 +93,7 @@ class MistralSpeechToTextModel(SpeechToTextModel):
                     headers=self._get_headers(),
                     files=files,
                     data=data,
+                    timeout=self._get_request_timeout(timeout, deadline),
                 )
         else:
             filename = getattr(audio_file, "name", "audio.mp3")
@@ -97,6 +103,7 @@ class MistralSpeechToTextModel(SpeechToTextModel):
                 headers=self._get_headers(),
                 files=files,
                 data=data,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
         self._handle_error(response)
@@ -114,28 +121,20 @@ class MistralSpeechToTextModel(SpeechToTextModel):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Async transcribe audio to text using Mistral's Voxtral model."""
         data = self._build_request_data(language, prompt)
 
-        if isinstance(audio_file, str):
-            with open(audio_file, "rb") as f:
-                files: Dict[str, Any] = {"file": (audio_file, f, _guess_audio_content_type(audio_file))}
-                response = await self.async_client.post(
-                    f"{self.base_url}/audio/transcriptions",
-                    headers=self._get_headers(),
-                    files=files,
-                    data=data,
-                )
-        else:
-            filename = getattr(audio_file, "name", "audio.mp3")
-            files = {"file": (filename, audio_file, _guess_audio_content_type(filename))}
-            response = await self.async_client.post(
-                f"{self.base_url}/audio/transcriptions",
-                headers=self._get_headers(),
-                files=files,
-                data=data,
-            )
+        upload = _audio_upload(audio_file, data)
+        response = await self.async_client.post(
+            f"{self.base_url}/audio/transcriptions",
+            headers={**self._get_headers(), **upload.headers},
+            content=upload,
+            timeout=self._get_request_timeout(timeout, deadline),
+        )
 
         self._handle_error(response)
         response_data = response.json()
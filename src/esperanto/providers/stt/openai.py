@@ -2,7 +2,7 @@
 
 import os
 from dataclasses import dataclass
-from typing import Any, BinaryIO, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Union
 
 import httpx
 
@@ -10,8 +10,11 @@ from esperanto.common_types import TranscriptionResponse
 from esperanto.providers.stt.base import (
     Model,
     SpeechToTextModel,
+    _audio_upload,
     _guess_audio_content_type,
 )
+from esperanto.utils import json_codec
+from esperanto.utils.timeout import TimeoutValue
 
 
 @dataclass
@@ -87,9 +90,16 @@ class OpenAISpeechToTextModel(SpeechToTextModel):
             return []
 
     def _get_api_kwargs(
-        self, language: Optional[str] = None, prompt: Optional[str] = None
+        self,
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        timestamps: bool = False,
     ) -> Dict[str, Any]:
-        """Get kwargs for API calls."""
+        """Get kwargs for API calls.
+
+        With ``timestamps`` the response format is ``verbose_json``, which
+        adds segment timestamps to the transcript.
+        """
         kwargs = {
             "model": self.get_model_name(),
         }
@@ -98,18 +108,23 @@ class OpenAISpeechToTextModel(SpeechToTextModel):
             kwargs["language"] = language
         if prompt:
             kwargs["prompt"] = prompt
+        if timestamps:
+            kwargs["response_format"] = "verbose_json"
 
         return kwargs
 
-    def transcribe(
+    def _supports_timestamps(self) -> bool:
+        """Whether the model returns segment timestamps with ``verbose_json``."""
+        return "whisper" in self.get_model_name()
+
+    def _post_transcription(
         self,
         audio_file: Union[str, BinaryIO],
-        language: Optional[str] = None,
-        prompt: Optional[str] = None,
-    ) -> TranscriptionResponse:
-        """Transcribe audio to text using OpenAI's Whisper model."""
-        kwargs = self._get_api_kwargs(language, prompt)
-
+        kwargs: Dict[str, Any],
+        timeout: Optional[TimeoutValue],
+        deadline: Optional[float],
+    ) -> Dict[str, Any]:
+        """Upload audio to the transcriptions endpoint and return the JSON response."""
         # Handle file input
         if isinstance(audio_file, str):
             # For file path, open and send as multipart form data
@@ -119,7 +134,8 @@ class OpenAISpeechToTextModel(SpeechToTextModel):
                     f"{self.base_url}/audio/transcriptions",
                     headers=self._get_headers(),
                     files=files,
-                    data=kwargs
+                    data=kwargs,
+                    timeout=self._get_request_timeout(timeout, deadline),
                 )
         else:
             # For BinaryIO, send the file object directly
@@ -129,56 +145,175 @@ class OpenAISpeechToTextModel(SpeechToTextModel):
                 f"{self.base_url}/audio/transcriptions",
                 headers=self._get_headers(),
                 files=files,
-                data=kwargs
+                data=kwargs,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
 
         self._handle_error(response)
-        response_data = response.json()
+        return response.json()
+
+    async def _apost_transcription(
+        self,
+        audio_file: Union[str, BinaryIO],
+        kwargs: Dict[str, Any],
+        timeout: Optional[TimeoutValue],
+        deadline: Optional[float],
+    ) -> Dict[str, Any]:
+        """Async upload audio to the transcriptions endpoint and return the JSON response."""
+        upload = _audio_upload(audio_file, kwargs)
+        response = await self.async_client.post(
+            f"{self.base_url}/audio/transcriptions",
+            headers={**self._get_headers(), **upload.headers},
+            content=upload,
+            timeout=self._get_request_timeout(timeout, deadline),
+        )
+
+        self._handle_error(response)
+        return response.json()
+
+    def _transcription_response(
+        self, response_data: Dict[str, Any], language: Optional[str]
+    ) -> TranscriptionResponse:
+        """Build a TranscriptionResponse, keeping any segment timestamps."""
+        metadata = None
+        if response_data.get("segments"):
+            metadata = {
+                "segments": [
+                    {"start": segment["start"], "end": segment["end"], "text": segment.get("text", "")}
+                    for segment in response_data["segments"]
+                ]
+            }
 
         return TranscriptionResponse(
             text=response_data["text"],
-            language=language,  # OpenAI doesn't return detected language
+            language=language,  # verbose_json reports a language name, not a code
+            duration=response_data.get("duration"),
             model=self.get_model_name(),
             provider=self.provider,
+            metadata=metadata,
         )
 
+    def transcribe(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+    ) -> TranscriptionResponse:
+        """Transcribe audio to text using OpenAI's Whisper model."""
+        kwargs = self._get_api_kwargs(language, prompt)
+        response_data = self._post_transcription(audio_file, kwargs, timeout, deadline)
+        return self._transcription_response(response_data, language)
+
     async def atranscribe(
         self,
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Async transcribe audio to text using OpenAI's Whisper model."""
         kwargs = self._get_api_kwargs(language, prompt)
+        response_data = await self._apost_transcription(audio_file, kwargs, timeout, deadline)
+        return self._transcription_response(response_data, language)
 
-        # Handle file input
-        if isinstance(audio_file, str):
-            # For file path, open and send as multipart form data
-            with open(audio_file, "rb") as f:
-                files: Dict[str, Any] = {"file": (audio_file, f, _guess_audio_content_type(audio_file))}
-                response = await self.async_client.post(
-                    f"{self.base_url}/audio/transcriptions",
-                    headers=self._get_headers(),
-                    files=files,
-                    data=kwargs
-                )
-        else:
-            # For BinaryIO, send the file object directly
-            filename = getattr(audio_file, 'name', 'audio.mp3')
-            files = {"file": (filename, audio_file, _guess_audio_content_type(filename))}
-            response = await self.async_client.post(
-                f"{self.base_url}/audio/transcriptions",
-                headers=self._get_headers(),
-                files=files,
-                data=kwargs
+    def _transcribe_chunk(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str],
+        prompt: Optional[str],
+        timeout: Optional[TimeoutValue],
+        deadline: Optional[float],
+    ) -> TranscriptionResponse:
+        """Transcribe a chunk with segment timestamps when the model has them."""
+        if not self._supports_timestamps():
+            return super()._transcribe_chunk(audio_file, language, prompt, timeout, deadline)
+        kwargs = self._get_api_kwargs(language, prompt, timestamps=True)
+        response_data = self._post_transcription(audio_file, kwargs, timeout, deadline)
+        return self._transcription_response(response_data, language)
+
+    async def _atranscribe_chunk(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str],
+        prompt: Optional[str],
+        timeout: Optional[TimeoutValue],
+        deadline: Optional[float],
+    ) -> TranscriptionResponse:
+        """Async transcribe a chunk with segment timestamps when the model has them."""
+        if not self._supports_timestamps():
+            return await super()._atranscribe_chunk(
+                audio_file, language, prompt, timeout, deadline
             )
+        kwargs = self._get_api_kwargs(language, prompt, timestamps=True)
+        response_data = await self._apost_transcription(audio_file, kwargs, timeout, deadline)
+        return self._transcription_response(response_data, language)
 
-        self._handle_error(response)
-        response_data = response.json()
+    def _supports_streaming(self) -> bool:
+        """Whether the model streams transcript deltas with ``stream=true``."""
+        return self.get_model_name().startswith(("gpt-4o-transcribe", "gpt-4o-mini-transcribe"))
 
-        return TranscriptionResponse(
-            text=response_data["text"],
-            language=language,  # OpenAI doesn't return detected language
-            model=self.get_model_name(),
-            provider=self.provider,
-        )
+    async def _astream_segment(
+        self,
+        audio: BinaryIO,
+        is_final: bool,
+        language: Optional[str],
+        prompt: Optional[str],
+        timeout: Optional[TimeoutValue],
+        deadline: Optional[float],
+    ) -> AsyncIterator[TranscriptionResponse]:
+        """Stream transcript deltas for a finished speech segment.
+
+        GPT-4o transcription models return Server-Sent Events with
+        ``transcript.text.delta`` and ``transcript.text.done`` events when
+        called with ``stream=true``. Other models, and non-final snapshots,
+        use a regular request.
+        """
+        if not is_final or not self._supports_streaming():
+            async for result in super()._astream_segment(
+                audio, is_final, language, prompt, timeout, deadline
+            ):
+                yield result
+            return
+
+        upload = _audio_upload(audio, {**self._get_api_kwargs(language, prompt), "stream": True})
+        async with self.async_client.stream(
+            "POST",
+            f"{self.base_url}/audio/transcriptions",
+            headers={**self._get_headers(), **upload.headers},
+            content=upload,
+            timeout=self._get_request_timeout(timeout, deadline),
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                self._handle_error(response)
+
+            text = ""
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:].strip()
+                if data == "[DONE]":
+                    break
+                event = json_codec.loads(data)
+                if event.get("type") == "transcript.text.delta":
+                    text += event.get("delta", "")
+                    final = False
+                elif event.get("type") == "transcript.text.done":
+                    text = event.get("text", text)
+                    final = True
+                else:
+                    continue
+                yield TranscriptionResponse(
+                    text=text,
+                    language=language,
+                    model=self.get_model_name(),
+                    provider=self.provider,
+                    is_final=final,
+                )
+                if final:
+                    return
@@ -9,8 +9,9 @@ import httpx
 
 from esperanto.common_types import Model, TranscriptionResponse
 from esperanto.utils.logging import logger
+from esperanto.utils.timeout import TimeoutValue
 
-from .base import SpeechToTextModel
+from .base import SpeechToTextModel, _audio_upload
 
 
 class OpenAICompatibleSpeechToTextModel(SpeechToTextModel):
@@ -228,6 +229,9 @@ class OpenAICompatibleSpeechToTextModel(SpeechToTextModel):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Transcribe audio to text using OpenAI-compatible Speech-to-Text API.
 
@@ -235,6 +239,7 @@ class OpenAICompatibleSpeechToTextModel(SpeechToTextModel):
             audio_file: Path to audio file or file-like object
             language: Optional language code (e.g., 'en', 'es')
             prompt: Optional text to guide the transcription
+            timeout, deadline: See ``SpeechToTextModel.transcribe``.
 
         Returns:
             TranscriptionResponse containing the transcribed text and metadata
@@ -255,7 +260,8 @@ class OpenAICompatibleSpeechToTextModel(SpeechToTextModel):
                         f"{self.base_url}/audio/transcriptions",
                         headers=self._get_headers(),
                         files=files,
-                        data=kwargs
+                        data=kwargs,
+                        timeout=self._get_request_timeout(timeout, deadline),
                     )
             else:
                 # For BinaryIO, send the file object directly
@@ -266,7 +272,8 @@ class OpenAICompatibleSpeechToTextModel(SpeechToTextModel):
                     f"{self.base_url}/audio/transcriptions",
                     headers=self._get_headers(),
                     files=files,
-                    data=kwargs
+                    data=kwargs,
+                    timeout=self._get_request_timeout(timeout, deadline),
                 )
 
             self._handle_error(response)
@@ -286,6 +293,9 @@ class OpenAICompatibleSpeechToTextModel(SpeechToTextModel):
         audio_file: Union[str, BinaryIO],
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
     ) -> TranscriptionResponse:
         """Transcribe audio to text using OpenAI-compatible Speech-to-Text API asynchronously.
 
@@ -293,6 +303,7 @@ class OpenAICompatibleSpeechToTextModel(SpeechToTextModel):
             audio_file: Path to audio file or file-like object
             language: Optional language code (e.g., 'en', 'es')
             prompt: Optional text to guide the transcription
+            timeout, deadline: See ``SpeechToTextModel.transcribe``.
 
         Returns:
             TranscriptionResponse containing the transcribed text and metadata
@@ -303,29 +314,14 @@ class OpenAICompatibleSpeechToTextModel(SpeechToTextModel):
         try:
             kwargs = self._get_api_kwargs(language, prompt)
 
-            # Handle file input
-            if isinstance(audio_file, str):
-                # For file path, open and send as multipart form data
-                mime_type = self._get_audio_mime_type(audio_file)
-                with open(audio_file, "rb") as f:
-                    files: Dict[str, Any] = {"file": (audio_file, f, mime_type)}
-                    response = await self.async_client.post(
-                        f"{self.base_url}/audio/transcriptions",
-                        headers=self._get_headers(),
-                        files=files,
-                        data=kwargs
-                    )
-            else:
-                # For BinaryIO, send the file object directly
-                filename = getattr(audio_file, 'name', 'audio.mp3')
-                mime_type = self._get_audio_mime_type(filename)
-                files = {"file": (filename, audio_file, mime_type)}
-                response = await self.async_client.post(
-                    f"{self.base_url}/audio/transcriptions",
-                    headers=self._get_headers(),
-                    files=files,
-                    data=kwargs
-                )
+            filename = audio_file if isinstance(audio_file, str) else getattr(audio_file, 'name', 'audio.mp3')
+            upload = _audio_upload(audio_file, kwargs, self._get_audio_mime_type(filename or 'audio.mp3'))
+            response = await self.async_client.post(
+                f"{self.base_url}/audio/transcriptions",
+                headers={**self._get_headers(), **upload.headers},
+                content=upload,
+                timeout=self._get_request_timeout(timeout, deadline),
+            )
 
             self._handle_error(response)
             response_data = response.json()
@@ -2,11 +2,18 @@
 
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
-from .base import AudioResponse, Model, TextToSpeechModel, Voice
+from .base import (
+    AudioResponse,
+    Model,
+    SpeechRequest,
+    TextToSpeechModel,
+    TimeoutValue,
+    Voice,
+)
 from .openai import RESPONSE_FORMAT_TO_CONTENT_TYPE
 
 
@@ -184,11 +191,29 @@ class AzureTextToSpeechModel(TextToSpeechModel):
         """
         return []
 
+    def _speech_stream_request(
+        self, text: str, voice: str, **kwargs: Any
+    ) -> Optional[SpeechRequest]:
+        """Build the streaming request; /audio/speech returns raw audio."""
+        return SpeechRequest(
+            url=self._build_url("audio/speech"),
+            payload={
+                "model": self.deployment_name,
+                "voice": voice,
+                "input": text,
+                "response_format": kwargs.pop("response_format", "mp3"),
+                **kwargs,
+            },
+        )
+
     def generate_speech(
         self,
         text: str,
         voice: str = "alloy",
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text using Azure OpenAI TTS.
@@ -197,6 +222,7 @@ class AzureTextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice to use (default: "alloy")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional parameters to pass to the Azure API
 
         Returns:
@@ -222,7 +248,8 @@ class AzureTextToSpeechModel(TextToSpeechModel):
             response = self.client.post(
                 url,
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -255,6 +282,9 @@ class AzureTextToSpeechModel(TextToSpeechModel):
         text: str,
         voice: str = "alloy",
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text using Azure OpenAI TTS asynchronously.
@@ -263,6 +293,7 @@ class AzureTextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice to use (default: "alloy")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional parameters to pass to the Azure API
 
         Returns:
@@ -288,7 +319,8 @@ class AzureTextToSpeechModel(TextToSpeechModel):
             response = await self.async_client.post(
                 url,
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
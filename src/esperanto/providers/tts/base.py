@@ -1,18 +1,195 @@
 """Base text-to-speech model interface."""
 
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import os
 import warnings
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+import httpx
 
 from esperanto.common_types import Model
 from esperanto.common_types.tts import AudioResponse, Voice
+from esperanto.utils.audio_cache import AudioCacheMixin, audio_cache_key
 from esperanto.utils.connect import HttpConnectionMixin
+from esperanto.utils.instrumentation import instrument_methods
+from esperanto.utils.speech import DEFAULT_MAX_SEGMENT_CHARS, concat_audio, split_text
+from esperanto.utils.timeout import TimeoutValue
+
+
+@dataclass(frozen=True)
+class SpeechRequest:
+    """A synthesis request whose response body is the raw audio.
+
+    Attributes:
+        url: Endpoint to POST to.
+        payload: JSON request body.
+    """
+
+    url: str
+    payload: Dict[str, Any]
+
+
+class _AudioFileSink:
+    """Write streamed audio to a path or an open binary file as it arrives.
+
+    Paths are written to a ``.part`` file next to the target, which replaces
+    the target only once the stream completes, so an interrupted stream never
+    leaves a truncated file under the final name.
+    """
+
+    def __init__(self, output_file: Union[str, Path, BinaryIO]):
+        if isinstance(output_file, (str, Path)):
+            self.path: Optional[Path] = Path(output_file).absolute()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._part = self.path.with_name(self.path.name + ".part")
+            self._file: BinaryIO = open(self._part, "wb")
+        else:
+            self.path = None
+            self._file = output_file
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+
+    def commit(self) -> None:
+        if self.path is not None:
+            self._file.close()
+            os.replace(self._part, self.path)
+
+    def abort(self) -> None:
+        if self.path is not None:
+            self._file.close()
+            try:
+                os.remove(self._part)
+            except OSError:
+                pass
+
+
+# Synthesis methods whose results go through the audio cache
+_CACHED_METHODS = (
+    "generate_speech",
+    "agenerate_speech",
+    "generate_multi_speaker_speech",
+    "agenerate_multi_speaker_speech",
+)
+# Set while a cached call runs so nested calls (e.g. via super()) do not look
+# up or store the same entry again
+_in_cached_call: ContextVar[bool] = ContextVar("esperanto_tts_cached_call", default=False)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _with_audio_cache(method: _F) -> _F:
+    """Serve a synthesis method from the model's audio cache when enabled.
+
+    The cache key covers the provider, endpoint, model, method, text, voice or
+    speaker configs, and every other keyword argument. ``output_file``,
+    ``timeout`` and ``deadline`` do not affect the audio and are left out; on
+    a hit, ``output_file`` is written from the cached audio.
+    """
+    signature = inspect.signature(method)
+    name = method.__name__
+    cache_name = name[1:] if name.startswith("agenerate") else name
+
+    def lookup(self: "TextToSpeechModel", args: Any, kwargs: Any) -> Any:
+        cache = None if _in_cached_call.get() else self._get_audio_cache()
+        if cache is None:
+            return None
+        try:
+            arguments = signature.bind(self, *args, **kwargs).arguments
+        except TypeError:
+            return None
+        params: Dict[str, Any] = {}
+        for param_name, value in arguments.items():
+            kind = signature.parameters[param_name].kind
+            if kind is inspect.Parameter.VAR_KEYWORD:
+                params.update(value)
+            elif param_name not in ("self", "text", "output_file", "timeout", "deadline"):
+                params[param_name] = value
+        key = audio_cache_key(
+            getattr(self, "provider", type(self).__name__),
+            self.base_url,
+            self.model_name,
+            cache_name,
+            arguments.get("text", ""),
+            params,
+        )
+        if key is None:
+            return None
+        return cache, key, arguments.get("output_file")
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: "TextToSpeechModel", *args: Any, **kwargs: Any) -> Any:
+            request = lookup(self, args, kwargs)
+            if request is None:
+                return await method(self, *args, **kwargs)
+            cache, key, output_file = request
+            response = cache.get_memory(key)
+            if response is None:
+                response = (
+                    await asyncio.to_thread(cache.get_disk, key)
+                    if cache.has_disk
+                    else cache.get_disk(key)
+                )
+            if response is not None:
+                if output_file:
+                    await asyncio.to_thread(self.save_audio, response, output_file)
+                return response
+            token = _in_cached_call.set(True)
+            try:
+                response = await method(self, *args, **kwargs)
+            finally:
+                _in_cached_call.reset(token)
+            cache.put_memory(key, response)
+            if cache.has_disk:
+                await asyncio.to_thread(cache.put_disk, key, response)
+            return response
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self: "TextToSpeechModel", *args: Any, **kwargs: Any) -> Any:
+        request = lookup(self, args, kwargs)
+        if request is None:
+            return method(self, *args, **kwargs)
+        cache, key, output_file = request
+        response = cache.get(key)
+        if response is not None:
+            if output_file:
+                self.save_audio(response, output_file)
+            return response
+        token = _in_cached_call.set(True)
+        try:
+            response = method(self, *args, **kwargs)
+        finally:
+            _in_cached_call.reset(token)
+        cache.put(key, response)
+        return response
+
+    return wrapper  # type: ignore[return-value]
 
 
 @dataclass
-class TextToSpeechModel(HttpConnectionMixin, ABC):
+class TextToSpeechModel(HttpConnectionMixin, AudioCacheMixin, ABC):
     """Base class for text-to-speech models.
 
     Attributes:
@@ -45,6 +222,15 @@ class TextToSpeechModel(HttpConnectionMixin, ABC):
         "sub",
     ]
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Wrap synthesis methods with the audio cache, then with call instrumentation."""
+        super().__init_subclass__(**kwargs)
+        for name in _CACHED_METHODS:
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "__isabstractmethod__", False):
+                setattr(cls, name, _with_audio_cache(method))
+        instrument_methods(cls, ("generate_speech", "agenerate_speech"))
+
     def __post_init__(self):
         """Initialize configuration after dataclass initialization."""
         # Initialize config with default values
@@ -71,6 +257,9 @@ class TextToSpeechModel(HttpConnectionMixin, ABC):
         text: str,
         voice: str,
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> AudioResponse:
         """Generate speech from text.
@@ -79,6 +268,12 @@ class TextToSpeechModel(HttpConnectionMixin, ABC):
             text: The text to convert to speech.
             voice: The voice ID or name to use.
             output_file: Optional path to save the audio file.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
             **kwargs: Additional provider-specific parameters.
 
         Returns:
@@ -96,11 +291,349 @@ class TextToSpeechModel(HttpConnectionMixin, ABC):
         text: str,
         voice: str,
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> AudioResponse:
         """Async version of generate_speech."""
         pass
 
+    def generate_speech_stream(
+        self,
+        text: str,
+        voice: str,
+        output_file: Optional[Union[str, Path, BinaryIO]] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """Generate speech from text, yielding audio bytes as they arrive.
+
+        Playback can start on the first chunk instead of after the whole file
+        has been synthesized and downloaded. Providers that return audio
+        inside a JSON body yield the complete audio as a single chunk.
+
+        Args:
+            text: The text to convert to speech.
+            voice: The voice ID or name to use.
+            output_file: Optional path or writable binary file. Each chunk is
+                written as it arrives. A path is only created once the stream
+                completes; an interrupted stream leaves no partial file.
+            chunk_size: Size of yielded chunks in bytes. By default data is
+                yielded as soon as it is received.
+            timeout: Per-call override for the HTTP timeout. A number sets every
+                phase; a dict such as {"connect": 2, "read": 30} overrides only the
+                phases it names. If None, uses the instance timeout.
+            deadline: Total time budget in seconds for this call, from sending the
+                request to reading the response body. httpx.TimeoutException is
+                raised once it is spent.
+            **kwargs: Additional provider-specific parameters.
+
+        Yields:
+            bytes: Consecutive pieces of the encoded audio.
+
+        Raises:
+            RuntimeError: If speech generation fails.
+        """
+        request = self._speech_stream_request(text, voice, **kwargs)
+        sink = _AudioFileSink(output_file) if output_file is not None else None
+        try:
+            if request is None:
+                response = self.generate_speech(
+                    text, voice, timeout=timeout, deadline=deadline, **kwargs
+                )
+                if sink is not None:
+                    sink.write(response.audio_data)
+                yield response.audio_data
+            else:
+                with self.client.stream(
+                    "POST",
+                    request.url,
+                    headers=self._get_headers(),
+                    json=request.payload,
+                    timeout=self._get_request_timeout(timeout, deadline),
+                ) as http_response:
+                    if http_response.status_code >= 400:
+                        http_response.read()
+                        self._handle_error(http_response)
+                    for chunk in http_response.iter_bytes(chunk_size):
+                        if sink is not None:
+                            sink.write(chunk)
+                        yield chunk
+        except BaseException:
+            if sink is not None:
+                sink.abort()
+            raise
+        if sink is not None:
+            sink.commit()
+
+    async def agenerate_speech_stream(
+        self,
+        text: str,
+        voice: str,
+        output_file: Optional[Union[str, Path, BinaryIO]] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[bytes]:
+        """Async version of generate_speech_stream.
+
+        File writes for ``output_file`` run in a worker thread so they do not
+        block the event loop.
+        """
+        request = self._speech_stream_request(text, voice, **kwargs)
+        sink = (
+            await asyncio.to_thread(_AudioFileSink, output_file)
+            if output_file is not None
+            else None
+        )
+        try:
+            if request is None:
+                response = await self.agenerate_speech(
+                    text, voice, timeout=timeout, deadline=deadline, **kwargs
+                )
+                if sink is not None:
+                    await asyncio.to_thread(sink.write, response.audio_data)
+                yield response.audio_data
+            else:
+                async with self.async_client.stream(
+                    "POST",
+                    request.url,
+                    headers=self._get_headers(),
+                    json=request.payload,
+                    timeout=self._get_request_timeout(timeout, deadline),
+                ) as http_response:
+                    if http_response.status_code >= 400:
+                        await http_response.aread()
+                        self._handle_error(http_response)
+                    async for chunk in http_response.aiter_bytes(chunk_size):
+                        if sink is not None:
+                            await asyncio.to_thread(sink.write, chunk)
+                        yield chunk
+        except BaseException:
+            if sink is not None:
+                sink.abort()
+            raise
+        if sink is not None:
+            await asyncio.to_thread(sink.commit)
+
+    def generate_speech_segments(
+        self,
+        text: str,
+        voice: str,
+        *,
+        max_chars: int = DEFAULT_MAX_SEGMENT_CHARS,
+        max_concurrency: int = 4,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> Iterator[AudioResponse]:
+        """Synthesize a long text as consecutive segments.
+
+        The text is split at sentence boundaries (SSML-aware) into segments of
+        at most ``max_chars`` characters, which are synthesized concurrently on
+        a thread pool. Segments are yielded in order, each as soon as it and
+        all segments before it are ready, so playback of the first segment can
+        start while the rest are still being synthesized.
+
+        Args:
+            text: The text to convert to speech.
+            voice: The voice ID or name to use.
+            max_chars: Maximum characters sent in one request.
+            max_concurrency: Maximum number of segments synthesized at once.
+            timeout: Per-call HTTP timeout override applied to each segment.
+            deadline: Time budget in seconds applied to each segment request.
+            **kwargs: Additional provider-specific parameters for every segment.
+
+        Yields:
+            AudioResponse: One response per segment, in reading order.
+        """
+        segments = self._plan_segments(text, max_chars, max_concurrency)
+
+        def run(segment: str) -> AudioResponse:
+            return self.generate_speech(
+                segment, voice, timeout=timeout, deadline=deadline, **kwargs
+            )
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(segments)),
+            thread_name_prefix="esperanto-tts",
+        )
+        try:
+            yield from executor.map(run, segments)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def agenerate_speech_segments(
+        self,
+        text: str,
+        voice: str,
+        *,
+        max_chars: int = DEFAULT_MAX_SEGMENT_CHARS,
+        max_concurrency: int = 4,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[AudioResponse]:
+        """Async version of generate_speech_segments.
+
+        Segments are sent through ``agenerate_speech`` with at most
+        ``max_concurrency`` requests in flight. Requests still running when
+        the iterator is closed are cancelled.
+        """
+        segments = self._plan_segments(text, max_chars, max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(segment: str) -> AudioResponse:
+            async with semaphore:
+                return await self.agenerate_speech(
+                    segment, voice, timeout=timeout, deadline=deadline, **kwargs
+                )
+
+        tasks = [asyncio.ensure_future(run(segment)) for segment in segments]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def generate_speech_long(
+        self,
+        text: str,
+        voice: str,
+        output_file: Optional[Union[str, Path]] = None,
+        *,
+        max_chars: int = DEFAULT_MAX_SEGMENT_CHARS,
+        max_concurrency: int = 4,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> AudioResponse:
+        """Generate speech for a text longer than one request allows.
+
+        Segments from ``generate_speech_segments`` are joined without
+        re-encoding. WAV and PCM output are joined sample by sample, MP3 and
+        AAC frame by frame, and Ogg Opus is remuxed into a single stream.
+        Other formats raise ``ValueError`` when the text needs more than one
+        segment.
+
+        Accepts the same arguments as ``generate_speech_segments``, plus an
+        optional ``output_file`` for the joined audio.
+
+        Returns:
+            AudioResponse with the joined audio. ``metadata["segments"]``
+            lists the text of each segment.
+        """
+        segments = self._plan_segments(text, max_chars, max_concurrency)
+        if len(segments) == 1:
+            return self.generate_speech(
+                text, voice, output_file, timeout=timeout, deadline=deadline, **kwargs
+            )
+        responses = list(
+            self.generate_speech_segments(
+                text, voice, max_chars=max_chars, max_concurrency=max_concurrency,
+                timeout=timeout, deadline=deadline, **kwargs,
+            )
+        )
+        return self._join_segments(segments, responses, output_file)
+
+    async def agenerate_speech_long(
+        self,
+        text: str,
+        voice: str,
+        output_file: Optional[Union[str, Path]] = None,
+        *,
+        max_chars: int = DEFAULT_MAX_SEGMENT_CHARS,
+        max_concurrency: int = 4,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> AudioResponse:
+        """Async version of generate_speech_long.
+
+        Joining the audio and writing ``output_file`` run in a worker thread.
+        """
+        segments = self._plan_segments(text, max_chars, max_concurrency)
+        if len(segments) == 1:
+            return await self.agenerate_speech(
+                text, voice, output_file, timeout=timeout, deadline=deadline, **kwargs
+            )
+        responses = [
+            response
+            async for response in self.agenerate_speech_segments(
+                text, voice, max_chars=max_chars, max_concurrency=max_concurrency,
+                timeout=timeout, deadline=deadline, **kwargs,
+            )
+        ]
+        return await asyncio.to_thread(
+            self._join_segments, segments, responses, output_file
+        )
+
+    def _plan_segments(self, text: str, max_chars: int, max_concurrency: int) -> List[str]:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        segments = split_text(text, max_chars)
+        if not segments:
+            raise ValueError("Text must be a non-empty string")
+        return segments
+
+    def _join_segments(
+        self,
+        segments: List[str],
+        responses: List[AudioResponse],
+        output_file: Optional[Union[str, Path]],
+    ) -> AudioResponse:
+        """Join per-segment responses into one AudioResponse."""
+        first = responses[0]
+        for response in responses[1:]:
+            if response.content_type != first.content_type:
+                raise RuntimeError(
+                    f"Segments returned different audio types: "
+                    f"{first.content_type} and {response.content_type}"
+                )
+        audio_data = concat_audio([r.audio_data for r in responses], first.content_type)
+        durations = [r.duration for r in responses if r.duration is not None]
+
+        if output_file:
+            self.save_audio(audio_data, output_file)
+
+        return AudioResponse(
+            audio_data=audio_data,
+            duration=sum(durations) if len(durations) == len(responses) else None,
+            content_type=first.content_type,
+            model=first.model,
+            voice=first.voice,
+            provider=first.provider,
+            metadata={"segments": segments},
+        )
+
+    def _speech_stream_request(
+        self, text: str, voice: str, **kwargs: Any
+    ) -> Optional[SpeechRequest]:
+        """Build a request whose response body is the raw audio stream.
+
+        Providers whose synthesis endpoint returns audio bytes directly
+        override this. The default returns None, and streaming falls back to
+        ``generate_speech``.
+        """
+        return None
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get headers for API requests."""
+        return {}
+
+    def _handle_error(self, response: httpx.Response) -> None:
+        """Raise RuntimeError for HTTP error responses."""
+        if response.status_code >= 400:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+
     @property
     @abstractmethod
     def available_voices(self) -> Dict[str, Voice]:
@@ -183,11 +716,16 @@ class TextToSpeechModel(HttpConnectionMixin, ABC):
         if model and not isinstance(model, str):
             raise ValueError("Model must be a string")
 
-    def save_audio(self, audio_data: bytes, output_file: Union[str, Path]) -> str:
+    def save_audio(
+        self,
+        audio_data: Union[bytes, memoryview, AudioResponse],
+        output_file: Union[str, Path],
+    ) -> str:
         """Save audio data to a file.
 
         Args:
-            audio_data: Raw audio data in bytes
+            audio_data: Raw audio data, or a response whose audio is written
+                without being loaded into memory
             output_file: Path to save the audio file
 
         Returns:
@@ -201,7 +739,10 @@ class TextToSpeechModel(HttpConnectionMixin, ABC):
 
         try:
             with open(output_path, "wb") as f:
-                f.write(audio_data)
+                if isinstance(audio_data, AudioResponse):
+                    audio_data.write_to(f)
+                else:
+                    f.write(audio_data)
             return str(output_path)
         except IOError as e:
             raise IOError(f"Failed to save audio file: {str(e)}") from e
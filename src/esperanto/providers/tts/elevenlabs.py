@@ -5,7 +5,14 @@ from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
-from .base import AudioResponse, Model, TextToSpeechModel, Voice
+from .base import (
+    AudioResponse,
+    Model,
+    SpeechRequest,
+    TextToSpeechModel,
+    TimeoutValue,
+    Voice,
+)
 
 
 class ElevenLabsTextToSpeechModel(TextToSpeechModel):
@@ -86,7 +93,29 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
                 error_message = f"HTTP {response.status_code}: {response.text}"
             raise RuntimeError(f"ElevenLabs API error: {error_message}")
 
-    def generate_speech(self, text: str, voice: str, output_file: Optional[Union[str, Path]] = None, **kwargs: Any) -> AudioResponse:
+    def _speech_stream_request(
+        self, text: str, voice: str, **kwargs: Any
+    ) -> Optional[SpeechRequest]:
+        """Build a request for the dedicated streaming endpoint."""
+        return SpeechRequest(
+            url=f"{self.base_url}/v1/text-to-speech/{voice}/stream?output_format=mp3_44100_128",
+            payload={
+                "text": text,
+                "model_id": self.model_name,
+                "voice_settings": self.voice_settings,
+            },
+        )
+
+    def generate_speech(
+        self,
+        text: str,
+        voice: str,
+        output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> AudioResponse:
         """Generate speech synchronously."""
         # Prepare request payload
         payload = {
@@ -99,7 +128,8 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
         response = self.client.post(
             f"{self.base_url}/v1/text-to-speech/{voice}?output_format=mp3_44100_128",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -120,7 +150,16 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
 
         return response_audio
 
-    async def agenerate_speech(self, text: str, voice: str, output_file: Optional[Union[str, Path]] = None, **kwargs: Any) -> AudioResponse:
+    async def agenerate_speech(
+        self,
+        text: str,
+        voice: str,
+        output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> AudioResponse:
         """Generate speech asynchronously."""
         # Prepare request payload
         payload = {
@@ -133,7 +172,8 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
         response = await self.async_client.post(
             f"{self.base_url}/v1/text-to-speech/{voice}?output_format=mp3_44100_128",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -185,6 +225,9 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
         text: str,
         speaker_configs: List[Dict[str, str]],
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech with multiple speakers using ElevenLabs text-to-dialogue.
@@ -193,6 +236,7 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
             text: Text containing the conversation with speaker names
             speaker_configs: List of dicts with 'speaker' and 'voice' keys
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional arguments passed to the provider
 
         Returns:
@@ -246,7 +290,8 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
         response = self.client.post(
             f"{self.base_url}/v1/text-to-dialogue",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -272,6 +317,9 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
         text: str,
         speaker_configs: List[Dict[str, str]],
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech with multiple speakers asynchronously using ElevenLabs text-to-dialogue.
@@ -280,6 +328,7 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
             text: Text containing the conversation with speaker names
             speaker_configs: List of dicts with 'speaker' and 'voice' keys
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional arguments passed to the provider
 
         Returns:
@@ -327,7 +376,8 @@ class ElevenLabsTextToSpeechModel(TextToSpeechModel):
         response = await self.async_client.post(
             f"{self.base_url}/v1/text-to-dialogue",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
 
@@ -1,14 +1,17 @@
 """Google GenAI Text-to-Speech provider implementation."""
 import base64
-import io
 import os
-import wave
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 import httpx
 
-from .base import AudioResponse, Model, TextToSpeechModel, Voice
+from esperanto.utils.audio import wav_header
+
+from .base import AudioResponse, Model, TextToSpeechModel, TimeoutValue, Voice
+
+# Gemini TTS returns 16-bit mono PCM at this rate
+_PCM_SAMPLE_RATE = 24000
 
 
 class GoogleTextToSpeechModel(TextToSpeechModel):
@@ -78,28 +81,6 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         """Get the provider name."""
         return "google"
 
-    def _convert_pcm_to_wav(self, pcm_data: bytes) -> bytes:
-        """Convert PCM audio data to WAV format.
-        
-        Google returns 16-bit PCM at 24kHz sample rate.
-        """
-        # Create a WAV file in memory
-        wav_buffer = io.BytesIO()
-        
-        # PCM format parameters from Google's API
-        sample_rate = 24000  # 24kHz
-        sample_width = 2     # 16-bit = 2 bytes
-        channels = 1         # Mono
-        
-        with wave.open(wav_buffer, 'wb') as wav_file:
-            wav_file.setnchannels(channels)
-            wav_file.setsampwidth(sample_width)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(pcm_data)
-        
-        wav_buffer.seek(0)
-        return wav_buffer.read()
-
     @property
     def available_voices(self) -> Dict[str, Voice]:
         """Get available voices."""
@@ -303,6 +284,9 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         text: str,
         voice: str,
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text.
@@ -311,6 +295,7 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice ID to use
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional arguments passed to the provider
 
         Returns:
@@ -345,7 +330,8 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         response = self.client.post(
             f"{self.base_url}/models/{model_name}:generateContent?key={self.api_key}",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
@@ -355,21 +341,17 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         audio_data_b64 = response_data["candidates"][0]["content"]["parts"][0]["inlineData"]["data"]
         pcm_data = base64.b64decode(audio_data_b64)
         
-        # Convert PCM to WAV format
-        audio_data = self._convert_pcm_to_wav(pcm_data)
-
-        response_audio = AudioResponse(
-            audio_data=audio_data,
-            content_type="audio/wav",  # Converted to WAV format
+        # Wrap the PCM in a WAV header without copying it
+        response_audio = AudioResponse.from_parts(
+            [wav_header(len(pcm_data), _PCM_SAMPLE_RATE), pcm_data],
+            content_type="audio/wav",
             model=model_name,
             voice=voice,
             provider="google"
         )
 
         if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(audio_data)
+            response_audio.save(output_file)
 
         return response_audio
 
@@ -378,6 +360,9 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         text: str,
         voice: str,
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text asynchronously.
@@ -386,6 +371,7 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice ID to use
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional arguments passed to the provider
 
         Returns:
@@ -420,7 +406,8 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         response = await self.async_client.post(
             f"{self.base_url}/models/{model_name}:generateContent?key={self.api_key}",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
@@ -430,21 +417,17 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         audio_data_b64 = response_data["candidates"][0]["content"]["parts"][0]["inlineData"]["data"]
         pcm_data = base64.b64decode(audio_data_b64)
         
-        # Convert PCM to WAV format
-        audio_data = self._convert_pcm_to_wav(pcm_data)
-
-        response_audio = AudioResponse(
-            audio_data=audio_data,
-            content_type="audio/wav",  # Converted to WAV format
+        # Wrap the PCM in a WAV header without copying it
+        response_audio = AudioResponse.from_parts(
+            [wav_header(len(pcm_data), _PCM_SAMPLE_RATE), pcm_data],
+            content_type="audio/wav",
             model=model_name,
             voice=voice,
             provider="google"
         )
 
         if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(audio_data)
+            response_audio.save(output_file)
 
         return response_audio
 
@@ -453,6 +436,9 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         text: str,
         speaker_configs: List[Dict[str, str]],
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech with multiple speakers (Google-specific feature).
@@ -461,6 +447,7 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
             text: Text containing the conversation with speaker names
             speaker_configs: List of dicts with 'speaker' and 'voice' keys
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional arguments passed to the provider
 
         Returns:
@@ -511,7 +498,8 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         response = self.client.post(
             f"{self.base_url}/models/{model_name}:generateContent?key={self.api_key}",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
@@ -521,21 +509,17 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         audio_data_b64 = response_data["candidates"][0]["content"]["parts"][0]["inlineData"]["data"]
         pcm_data = base64.b64decode(audio_data_b64)
         
-        # Convert PCM to WAV format
-        audio_data = self._convert_pcm_to_wav(pcm_data)
-
-        response_audio = AudioResponse(
-            audio_data=audio_data,
-            content_type="audio/wav",  # Converted to WAV format
+        # Wrap the PCM in a WAV header without copying it
+        response_audio = AudioResponse.from_parts(
+            [wav_header(len(pcm_data), _PCM_SAMPLE_RATE), pcm_data],
+            content_type="audio/wav",
             model=model_name,
             voice="multi-speaker",
             provider="google"
         )
 
         if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(audio_data)
+            response_audio.save(output_file)
 
         return response_audio
     
@@ -544,6 +528,9 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         text: str,
         speaker_configs: List[Dict[str, str]],
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech with multiple speakers asynchronously (Google-specific feature).
@@ -552,6 +539,7 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
             text: Text containing the conversation with speaker names
             speaker_configs: List of dicts with 'speaker' and 'voice' keys
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional arguments passed to the provider
 
         Returns:
@@ -596,7 +584,8 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         response = await self.async_client.post(
             f"{self.base_url}/models/{model_name}:generateContent?key={self.api_key}",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
@@ -606,20 +595,16 @@ class GoogleTextToSpeechModel(TextToSpeechModel):
         audio_data_b64 = response_data["candidates"][0]["content"]["parts"][0]["inlineData"]["data"]
         pcm_data = base64.b64decode(audio_data_b64)
         
-        # Convert PCM to WAV format
-        audio_data = self._convert_pcm_to_wav(pcm_data)
-
-        response_audio = AudioResponse(
-            audio_data=audio_data,
-            content_type="audio/wav",  # Converted to WAV format
+        # Wrap the PCM in a WAV header without copying it
+        response_audio = AudioResponse.from_parts(
+            [wav_header(len(pcm_data), _PCM_SAMPLE_RATE), pcm_data],
+            content_type="audio/wav",
             model=model_name,
             voice="multi-speaker",
             provider="google"
         )
 
         if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(audio_data)
+            response_audio.save(output_file)
 
         return response_audio
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
-from .base import AudioResponse, Model, TextToSpeechModel, Voice
+from .base import AudioResponse, Model, TextToSpeechModel, TimeoutValue, Voice
 
 RESPONSE_FORMAT_TO_CONTENT_TYPE = {
     "mp3": "audio/mp3",
@@ -110,6 +110,9 @@ class MistralTextToSpeechModel(TextToSpeechModel):
         text: str,
         voice: str,
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs: Any,
     ) -> AudioResponse:
         try:
@@ -127,6 +130,7 @@ class MistralTextToSpeechModel(TextToSpeechModel):
                 f"{self.base_url}/audio/speech",
                 headers=self._get_headers(),
                 json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -156,6 +160,9 @@ class MistralTextToSpeechModel(TextToSpeechModel):
         text: str,
         voice: str,
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs: Any,
     ) -> AudioResponse:
         try:
@@ -173,6 +180,7 @@ class MistralTextToSpeechModel(TextToSpeechModel):
                 f"{self.base_url}/audio/speech",
                 headers=self._get_headers(),
                 json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -1,11 +1,18 @@
 """OpenAI Text-to-Speech provider implementation."""
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
-from .base import AudioResponse, Model, TextToSpeechModel, Voice
+from .base import (
+    AudioResponse,
+    Model,
+    SpeechRequest,
+    TextToSpeechModel,
+    TimeoutValue,
+    Voice,
+)
 
 RESPONSE_FORMAT_TO_CONTENT_TYPE = {
     "mp3": "audio/mp3",
@@ -159,11 +166,29 @@ class OpenAITextToSpeechModel(TextToSpeechModel):
             if model["id"].startswith("tts")
         ]
 
+    def _speech_stream_request(
+        self, text: str, voice: str, **kwargs: Any
+    ) -> Optional[SpeechRequest]:
+        """Build the streaming request; /audio/speech returns raw audio."""
+        return SpeechRequest(
+            url=f"{self.base_url}/audio/speech",
+            payload={
+                "model": self.model_name,
+                "voice": voice,
+                "input": text,
+                "response_format": kwargs.pop("response_format", "mp3"),
+                **kwargs,
+            },
+        )
+
     def generate_speech(
         self,
         text: str,
         voice: str = "alloy",
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text using OpenAI's Text-to-Speech API.
@@ -172,6 +197,7 @@ class OpenAITextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice to use (default: "alloy")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional parameters to pass to the OpenAI API
 
         Returns:
@@ -196,7 +222,8 @@ class OpenAITextToSpeechModel(TextToSpeechModel):
             response = self.client.post(
                 f"{self.base_url}/audio/speech",
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -229,6 +256,9 @@ class OpenAITextToSpeechModel(TextToSpeechModel):
         text: str,
         voice: str = "alloy",
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text using OpenAI's Text-to-Speech API asynchronously.
@@ -237,6 +267,7 @@ class OpenAITextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice to use (default: "alloy")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional parameters to pass to the OpenAI API
 
         Returns:
@@ -261,7 +292,8 @@ class OpenAITextToSpeechModel(TextToSpeechModel):
             response = await self.async_client.post(
                 f"{self.base_url}/audio/speech",
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from esperanto.common_types import Model
 from esperanto.utils.logging import logger
+from esperanto.utils.timeout import TimeoutValue
 
 from .base import AudioResponse, Voice
 from .openai import RESPONSE_FORMAT_TO_CONTENT_TYPE, OpenAITextToSpeechModel
@@ -208,6 +209,9 @@ class OpenAICompatibleTextToSpeechModel(OpenAITextToSpeechModel):
         text: str,
         voice: str = "default",
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text using OpenAI-compatible Text-to-Speech API.
@@ -216,6 +220,7 @@ class OpenAICompatibleTextToSpeechModel(OpenAITextToSpeechModel):
             text: Text to convert to speech
             voice: Voice to use (default: "default")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -240,7 +245,8 @@ class OpenAICompatibleTextToSpeechModel(OpenAITextToSpeechModel):
             response = self.client.post(
                 f"{self.base_url}/audio/speech",
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -273,6 +279,9 @@ class OpenAICompatibleTextToSpeechModel(OpenAITextToSpeechModel):
         text: str,
         voice: str = "default",
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text using OpenAI-compatible Text-to-Speech API asynchronously.
@@ -281,6 +290,7 @@ class OpenAICompatibleTextToSpeechModel(OpenAITextToSpeechModel):
             text: Text to convert to speech
             voice: Voice to use (default: "default")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -305,7 +315,8 @@ class OpenAICompatibleTextToSpeechModel(OpenAITextToSpeechModel):
             response = await self.async_client.post(
                 f"{self.base_url}/audio/speech",
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -1,14 +1,14 @@
 """Google Vertex AI Text-to-Speech provider implementation."""
 import base64
 import os
-import subprocess
-import time
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 import httpx
 
-from .base import AudioResponse, Model, TextToSpeechModel, Voice
+from esperanto.utils.google_auth import google_credentials
+
+from .base import AudioResponse, Model, TextToSpeechModel, TimeoutValue, Voice
 
 
 class VertexTextToSpeechModel(TextToSpeechModel):
@@ -52,34 +52,13 @@ class VertexTextToSpeechModel(TextToSpeechModel):
         # Initialize HTTP clients with configurable timeout
         self._create_http_clients()
 
-        # Cache for access token
-        self._access_token = None
-        self._token_expiry = 0
-
     def _get_access_token(self) -> str:
-        """Get OAuth 2.0 access token for Google Cloud APIs."""
-        current_time = time.time()
-        
-        # Check if token is still valid (with 5-minute buffer)
-        if self._access_token and current_time < (self._token_expiry - 300):
-            return self._access_token
-            
-        try:
-            # Use gcloud to get access token
-            result = subprocess.run(
-                ["gcloud", "auth", "application-default", "print-access-token"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            self._access_token = result.stdout.strip()
-            # Tokens typically expire in 1 hour
-            self._token_expiry = current_time + 3600
-            return self._access_token
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(
-                f"Failed to get access token. Make sure you're authenticated with 'gcloud auth application-default login': {e}"
-            )
+        """Get OAuth 2.0 access token for Google Cloud APIs via the gcloud CLI."""
+        return google_credentials.access_token().token()
+
+    async def _aget_access_token(self) -> str:
+        """Get OAuth 2.0 access token without blocking the event loop."""
+        return await google_credentials.access_token().atoken()
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for Cloud Text-to-Speech API requests."""
@@ -88,6 +67,13 @@ class VertexTextToSpeechModel(TextToSpeechModel):
             "Content-Type": "application/json",
         }
 
+    async def _aget_headers(self) -> Dict[str, str]:
+        """Get headers for Cloud Text-to-Speech API requests from async code."""
+        return {
+            "Authorization": f"Bearer {await self._aget_access_token()}",
+            "Content-Type": "application/json",
+        }
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle HTTP error responses."""
         if response.status_code >= 400:
@@ -187,6 +173,9 @@ class VertexTextToSpeechModel(TextToSpeechModel):
         text: str,
         voice: str,
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text.
@@ -195,6 +184,7 @@ class VertexTextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice ID to use (e.g., "en-US-Standard-A")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional arguments passed to the provider
 
         Returns:
@@ -221,7 +211,8 @@ class VertexTextToSpeechModel(TextToSpeechModel):
         response = self.client.post(
             f"{self.base_url}/text:synthesize",
             headers=self._get_headers(),
-            json=payload
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
@@ -251,6 +242,9 @@ class VertexTextToSpeechModel(TextToSpeechModel):
         text: str,
         voice: str,
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text asynchronously.
@@ -259,6 +253,7 @@ class VertexTextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice ID to use (e.g., "en-US-Standard-A")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional arguments passed to the provider
 
         Returns:
@@ -284,8 +279,9 @@ class VertexTextToSpeechModel(TextToSpeechModel):
         # Make async HTTP request
         response = await self.async_client.post(
             f"{self.base_url}/text:synthesize",
-            headers=self._get_headers(),
-            json=payload
+            headers=await self._aget_headers(),
+            json=payload,
+            timeout=self._get_request_timeout(timeout, deadline),
         )
         self._handle_error(response)
         
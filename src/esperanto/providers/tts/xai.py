@@ -3,11 +3,18 @@
 import asyncio
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
 
-from .base import AudioResponse, Model, TextToSpeechModel, Voice
+from .base import (
+    AudioResponse,
+    Model,
+    SpeechRequest,
+    TextToSpeechModel,
+    TimeoutValue,
+    Voice,
+)
 
 
 class XAITextToSpeechModel(TextToSpeechModel):
@@ -161,11 +168,54 @@ class XAITextToSpeechModel(TextToSpeechModel):
         """
         return []
 
+    def _build_payload(
+        self, text: str, voice: str, kwargs: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], str]:
+        """Build the TTS request payload.
+
+        Returns:
+            Tuple of (payload, response_format)
+        """
+        response_format = kwargs.pop("response_format", "mp3")
+        # Allow codec kwarg to override response_format for consistency
+        response_format = kwargs.pop("codec", response_format)
+        language = kwargs.pop("language", "auto")
+
+        # Split kwargs: known output_format fields stay nested, everything
+        # else is forwarded as a top-level request param.
+        format_kwargs = {
+            k: kwargs.pop(k)
+            for k in list(kwargs)
+            if k in self.OUTPUT_FORMAT_FIELDS
+        }
+
+        payload = {
+            "voice_id": voice,
+            "text": text,
+            "language": language,
+            "output_format": {
+                "codec": response_format,
+                **format_kwargs,
+            },
+            **kwargs,
+        }
+        return payload, response_format
+
+    def _speech_stream_request(
+        self, text: str, voice: str, **kwargs: Any
+    ) -> Optional[SpeechRequest]:
+        """Build the streaming request; the TTS endpoint returns raw audio."""
+        payload, _ = self._build_payload(text, voice, kwargs)
+        return SpeechRequest(url=self.build_url("v1/tts"), payload=payload)
+
     def generate_speech(
         self,
         text: str,
         voice: str = DEFAULT_VOICE,
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Generate speech from text using xAI TTS.
@@ -174,6 +224,7 @@ class XAITextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice to use (default: "eve")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional parameters to pass to the xAI API
 
         Returns:
@@ -183,38 +234,16 @@ class XAITextToSpeechModel(TextToSpeechModel):
             RuntimeError: If speech generation fails
         """
         try:
-            response_format = kwargs.pop("response_format", "mp3")
-            # Allow codec kwarg to override response_format for consistency
-            response_format = kwargs.pop("codec", response_format)
-            language = kwargs.pop("language", "auto")
+            payload, response_format = self._build_payload(text, voice, kwargs)
             url = self.build_url("v1/tts")
 
-            # Split kwargs: known output_format fields stay nested, everything
-            # else is forwarded as a top-level request param.
-            format_kwargs = {
-                k: kwargs.pop(k)
-                for k in list(kwargs)
-                if k in self.OUTPUT_FORMAT_FIELDS
-            }
-
-            # Prepare request payload
-            payload = {
-                "voice_id": voice,
-                "text": text,
-                "language": language,
-                "output_format": {
-                    "codec": response_format,
-                    **format_kwargs,
-                },
-                **kwargs,
-            }
-
             # Generate speech
             assert self.client is not None  # guaranteed by __init__ via _create_http_clients
             response = self.client.post(
                 url,
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -247,6 +276,9 @@ class XAITextToSpeechModel(TextToSpeechModel):
         text: str,
         voice: str = "eve",
         output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> AudioResponse:
         """Async version of generate_speech.
@@ -255,6 +287,7 @@ class XAITextToSpeechModel(TextToSpeechModel):
             text: Text to convert to speech
             voice: Voice to use (default: "eve")
             output_file: Optional path to save the audio file
+            timeout, deadline: See ``TextToSpeechModel.generate_speech``.
             **kwargs: Additional parameters to pass to the xAI API
 
         Returns:
@@ -264,38 +297,16 @@ class XAITextToSpeechModel(TextToSpeechModel):
             RuntimeError: If speech generation fails
         """
         try:
-            response_format = kwargs.pop("response_format", "mp3")
-            # Allow codec kwarg to override response_format for consistency
-            response_format = kwargs.pop("codec", response_format)
-            language = kwargs.pop("language", "auto")
+            payload, response_format = self._build_payload(text, voice, kwargs)
             url = self.build_url("v1/tts")
 
-            # Split kwargs: known output_format fields stay nested, everything
-            # else is forwarded as a top-level request param.
-            format_kwargs = {
-                k: kwargs.pop(k)
-                for k in list(kwargs)
-                if k in self.OUTPUT_FORMAT_FIELDS
-            }
-
-            # Prepare request payload
-            payload = {
-                "voice_id": voice,
-                "text": text,
-                "language": language,
-                "output_format": {
-                    "codec": response_format,
-                    **format_kwargs,
-                },
-                **kwargs,
-            }
-
             # Generate speech
             assert self.async_client is not None  # guaranteed by __init__ via _create_http_clients
             response = await self.async_client.post(
                 url,
                 headers=self._get_headers(),
-                json=payload
+                json=payload,
+                timeout=self._get_request_timeout(timeout, deadline),
             )
             self._handle_error(response)
 
@@ -1,6 +1,67 @@
 """Utility modules for Esperanto."""
 
+from esperanto.utils.audio_cache import (
+    AudioCache,
+    AudioCacheConfig,
+    AudioCacheStats,
+    clear_audio_caches,
+)
+from esperanto.utils.circuit_breaker import (
+    CircuitBreakerConfig,
+    CircuitBreakerStats,
+    CircuitState,
+    get_circuit_breaker_states,
+    reset_circuit_breakers,
+)
+from esperanto.utils.dns import clear_dns_cache
 from esperanto.utils.embedding import validate_and_decode_embedding
+from esperanto.utils.google_auth import clear_google_credentials
+from esperanto.utils.instrumentation import (
+    CallEvent,
+    CallMetrics,
+    add_call_hook,
+    clear_instrumentation,
+    enable_tracing,
+    remove_call_hook,
+)
+from esperanto.utils.json_codec import JSONCodec, get_json_codec, set_json_codec
 from esperanto.utils.model_cache import ModelCache
+from esperanto.utils.profiling import (
+    ProfileReport,
+    disable_profiling,
+    enable_profiling,
+    get_profile_report,
+    profile,
+)
+from esperanto.utils.ssl import clear_ssl_contexts
 
-__all__ = ["ModelCache", "validate_and_decode_embedding"]
\ No newline at end of file
+__all__ = [
+    "AudioCache",
+    "AudioCacheConfig",
+    "AudioCacheStats",
+    "CallEvent",
+    "CallMetrics",
+    "CircuitBreakerConfig",
+    "CircuitBreakerStats",
+    "CircuitState",
+    "JSONCodec",
+    "ModelCache",
+    "ProfileReport",
+    "add_call_hook",
+    "clear_audio_caches",
+    "clear_dns_cache",
+    "clear_google_credentials",
+    "clear_instrumentation",
+    "clear_ssl_contexts",
+    "disable_profiling",
+    "enable_profiling",
+    "enable_tracing",
+    "get_circuit_breaker_states",
+    "get_json_codec",
+    "get_profile_report",
+    "profile",
+    "remove_call_hook",
+    "reset_circuit_breakers",
+    "set_json_codec",
+    "validate_and_decode_embedding",
+]
\ No newline at end of file
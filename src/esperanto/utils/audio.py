@@ -0,0 +1,641 @@
+"""Audio helpers for long-form speech-to-text.
+
+Long recordings are split into chunks that fit provider upload limits. Each cut
+is placed at the quietest point near the target chunk length, and consecutive
+chunks overlap slightly so words at a boundary are not lost. Transcripts are
+stitched back together with the duplicated overlap removed.
+
+For live audio, ``SpeechSegmenter`` runs a simple energy-based voice activity
+detector over a stream of raw PCM and reports speech segments as they grow
+and when they end.
+
+Only the standard library is used. PCM WAV input is read directly; any other
+format is first decoded to 16 kHz mono WAV with the ``ffmpeg`` binary.
+"""
+
+import io
+import math
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import wave
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Deque, Dict, List, Optional, Sequence, Union
+
+DEFAULT_CHUNK_SECONDS = 600.0
+DEFAULT_OVERLAP_SECONDS = 2.0
+# Stays under the 25 MB upload limit of Whisper-style endpoints
+DEFAULT_MAX_CHUNK_BYTES = 24 * 1024 * 1024
+DEFAULT_SEARCH_SECONDS = 30.0
+
+# Energy is measured over windows of this length when looking for silence
+_ENERGY_WINDOW_SECONDS = 0.05
+# Samples per second actually inspected when measuring energy
+_ENERGY_SAMPLE_RATE = 8000
+_DECODE_SAMPLE_RATE = 16000
+# Size of the header ``wav_header`` writes before the PCM of each chunk
+_WAV_HEADER_BYTES = 44
+
+DEFAULT_STREAM_SAMPLE_RATE = 16000
+# Voice activity is decided per window of this length
+_VAD_WINDOW_SECONDS = 0.03
+# Audio kept from before speech starts so the first syllable is not clipped
+_VAD_PRE_ROLL_SECONDS = 0.2
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """A contiguous span of a recording, in frames and seconds.
+
+    Attributes:
+        index: Position of the chunk in the recording.
+        start_frame: First frame of the chunk.
+        end_frame: Frame after the last frame of the chunk.
+        start: Chunk start in seconds from the beginning of the recording.
+        end: Chunk end in seconds from the beginning of the recording.
+    """
+
+    index: int
+    start_frame: int
+    end_frame: int
+    start: float
+    end: float
+
+
+class WavSource:
+    """Thread-safe random access to the frames of a PCM WAV file."""
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        close_file: bool = False,
+        cleanup_path: Optional[str] = None,
+    ):
+        """Open a PCM WAV stream.
+
+        Args:
+            fileobj: Seekable binary stream positioned at the WAV header.
+            close_file: Whether closing the source also closes ``fileobj``.
+            cleanup_path: Temporary file removed when the source is closed.
+
+        Raises:
+            wave.Error: If the stream is not a PCM WAV file.
+        """
+        self._fileobj = fileobj
+        self._close_file = close_file
+        self._cleanup_path = cleanup_path
+        self._reader = wave.open(fileobj, "rb")
+        self._lock = threading.Lock()
+        self.nchannels = self._reader.getnchannels()
+        self.sampwidth = self._reader.getsampwidth()
+        self.framerate = self._reader.getframerate()
+        self.nframes = self._reader.getnframes()
+
+    @property
+    def duration(self) -> float:
+        """Duration of the recording in seconds."""
+        return self.nframes / self.framerate
+
+    @property
+    def bytes_per_second(self) -> int:
+        """Size of one second of audio in bytes."""
+        return self.framerate * self.nchannels * self.sampwidth
+
+    def read_frames(self, start: int, end: int) -> bytes:
+        """Read raw frames in ``[start, end)``."""
+        with self._lock:
+            self._reader.setpos(start)
+            return self._reader.readframes(end - start)
+
+    def export(self, chunk: AudioChunk) -> io.BytesIO:
+        """Encode a chunk as a standalone WAV file in memory.
+
+        The returned buffer has a ``name`` attribute so providers can infer
+        the content type from it.
+        """
+        return pcm_to_wav(
+            self.read_frames(chunk.start_frame, chunk.end_frame),
+            self.framerate,
+            self.sampwidth,
+            self.nchannels,
+            name=f"chunk_{chunk.index:04d}.wav",
+        )
+
+    def close(self) -> None:
+        """Close the reader and remove any temporary decoded file."""
+        self._reader.close()
+        if self._close_file:
+            self._fileobj.close()
+        if self._cleanup_path is not None:
+            try:
+                os.remove(self._cleanup_path)
+            except OSError:
+                pass
+            self._cleanup_path = None
+
+    def __enter__(self) -> "WavSource":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def open_audio_source(audio_file: Union[str, BinaryIO]) -> WavSource:
+    """Open a recording for chunked reading.
+
+    PCM WAV files are read in place. Other formats are decoded to a temporary
+    16 kHz mono WAV file with ffmpeg, which is removed when the source closes.
+
+    Args:
+        audio_file: Path to an audio file or a binary file object.
+
+    Returns:
+        WavSource: Random-access reader over the recording.
+
+    Raises:
+        RuntimeError: If the audio is not PCM WAV and ffmpeg is unavailable
+            or fails to decode it.
+    """
+    if isinstance(audio_file, str):
+        fileobj: BinaryIO = open(audio_file, "rb")
+        try:
+            return WavSource(fileobj, close_file=True)
+        except (wave.Error, EOFError):
+            fileobj.close()
+        return _decode_with_ffmpeg(audio_file)
+
+    start = audio_file.tell() if audio_file.seekable() else None
+    if start is not None:
+        try:
+            return WavSource(audio_file)
+        except (wave.Error, EOFError):
+            audio_file.seek(start)
+    return _decode_with_ffmpeg(audio_file)
+
+
+def _decode_with_ffmpeg(audio_file: Union[str, BinaryIO]) -> WavSource:
+    """Decode any audio format to a temporary 16 kHz mono PCM WAV file."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError(
+            "Long-form transcription of non-WAV audio requires ffmpeg. "
+            "Install ffmpeg and make sure it is on PATH, or pass a PCM WAV file."
+        )
+
+    fd, path = tempfile.mkstemp(suffix=".wav", prefix="esperanto-")
+    os.close(fd)
+    source = audio_file if isinstance(audio_file, str) else "pipe:0"
+    command = [
+        ffmpeg, "-v", "error", "-y", "-i", source,
+        "-ac", "1", "-ar", str(_DECODE_SAMPLE_RATE), "-c:a", "pcm_s16le", path,
+    ]
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL if isinstance(audio_file, str) else subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if not isinstance(audio_file, str) and process.stdin is not None:
+            try:
+                shutil.copyfileobj(audio_file, process.stdin)
+            except BrokenPipeError:
+                pass
+            finally:
+                process.stdin.close()
+        stderr = process.stderr.read() if process.stderr is not None else b""
+        if process.wait() != 0:
+            raise RuntimeError(
+                f"ffmpeg failed to decode audio: {stderr.decode(errors='replace').strip()}"
+            )
+        return WavSource(open(path, "rb"), close_file=True, cleanup_path=path)
+    except BaseException:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
+
+
+def _samples(frames: bytes, sampwidth: int) -> Sequence[int]:
+    """Convert little-endian PCM frames to integer samples."""
+    if sampwidth == 1:
+        # 8-bit WAV is unsigned
+        return [sample - 128 for sample in frames]
+    if sampwidth == 3:
+        # Keep the two most significant bytes of each 24-bit sample
+        high = bytearray(len(frames) // 3 * 2)
+        high[0::2] = frames[1::3]
+        high[1::2] = frames[2::3]
+        frames = bytes(high)
+        sampwidth = 2
+    samples = array("h" if sampwidth == 2 else "i")
+    samples.frombytes(frames[: len(frames) - len(frames) % samples.itemsize])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples
+
+
+def find_quietest_frame(source: WavSource, start: int, end: int) -> int:
+    """Find the frame in ``[start, end)`` at the centre of the quietest window.
+
+    Ties go to the latest window so chunks stay as long as possible.
+
+    Args:
+        source: Recording to inspect.
+        start: First candidate frame.
+        end: Frame after the last candidate frame.
+
+    Returns:
+        int: Frame index at which to cut.
+    """
+    window = max(1, int(source.framerate * _ENERGY_WINDOW_SECONDS))
+    if end - start <= window:
+        return (start + end) // 2
+
+    samples = _samples(source.read_frames(start, end), source.sampwidth)
+    window_samples = window * source.nchannels
+    stride = max(1, source.framerate // _ENERGY_SAMPLE_RATE) * source.nchannels
+
+    best_offset = 0
+    best_energy: Optional[int] = None
+    for offset in range(0, len(samples) - window_samples + 1, window_samples):
+        energy = sum(
+            s * s for s in samples[offset:offset + window_samples:stride]
+        )
+        if best_energy is None or energy <= best_energy:
+            best_energy = energy
+            best_offset = offset
+    return start + (best_offset + window_samples // 2) // source.nchannels
+
+
+def plan_chunks(
+    source: WavSource,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+    search_seconds: float = DEFAULT_SEARCH_SECONDS,
+) -> List[AudioChunk]:
+    """Split a recording into overlapping chunks cut at silence.
+
+    Each chunk is at most ``chunk_seconds`` long and, once encoded as WAV, at
+    most ``max_chunk_bytes``. The cut is placed at the quietest point within
+    the last ``search_seconds`` of the chunk, but never in its first half so
+    every chunk makes progress, and the next chunk starts
+    ``overlap_seconds`` before that cut.
+
+    Args:
+        source: Recording to split.
+        chunk_seconds: Maximum chunk duration in seconds.
+        overlap_seconds: Audio shared by consecutive chunks, in seconds.
+        max_chunk_bytes: Maximum encoded chunk size in bytes.
+        search_seconds: How far back from the maximum length to look for silence.
+
+    Returns:
+        List[AudioChunk]: Chunks in recording order.
+
+    Raises:
+        ValueError: If the limits leave no room for progress past the overlap.
+    """
+    if chunk_seconds <= 0:
+        raise ValueError(f"chunk_seconds must be positive, got {chunk_seconds}")
+    if overlap_seconds < 0:
+        raise ValueError(f"overlap_seconds must be non-negative, got {overlap_seconds}")
+
+    rate = source.framerate
+    frame_bytes = source.nchannels * source.sampwidth
+    max_frames = min(
+        int(chunk_seconds * rate), (max_chunk_bytes - _WAV_HEADER_BYTES) // frame_bytes
+    )
+    overlap = int(overlap_seconds * rate)
+    if max_frames <= 2 * overlap:
+        raise ValueError(
+            "Chunks must be longer than twice the overlap; "
+            f"got {max_frames / rate:.1f}s chunks with {overlap_seconds}s overlap"
+        )
+    search = int(search_seconds * rate)
+
+    bounds = []
+    start = 0
+    while source.nframes - start > max_frames:
+        target = start + max_frames
+        cut = find_quietest_frame(
+            source, max(start + max_frames // 2, target - search), target
+        )
+        bounds.append((start, cut))
+        start = cut - overlap
+    bounds.append((start, source.nframes))
+
+    return [
+        AudioChunk(index, first, last, first / rate, last / rate)
+        for index, (first, last) in enumerate(bounds)
+    ]
+
+
+def _normalize_word(word: str) -> str:
+    return "".join(ch for ch in word.lower() if ch.isalnum())
+
+
+def _overlap(previous: List[str], current: List[str], max_words: int) -> int:
+    """Number of leading words of ``current`` already present in ``previous``.
+
+    A chunk starts inside speech that the previous chunk already covered, so
+    its first word may be cut off mid-word. Up to two leading words may be
+    skipped before the match; a match after skipping needs at least two words.
+    """
+    tail = [_normalize_word(w) for w in previous[-max_words:]]
+    head = [_normalize_word(w) for w in current[: max_words + 2]]
+    for length in range(min(len(tail), len(head)), 0, -1):
+        for skip in range(0, 3):
+            if skip and length < 2:
+                continue
+            if head[skip:skip + length] == tail[-length:]:
+                return skip + length
+    return 0
+
+
+def stitch_transcripts(texts: Sequence[str], max_overlap_words: int = 40) -> str:
+    """Join chunk transcripts, dropping words repeated across the overlap.
+
+    Args:
+        texts: Transcripts of consecutive overlapping chunks, in order.
+        max_overlap_words: Longest repeated run to look for at each boundary.
+
+    Returns:
+        str: The combined transcript.
+    """
+    words: List[str] = []
+    for text in texts:
+        current = text.split()
+        if not current:
+            continue
+        if words:
+            current = current[_overlap(words, current, max_overlap_words):]
+        words.extend(current)
+    return " ".join(words)
+
+
+def offset_segments(
+    segments: Sequence[Dict[str, Any]], offset: float, after: float = 0.0
+) -> List[Dict[str, Any]]:
+    """Shift chunk-relative segment timestamps onto the recording timeline.
+
+    Segments whose midpoint falls before ``after`` were already covered by the
+    previous chunk and are dropped.
+
+    Args:
+        segments: Segments with ``start`` and ``end`` in seconds.
+        offset: Chunk start time in seconds.
+        after: End of the previous chunk in seconds.
+
+    Returns:
+        List[Dict[str, Any]]: Shifted segments.
+    """
+    shifted = []
+    for segment in segments:
+        start = float(segment.get("start", 0.0)) + offset
+        end = float(segment.get("end", segment.get("start", 0.0))) + offset
+        if (start + end) / 2 < after:
+            continue
+        shifted.append({**segment, "start": start, "end": end})
+    return shifted
+
+
+def wav_header(
+    data_size: int, sample_rate: int, sample_width: int = 2, channels: int = 1
+) -> bytes:
+    """Build the 44-byte header of a PCM WAV file.
+
+    Writing the header followed by the PCM produces a WAV file without
+    copying the PCM into a new buffer.
+
+    Args:
+        data_size: Size of the PCM that follows, in bytes.
+        sample_rate: Frames per second.
+        sample_width: Bytes per sample.
+        channels: Number of interleaved channels.
+
+    Returns:
+        bytes: The RIFF, ``fmt `` and ``data`` chunk headers.
+    """
+    block_align = channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
+
+
+def pcm_to_wav(
+    pcm: bytes,
+    sample_rate: int,
+    sample_width: int = 2,
+    channels: int = 1,
+    name: str = "audio.wav",
+) -> io.BytesIO:
+    """Wrap raw little-endian PCM in a WAV container in memory.
+
+    Args:
+        pcm: Raw PCM frames.
+        sample_rate: Frames per second.
+        sample_width: Bytes per sample.
+        channels: Number of interleaved channels.
+        name: Value of the buffer's ``name`` attribute.
+
+    Returns:
+        io.BytesIO: WAV file positioned at the start.
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(sample_rate)
+        writer.writeframes(pcm)
+    buffer.seek(0)
+    buffer.name = name
+    return buffer
+
+
+@dataclass(frozen=True)
+class SpeechSegment:
+    """Speech detected in a live audio stream.
+
+    Attributes:
+        index: Position of the segment in the stream.
+        audio: Raw PCM of the segment so far.
+        start: Segment start in seconds from the beginning of the stream.
+        end: Segment end in seconds from the beginning of the stream.
+        is_final: Whether the segment has ended. Non-final segments are
+            snapshots of speech that is still going on.
+    """
+
+    index: int
+    audio: bytes
+    start: float
+    end: float
+    is_final: bool
+
+
+class SpeechSegmenter:
+    """Energy-based voice activity detection over a stream of raw PCM.
+
+    Audio is fed in arbitrary-sized pieces. A segment starts at the first
+    window louder than ``silence_threshold`` and ends after
+    ``min_silence_seconds`` of quiet or once it reaches
+    ``max_segment_seconds``. While a segment is open, a non-final snapshot is
+    reported every ``partial_interval_seconds`` of audio.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = DEFAULT_STREAM_SAMPLE_RATE,
+        sample_width: int = 2,
+        channels: int = 1,
+        *,
+        silence_threshold: float = 0.01,
+        min_silence_seconds: float = 0.6,
+        max_segment_seconds: float = 15.0,
+        partial_interval_seconds: Optional[float] = 1.0,
+    ):
+        """Initialize the segmenter.
+
+        Args:
+            sample_rate: Frames per second of the input.
+            sample_width: Bytes per sample (1, 2, 3 or 4).
+            channels: Number of interleaved channels.
+            silence_threshold: RMS level, as a fraction of full scale, below
+                which a window counts as silence.
+            min_silence_seconds: Quiet time that ends a segment.
+            max_segment_seconds: Length at which a segment is force-ended.
+            partial_interval_seconds: Audio between non-final snapshots, or
+                None to report final segments only.
+
+        Raises:
+            ValueError: If the format or timing parameters are invalid.
+        """
+        if sample_width not in (1, 2, 3, 4):
+            raise ValueError(f"sample_width must be 1, 2, 3 or 4 bytes, got {sample_width}")
+        if sample_rate <= 0 or channels <= 0:
+            raise ValueError("sample_rate and channels must be positive")
+        if min_silence_seconds <= 0 or max_segment_seconds <= min_silence_seconds:
+            raise ValueError(
+                "max_segment_seconds must be greater than min_silence_seconds, "
+                "and both must be positive"
+            )
+        if partial_interval_seconds is not None and partial_interval_seconds <= 0:
+            raise ValueError("partial_interval_seconds must be positive or None")
+
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.channels = channels
+        self._frame_bytes = sample_width * channels
+        self._window_frames = max(1, int(sample_rate * _VAD_WINDOW_SECONDS))
+        self._window_bytes = self._window_frames * self._frame_bytes
+        # 24-bit audio is measured on its top 16 bits
+        full_scale = 2 ** (8 * (2 if sample_width == 3 else sample_width) - 1)
+        self._threshold = silence_threshold * full_scale
+        self._min_silence = int(min_silence_seconds * sample_rate)
+        self._max_segment = int(max_segment_seconds * sample_rate)
+        self._partial_interval = (
+            int(partial_interval_seconds * sample_rate)
+            if partial_interval_seconds is not None
+            else None
+        )
+
+        self._pending = b""
+        self._pre_roll: Deque[bytes] = deque(
+            maxlen=max(1, math.ceil(_VAD_PRE_ROLL_SECONDS / _VAD_WINDOW_SECONDS))
+        )
+        self._speech = bytearray()
+        self._in_speech = False
+        self._segment_start = 0
+        self._silence = 0
+        self._since_partial = 0
+        self._position = 0
+        self._index = 0
+
+    def _is_voiced(self, window: bytes) -> bool:
+        samples = _samples(window, self.sample_width)
+        if not samples:
+            return False
+        rms = math.sqrt(sum(s * s for s in samples) / len(samples))
+        return rms >= self._threshold
+
+    def _segment(self, is_final: bool) -> SpeechSegment:
+        frames = len(self._speech) // self._frame_bytes
+        segment = SpeechSegment(
+            index=self._index,
+            audio=bytes(self._speech),
+            start=self._segment_start / self.sample_rate,
+            end=(self._segment_start + frames) / self.sample_rate,
+            is_final=is_final,
+        )
+        if is_final:
+            self._index += 1
+            self._speech.clear()
+            self._in_speech = False
+        self._since_partial = 0
+        return segment
+
+    def feed(self, data: bytes) -> List[SpeechSegment]:
+        """Add audio and return the segment snapshots it completes."""
+        segments = []
+        data = self._pending + data
+        usable = len(data) - len(data) % self._window_bytes
+        self._pending = data[usable:]
+
+        for offset in range(0, usable, self._window_bytes):
+            window = data[offset:offset + self._window_bytes]
+            voiced = self._is_voiced(window)
+            self._position += self._window_frames
+
+            if not self._in_speech:
+                if voiced:
+                    self._in_speech = True
+                    self._speech.extend(b"".join(self._pre_roll))
+                    self._speech.extend(window)
+                    self._segment_start = self._position - len(self._speech) // self._frame_bytes
+                    self._silence = 0
+                    self._since_partial = self._window_frames
+                    self._pre_roll.clear()
+                else:
+                    self._pre_roll.append(window)
+                continue
+
+            self._speech.extend(window)
+            self._silence = 0 if voiced else self._silence + self._window_frames
+            self._since_partial += self._window_frames
+            length = len(self._speech) // self._frame_bytes
+
+            if self._silence >= self._min_silence or length >= self._max_segment:
+                segments.append(self._segment(is_final=True))
+            elif self._partial_interval is not None and self._since_partial >= self._partial_interval:
+                segments.append(self._segment(is_final=False))
+        return segments
+
+    def flush(self) -> List[SpeechSegment]:
+        """End the stream and return the final open segment, if any."""
+        if self._pending and self._in_speech:
+            self._speech.extend(self._pending[: len(self._pending) - len(self._pending) % self._frame_bytes])
+        self._pending = b""
+        self._pre_roll.clear()
+        if not self._in_speech:
+            return []
+        return [self._segment(is_final=True)]
@@ -0,0 +1,450 @@
+"""Content-addressed cache for synthesized speech.
+
+Text-to-speech output is fully determined by the provider, endpoint, model,
+voice, text and generation parameters, so repeated phrases (IVR prompts,
+notifications) can be served without calling the provider again. Entries live
+in an in-memory LRU tier and, optionally, in an on-disk tier shared across
+processes. Both tiers evict least recently used entries once their size
+budget is exceeded.
+
+Disk hits are memory-mapped: the returned ``AudioResponse`` wraps the mapped
+file without copying it into process memory.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from pydantic import BaseModel
+
+from esperanto.common_types.tts import AudioResponse
+
+# Environment variable enabling the in-memory audio cache for all TTS models
+AUDIO_CACHE_ENV_VAR = "ESPERANTO_TTS_CACHE"
+# Environment variable enabling the audio cache with a disk tier in this directory
+AUDIO_CACHE_DIR_ENV_VAR = "ESPERANTO_TTS_CACHE_DIR"
+
+_META_SUFFIX = ".json"
+
+
+@dataclass(frozen=True)
+class AudioCacheConfig:
+    """Size budgets and location of an audio cache.
+
+    Attributes:
+        memory_max_bytes: Total audio size kept in memory. 0 disables the tier.
+        directory: Directory of the disk tier. None keeps the cache in memory only.
+        disk_max_bytes: Total size of audio and metadata files kept on disk.
+    """
+
+    memory_max_bytes: int = 64 * 1024 * 1024
+    directory: Optional[str] = None
+    disk_max_bytes: int = 1024 * 1024 * 1024
+
+    def __post_init__(self):
+        if self.memory_max_bytes < 0:
+            raise ValueError(
+                f"memory_max_bytes must be non-negative, got {self.memory_max_bytes}"
+            )
+        if self.disk_max_bytes < 0:
+            raise ValueError(f"disk_max_bytes must be non-negative, got {self.disk_max_bytes}")
+        if self.directory is not None:
+            object.__setattr__(
+                self, "directory", str(Path(self.directory).expanduser().absolute())
+            )
+
+
+@dataclass(frozen=True)
+class AudioCacheStats:
+    """Point-in-time snapshot of an audio cache.
+
+    Attributes:
+        memory_hits: Lookups served from memory.
+        disk_hits: Lookups served from disk.
+        misses: Lookups not found in any tier.
+        memory_entries: Entries currently held in memory.
+        memory_bytes: Audio bytes currently held in memory.
+        disk_entries: Entries currently stored on disk.
+        disk_bytes: Bytes currently stored on disk.
+    """
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    memory_entries: int
+    memory_bytes: int
+    disk_entries: int
+    disk_bytes: int
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Cannot use {type(value).__name__} in an audio cache key")
+
+
+def audio_cache_key(
+    provider: str,
+    base_url: Optional[str],
+    model: Optional[str],
+    method: str,
+    text: str,
+    params: Dict[str, Any],
+) -> Optional[str]:
+    """Build the content address of a synthesis request.
+
+    Args:
+        provider: Provider name.
+        base_url: Endpoint the request is sent to.
+        model: Model name.
+        method: Synthesis method, e.g. ``generate_speech``.
+        text: Input text.
+        params: Voice and every other generation parameter.
+
+    Returns:
+        Hex digest identifying the request, or None if a parameter cannot be
+        serialized deterministically (such requests are not cached).
+    """
+    try:
+        payload = json.dumps(
+            [provider, base_url, model, method, text, params],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=_json_default,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class AudioCache:
+    """Two-tier LRU cache of AudioResponse objects keyed by ``audio_cache_key``.
+
+    Thread-safe. The disk tier stores each entry as an audio file plus a JSON
+    metadata file under ``<directory>/<key[:2]>/``. Files are written to a
+    temporary name and renamed into place, so concurrent processes sharing a
+    directory never read a partial entry. Recency on disk is tracked through
+    file modification times, which hits refresh.
+    """
+
+    def __init__(self, config: AudioCacheConfig):
+        """Initialize the cache.
+
+        Args:
+            config: Size budgets and optional disk directory.
+        """
+        self.config = config
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, AudioResponse]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: Optional["OrderedDict[str, int]"] = None
+        self._disk_bytes = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def has_disk(self) -> bool:
+        """Whether the cache has a disk tier."""
+        return self.config.directory is not None
+
+    def get(self, key: str) -> Optional[AudioResponse]:
+        """Look up an entry in memory, then on disk."""
+        response = self.get_memory(key)
+        if response is None:
+            response = self.get_disk(key)
+        return response
+
+    def get_memory(self, key: str) -> Optional[AudioResponse]:
+        """Look up an entry in the memory tier only.
+
+        A miss here is not counted; follow up with ``get_disk``.
+        """
+        with self._lock:
+            response = self._memory.get(key)
+            if response is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+            return response
+
+    def get_disk(self, key: str) -> Optional[AudioResponse]:
+        """Look up an entry in the disk tier and promote it to memory."""
+        if not self.has_disk:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        audio_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "rb") as f:
+                meta = f.read()
+            fields = json.loads(meta)
+            with open(audio_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                audio: Any = (
+                    memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                    if size
+                    else b""
+                )
+            os.utime(audio_path)
+            response = AudioResponse(audio_data=audio, **fields)
+        except (OSError, ValueError):
+            with self._lock:
+                self._misses += 1
+            return None
+
+        entry_size = size + len(meta)
+        with self._lock:
+            self._disk_hits += 1
+            index = self._disk_index()
+            if key not in index:
+                index[key] = entry_size
+                self._disk_bytes += entry_size
+            index.move_to_end(key)
+            self._put_memory(key, response)
+        return response
+
+    def put(self, key: str, response: AudioResponse) -> None:
+        """Store an entry in memory and, if configured, on disk."""
+        with self._lock:
+            self._put_memory(key, response)
+        if self.has_disk:
+            self.put_disk(key, response)
+
+    def put_memory(self, key: str, response: AudioResponse) -> None:
+        """Store an entry in the memory tier only."""
+        with self._lock:
+            self._put_memory(key, response)
+
+    def put_disk(self, key: str, response: AudioResponse) -> None:
+        """Store an entry in the disk tier only."""
+        meta = json.dumps(response.model_dump(mode="json", exclude={"audio_data"})).encode()
+        size = response.size + len(meta)
+        if not self.has_disk or size > self.config.disk_max_bytes:
+            return
+
+        audio_path, meta_path = self._paths(key)
+        audio_path.parent.mkdir(parents=True, exist_ok=True)
+        # Metadata first: an entry exists once its audio file does
+        self._write_atomic(meta_path, meta)
+        self._write_atomic(audio_path, response)
+
+        with self._lock:
+            index = self._disk_index()
+            self._disk_bytes += size - index.pop(key, 0)
+            index[key] = size
+            evicted = []
+            while self._disk_bytes > self.config.disk_max_bytes and index:
+                old_key, old_size = index.popitem(last=False)
+                self._disk_bytes -= old_size
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._remove_files(old_key)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            keys = list(self._disk_index()) if self.has_disk else []
+            self._disk = None
+            self._disk_bytes = 0
+            self._memory_hits = self._disk_hits = self._misses = 0
+        for key in keys:
+            self._remove_files(key)
+
+    def stats(self) -> AudioCacheStats:
+        """Take a snapshot of hit counts and tier sizes."""
+        with self._lock:
+            index = self._disk_index() if self.has_disk else {}
+            return AudioCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                memory_entries=len(self._memory),
+                memory_bytes=self._memory_bytes,
+                disk_entries=len(index),
+                disk_bytes=self._disk_bytes,
+            )
+
+    def _put_memory(self, key: str, response: AudioResponse) -> None:
+        size = response.size
+        if size > self.config.memory_max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.size
+        self._memory[key] = response
+        self._memory_bytes += size
+        while self._memory_bytes > self.config.memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.size
+
+    def _paths(self, key: str) -> "tuple[Path, Path]":
+        assert self.config.directory is not None
+        base = Path(self.config.directory) / key[:2] / key
+        return base, base.with_name(key + _META_SUFFIX)
+
+    def _disk_index(self) -> "OrderedDict[str, int]":
+        """Load the disk index on first use, oldest entry first."""
+        if self._disk is not None:
+            return self._disk
+        entries = []
+        directory = self.config.directory
+        if directory is not None and os.path.isdir(directory):
+            for shard in os.scandir(directory):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if entry.name.endswith((_META_SUFFIX, ".tmp")):
+                        continue
+                    try:
+                        stat = entry.stat()
+                        meta_size = os.path.getsize(entry.path + _META_SUFFIX)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, entry.name, stat.st_size + meta_size))
+        entries.sort()
+        self._disk = OrderedDict((key, size) for _, key, size in entries)
+        self._disk_bytes = sum(self._disk.values())
+        return self._disk
+
+    @staticmethod
+    def _write_atomic(path: Path, data: Union[bytes, AudioResponse]) -> None:
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                if isinstance(data, AudioResponse):
+                    data.write_to(f)
+                else:
+                    f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _remove_files(self, key: str) -> None:
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                # Already evicted by another process, or still mapped on Windows
+                pass
+
+
+class AudioCacheRegistry:
+    """Process-wide audio caches shared by every model with the same config."""
+
+    def __init__(self):
+        self._caches: Dict[AudioCacheConfig, AudioCache] = {}
+        self._lock = threading.Lock()
+
+    def get(self, config: AudioCacheConfig) -> AudioCache:
+        """Get the cache for a config, creating it on first use."""
+        with self._lock:
+            cache = self._caches.get(config)
+            if cache is None:
+                cache = AudioCache(config)
+                self._caches[config] = cache
+            return cache
+
+    def clear(self) -> None:
+        """Empty every registered cache and forget them."""
+        with self._lock:
+            caches = list(self._caches.values())
+            self._caches.clear()
+        for cache in caches:
+            cache.clear()
+
+
+# Process-wide registry used by all TTS providers
+audio_caches = AudioCacheRegistry()
+
+
+def clear_audio_caches() -> None:
+    """Remove every cached audio entry, in memory and on disk."""
+    audio_caches.clear()
+
+
+class AudioCacheMixin:
+    """Mixin resolving the audio cache configuration of a TTS model.
+
+    The audio cache is disabled by default. It is enabled using a priority
+    system:
+
+    1. Config dict audio_cache (highest priority)
+    2. Environment variables ESPERANTO_TTS_CACHE_DIR (memory and disk) and
+       ESPERANTO_TTS_CACHE (memory only)
+    3. Default: disabled
+
+    The config value may be True/False, a dict of AudioCacheConfig fields or
+    an AudioCacheConfig. Models with equal settings share one cache.
+
+    The mixin must be used with classes that have a _config: Dict[str, Any]
+    attribute.
+
+    Example:
+        speaker = AIFactory.create_text_to_speech(
+            "openai",
+            "tts-1",
+            config={"audio_cache": {"directory": "~/.cache/esperanto-tts"}},
+        )
+    """
+
+    def _get_audio_cache_config(self) -> Optional[AudioCacheConfig]:
+        """Resolve audio cache settings using the priority hierarchy.
+
+        Returns:
+            AudioCacheConfig when enabled, None when disabled.
+
+        Raises:
+            ValueError: If the configured value is invalid.
+        """
+        setting: Any = None
+        config = getattr(self, "_config", None) or {}
+        if "audio_cache" in config:
+            setting = config["audio_cache"]
+        else:
+            directory = os.getenv(AUDIO_CACHE_DIR_ENV_VAR)
+            if directory:
+                setting = {"directory": directory}
+            elif os.getenv(AUDIO_CACHE_ENV_VAR, "").lower() in ("true", "1", "yes"):
+                setting = True
+
+        if setting is None or setting is False:
+            return None
+        if setting is True:
+            return AudioCacheConfig()
+        if isinstance(setting, AudioCacheConfig):
+            return setting
+        if isinstance(setting, dict):
+            try:
+                return AudioCacheConfig(**setting)
+            except TypeError as e:
+                raise ValueError(f"Invalid audio_cache config: {e}") from e
+        raise ValueError(f"audio_cache must be a bool or dict, got {type(setting).__name__}")
+
+    def _get_audio_cache(self) -> Optional[AudioCache]:
+        """Get the shared audio cache for this model, if enabled."""
+        config = self._get_audio_cache_config()
+        if config is None:
+            return None
+        return audio_caches.get(config)
+
+    @property
+    def audio_cache_stats(self) -> Optional[AudioCacheStats]:
+        """Hit counts and sizes of this model's cache, or None when disabled."""
+        cache = self._get_audio_cache()
+        return cache.stats() if cache is not None else None
@@ -0,0 +1,490 @@
+"""Circuit breaker and endpoint health tracking for Esperanto providers."""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+from esperanto.common_types.exceptions import CircuitOpenError
+
+from .json_codec import AsyncJSONClient, JSONClient
+
+# Environment variable enabling circuit breakers for all providers
+CIRCUIT_BREAKER_ENV_VAR = "ESPERANTO_CIRCUIT_BREAKER"
+
+# HTTP status codes counted as endpoint failures. Other 4xx responses are
+# caller errors and say nothing about the endpoint's health.
+FAILURE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Thresholds controlling when a circuit opens and recovers.
+
+    Attributes:
+        failure_rate_threshold: Error rate (0-1) in the rolling window that opens the circuit.
+        latency_threshold: Optional p95 latency in seconds that opens the circuit.
+        minimum_calls: Calls required in the window before thresholds are evaluated.
+        window_seconds: Length of the rolling window in seconds.
+        window_size: Maximum number of calls kept in the rolling window.
+        recovery_timeout: Seconds an open circuit waits before allowing probes.
+        half_open_max_calls: Concurrent probe requests allowed while half-open.
+    """
+
+    failure_rate_threshold: float = 0.5
+    latency_threshold: Optional[float] = None
+    minimum_calls: int = 10
+    window_seconds: float = 60.0
+    window_size: int = 100
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+
+    def __post_init__(self):
+        if not 0 < self.failure_rate_threshold <= 1:
+            raise ValueError(
+                f"failure_rate_threshold must be in (0, 1], got {self.failure_rate_threshold}"
+            )
+        if self.latency_threshold is not None and self.latency_threshold <= 0:
+            raise ValueError(
+                f"latency_threshold must be positive, got {self.latency_threshold}"
+            )
+        if self.minimum_calls < 1:
+            raise ValueError(f"minimum_calls must be at least 1, got {self.minimum_calls}")
+        if self.window_seconds <= 0:
+            raise ValueError(f"window_seconds must be positive, got {self.window_seconds}")
+        if self.window_size < 1:
+            raise ValueError(f"window_size must be at least 1, got {self.window_size}")
+        if self.recovery_timeout < 0:
+            raise ValueError(
+                f"recovery_timeout must be non-negative, got {self.recovery_timeout}"
+            )
+        if self.half_open_max_calls < 1:
+            raise ValueError(
+                f"half_open_max_calls must be at least 1, got {self.half_open_max_calls}"
+            )
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """Point-in-time snapshot of an endpoint's health.
+
+    Attributes:
+        key: Circuit breaker key (provider and base URL).
+        state: Current circuit state.
+        calls: Calls in the rolling window.
+        failures: Failed calls in the rolling window.
+        error_rate: Failure ratio in the rolling window (0 when empty).
+        latency_p50: Median latency in seconds, or None when the window is empty.
+        latency_p95: 95th percentile latency in seconds, or None when empty.
+        latency_p99: 99th percentile latency in seconds, or None when empty.
+        opened_at: time.monotonic() timestamp of the last transition to open.
+        rejected: Calls rejected while open since the breaker was created.
+    """
+
+    key: str
+    state: CircuitState
+    calls: int
+    failures: int
+    error_rate: float
+    latency_p50: Optional[float]
+    latency_p95: Optional[float]
+    latency_p99: Optional[float]
+    opened_at: Optional[float]
+    rejected: int
+
+
+def _percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for a single provider endpoint.
+
+    Outcomes are kept in a rolling window bounded both by time and by count.
+    Once the window holds at least ``minimum_calls`` outcomes, the circuit
+    opens when the error rate or the p95 latency crosses its threshold. An open
+    circuit rejects calls with ``CircuitOpenError`` until ``recovery_timeout``
+    elapses, then lets ``half_open_max_calls`` probe requests through. A
+    successful probe closes the circuit; a failed probe re-opens it.
+    """
+
+    def __init__(self, key: str, config: Optional[CircuitBreakerConfig] = None):
+        """Initialize the circuit breaker.
+
+        Args:
+            key: Identifier of the endpoint (provider and base URL).
+            config: Thresholds to apply. Defaults to CircuitBreakerConfig().
+        """
+        self.key = key
+        self.config = config or CircuitBreakerConfig()
+        self._lock = threading.Lock()
+        self._window: Deque[Tuple[float, bool, float]] = deque(
+            maxlen=self.config.window_size
+        )
+        self._state = CircuitState.CLOSED
+        self._opened_at: Optional[float] = None
+        self._half_open_in_flight = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, accounting for an elapsed recovery timeout."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and self._opened_at is not None
+            and now - self._opened_at >= self.config.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.config.window_seconds
+        while self._window and self._window[0][0] < cutoff:
+            self._window.popleft()
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._half_open_in_flight = 0
+
+    def before_call(self) -> None:
+        """Admit or reject a call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probe slots taken.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state is CircuitState.CLOSED:
+                return
+            if (
+                state is CircuitState.HALF_OPEN
+                and self._half_open_in_flight < self.config.half_open_max_calls
+            ):
+                self._half_open_in_flight += 1
+                return
+            self._rejected += 1
+            opened_at = self._opened_at if self._opened_at is not None else now
+            retry_after = max(0.0, opened_at + self.config.recovery_timeout - now)
+            raise CircuitOpenError(self.key, retry_after)
+
+    def record(self, success: bool, latency: float) -> None:
+        """Record the outcome of an admitted call.
+
+        Args:
+            success: Whether the endpoint served the call successfully.
+            latency: Call duration in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+
+            if state is CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if success:
+                    self._state = CircuitState.CLOSED
+                    self._opened_at = None
+                    self._window.clear()
+                    self._window.append((now, success, latency))
+                else:
+                    self._open(now)
+                return
+
+            self._window.append((now, success, latency))
+            if state is CircuitState.OPEN:
+                return
+
+            self._trim(now)
+            if len(self._window) < self.config.minimum_calls:
+                return
+
+            failures = sum(1 for _, ok, _ in self._window if not ok)
+            if failures / len(self._window) >= self.config.failure_rate_threshold:
+                self._open(now)
+                return
+
+            if self.config.latency_threshold is not None:
+                latencies = sorted(lat for _, _, lat in self._window)
+                p95 = _percentile(latencies, 95)
+                if p95 is not None and p95 >= self.config.latency_threshold:
+                    self._open(now)
+
+    def release(self) -> None:
+        """Give back the probe slot of an admitted call without an outcome.
+
+        For calls that end without a verdict on the endpoint, such as a
+        cancelled request or an error raised before it was sent.
+        """
+        with self._lock:
+            if self._current_state(time.monotonic()) is CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def stats(self) -> CircuitBreakerStats:
+        """Return a snapshot of the endpoint's health."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            self._trim(now)
+            calls = len(self._window)
+            failures = sum(1 for _, ok, _ in self._window if not ok)
+            latencies = sorted(lat for _, _, lat in self._window)
+            return CircuitBreakerStats(
+                key=self.key,
+                state=state,
+                calls=calls,
+                failures=failures,
+                error_rate=failures / calls if calls else 0.0,
+                latency_p50=_percentile(latencies, 50),
+                latency_p95=_percentile(latencies, 95),
+                latency_p99=_percentile(latencies, 99),
+                opened_at=self._opened_at,
+                rejected=self._rejected,
+            )
+
+    def reset(self) -> None:
+        """Close the circuit and forget all recorded outcomes."""
+        with self._lock:
+            self._window.clear()
+            self._state = CircuitState.CLOSED
+            self._opened_at = None
+            self._half_open_in_flight = 0
+            self._rejected = 0
+
+
+class CircuitBreakerRegistry:
+    """Thread-safe registry sharing one circuit breaker per endpoint key.
+
+    All provider instances talking to the same provider and base URL share a
+    breaker, so health observed by one instance protects the others.
+    """
+
+    def __init__(self):
+        """Initialize the registry."""
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: str, config: Optional[CircuitBreakerConfig] = None
+    ) -> CircuitBreaker:
+        """Get the breaker for a key, creating it on first use.
+
+        The config of the first caller wins; later configs for the same key
+        are ignored so all instances observe the same thresholds.
+        """
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(key, config)
+                self._breakers[key] = breaker
+            return breaker
+
+    def states(self) -> Dict[str, CircuitBreakerStats]:
+        """Snapshot every registered breaker, keyed by endpoint key."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.key: breaker.stats() for breaker in breakers}
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Reset one breaker, or all of them when key is None."""
+        with self._lock:
+            breakers = (
+                list(self._breakers.values())
+                if key is None
+                else [b for k, b in self._breakers.items() if k == key]
+            )
+        for breaker in breakers:
+            breaker.reset()
+
+    def clear(self) -> None:
+        """Remove all registered breakers."""
+        with self._lock:
+            self._breakers.clear()
+
+
+# Process-wide registry used by all providers
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def get_circuit_breaker_states() -> Dict[str, CircuitBreakerStats]:
+    """Return a health snapshot of every endpoint with a circuit breaker.
+
+    Returns:
+        Dict mapping "provider:base_url" keys to CircuitBreakerStats.
+    """
+    return circuit_breakers.states()
+
+
+def reset_circuit_breakers(key: Optional[str] = None) -> None:
+    """Close circuits and clear recorded outcomes.
+
+    Args:
+        key: Endpoint key to reset. Resets every breaker when None.
+    """
+    circuit_breakers.reset(key)
+
+
+def _is_failure_response(response: httpx.Response) -> bool:
+    return response.status_code in FAILURE_STATUS_CODES or response.status_code >= 500
+
+
+class CircuitBreakerClient(JSONClient):
+    """httpx.Client that routes every request through a circuit breaker.
+
+    Hooks ``send()`` so that all request helpers (``get``, ``post``,
+    ``stream``) are covered while httpx keeps handling proxies from the
+    environment. For streamed responses the recorded latency is time to
+    response headers.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.circuit_breaker = breaker
+
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        self.circuit_breaker.before_call()
+        start = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+        except httpx.TransportError:
+            self.circuit_breaker.record(False, time.monotonic() - start)
+            raise
+        except BaseException:
+            # Cancelled, or failed without reaching the endpoint
+            self.circuit_breaker.release()
+            raise
+        self.circuit_breaker.record(
+            not _is_failure_response(response), time.monotonic() - start
+        )
+        return response
+
+
+class AsyncCircuitBreakerClient(AsyncJSONClient):
+    """httpx.AsyncClient that routes every request through a circuit breaker.
+
+    See CircuitBreakerClient for details.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.circuit_breaker = breaker
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        self.circuit_breaker.before_call()
+        start = time.monotonic()
+        try:
+            response = await super().send(request, **kwargs)
+        except httpx.TransportError:
+            self.circuit_breaker.record(False, time.monotonic() - start)
+            raise
+        except BaseException:
+            # Cancelled, or failed without reaching the endpoint
+            self.circuit_breaker.release()
+            raise
+        self.circuit_breaker.record(
+            not _is_failure_response(response), time.monotonic() - start
+        )
+        return response
+
+
+class CircuitBreakerMixin:
+    """Mixin providing circuit breaker configuration functionality.
+
+    Circuit breakers are disabled by default. They are enabled using a
+    priority system:
+
+    1. Config dict circuit_breaker (highest priority)
+    2. Environment variable ESPERANTO_CIRCUIT_BREAKER
+    3. Default: disabled
+
+    The config value may be True/False or a dict of CircuitBreakerConfig
+    fields. Breakers are keyed by provider and base URL and shared across
+    instances via the process-wide registry.
+
+    The mixin must be used with classes that have:
+    - _config: Dict[str, Any] attribute
+    - provider property
+
+    Example:
+        model = AIFactory.create_language(
+            "openai",
+            "gpt-4o-mini",
+            config={"circuit_breaker": {"failure_rate_threshold": 0.3}},
+        )
+    """
+
+    def _get_circuit_breaker_config(self) -> Optional[CircuitBreakerConfig]:
+        """Resolve circuit breaker settings using the priority hierarchy.
+
+        Returns:
+            CircuitBreakerConfig when enabled, None when disabled.
+
+        Raises:
+            ValueError: If the configured value is invalid.
+        """
+        setting: Any = None
+        if hasattr(self, "_config") and "circuit_breaker" in self._config:
+            setting = self._config["circuit_breaker"]
+        else:
+            env_value = os.getenv(CIRCUIT_BREAKER_ENV_VAR, "").lower()
+            if env_value in ("true", "1", "yes"):
+                setting = True
+
+        if setting is None or setting is False:
+            return None
+        if setting is True:
+            return CircuitBreakerConfig()
+        if isinstance(setting, CircuitBreakerConfig):
+            return setting
+        if isinstance(setting, dict):
+            try:
+                return CircuitBreakerConfig(**setting)
+            except TypeError as e:
+                raise ValueError(f"Invalid circuit_breaker config: {e}") from e
+        raise ValueError(
+            f"circuit_breaker must be a bool or dict, got {type(setting).__name__}"
+        )
+
+    def _get_circuit_breaker_key(self) -> str:
+        """Return the registry key for this provider endpoint."""
+        provider = getattr(self, "provider", type(self).__name__)
+        # Azure keeps an endpoint from config or the environment in azure_endpoint
+        base_url = getattr(self, "base_url", None) or getattr(self, "azure_endpoint", None) or ""
+        return f"{provider}:{base_url}"
+
+    def _get_circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Get the shared circuit breaker for this endpoint, if enabled."""
+        config = self._get_circuit_breaker_config()
+        if config is None:
+            return None
+        return circuit_breakers.get(self._get_circuit_breaker_key(), config)
+
+    @property
+    def circuit_breaker_stats(self) -> Optional[CircuitBreakerStats]:
+        """Health snapshot of this endpoint, or None when breakers are disabled."""
+        breaker = self._get_circuit_breaker()
+        return breaker.stats() if breaker is not None else None
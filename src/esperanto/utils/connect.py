@@ -1,35 +1,88 @@
 """Connection utilities for Esperanto providers."""
 
+import asyncio
+import logging
+import os
+import threading
+import weakref
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 import httpx
 
-from .ssl import SSLMixin
+from .circuit_breaker import (
+    AsyncCircuitBreakerClient,
+    CircuitBreaker,
+    CircuitBreakerClient,
+    CircuitBreakerMixin,
+)
+from .dns import DEFAULT_DNS_TTL, DNS_CACHE_ENV_VAR, dns_caching_transport
+from .instrumentation import ASYNC_HTTP_EVENT_HOOKS, HTTP_EVENT_HOOKS
+from .json_codec import AsyncJSONClient, JSONClient
+from .ssl import SSLMixin, get_ssl_context
 from .timeout import TimeoutMixin
 
+logger = logging.getLogger(__name__)
 
-class HttpConnectionMixin(TimeoutMixin, SSLMixin, ABC):
+# Guards lazy client creation; held only while a client is built
+_client_creation_lock = threading.Lock()
+
+# Errors of a warmup request that leave the connection cold
+_WARMUP_ERRORS = (httpx.HTTPError,)
+
+# Idle connections kept by the pool (httpx's max_keepalive_connections)
+_MAX_WARMUP_CONNECTIONS = 20
+
+
+@dataclass(frozen=True)
+class _HttpClientSettings:
+    """Resolved settings shared by a provider's sync and async clients."""
+
+    timeout: Any
+    verify: Union[bool, str]
+    breaker: Optional[CircuitBreaker]
+    keepalive_expiry: Optional[float] = None
+    dns_cache_ttl: Optional[float] = None
+
+
+class HttpConnectionMixin(TimeoutMixin, SSLMixin, CircuitBreakerMixin, ABC):
     """Mixin providing HTTP connection functionality.
 
     This mixin provides a standardized way to configure HTTP connections across all Esperanto providers.
 
     This mixin already provides timeout and SSL configuration functionality as httpx client relies on `_get_timeout` and `_get_ssl_verify` methods.
 
+    When a circuit breaker is enabled (see CircuitBreakerMixin), the clients route
+    every request through the endpoint's shared breaker so a degraded provider
+    fails fast instead of tying up callers for the full timeout.
+
     Proxy configuration is handled automatically by httpx via the standard environment variables:
     HTTP_PROXY, HTTPS_PROXY, and NO_PROXY.
 
+    The `client` and `async_client` are created on first use, so constructing a
+    provider is cheap and a model used only synchronously never builds an async
+    client (or vice versa). SSL contexts are shared across instances (see
+    `get_ssl_context`).
+
+    `warmup()` and `awarmup()` open pooled connections ahead of the first
+    request, optionally keeping them open with periodic pings. The
+    `keepalive_expiry` config key sets how long idle pooled connections are
+    kept (httpx default: 5 seconds), and `dns_cache` (or the
+    ESPERANTO_DNS_CACHE environment variable) caches resolved addresses of
+    the provider's host (see `esperanto.utils.dns`).
+
     The `_create_http_clients` method should be used with classes that have:
-    - client: httpx.Client and async_client: httpx.AsyncClient attributes
     - Provider-specific __post_init__() that calls super().__post_init__()
     """
 
-    # Type annotations only; the actual instances are assigned by
-    # _create_http_clients() during each provider's __post_init__.
-    client: httpx.Client
-    async_client: httpx.AsyncClient
-
     def _create_http_clients(self) -> None:
-        """Create HTTP clients with configured timeout and SSL settings.
+        """Configure HTTP clients with timeout, SSL and circuit breaker settings.
+
+        Settings are resolved and validated here, so configuration errors
+        surface at construction; the clients themselves are created on first
+        access of `client` or `async_client`.
 
         Proxy configuration is handled automatically by httpx via
         HTTP_PROXY, HTTPS_PROXY, and NO_PROXY environment variables.
@@ -42,10 +95,239 @@ class HttpConnectionMixin(TimeoutMixin, SSLMixin, ABC):
         if base_url:
             self.base_url = base_url.rstrip("/")
 
-        timeout = self._get_timeout()
-        verify = self._get_ssl_verify()
-        self.client = httpx.Client(timeout=timeout, verify=verify)
-        self.async_client = httpx.AsyncClient(timeout=timeout, verify=verify)
+        self._http_client_settings = _HttpClientSettings(
+            timeout=self._get_timeout(),
+            verify=self._get_ssl_verify(),
+            breaker=self._get_circuit_breaker(),
+            keepalive_expiry=self._get_keepalive_expiry(),
+            dns_cache_ttl=self._get_dns_cache_ttl(),
+        )
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._keepalive_stop: Optional[threading.Event] = None
+        self._keepalive_task: Optional["asyncio.Task[None]"] = None
+
+    def _get_keepalive_expiry(self) -> Optional[float]:
+        """Get seconds idle pooled connections are kept, or None for httpx's default.
+
+        Raises:
+            ValueError: If the configured value is not a positive number.
+        """
+        value = getattr(self, "_config", {}).get("keepalive_expiry")
+        if value is None:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise ValueError(f"keepalive_expiry must be a positive number, got {value!r}")
+        return float(value)
+
+    def _get_dns_cache_ttl(self) -> Optional[float]:
+        """Get the DNS cache TTL in seconds, or None when DNS caching is disabled.
+
+        Priority: the `dns_cache` config key (True, False or a TTL in seconds),
+        then the ESPERANTO_DNS_CACHE environment variable ("true" or a TTL).
+
+        Raises:
+            ValueError: If the configured value is invalid.
+        """
+        config = getattr(self, "_config", {})
+        if "dns_cache" in config:
+            setting = config["dns_cache"]
+            source = "dns_cache"
+        else:
+            setting = os.getenv(DNS_CACHE_ENV_VAR, "").strip().lower() or None
+            source = DNS_CACHE_ENV_VAR
+            if setting in ("true", "yes"):
+                setting = True
+            elif setting in ("false", "no", "0"):
+                setting = None
+        if setting is None or setting is False:
+            return None
+        if setting is True:
+            return DEFAULT_DNS_TTL
+        try:
+            ttl = float(setting)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"{source} must be a boolean or a TTL in seconds, got {setting!r}"
+            ) from None
+        if ttl <= 0:
+            raise ValueError(f"{source} TTL must be positive, got {ttl}")
+        return ttl
+
+    def _build_http_client(
+        self,
+        client_class: Type[Any],
+        breaker_client_class: Type[Any],
+        event_hooks: Dict[str, List[Callable[..., Any]]],
+    ) -> Any:
+        """Create a client from the settings stored by _create_http_clients."""
+        settings = self.__dict__.get("_http_client_settings")
+        if settings is None:
+            raise AttributeError(
+                f"{type(self).__name__} has no HTTP clients; "
+                "_create_http_clients() was not called"
+            )
+        kwargs: Dict[str, Any] = {
+            "timeout": settings.timeout,
+            "verify": get_ssl_context(settings.verify),
+            # Attribute body sizes to the call being instrumented, if any
+            "event_hooks": event_hooks,
+        }
+        if settings.keepalive_expiry is not None or settings.dns_cache_ttl is not None:
+            # httpx's default limits, with the configured keep-alive expiry
+            kwargs["limits"] = httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=settings.keepalive_expiry or 5.0,
+            )
+        if settings.dns_cache_ttl is not None:
+            # Proxied requests keep httpx's transports; the proxy resolves the host
+            kwargs["transport"] = dns_caching_transport(
+                issubclass(client_class, httpx.AsyncClient),
+                settings.dns_cache_ttl,
+                verify=kwargs["verify"],
+                limits=kwargs["limits"],
+            )
+        if settings.breaker is None:
+            return client_class(**kwargs)
+        return breaker_client_class(settings.breaker, **kwargs)
+
+    @property
+    def client(self) -> httpx.Client:
+        """Sync HTTP client, created on first access."""
+        client = self.__dict__.get("_client")
+        if client is None:
+            with _client_creation_lock:
+                client = self.__dict__.get("_client")
+                if client is None:
+                    client = self._build_http_client(
+                        JSONClient, CircuitBreakerClient, HTTP_EVENT_HOOKS
+                    )
+                    self._client = client
+        return client
+
+    @client.setter
+    def client(self, value: httpx.Client) -> None:
+        self._client = value
+
+    @client.deleter
+    def client(self) -> None:
+        self._client = None
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Async HTTP client, created on first access."""
+        client = self.__dict__.get("_async_client")
+        if client is None:
+            with _client_creation_lock:
+                client = self.__dict__.get("_async_client")
+                if client is None:
+                    client = self._build_http_client(
+                        AsyncJSONClient, AsyncCircuitBreakerClient, ASYNC_HTTP_EVENT_HOOKS
+                    )
+                    self._async_client = client
+        return client
+
+    @async_client.setter
+    def async_client(self, value: httpx.AsyncClient) -> None:
+        self._async_client = value
+
+    @async_client.deleter
+    def async_client(self) -> None:
+        self._async_client = None
+
+    def warmup(
+        self,
+        connections: int = 1,
+        keepalive: Optional[float] = None,
+        url: Optional[str] = None,
+    ) -> int:
+        """Open pooled connections to the provider ahead of the first request.
+
+        Sends `connections` concurrent HEAD requests to the provider's base URL
+        and holds each response until all have arrived, so that every request
+        sets up its own connection (DNS, TCP and TLS). Any HTTP status counts,
+        as the connection is open either way. Failed requests are logged at
+        debug level rather than raised, so a warmup at boot cannot fail startup.
+        Warmup requests bypass the circuit breaker, so they neither count
+        towards its health statistics nor get rejected by an open circuit.
+
+        Only the sync client is warmed; use `awarmup()` for the async client.
+
+        Args:
+            connections: Number of connections to open, at most 20 (the number
+                of idle connections the pool keeps).
+            keepalive: If set, repeat the warmup every `keepalive` seconds from
+                a background thread until `close()`, so idle connections are not
+                dropped. Use an interval below the `keepalive_expiry` config
+                value (5 seconds by default).
+            url: URL to request instead of the provider's base URL.
+
+        Returns:
+            Number of warmup requests that got a response.
+
+        Raises:
+            ValueError: If an argument is invalid or the provider has no base URL.
+        """
+        url = self._check_warmup_args(connections, keepalive, url)
+        opened = _open_connections(self.client, url, connections)
+        if keepalive is not None:
+            self._stop_keepalive()
+            stop = self._keepalive_stop = threading.Event()
+            threading.Thread(
+                target=_keepalive_loop,
+                args=(weakref.ref(self), stop, connections, keepalive, url),
+                name="esperanto-keepalive",
+                daemon=True,
+            ).start()
+        return opened
+
+    async def awarmup(
+        self,
+        connections: int = 1,
+        keepalive: Optional[float] = None,
+        url: Optional[str] = None,
+    ) -> int:
+        """Async version of `warmup()`, warming the async client.
+
+        With `keepalive`, the pings run as a task on the current event loop
+        until `aclose()`.
+        """
+        url = self._check_warmup_args(connections, keepalive, url)
+        opened = await _aopen_connections(self.async_client, url, connections)
+        if keepalive is not None:
+            self._stop_async_keepalive()
+            self._keepalive_task = asyncio.get_running_loop().create_task(
+                _akeepalive_loop(weakref.ref(self), connections, keepalive, url)
+            )
+        return opened
+
+    def _check_warmup_args(
+        self, connections: int, keepalive: Optional[float], url: Optional[str]
+    ) -> str:
+        """Validate warmup arguments and return the URL to request."""
+        if not 1 <= connections <= _MAX_WARMUP_CONNECTIONS:
+            raise ValueError(
+                f"connections must be between 1 and {_MAX_WARMUP_CONNECTIONS}, got {connections}"
+            )
+        if keepalive is not None and keepalive <= 0:
+            raise ValueError(f"keepalive must be positive, got {keepalive}")
+        url = url or getattr(self, "base_url", None) or getattr(self, "azure_endpoint", None)
+        if not url:
+            raise ValueError(f"{type(self).__name__} has no base URL to warm up; pass url=")
+        return url
+
+    def _stop_keepalive(self) -> None:
+        stop = self.__dict__.get("_keepalive_stop")
+        if stop is not None:
+            stop.set()
+            self._keepalive_stop = None
+
+    def _stop_async_keepalive(self) -> None:
+        task = self.__dict__.get("_keepalive_task")
+        if task is not None:
+            task.cancel()
+            self._keepalive_task = None
 
     def _create_langchain_http_clients(self) -> tuple[httpx.Client, httpx.AsyncClient]:
         """Create new HTTP clients for LangChain integration.
@@ -60,7 +342,7 @@ class HttpConnectionMixin(TimeoutMixin, SSLMixin, ABC):
             Tuple of (sync_client, async_client) for use with LangChain.
         """
         timeout = self._get_timeout()
-        verify = self._get_ssl_verify()
+        verify = self._get_ssl_context()
         return (
             httpx.Client(timeout=timeout, verify=verify),
             httpx.AsyncClient(timeout=timeout, verify=verify),
@@ -68,25 +350,22 @@ class HttpConnectionMixin(TimeoutMixin, SSLMixin, ABC):
 
     def close(self):
         """Explicitly close HTTP clients."""
+        self._stop_keepalive()
+        # Read the instance dict so closing never creates a client
+        client = self.__dict__.get("_client")
         try:
-            if (
-                hasattr(self, "client")
-                and self.client is not None
-                and not self.client.is_closed
-            ):
-                self.client.close()
+            if client is not None and not client.is_closed:
+                client.close()
         except Exception:
             pass  # Ignore cleanup errors
 
     async def aclose(self):
         """Asynchronously close HTTP clients."""
+        self._stop_async_keepalive()
+        async_client = self.__dict__.get("_async_client")
         try:
-            if (
-                hasattr(self, "async_client")
-                and self.async_client is not None
-                and not self.async_client.is_closed
-            ):
-                await self.async_client.aclose()
+            if async_client is not None and not async_client.is_closed:
+                await async_client.aclose()
         except Exception:
             pass  # Ignore cleanup errors
 
@@ -117,3 +396,103 @@ class HttpConnectionMixin(TimeoutMixin, SSLMixin, ABC):
                 self.close()
         except Exception:
             pass  # Ignore cleanup errors
+
+
+def _open_connections(client: httpx.Client, url: str, connections: int) -> int:
+    """Send concurrent HEAD requests, each holding a connection until all are done."""
+
+    def send(_: int) -> Optional[httpx.Response]:
+        try:
+            # httpx's own send() skips the circuit breaker: a ping's response
+            # says nothing about the endpoint's health
+            return httpx.Client.send(client, client.build_request("HEAD", url), stream=True)
+        except _WARMUP_ERRORS as e:
+            logger.debug(f"Warmup request to {url} failed: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        responses = list(pool.map(send, range(connections)))
+    # Reading the (empty) body returns the connection to the pool; closing an
+    # unread response would drop it
+    for response in responses:
+        if response is not None:
+            _release(response)
+    return sum(response is not None for response in responses)
+
+
+async def _aopen_connections(client: httpx.AsyncClient, url: str, connections: int) -> int:
+    """Async version of _open_connections."""
+
+    async def send() -> Optional[httpx.Response]:
+        try:
+            return await httpx.AsyncClient.send(
+                client, client.build_request("HEAD", url), stream=True
+            )
+        except _WARMUP_ERRORS as e:
+            logger.debug(f"Warmup request to {url} failed: {e}")
+            return None
+
+    responses = await asyncio.gather(*(send() for _ in range(connections)))
+    for response in responses:
+        if response is not None:
+            await _arelease(response)
+    return sum(response is not None for response in responses)
+
+
+def _release(response: httpx.Response) -> None:
+    try:
+        response.read()
+    except httpx.HTTPError as e:
+        logger.debug(f"Warmup response from {response.url} failed: {e}")
+    finally:
+        response.close()
+
+
+async def _arelease(response: httpx.Response) -> None:
+    try:
+        await response.aread()
+    except httpx.HTTPError as e:
+        logger.debug(f"Warmup response from {response.url} failed: {e}")
+    finally:
+        await response.aclose()
+
+
+def _keepalive_loop(
+    ref: "weakref.ref[HttpConnectionMixin]",
+    stop: threading.Event,
+    connections: int,
+    interval: float,
+    url: str,
+) -> None:
+    """Re-warm a model's sync client until stopped, closed or collected."""
+    while not stop.wait(interval):
+        model = ref()
+        client = model.__dict__.get("_client") if model is not None else None
+        # Hold only the client between pings, so the model can be collected
+        del model
+        if client is None or client.is_closed:
+            return
+        try:
+            _open_connections(client, url, connections)
+        except RuntimeError:  # Closed during the ping
+            return
+
+
+async def _akeepalive_loop(
+    ref: "weakref.ref[HttpConnectionMixin]",
+    connections: int,
+    interval: float,
+    url: str,
+) -> None:
+    """Re-warm a model's async client until cancelled, closed or collected."""
+    while True:
+        await asyncio.sleep(interval)
+        model = ref()
+        client = model.__dict__.get("_async_client") if model is not None else None
+        del model
+        if client is None or client.is_closed:
+            return
+        try:
+            await _aopen_connections(client, url, connections)
+        except RuntimeError:  # Closed during the ping
+            return
@@ -0,0 +1,159 @@
+"""Process-wide caching of DNS results for provider connections.
+
+httpx resolves the provider's host name for every new connection. With
+caching enabled (``config={"dns_cache": True}`` or ``ESPERANTO_DNS_CACHE``),
+the addresses of each host are resolved once and reused for ``ttl`` seconds
+by every client in the process, so opening connections after idle or under
+load does not wait on the resolver. Addresses are tried in resolver order,
+and TLS still verifies the certificate against the host name.
+"""
+
+import socket
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpcore
+import httpx
+
+# Environment variable enabling DNS caching for all providers ("true" or a TTL)
+DNS_CACHE_ENV_VAR = "ESPERANTO_DNS_CACHE"
+
+# Seconds a resolved address list is reused when no TTL is configured
+DEFAULT_DNS_TTL = 300.0
+
+_Key = Tuple[str, int]
+
+
+class DNSCache:
+    """Resolved addresses by host and port, shared across clients."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[_Key, Tuple[float, List[str]]] = {}
+
+    def resolve(self, host: str, port: int, ttl: float) -> List[str]:
+        """Return the addresses of ``host``, resolving it if not cached.
+
+        Raises:
+            httpcore.ConnectError: If the host cannot be resolved.
+        """
+        addresses = self._lookup((host, port))
+        if addresses is None:
+            try:
+                infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError as e:
+                raise httpcore.ConnectError(str(e)) from e
+            addresses = self._store((host, port), infos, ttl)
+        return addresses
+
+    async def aresolve(self, host: str, port: int, ttl: float) -> List[str]:
+        """Async version of ``resolve()``, resolving without blocking the loop."""
+        addresses = self._lookup((host, port))
+        if addresses is None:
+            # Imported here, as httpx only loads anyio for async clients
+            import anyio
+
+            try:
+                infos = await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError as e:
+                raise httpcore.ConnectError(str(e)) from e
+            addresses = self._store((host, port), infos, ttl)
+        return addresses
+
+    def clear(self) -> None:
+        """Forget all resolved addresses."""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key: _Key) -> Optional[List[str]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def _store(self, key: _Key, infos: Iterable[Any], ttl: float) -> List[str]:
+        # Drop the duplicates getaddrinfo returns per protocol, keeping order
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, addresses)
+        return addresses
+
+
+# Shared by every client with DNS caching enabled
+dns_cache = DNSCache()
+
+
+def clear_dns_cache() -> None:
+    """Forget all cached DNS results, e.g. after a provider changes address."""
+    dns_cache.clear()
+
+
+class _CachingSyncBackend(httpcore.SyncBackend):
+    """Network backend connecting to cached addresses of the host."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.NetworkStream:
+        error: Optional[Exception] = None
+        for address in dns_cache.resolve(host, port, self.ttl):
+            try:
+                return super().connect_tcp(address, port, timeout, local_address, socket_options)
+            except httpcore.ConnectError as e:
+                error = e
+        raise error or httpcore.ConnectError(f"No addresses found for {host}")
+
+
+class _CachingAsyncBackend(httpcore.AnyIOBackend):
+    """Async network backend connecting to cached addresses of the host."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        error: Optional[Exception] = None
+        for address in await dns_cache.aresolve(host, port, self.ttl):
+            try:
+                return await super().connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except httpcore.ConnectError as e:
+                error = e
+        raise error or httpcore.ConnectError(f"No addresses found for {host}")
+
+
+def dns_caching_transport(
+    async_: bool, ttl: float, **kwargs: Any
+) -> Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport]:
+    """Create an httpx transport that resolves host names through ``dns_cache``.
+
+    Args:
+        async_: Whether to create a transport for httpx.AsyncClient.
+        ttl: Seconds resolved addresses are reused.
+        **kwargs: Passed to the transport (verify, limits, ...).
+    """
+    transport: Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport]
+    if async_:
+        transport = httpx.AsyncHTTPTransport(**kwargs)
+        backend: Any = _CachingAsyncBackend(ttl)
+    else:
+        transport = httpx.HTTPTransport(**kwargs)
+        backend = _CachingSyncBackend(ttl)
+    # httpx has no option for the network backend of its connection pool
+    transport._pool._network_backend = backend
+    return transport
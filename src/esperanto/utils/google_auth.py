@@ -0,0 +1,195 @@
+"""Shared access tokens for Google Cloud APIs.
+
+Vertex AI providers authenticate with an OAuth 2.0 access token obtained
+from google-auth credentials or, without them, from the ``gcloud`` CLI.
+Getting a token is blocking network or process I/O that can take seconds,
+so it is never done on the caller's thread while a usable token exists:
+
+- Credentials are loaded once per identity (service account file or
+  Application Default Credentials) and shared by every model using it.
+- Each identity has one ``GoogleAccessToken``. A refresh starts in the
+  background ``REFRESH_AHEAD_SECONDS`` before the token expires while
+  callers keep using the current token.
+- Only one refresh runs at a time per identity. Concurrent callers, in any
+  thread or event loop, wait for the same refresh; ``atoken()`` waits
+  without blocking the event loop.
+"""
+
+import asyncio
+import calendar
+import concurrent.futures
+import subprocess
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+
+# Start a background refresh when the token has less than this left
+REFRESH_AHEAD_SECONDS = 300.0
+# A token this close to expiry is not handed out; callers wait for a new one
+_EXPIRY_MARGIN_SECONDS = 30.0
+# Lifetime assumed when the expiry is unknown (gcloud tokens last an hour)
+_DEFAULT_TOKEN_LIFETIME = 3600.0
+
+_GCLOUD_COMMAND = ["gcloud", "auth", "application-default", "print-access-token"]
+
+
+def _expiry_of(credentials: Any) -> float:
+    """Expiry of google-auth credentials as a Unix timestamp."""
+    expiry = getattr(credentials, "expiry", None)
+    if isinstance(expiry, datetime):
+        # google-auth stores naive UTC datetimes
+        return float(calendar.timegm(expiry.utctimetuple()))
+    return time.time() + _DEFAULT_TOKEN_LIFETIME
+
+
+class GoogleAccessToken:
+    """Refresh-ahead, single-flight access token for one identity.
+
+    Args:
+        credentials: google-auth credentials, or None to use the gcloud CLI.
+        refresh_ahead: Seconds before expiry at which a background refresh
+            starts.
+    """
+
+    def __init__(self, credentials: Any = None, refresh_ahead: float = REFRESH_AHEAD_SECONDS):
+        self.credentials = credentials
+        self.refresh_ahead = refresh_ahead
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._expiry = 0.0
+        self._pending: Optional["concurrent.futures.Future[str]"] = None
+
+    def token(self) -> str:
+        """Get a valid access token, waiting only if none is usable."""
+        token = self._current()
+        if token is not None:
+            return token
+        return self._refresh().result()
+
+    async def atoken(self) -> str:
+        """Async get a valid access token without blocking the event loop."""
+        token = self._current()
+        if token is not None:
+            return token
+        return await asyncio.wrap_future(self._refresh())
+
+    def _current(self) -> Optional[str]:
+        """Return the cached token if usable, refreshing ahead of expiry."""
+        with self._lock:
+            if self._token is None:
+                self._seed_from_credentials()
+            now = time.time()
+            if self._token is None or now >= self._expiry - _EXPIRY_MARGIN_SECONDS:
+                return None
+            if now >= self._expiry - self.refresh_ahead:
+                self._start_refresh()
+            return self._token
+
+    def _seed_from_credentials(self) -> None:
+        """Use a token the credentials already hold, without a refresh."""
+        credentials = self.credentials
+        if credentials is not None and credentials.valid and credentials.token:
+            self._token = credentials.token
+            self._expiry = _expiry_of(credentials)
+
+    def _refresh(self) -> "concurrent.futures.Future[str]":
+        with self._lock:
+            return self._start_refresh()
+
+    def _start_refresh(self) -> "concurrent.futures.Future[str]":
+        """Start a refresh unless one is running. Call with the lock held."""
+        if self._pending is None:
+            future: "concurrent.futures.Future[str]" = concurrent.futures.Future()
+            self._pending = future
+            threading.Thread(
+                target=self._run_refresh,
+                args=(future,),
+                name="esperanto-google-auth",
+                daemon=True,
+            ).start()
+        return self._pending
+
+    def _run_refresh(self, future: "concurrent.futures.Future[str]") -> None:
+        try:
+            token, expiry = self._fetch()
+        except BaseException as e:
+            with self._lock:
+                self._pending = None
+            future.set_exception(e)
+            return
+        with self._lock:
+            self._token, self._expiry = token, expiry
+            self._pending = None
+        future.set_result(token)
+
+    def _fetch(self) -> Tuple[str, float]:
+        """Get a new token and its expiry. Blocking."""
+        if self.credentials is not None:
+            try:
+                from google.auth.transport.requests import Request
+
+                self.credentials.refresh(Request())
+            except Exception as e:
+                raise RuntimeError(f"Failed to refresh credentials: {e}") from e
+            return self.credentials.token, _expiry_of(self.credentials)
+
+        try:
+            result = subprocess.run(_GCLOUD_COMMAND, capture_output=True, text=True, check=True)
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            raise RuntimeError(
+                "Failed to get access token. Either set credentials_file / "
+                "GOOGLE_APPLICATION_CREDENTIALS, install google-auth for ADC, "
+                f"or authenticate with 'gcloud auth application-default login': {e}"
+            ) from e
+        return result.stdout.strip(), time.time() + _DEFAULT_TOKEN_LIFETIME
+
+
+class GoogleCredentialRegistry:
+    """Process-wide credentials and access tokens, shared per identity."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._credentials: Dict[Hashable, Any] = {}
+        self._tokens: Dict[Hashable, GoogleAccessToken] = {}
+
+    def load(self, identity: Hashable, loader: Callable[[], Any]) -> Any:
+        """Get the credentials for an identity, loading them on first use.
+
+        Args:
+            identity: Key of the identity, e.g. a service account file path.
+            loader: Returns the credentials, or None for the gcloud CLI.
+                Errors propagate and nothing is cached.
+        """
+        with self._lock:
+            if identity in self._credentials:
+                return self._credentials[identity]
+        credentials = loader()
+        with self._lock:
+            return self._credentials.setdefault(identity, credentials)
+
+    def access_token(self, credentials: Any = None) -> GoogleAccessToken:
+        """Get the shared access token for credentials (None for gcloud)."""
+        key = ("gcloud",) if credentials is None else ("credentials", id(credentials))
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is None:
+                # The token holds a reference, so the id is not reused
+                token = self._tokens[key] = GoogleAccessToken(credentials)
+            return token
+
+    def clear(self) -> None:
+        """Forget all credentials and cached tokens."""
+        with self._lock:
+            self._credentials.clear()
+            self._tokens.clear()
+
+
+google_credentials = GoogleCredentialRegistry()
+
+
+def clear_google_credentials() -> None:
+    """Forget all shared Google credentials and access tokens."""
+    google_credentials.clear()
@@ -0,0 +1,810 @@
+"""Metrics and tracing hooks for provider calls.
+
+The model base classes route every provider's ``chat_complete`` /
+``achat_complete``, ``embed`` / ``aembed``, ``rerank`` / ``arerank``,
+``transcribe`` / ``atranscribe`` and ``generate_speech`` /
+``agenerate_speech`` through a common wrapper. While instrumentation is
+active, the wrapper records a ``CallEvent`` per call and reports it to:
+
+- hooks registered with ``add_call_hook`` (any callable taking the event);
+- ``CallMetrics``, a hook that keeps Prometheus-style counters and
+  histograms and renders them in the text exposition format;
+- OpenTelemetry, when enabled with ``enable_tracing()`` or
+  ``ESPERANTO_OTEL_TRACING=true`` (requires ``opentelemetry-api``). Each call
+  is a client span that is current while the provider runs, so spans of
+  nested calls (e.g. the models a FailoverLanguageModel tries) are children.
+
+Request and response body sizes are measured by httpx event hooks on the
+clients built by HttpConnectionMixin. With no hooks and tracing disabled the
+wrapper calls straight through to the provider.
+
+Calls sampled by a profiler (see ``esperanto.utils.profiling``) also record
+seconds spent per stage: the provider methods named in ``STAGE_METHODS`` are
+timed, and "network" is the time from sending each request to receiving its
+response headers.
+"""
+
+import functools
+import inspect
+import logging
+import math
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Environment variable enabling OpenTelemetry spans for all provider calls
+TRACING_ENV_VAR = "ESPERANTO_OTEL_TRACING"
+
+CallHook = Callable[["CallEvent"], None]
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Provider methods timed in profiled calls, by stage. A stage method called
+# from another one is counted once, in the outer stage.
+STAGE_METHODS = {
+    "_build_request_template": "payload",
+    "_get_api_kwargs": "payload",
+    "_format_messages": "payload",
+    "_build_request_payload": "payload",
+    "_parse_sse_stream": "sse_parse",
+    "_parse_sse_stream_async": "sse_parse",
+    "_normalize_response": "normalize",
+    "_normalize_chunk": "normalize",
+    "_parse_response": "normalize",
+}
+
+
+@dataclass
+class CallEvent:
+    """Measurements of one provider call, reported when the call ends.
+
+    Attributes:
+        operation: Method called, e.g. "chat_complete" or "aembed".
+        provider: Provider name.
+        model: Model name, if known.
+        stream: Whether the call returned a stream of chunks.
+        status: "ok", "error", or "cancelled" when a stream was closed early
+            or the task was cancelled.
+        error: Exception raised by the call, if any.
+        start_time: Wall-clock start time (Unix timestamp).
+        latency: Seconds until the result was returned or, for streams,
+            until the last chunk.
+        chunks: Number of streamed chunks.
+        input_tokens: Prompt tokens reported by the provider.
+        output_tokens: Completion tokens reported by the provider.
+        total_tokens: Total tokens reported by the provider.
+        bytes_sent: Request body bytes, when sent through the model's clients.
+        bytes_received: Response body bytes, when received through the
+            model's clients.
+        stages: Seconds spent per stage ("payload", "network", "sse_parse",
+            "normalize"), only for calls sampled by a profiler.
+    """
+
+    operation: str
+    provider: str
+    model: Optional[str] = None
+    stream: bool = False
+    status: str = "ok"
+    error: Optional[BaseException] = None
+    start_time: float = field(default_factory=time.time)
+    latency: Optional[float] = None
+    chunks: int = 0
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+    bytes_sent: Optional[int] = None
+    bytes_received: Optional[int] = None
+    stages: Optional[Dict[str, float]] = None
+    _owner: int = field(default=0, repr=False, compare=False)
+    _started: float = field(default_factory=time.perf_counter, repr=False, compare=False)
+    _responses: List[httpx.Response] = field(default_factory=list, repr=False, compare=False)
+    _span: Any = field(default=None, repr=False, compare=False)
+    _profiler: Any = field(default=None, repr=False, compare=False)
+    _in_stage: bool = field(default=False, repr=False, compare=False)
+    _request_sent: float = field(default=0.0, repr=False, compare=False)
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """Output tokens per second over the whole call."""
+        if not self.output_tokens or not self.latency:
+            return None
+        return self.output_tokens / self.latency
+
+    def _record_usage(self, result: Any) -> None:
+        usage = getattr(result, "usage", None)
+        if usage is None:
+            return
+        self.input_tokens = getattr(usage, "prompt_tokens", None)
+        self.output_tokens = getattr(usage, "completion_tokens", None)
+        self.total_tokens = getattr(usage, "total_tokens", None)
+
+    def _record_request(self, request: httpx.Request) -> None:
+        try:
+            size = len(request.content)
+        except httpx.RequestNotRead:
+            # Streamed body; httpx sets Content-Length when the size is known
+            size = int(request.headers.get("content-length", 0))
+        self.bytes_sent = (self.bytes_sent or 0) + size
+
+    def _add_stage(self, stage: str, seconds: float) -> None:
+        stages = self.stages
+        if stages is not None:
+            stages[stage] = stages.get(stage, 0.0) + seconds
+
+
+# Call being recorded in the current thread or task
+_current_call: ContextVar[Optional[CallEvent]] = ContextVar(
+    "esperanto_current_call", default=None
+)
+# id() of the model whose unsampled call is running, so calls it makes on
+# itself (e.g. via super()) are not sampled again
+_unsampled_call: ContextVar[Optional[int]] = ContextVar(
+    "esperanto_unsampled_call", default=None
+)
+# Profiler of the innermost ``profile()`` block, if any
+_current_profiler: ContextVar[Any] = ContextVar("esperanto_current_profiler", default=None)
+
+
+def _on_request(request: httpx.Request) -> None:
+    event = _current_call.get()
+    if event is not None:
+        event._record_request(request)
+        if event.stages is not None:
+            event._request_sent = time.perf_counter()
+
+
+def _on_response(response: httpx.Response) -> None:
+    event = _current_call.get()
+    if event is not None:
+        # Bodies may still be streaming; they are counted when the call ends
+        event._responses.append(response)
+        if event.stages is not None and event._request_sent:
+            event._add_stage("network", time.perf_counter() - event._request_sent)
+            event._request_sent = 0.0
+
+
+async def _aon_request(request: httpx.Request) -> None:
+    _on_request(request)
+
+
+async def _aon_response(response: httpx.Response) -> None:
+    _on_response(response)
+
+
+# httpx event hooks that attribute body sizes to the current call
+HTTP_EVENT_HOOKS: Dict[str, List[Callable[..., Any]]] = {
+    "request": [_on_request],
+    "response": [_on_response],
+}
+ASYNC_HTTP_EVENT_HOOKS: Dict[str, List[Callable[..., Any]]] = {
+    "request": [_aon_request],
+    "response": [_aon_response],
+}
+
+
+class Instrumentation:
+    """Process-wide call hooks and tracer."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hooks: Tuple[CallHook, ...] = ()
+        self._tracer: Any = None
+        self._profiler: Any = None
+        self._profile_blocks = 0
+        # Read on every call; kept in sync with the hooks, tracer and profilers
+        self.active = False
+        # Whether every call is recorded, not only the sampled ones
+        self.observed = False
+        self._configure_from_env()
+
+    def add_hook(self, hook: CallHook) -> CallHook:
+        """Call ``hook(event)`` when each provider call ends.
+
+        Hooks run on the calling thread; exceptions they raise are logged and
+        ignored. Returns the hook, so this can be used as a decorator.
+        """
+        with self._lock:
+            if hook not in self._hooks:
+                self._hooks = self._hooks + (hook,)
+            self._update()
+        return hook
+
+    def remove_hook(self, hook: CallHook) -> None:
+        """Stop calling a hook added with add_hook."""
+        with self._lock:
+            self._hooks = tuple(h for h in self._hooks if h is not hook)
+            self._update()
+
+    def enable_tracing(self, tracer: Any = None) -> None:
+        """Emit an OpenTelemetry span for each provider call.
+
+        Args:
+            tracer: OpenTelemetry tracer to use. Defaults to the "esperanto"
+                tracer of the global tracer provider.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetry tracing requires opentelemetry-api. "
+                "Install with: uv add opentelemetry-api or pip install opentelemetry-api"
+            ) from e
+        with self._lock:
+            self._tracer = tracer if tracer is not None else trace.get_tracer("esperanto")
+            self._update()
+
+    def disable_tracing(self) -> None:
+        """Stop emitting OpenTelemetry spans."""
+        with self._lock:
+            self._tracer = None
+            self._update()
+
+    def clear(self) -> None:
+        """Remove all hooks and reset tracing to the environment setting."""
+        with self._lock:
+            self._hooks = ()
+            self._tracer = None
+            self._update()
+        self._configure_from_env()
+
+    def _configure_from_env(self) -> None:
+        if os.getenv(TRACING_ENV_VAR, "").lower() not in ("true", "1", "yes"):
+            return
+        try:
+            self.enable_tracing()
+        except ImportError as e:
+            logger.warning(f"{TRACING_ENV_VAR} is set but tracing is unavailable: {e}")
+
+    def _set_profiler(self, profiler: Any) -> None:
+        """Set the process-wide profiler (None to disable)."""
+        with self._lock:
+            self._profiler = profiler
+            self._update()
+
+    def _enter_profile_block(self) -> None:
+        with self._lock:
+            self._profile_blocks += 1
+            self._update()
+
+    def _exit_profile_block(self) -> None:
+        with self._lock:
+            self._profile_blocks -= 1
+            self._update()
+
+    def _update(self) -> None:
+        self.active = (
+            bool(self._hooks)
+            or self._tracer is not None
+            or self._profiler is not None
+            or self._profile_blocks > 0
+        )
+        self.observed = bool(self._hooks) or self._tracer is not None
+
+    def _sample(self) -> Any:
+        """Return the profiler sampling the call about to start, if any."""
+        profiler = _current_profiler.get() or self._profiler
+        if profiler is not None and random.random() < profiler.sample_rate:
+            return profiler
+        return None
+
+    def _begin(self, model: Any, operation: str, profiler: Any = None) -> CallEvent:
+        event = CallEvent(
+            operation=operation,
+            provider=str(getattr(model, "provider", type(model).__name__)),
+            model=getattr(model, "model_name", None),
+            _owner=id(model),
+        )
+        if profiler is not None:
+            event.stages = {}
+            event._profiler = profiler
+        tracer = self._tracer
+        if tracer is not None:
+            try:
+                from opentelemetry.trace import SpanKind
+
+                event._span = tracer.start_span(
+                    f"{operation} {event.model or event.provider}",
+                    kind=SpanKind.CLIENT,
+                    attributes={
+                        "gen_ai.operation.name": operation,
+                        "gen_ai.system": event.provider,
+                        "gen_ai.request.model": event.model or "",
+                    },
+                )
+            except Exception as e:
+                logger.debug(f"Could not start span for {operation}: {e}")
+        return event
+
+    def _finish(self, event: CallEvent) -> None:
+        event.latency = time.perf_counter() - event._started
+        if event._responses:
+            event.bytes_received = sum(_received_bytes(r) for r in event._responses)
+            event._responses.clear()
+        if event._span is not None:
+            _end_span(event)
+        if event._profiler is not None:
+            event._profiler.record(event)
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logger.warning(f"Call hook {hook!r} failed: {e}")
+
+    def _fail(self, event: CallEvent, error: BaseException) -> None:
+        event.error = error
+        event.status = "error" if isinstance(error, Exception) else "cancelled"
+
+
+instrumentation = Instrumentation()
+
+
+def add_call_hook(hook: CallHook) -> CallHook:
+    """Call ``hook(event)`` with a CallEvent when each provider call ends."""
+    return instrumentation.add_hook(hook)
+
+
+def remove_call_hook(hook: CallHook) -> None:
+    """Stop calling a hook added with add_call_hook."""
+    instrumentation.remove_hook(hook)
+
+
+def enable_tracing(tracer: Any = None) -> None:
+    """Emit an OpenTelemetry span for each provider call."""
+    instrumentation.enable_tracing(tracer)
+
+
+def clear_instrumentation() -> None:
+    """Remove all call hooks and reset tracing to the environment setting."""
+    instrumentation.clear()
+
+
+def _received_bytes(response: httpx.Response) -> int:
+    """Body bytes as received (before decompression) of a response."""
+    if response.num_bytes_downloaded:
+        return response.num_bytes_downloaded
+    try:
+        # Responses built in memory (e.g. by a mock transport) are not counted
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        return 0
+
+
+def _end_span(event: CallEvent) -> None:
+    span = event._span
+    try:
+        from opentelemetry.trace import Status, StatusCode
+
+        attributes = {
+            "gen_ai.usage.input_tokens": event.input_tokens,
+            "gen_ai.usage.output_tokens": event.output_tokens,
+            "esperanto.stream": event.stream,
+            "esperanto.status": event.status,
+            "esperanto.bytes_sent": event.bytes_sent,
+            "esperanto.bytes_received": event.bytes_received,
+        }
+        span.set_attributes({k: v for k, v in attributes.items() if v is not None})
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, str(event.error)))
+        span.end()
+    except Exception as e:
+        logger.debug(f"Could not end span for {event.operation}: {e}")
+
+
+class _Activation:
+    """Make an event (and its span) current for the duration of a step."""
+
+    __slots__ = ("event", "token", "otel_token")
+
+    def __init__(self, event: CallEvent):
+        self.event = event
+
+    def __enter__(self) -> None:
+        self.token = _current_call.set(self.event)
+        self.otel_token = None
+        if self.event._span is not None:
+            from opentelemetry import context, trace
+
+            self.otel_token = context.attach(trace.set_span_in_context(self.event._span))
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.otel_token is not None:
+            from opentelemetry import context
+
+            context.detach(self.otel_token)
+        _current_call.reset(self.token)
+
+
+def _is_nested(model: Any) -> bool:
+    """True inside an instrumented call on the same model (e.g. via super())."""
+    current = _current_call.get()
+    if current is not None and current._owner == id(model):
+        return True
+    return _unsampled_call.get() == id(model)
+
+
+def _record_stream(event: CallEvent, stream: Iterable[Any]) -> Iterator[Any]:
+    iterator = iter(stream)
+    try:
+        while True:
+            with _Activation(event):
+                try:
+                    chunk = next(iterator)
+                except StopIteration:
+                    break
+            event.chunks += 1
+            yield chunk
+    except BaseException as e:
+        instrumentation._fail(event, e)
+        raise
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+        instrumentation._finish(event)
+
+
+async def _arecord_stream(event: CallEvent, stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    try:
+        while True:
+            with _Activation(event):
+                try:
+                    chunk = await stream.__anext__()
+                except StopAsyncIteration:
+                    break
+            event.chunks += 1
+            yield chunk
+    except BaseException as e:
+        instrumentation._fail(event, e)
+        raise
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        instrumentation._finish(event)
+
+
+def _complete(event: CallEvent, result: Any) -> Any:
+    """Finish a call with its result, or hand back a recording stream."""
+    if inspect.isgenerator(result):
+        event.stream = True
+        return _record_stream(event, result)
+    if inspect.isasyncgen(result):
+        event.stream = True
+        return _arecord_stream(event, result)
+    event._record_usage(result)
+    instrumentation._finish(event)
+    return result
+
+
+def instrumented(method: _F) -> _F:
+    """Record calls of a provider method while instrumentation is active."""
+    operation = method.__name__
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if not instrumentation.active or _is_nested(self):
+                return await method(self, *args, **kwargs)
+            profiler = instrumentation._sample()
+            if profiler is None and not instrumentation.observed:
+                token = _unsampled_call.set(id(self))
+                try:
+                    return await method(self, *args, **kwargs)
+                finally:
+                    _unsampled_call.reset(token)
+            event = instrumentation._begin(self, operation, profiler)
+            try:
+                with _Activation(event):
+                    result = await method(self, *args, **kwargs)
+            except BaseException as e:
+                instrumentation._fail(event, e)
+                instrumentation._finish(event)
+                raise
+            return _complete(event, result)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if not instrumentation.active or _is_nested(self):
+            return method(self, *args, **kwargs)
+        profiler = instrumentation._sample()
+        if profiler is None and not instrumentation.observed:
+            # Only profilers are active and this call is not sampled
+            token = _unsampled_call.set(id(self))
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                _unsampled_call.reset(token)
+        event = instrumentation._begin(self, operation, profiler)
+        try:
+            with _Activation(event):
+                result = method(self, *args, **kwargs)
+        except BaseException as e:
+            instrumentation._fail(event, e)
+            instrumentation._finish(event)
+            raise
+        return _complete(event, result)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _profiled_call(event: Optional[CallEvent]) -> bool:
+    return event is not None and event.stages is not None and not event._in_stage
+
+
+def staged(method: _F, stage: str) -> _F:
+    """Add the time spent in a provider method to a stage of profiled calls.
+
+    Generator methods are timed per step, so time the consumer spends between
+    items is not counted.
+    """
+    if inspect.isgeneratorfunction(method):
+
+        @functools.wraps(method)
+        def generator_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            iterator = method(self, *args, **kwargs)
+            try:
+                while True:
+                    event = _current_call.get()
+                    profiled = _profiled_call(event)
+                    if profiled:
+                        assert event is not None
+                        event._in_stage = True
+                    start = time.perf_counter()
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                    finally:
+                        if profiled:
+                            assert event is not None
+                            event._in_stage = False
+                            event._add_stage(stage, time.perf_counter() - start)
+                    yield item
+            finally:
+                iterator.close()
+
+        return generator_wrapper  # type: ignore[return-value]
+
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        async def async_generator_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            iterator = method(self, *args, **kwargs)
+            try:
+                while True:
+                    event = _current_call.get()
+                    profiled = _profiled_call(event)
+                    if profiled:
+                        assert event is not None
+                        event._in_stage = True
+                    start = time.perf_counter()
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        if profiled:
+                            assert event is not None
+                            event._in_stage = False
+                            event._add_stage(stage, time.perf_counter() - start)
+                    yield item
+            finally:
+                await iterator.aclose()
+
+        return async_generator_wrapper  # type: ignore[return-value]
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            event = _current_call.get()
+            if not _profiled_call(event):
+                return await method(self, *args, **kwargs)
+            assert event is not None
+            event._in_stage = True
+            start = time.perf_counter()
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                event._in_stage = False
+                event._add_stage(stage, time.perf_counter() - start)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        event = _current_call.get()
+        if not _profiled_call(event):
+            return method(self, *args, **kwargs)
+        assert event is not None
+        event._in_stage = True
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            event._in_stage = False
+            event._add_stage(stage, time.perf_counter() - start)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def instrument_methods(cls: type, names: Iterable[str]) -> None:
+    """Wrap the named methods a class defines itself with ``instrumented``,
+    and its stage methods (see STAGE_METHODS) with ``staged``."""
+    for name in names:
+        method = cls.__dict__.get(name)
+        if method is not None and not getattr(method, "__isabstractmethod__", False):
+            setattr(cls, name, instrumented(method))
+    for name, stage in STAGE_METHODS.items():
+        method = cls.__dict__.get(name)
+        if inspect.isfunction(method):
+            setattr(cls, name, staged(method, stage))
+
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_LabelValues = Tuple[str, ...]
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class CallMetrics:
+    """Prometheus-style counters and histograms of provider calls.
+
+    Register an instance as a hook and expose ``render()`` on a metrics
+    endpoint::
+
+        metrics = CallMetrics()
+        add_call_hook(metrics)
+        ...
+        body = metrics.render()  # text/plain; version=0.0.4
+
+    Metrics, labelled by provider, model and operation:
+
+    - ``esperanto_calls_total`` (counter, also labelled by status)
+    - ``esperanto_call_duration_seconds`` (histogram)
+    - ``esperanto_tokens_total`` (counter, labelled by type input/output)
+    - ``esperanto_bytes_total`` (counter, labelled by direction sent/received)
+
+    Args:
+        buckets: Upper bounds of the histogram buckets in seconds.
+        namespace: Prefix of the metric names.
+    """
+
+    _LABELS = ("provider", "model", "operation")
+
+    def __init__(
+        self,
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+        namespace: str = "esperanto",
+    ):
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._calls: Dict[_LabelValues, int] = {}
+        self._tokens: Dict[_LabelValues, int] = {}
+        self._bytes: Dict[_LabelValues, int] = {}
+        self._latency: Dict[_LabelValues, _Histogram] = {}
+
+    def __call__(self, event: CallEvent) -> None:
+        labels = (event.provider, event.model or "", event.operation)
+        with self._lock:
+            self._inc(self._calls, labels + (event.status,))
+            if event.latency is not None:
+                self._observe(self._latency, labels, event.latency)
+            for kind, tokens in (("input", event.input_tokens), ("output", event.output_tokens)):
+                if tokens:
+                    self._inc(self._tokens, labels + (kind,), tokens)
+            for direction, size in (("sent", event.bytes_sent), ("received", event.bytes_received)):
+                if size:
+                    self._inc(self._bytes, labels + (direction,), size)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """Current values as (metric name, labels, value) tuples."""
+        ns = self.namespace
+        samples: List[Tuple[str, Dict[str, str], float]] = []
+        with self._lock:
+            for name, values, extra in (
+                (f"{ns}_calls_total", self._calls, "status"),
+                (f"{ns}_tokens_total", self._tokens, "type"),
+                (f"{ns}_bytes_total", self._bytes, "direction"),
+            ):
+                for key, value in values.items():
+                    samples.append((name, dict(zip(self._LABELS + (extra,), key)), value))
+            name = f"{ns}_call_duration_seconds"
+            for key, histogram in self._latency.items():
+                labels = dict(zip(self._LABELS, key))
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if math.isinf(bound) else repr(bound)
+                    samples.append((f"{name}_bucket", {**labels, "le": le}, cumulative))
+                samples.append((f"{name}_sum", labels, histogram.sum))
+                samples.append((f"{name}_count", labels, histogram.count))
+        return samples
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        ns = self.namespace
+        types = {
+            f"{ns}_calls_total": "counter",
+            f"{ns}_tokens_total": "counter",
+            f"{ns}_bytes_total": "counter",
+            f"{ns}_call_duration_seconds": "histogram",
+        }
+        by_family: Dict[str, List[str]] = {name: [] for name in types}
+        for name, labels, value in self.samples():
+            family = next(f for f in types if name == f or name.startswith(f + "_"))
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            by_family[family].append(f"{name}{{{label_text}}} {_format_value(value)}")
+        lines = []
+        for family, metric_type in types.items():
+            if by_family[family]:
+                lines.append(f"# TYPE {family} {metric_type}")
+                lines.extend(by_family[family])
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        """Set all metrics back to zero."""
+        with self._lock:
+            for values in (self._calls, self._tokens, self._bytes, self._latency):
+                values.clear()
+
+    @staticmethod
+    def _inc(values: Dict[_LabelValues, int], key: _LabelValues, amount: int = 1) -> None:
+        values[key] = values.get(key, 0) + amount
+
+    def _observe(
+        self, histograms: Dict[_LabelValues, _Histogram], key: _LabelValues, value: float
+    ) -> None:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = _Histogram(len(self.buckets))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                histogram.counts[i] += 1
+                break
+        histogram.sum += value
+        histogram.count += 1
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,273 @@
+"""Pluggable JSON encoding and decoding of request and response bodies.
+
+Providers encode request payloads and decode responses and stream events
+through the codec selected here: orjson if installed, else msgspec, else the
+standard library. Set ``ESPERANTO_JSON_BACKEND`` (``orjson``, ``msgspec``,
+``json`` or ``auto``) or call ``set_json_codec()`` to choose one explicitly.
+
+Every codec encodes like httpx's ``json=`` (compact separators, UTF-8
+without escaping non-ASCII text) and raises ``json.JSONDecodeError`` for
+invalid input, so the backend makes no difference to callers. The clients
+created by providers (``JSONClient``, ``AsyncJSONClient``) encode ``json=``
+payloads with the codec and decode ``response.json()`` with it.
+"""
+
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Union
+
+import httpx
+
+from .timeout import AsyncDeadlineClient, DeadlineClient
+
+# Environment variable selecting the JSON backend
+JSON_BACKEND_ENV_VAR = "ESPERANTO_JSON_BACKEND"
+
+_Data = Union[str, bytes, bytearray, memoryview]
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """A JSON backend.
+
+    Attributes:
+        name: Backend name, e.g. "orjson".
+        dumps: Encode an object to UTF-8 bytes.
+        loads: Decode str or bytes, raising json.JSONDecodeError if invalid.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[_Data], Any]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # The same options httpx uses for json= request bodies
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
+def _stdlib_loads(data: _Data) -> Any:
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+STDLIB_CODEC = JSONCodec("json", _stdlib_dumps, _stdlib_loads)
+
+
+def _check_finite(obj: Any) -> None:
+    """Raise like the standard library if ``obj`` holds NaN or infinity.
+
+    orjson and msgspec encode these as ``null`` instead of failing. Only
+    called when the encoded output contains ``null``.
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError("Out of range float values are not JSON compliant")
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def encode(obj: Any) -> bytes:
+        try:
+            data = orjson.dumps(obj, option=option)
+        except TypeError:
+            # Types orjson rejects (e.g. integers beyond 64 bits) still
+            # encode, or fail, as they do with the standard library
+            return _stdlib_dumps(obj)
+        if b"null" in data:
+            _check_finite(obj)
+        return data
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return JSONCodec("orjson", encode, orjson.loads)
+
+
+def _msgspec_codec() -> JSONCodec:
+    import msgspec  # type: ignore[import-not-found]
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def encode(obj: Any) -> bytes:
+        try:
+            data = encoder.encode(obj)
+        except TypeError:
+            return _stdlib_dumps(obj)
+        if b"null" in data:
+            _check_finite(obj)
+        return data
+
+    def decode(data: _Data) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            doc = data if isinstance(data, str) else bytes(data).decode("utf-8", "replace")
+            raise json.JSONDecodeError(str(e), doc, 0) from None
+
+    return JSONCodec("msgspec", encode, decode)
+
+
+# Optional backends, in the order they are preferred
+_BACKENDS: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+}
+# Package extra installing each optional backend
+_EXTRAS = {"orjson": "json", "msgspec": "msgspec"}
+
+_codec: Optional[JSONCodec] = None
+_codec_lock = threading.Lock()
+
+
+def _load_codec(name: str) -> JSONCodec:
+    """Return the codec of a backend name, or the fastest installed one.
+
+    Raises:
+        ValueError: If the name is not a known backend.
+        ImportError: If the named backend is not installed.
+    """
+    name = name.strip().lower() or "auto"
+    if name == "json":
+        return STDLIB_CODEC
+    if name == "auto":
+        for factory in _BACKENDS.values():
+            try:
+                return factory()
+            except ImportError:
+                continue
+        return STDLIB_CODEC
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend {name!r}; expected auto, orjson, msgspec or json"
+        )
+    try:
+        return _BACKENDS[name]()
+    except ImportError:
+        raise ImportError(
+            f"{name} is required for the {name} JSON backend. "
+            f"Install it with: pip install esperanto[{_EXTRAS[name]}]"
+        ) from None
+
+
+def get_json_codec() -> JSONCodec:
+    """Return the JSON codec in use, selecting it on first call.
+
+    The backend comes from ESPERANTO_JSON_BACKEND, defaulting to the
+    fastest installed one. It is imported here rather than when esperanto
+    is imported.
+    """
+    global _codec
+    codec = _codec
+    if codec is None:
+        with _codec_lock:
+            codec = _codec
+            if codec is None:
+                codec = _codec = _load_codec(os.getenv(JSON_BACKEND_ENV_VAR, "auto"))
+    return codec
+
+
+def set_json_codec(codec: Union[str, JSONCodec, None]) -> None:
+    """Select the JSON codec used by all providers.
+
+    Args:
+        codec: A backend name ("orjson", "msgspec", "json" or "auto"), a
+            custom JSONCodec, or None to select from ESPERANTO_JSON_BACKEND
+            again on next use.
+
+    Raises:
+        ValueError: If the name is not a known backend.
+        ImportError: If the named backend is not installed.
+    """
+    global _codec
+    if isinstance(codec, str):
+        codec = _load_codec(codec)
+    with _codec_lock:
+        _codec = codec
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` to compact UTF-8 JSON with the selected codec."""
+    return (_codec or get_json_codec()).dumps(obj)
+
+
+def loads(data: _Data) -> Any:
+    """Decode JSON text or bytes with the selected codec.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    return (_codec or get_json_codec()).loads(data)
+
+
+class JSONResponse(httpx.Response):
+    """httpx.Response decoding ``json()`` with the selected codec."""
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().json(**kwargs)
+        return loads(self.content)
+
+
+def _encode_json_body(kwargs: Dict[str, Any]) -> bool:
+    """Replace a ``json=`` payload in request kwargs with encoded content."""
+    payload = kwargs.pop("json", None)
+    if payload is None or kwargs.get("content") is not None:
+        return False
+    kwargs["content"] = dumps(payload)
+    return True
+
+
+class JSONClient(DeadlineClient):
+    """httpx.Client encoding and decoding JSON bodies with the selected codec.
+
+    ``json=`` payloads are encoded to bytes before httpx sees them, with the
+    Content-Type header httpx would set, and ``json()`` of responses
+    decodes with the codec.
+    """
+
+    def build_request(self, method: str, url: Any, **kwargs: Any) -> httpx.Request:
+        encoded = _encode_json_body(kwargs)
+        request = super().build_request(method, url, **kwargs)
+        if encoded:
+            request.headers.setdefault("Content-Type", "application/json")
+        return request
+
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        response = super().send(request, **kwargs)
+        response.__class__ = JSONResponse
+        return response
+
+
+class AsyncJSONClient(AsyncDeadlineClient):
+    """httpx.AsyncClient encoding and decoding JSON bodies with the selected codec.
+
+    See JSONClient for details.
+    """
+
+    def build_request(self, method: str, url: Any, **kwargs: Any) -> httpx.Request:
+        encoded = _encode_json_body(kwargs)
+        request = super().build_request(method, url, **kwargs)
+        if encoded:
+            request.headers.setdefault("Content-Type", "application/json")
+        return request
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        response = await super().send(request, **kwargs)
+        response.__class__ = JSONResponse
+        return response
@@ -0,0 +1,151 @@
+"""Streaming multipart/form-data bodies for async uploads."""
+
+import asyncio
+import os
+import secrets
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+def _field_value(value: Any) -> str:
+    """Render a form value the way httpx does for ``data=``."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\r", "%0D").replace("\n", "%0A")
+
+
+class AsyncMultipartUpload:
+    """Async iterable multipart body that streams one file in bounded chunks.
+
+    ``httpx.AsyncClient`` reads file objects passed via ``files=`` with
+    blocking ``read()`` calls on the event loop. This body instead opens and
+    reads the file in a worker thread, ``chunk_size`` bytes at a time, so a
+    large upload does not stall other coroutines and memory use stays bounded.
+
+    Form fields are sent before the file. The body can be iterated more than
+    once (e.g. when a request is retried) as long as a path or seekable stream
+    was given. ``Content-Length`` is set when the file size is known.
+
+    Example:
+        >>> upload = AsyncMultipartUpload("audio.mp3", data={"model": "whisper-1"})
+        >>> await client.post(url, content=upload, headers=upload.headers)
+    """
+
+    def __init__(
+        self,
+        file: Union[str, BinaryIO],
+        data: Optional[Dict[str, Any]] = None,
+        *,
+        field_name: str = "file",
+        filename: Optional[str] = None,
+        content_type: str = "application/octet-stream",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """Initialize the upload.
+
+        Args:
+            file: Path to the file or a binary file object.
+            data: Form fields sent alongside the file. List values are sent
+                as repeated fields.
+            field_name: Form field name of the file part.
+            filename: Filename reported to the server. Defaults to the base
+                name of the path or of the stream's ``name`` attribute.
+            content_type: Content type of the file part.
+            chunk_size: Bytes read from the file per thread hop.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.file = file
+        self.field_name = field_name
+        self.content_type = content_type
+        self.chunk_size = chunk_size
+        self.boundary = secrets.token_hex(16)
+
+        if filename is None:
+            source = file if isinstance(file, str) else getattr(file, "name", None)
+            filename = os.path.basename(source) if isinstance(source, str) and source else "upload"
+        self.filename = filename
+
+        self.fields: List[tuple] = []
+        for name, value in (data or {}).items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            self.fields.extend((name, _field_value(v)) for v in values)
+
+        self._start: Optional[int] = None
+        if not isinstance(file, str) and file.seekable():
+            self._start = file.tell()
+
+        self._head = self._render_head()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+    def _render_head(self) -> bytes:
+        parts = []
+        for name, value in self.fields:
+            parts.append(
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+                f"{value}\r\n"
+            )
+        parts.append(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(self.field_name)}"; '
+            f'filename="{_quote(self.filename)}"\r\n'
+            f"Content-Type: {self.content_type}\r\n\r\n"
+        )
+        return "".join(parts).encode()
+
+    def _file_size(self) -> Optional[int]:
+        if isinstance(self.file, str):
+            return os.path.getsize(self.file)
+        if self._start is None:
+            return None
+        try:
+            return os.fstat(self.file.fileno()).st_size - self._start
+        except (AttributeError, OSError, ValueError):
+            pass
+        position = self.file.tell()
+        end = self.file.seek(0, os.SEEK_END)
+        self.file.seek(position)
+        return end - self._start
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Content headers to send with the body."""
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        size = self._file_size()
+        if size is not None:
+            headers["Content-Length"] = str(len(self._head) + size + len(self._tail))
+        return headers
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+
+        if isinstance(self.file, str):
+            fileobj: BinaryIO = await asyncio.to_thread(open, self.file, "rb")
+            owned = True
+        else:
+            fileobj = self.file
+            owned = False
+            if self._start is not None:
+                await asyncio.to_thread(fileobj.seek, self._start)
+
+        try:
+            while True:
+                chunk = await asyncio.to_thread(fileobj.read, self.chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            if owned:
+                await asyncio.to_thread(fileobj.close)
+
+        yield self._tail
@@ -0,0 +1,250 @@
+"""Per-stage timing of provider calls.
+
+A profiled call records where its time went:
+
+- ``payload``: building the request (``_get_api_kwargs``, ``_format_messages``
+  and similar provider methods);
+- ``network``: from sending each request to receiving its response headers;
+- ``sse_parse``: parsing streamed server-sent events, including waiting for
+  the next bytes of the stream;
+- ``normalize``: converting provider responses and chunks into Esperanto
+  types (``_normalize_response``, ``_normalize_chunk``);
+- ``other``: the rest, such as JSON encoding inside httpx, reading response
+  bodies and provider bookkeeping.
+
+Profiling is opt-in, either for a block of code::
+
+    with esperanto.profile() as report:
+        model.chat_complete(messages)
+    print(report.render())
+
+or for the whole process with ``enable_profiling(sample_rate)`` or the
+``ESPERANTO_PROFILE`` environment variable, whose value is the sample rate
+(e.g. ``0.01`` to profile one call in a hundred, or ``true`` for every call).
+Unless call hooks or tracing are also enabled, calls that are not sampled
+only pay for a random number draw and a context variable update, so a low
+rate is safe in production.
+"""
+
+import logging
+import math
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from .instrumentation import CallEvent, _current_profiler, instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Environment variable enabling process-wide profiling at the given sample rate
+PROFILE_ENV_VAR = "ESPERANTO_PROFILE"
+
+# Stages in report order
+STAGES = ("payload", "network", "sse_parse", "normalize", "other", "total")
+
+_CallKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Timing of one stage across the profiled calls of one model operation.
+
+    Attributes:
+        calls: Number of profiled calls.
+        total: Seconds spent in the stage across all calls.
+        mean: Mean seconds per call.
+        p50: Median seconds per call over the retained samples.
+        p95: 95th percentile seconds per call over the retained samples.
+        max: Longest time in the stage for a single call.
+        share: Fraction of the total call time spent in the stage.
+    """
+
+    calls: int
+    total: float
+    mean: float
+    p50: float
+    p95: float
+    max: float
+    share: float
+
+
+class ProfileReport:
+    """Aggregated stage timings, by provider, model and operation.
+
+    Args:
+        max_samples: Per-call timings kept per stage for percentiles; older
+            samples are dropped.
+    """
+
+    def __init__(self, max_samples: int = 1000):
+        if max_samples < 1:
+            raise ValueError(f"max_samples must be at least 1, got {max_samples}")
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._calls: Dict[_CallKey, int] = {}
+        self._totals: Dict[_CallKey, Dict[str, float]] = {}
+        self._maxima: Dict[_CallKey, Dict[str, float]] = {}
+        self._samples: Dict[_CallKey, Dict[str, Deque[float]]] = {}
+
+    def record(self, event: CallEvent) -> None:
+        """Add the stage timings of a profiled call."""
+        if event.stages is None or event.latency is None:
+            return
+        timings = dict(event.stages)
+        timings["other"] = max(event.latency - sum(timings.values()), 0.0)
+        timings["total"] = event.latency
+        key = (event.provider, event.model or "", event.operation)
+        with self._lock:
+            self._calls[key] = self._calls.get(key, 0) + 1
+            totals = self._totals.setdefault(key, {})
+            maxima = self._maxima.setdefault(key, {})
+            samples = self._samples.setdefault(key, {})
+            for stage in STAGES:
+                seconds = timings.get(stage, 0.0)
+                totals[stage] = totals.get(stage, 0.0) + seconds
+                maxima[stage] = max(maxima.get(stage, 0.0), seconds)
+                if stage not in samples:
+                    samples[stage] = deque(maxlen=self.max_samples)
+                samples[stage].append(seconds)
+
+    def stats(self) -> Dict[_CallKey, Dict[str, StageStats]]:
+        """Stage statistics keyed by (provider, model, operation)."""
+        result: Dict[_CallKey, Dict[str, StageStats]] = {}
+        with self._lock:
+            for key, calls in self._calls.items():
+                totals = self._totals[key]
+                overall = totals["total"] or math.inf
+                result[key] = {
+                    stage: StageStats(
+                        calls=calls,
+                        total=totals[stage],
+                        mean=totals[stage] / calls,
+                        p50=_percentile(self._samples[key][stage], 0.5),
+                        p95=_percentile(self._samples[key][stage], 0.95),
+                        max=self._maxima[key][stage],
+                        share=totals[stage] / overall,
+                    )
+                    for stage in STAGES
+                }
+        return result
+
+    def render(self) -> str:
+        """Format the statistics as a plain-text table, in milliseconds."""
+        lines: List[str] = []
+        for (provider, model, operation), stages in sorted(self.stats().items()):
+            calls = stages["total"].calls
+            lines.append(f"{provider}/{model or '-'} {operation} ({calls} calls)")
+            lines.append(
+                f"  {'stage':<10}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}"
+                f"{'max ms':>10}{'share':>8}"
+            )
+            for stage, s in stages.items():
+                lines.append(
+                    f"  {stage:<10}{s.mean * 1000:>10.2f}{s.p50 * 1000:>10.2f}"
+                    f"{s.p95 * 1000:>10.2f}{s.max * 1000:>10.2f}{s.share:>8.1%}"
+                )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Drop all recorded timings."""
+        with self._lock:
+            self._calls.clear()
+            self._totals.clear()
+            self._maxima.clear()
+            self._samples.clear()
+
+
+def _percentile(samples: Deque[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class _Profiler:
+    """Samples calls into a report."""
+
+    def __init__(self, report: ProfileReport, sample_rate: float):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        self.report = report
+        self.sample_rate = sample_rate
+
+    def record(self, event: CallEvent) -> None:
+        self.report.record(event)
+
+
+@contextmanager
+def profile(
+    sample_rate: float = 1.0, report: Optional[ProfileReport] = None
+) -> Iterator[ProfileReport]:
+    """Profile the provider calls made in this block.
+
+    Calls started in the block's thread or task, and in tasks it creates, are
+    profiled; calls in other threads are not.
+
+    Args:
+        sample_rate: Fraction of calls to profile, between 0 and 1.
+        report: Report to add timings to. Defaults to a new one.
+
+    Yields:
+        ProfileReport: The report receiving the timings.
+
+    Raises:
+        ValueError: If sample_rate is outside [0, 1].
+    """
+    profiler = _Profiler(report or ProfileReport(), sample_rate)
+    token = _current_profiler.set(profiler)
+    instrumentation._enter_profile_block()
+    try:
+        yield profiler.report
+    finally:
+        instrumentation._exit_profile_block()
+        _current_profiler.reset(token)
+
+
+def enable_profiling(sample_rate: float = 1.0) -> ProfileReport:
+    """Profile provider calls in the whole process.
+
+    Args:
+        sample_rate: Fraction of calls to profile, between 0 and 1.
+
+    Returns:
+        ProfileReport: The process-wide report, also available from
+        get_profile_report().
+
+    Raises:
+        ValueError: If sample_rate is outside [0, 1].
+    """
+    profiler = _Profiler(ProfileReport(), sample_rate)
+    instrumentation._set_profiler(profiler)
+    return profiler.report
+
+
+def disable_profiling() -> None:
+    """Stop process-wide profiling. ``profile()`` blocks are not affected."""
+    instrumentation._set_profiler(None)
+
+
+def get_profile_report() -> Optional[ProfileReport]:
+    """The process-wide report, or None when process-wide profiling is off."""
+    profiler = instrumentation._profiler
+    return profiler.report if profiler is not None else None
+
+
+def _configure_from_env() -> None:
+    value = os.getenv(PROFILE_ENV_VAR, "").strip()
+    if not value or value.lower() in ("false", "no"):
+        return
+    try:
+        enable_profiling(1.0 if value.lower() in ("true", "yes") else float(value))
+    except ValueError:
+        # A bad setting must not make ``import esperanto`` fail
+        logger.warning(
+            f"{PROFILE_ENV_VAR} must be a sample rate between 0 and 1 or true, "
+            f"got {value!r}; profiling is disabled"
+        )
+
+
+_configure_from_env()
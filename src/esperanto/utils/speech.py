@@ -0,0 +1,321 @@
+"""Helpers for long-form text-to-speech.
+
+Long texts are split into segments at sentence boundaries so each request stays
+within provider limits. SSML input is only split between top-level elements,
+and each segment is re-wrapped in the original ``<speak>`` element.
+
+The synthesized segments are joined without re-encoding: WAV segments get a
+single rewritten header, MP3 segments are joined frame by frame with per-file
+tags and VBR info frames dropped, and Ogg Opus segments are remuxed into one
+logical stream. Only the standard library is used.
+"""
+
+import io
+import re
+import struct
+import wave
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from esperanto.utils.audio import wav_header
+
+DEFAULT_MAX_SEGMENT_CHARS = 2000
+
+# Split levels tried in order when a piece is too long: sentences and
+# paragraphs, then clauses, then words
+_SPLIT_PATTERNS = [
+    re.compile(r"[.!?…。！？]+[\"'”’)\]]*\s+|\n\s*\n"),
+    re.compile(r"[,;:–—]\s+"),
+    re.compile(r"\s+"),
+]
+_TAG_PATTERN = re.compile(r"<[^>]*>")
+_SPEAK_PATTERN = re.compile(r"^\s*(<speak\b[^>]*>)(.*)(</speak>)\s*$", re.DOTALL)
+# Closing one of these at the top level ends a sentence
+_SENTENCE_ELEMENTS = ("p", "s", "paragraph", "sentence")
+
+_WAV_TYPES = {"audio/wav", "audio/x-wav", "audio/wave", "audio/vnd.wave"}
+_PCM_TYPES = {"audio/pcm", "audio/l16", "audio/raw"}
+_MP3_TYPES = {"audio/mp3", "audio/mpeg"}
+_OGG_TYPES = {"audio/opus", "audio/ogg"}
+# ADTS frames are self-contained, so the streams can be joined as-is
+_ADTS_TYPES = {"audio/aac", "audio/aacp"}
+
+
+def _top_level_boundaries(text: str, pattern: "re.Pattern[str]", level: int) -> List[int]:
+    """Positions where ``text`` may be cut without splitting an SSML element."""
+    boundaries = []
+    depth = 0
+    position = 0
+    for tag in [*_TAG_PATTERN.finditer(text), None]:
+        end = tag.start() if tag else len(text)
+        if depth == 0:
+            for match in pattern.finditer(text, position, end):
+                boundaries.append(match.end())
+        if tag is None:
+            break
+        markup = tag.group()
+        name = markup.strip("</>").split(None, 1)[0].lower() if markup.strip("</>") else ""
+        if markup.startswith("</"):
+            depth = max(depth - 1, 0)
+            if depth == 0 and level == 0 and name in _SENTENCE_ELEMENTS:
+                boundaries.append(tag.end())
+        elif not markup.endswith("/>") and not markup.startswith(("<!", "<?")):
+            depth += 1
+        position = tag.end()
+    return boundaries
+
+
+def _split(text: str, max_chars: int, level: int) -> List[str]:
+    if len(text) <= max_chars:
+        return [text]
+    if level == len(_SPLIT_PATTERNS):
+        if _TAG_PATTERN.search(text):
+            # Cutting inside markup would produce invalid SSML
+            return [text]
+        return [text[i:i + max_chars] for i in range(0, len(text), max_chars)]
+
+    cuts = [0, *_top_level_boundaries(text, _SPLIT_PATTERNS[level], level), len(text)]
+    pieces: List[str] = []
+    for start, end in zip(cuts, cuts[1:]):
+        if end > start:
+            pieces.extend(_split(text[start:end], max_chars, level + 1))
+
+    segments: List[str] = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + len(piece) > max_chars:
+            segments.append(current)
+            current = ""
+        current += piece
+    if current:
+        segments.append(current)
+    return segments
+
+
+def split_text(text: str, max_chars: int = DEFAULT_MAX_SEGMENT_CHARS) -> List[str]:
+    """Split text into segments of at most ``max_chars`` characters.
+
+    Segments end at sentence or paragraph breaks where possible, falling back
+    to clause breaks and then to word breaks for very long sentences. Text
+    wrapped in ``<speak>`` is treated as SSML: it is only cut between
+    top-level elements, and every segment is wrapped in the original
+    ``<speak>`` tag. An SSML element longer than ``max_chars`` is kept whole.
+
+    Args:
+        text: Plain text or an SSML document.
+        max_chars: Maximum segment length, including any ``<speak>`` wrapper.
+
+    Returns:
+        Non-empty segments in reading order.
+
+    Raises:
+        ValueError: If ``max_chars`` is too small to hold any text.
+    """
+    match = _SPEAK_PATTERN.match(text)
+    opening, body, closing = match.groups() if match else ("", text, "")
+    budget = max_chars - len(opening) - len(closing)
+    if budget < 1:
+        raise ValueError(f"max_chars must leave room for text, got {max_chars}")
+
+    segments = (segment.strip() for segment in _split(body, budget, 0))
+    return [f"{opening}{segment}{closing}" for segment in segments if segment]
+
+
+def _media_type(content_type: str) -> str:
+    return content_type.split(";", 1)[0].strip().lower()
+
+
+def _concat_wav(chunks: Sequence[bytes]) -> bytes:
+    params: Optional[Tuple[int, int, int]] = None
+    frames = []
+    for chunk in chunks:
+        with wave.open(io.BytesIO(chunk), "rb") as wav:
+            current = (wav.getnchannels(), wav.getsampwidth(), wav.getframerate())
+            if params is not None and current != params:
+                raise ValueError(
+                    f"Cannot join WAV segments with different formats: {params} and {current}"
+                )
+            params = current
+            frames.append(wav.readframes(wav.getnframes()))
+    assert params is not None
+    channels, sample_width, sample_rate = params
+    header = wav_header(sum(len(f) for f in frames), sample_rate, sample_width, channels)
+    return b"".join([header, *frames])
+
+
+_MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _mp3_frame_length(header: bytes) -> Optional[int]:
+    """Length of the MPEG audio layer III frame starting with ``header``."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 3
+    layer = (header[1] >> 1) & 3
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    bitrate = _MP3_BITRATES[3 if version == 3 else 2][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 1
+    return (144 if version == 3 else 72) * bitrate // sample_rate + padding
+
+
+def _mp3_frames(data: bytes, keep_id3: bool) -> bytes:
+    """Strip tags and the VBR info frame, keeping the audio frames."""
+    start = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        start = 10 + size + (10 if data[5] & 0x10 else 0)
+    end = len(data) - 128 if data[-128:-125] == b"TAG" else len(data)
+
+    frame_length = _mp3_frame_length(data[start:start + 4])
+    audio_start = start
+    if frame_length and any(
+        marker in data[start:start + frame_length] for marker in (b"Xing", b"Info", b"VBRI")
+    ):
+        audio_start = start + frame_length
+    prefix = data[:start] if keep_id3 else b""
+    return prefix + data[audio_start:end]
+
+
+def _concat_mp3(chunks: Sequence[bytes]) -> bytes:
+    return b"".join(_mp3_frames(chunk, keep_id3=i == 0) for i, chunk in enumerate(chunks))
+
+
+def _ogg_crc_table() -> List[int]:
+    table = []
+    for i in range(256):
+        crc = i << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else crc << 1
+        table.append(crc & 0xFFFFFFFF)
+    return table
+
+
+_OGG_CRC_TABLE = _ogg_crc_table()
+_OGG_HEADER = struct.Struct("<4sBBqIIIB")
+_OGG_NO_GRANULE = -1
+
+
+def _ogg_crc(data: Union[bytes, bytearray]) -> int:
+    crc = 0
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ _OGG_CRC_TABLE[(crc >> 24) ^ byte]
+    return crc
+
+
+def _ogg_pages(data: bytes) -> List[Tuple[int, int, bytes, bytes]]:
+    """Parse Ogg pages into (header_type, granule, lacing, body) tuples."""
+    pages = []
+    offset = 0
+    while offset < len(data):
+        if len(data) - offset < _OGG_HEADER.size or data[offset:offset + 4] != b"OggS":
+            raise ValueError("Invalid Ogg stream: expected a page header")
+        _, _, header_type, granule, _, _, _, segments = _OGG_HEADER.unpack_from(data, offset)
+        lacing_start = offset + _OGG_HEADER.size
+        lacing = data[lacing_start:lacing_start + segments]
+        body_start = lacing_start + segments
+        body_end = body_start + sum(lacing)
+        if len(lacing) < segments or body_end > len(data):
+            raise ValueError("Invalid Ogg stream: truncated page")
+        pages.append((header_type, granule, lacing, data[body_start:body_end]))
+        offset = body_end
+    return pages
+
+
+def _ogg_header_packets(first_page_body: bytes) -> int:
+    if first_page_body.startswith(b"OpusHead"):
+        return 2
+    if first_page_body.startswith(b"\x01vorbis"):
+        return 3
+    raise ValueError("Only Ogg Opus and Ogg Vorbis segments can be joined")
+
+
+def _concat_ogg(chunks: Sequence[bytes]) -> bytes:
+    """Remux Ogg segments into one logical stream.
+
+    The first segment's header pages are kept. Header pages of later segments
+    are dropped, and their audio pages are renumbered onto the first stream's
+    serial number with granule positions continuing from the previous segment.
+    """
+    streams = [_ogg_pages(chunk) for chunk in chunks]
+    if not streams or not streams[0]:
+        raise ValueError("Invalid Ogg stream: no pages")
+    serial = struct.unpack_from("<I", chunks[0], 14)[0]
+    header_packets = _ogg_header_packets(streams[0][0][3])
+
+    output = bytearray()
+    sequence = 0
+    offset = 0
+    for index, pages in enumerate(streams):
+        if index > 0:
+            packets = 0
+            while pages and packets < header_packets:
+                packets += sum(1 for size in pages[0][2] if size < 255)
+                pages = pages[1:]
+        last_granule = offset
+        for page_number, (header_type, granule, lacing, body) in enumerate(pages):
+            header_type &= 0x01
+            if index == 0 and sequence == 0:
+                header_type |= 0x02
+            if index == len(streams) - 1 and page_number == len(pages) - 1:
+                header_type |= 0x04
+            if granule != _OGG_NO_GRANULE:
+                granule += offset
+                last_granule = granule
+            page = bytearray(
+                _OGG_HEADER.pack(b"OggS", 0, header_type, granule, serial, sequence, 0, len(lacing))
+            )
+            page += lacing
+            page += body
+            struct.pack_into("<I", page, 22, _ogg_crc(page))
+            output += page
+            sequence += 1
+        offset = last_granule
+    return bytes(output)
+
+
+_JOINERS: List[Tuple[set, Callable[[Sequence[bytes]], bytes]]] = [
+    (_WAV_TYPES, _concat_wav),
+    (_MP3_TYPES, _concat_mp3),
+    (_OGG_TYPES, _concat_ogg),
+    (_PCM_TYPES | _ADTS_TYPES, b"".join),
+]
+
+
+def can_concat_audio(content_type: str) -> bool:
+    """Whether ``concat_audio`` can join audio of this MIME type."""
+    media_type = _media_type(content_type)
+    return any(media_type in types for types, _ in _JOINERS)
+
+
+def concat_audio(chunks: Sequence[bytes], content_type: str) -> bytes:
+    """Join encoded audio segments into a single file without re-encoding.
+
+    Args:
+        chunks: Audio segments in playback order, all in the same format.
+        content_type: MIME type of the segments, e.g. ``audio/mp3``.
+
+    Returns:
+        The joined audio in the same format.
+
+    Raises:
+        ValueError: If the format cannot be joined or the segments do not match.
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+    media_type = _media_type(content_type)
+    for types, join in _JOINERS:
+        if media_type in types:
+            return join(chunks)
+    raise ValueError(
+        f"Cannot join audio of type {content_type!r}; "
+        "request wav, pcm, mp3, aac or opus output for long texts"
+    )
@@ -1,13 +1,64 @@
 """SSL verification configuration utilities for Esperanto providers."""
 
 import os
+import ssl
+import threading
 import warnings
-from typing import Any, Union
+from typing import Any, Dict, Hashable, Tuple, Union
+
+import httpx
 
 # Environment variable names for SSL configuration
 SSL_VERIFY_ENV_VAR = "ESPERANTO_SSL_VERIFY"
 SSL_CA_BUNDLE_ENV_VAR = "ESPERANTO_SSL_CA_BUNDLE"
 
+# Loading a CA bundle takes tens of milliseconds, so contexts are built once
+# per verify setting and shared by every client in the process.
+_ssl_contexts: Dict[Tuple[Hashable, ...], ssl.SSLContext] = {}
+_ssl_contexts_lock = threading.Lock()
+
+
+def _ssl_context_key(verify: Union[bool, str]) -> Tuple[Hashable, ...]:
+    if verify is True:
+        # httpx honours these for the default CA bundle
+        return (True, os.environ.get("SSL_CERT_FILE"), os.environ.get("SSL_CERT_DIR"))
+    if verify is False:
+        return (False,)
+    # A replaced bundle file gets a new context
+    return (verify, os.stat(verify).st_mtime_ns)
+
+
+def get_ssl_context(verify: Union[bool, str]) -> ssl.SSLContext:
+    """Get the shared SSL context for a verify setting.
+
+    Args:
+        verify: True for the default CA bundle, False to disable
+            verification, or the path to a CA bundle file or directory,
+            as returned by ``SSLMixin._get_ssl_verify``.
+
+    Returns:
+        ssl.SSLContext: Context built the way httpx would for ``verify``.
+    """
+    key = _ssl_context_key(verify)
+    with _ssl_contexts_lock:
+        context = _ssl_contexts.get(key)
+        if context is None:
+            if isinstance(verify, str):
+                if os.path.isdir(verify):
+                    context = ssl.create_default_context(capath=verify)
+                else:
+                    context = ssl.create_default_context(cafile=verify)
+            else:
+                context = httpx.create_ssl_context(verify=verify)
+            _ssl_contexts[key] = context
+        return context
+
+
+def clear_ssl_contexts() -> None:
+    """Drop all cached SSL contexts."""
+    with _ssl_contexts_lock:
+        _ssl_contexts.clear()
+
 
 class SSLMixin:
     """Mixin providing SSL verification configuration functionality.
@@ -89,6 +140,14 @@ class SSLMixin:
         # 5. Default: SSL verification enabled
         return True
 
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        """Get the shared SSL context for this instance's verify setting.
+
+        Raises:
+            ValueError: If the SSL configuration is invalid (see _get_ssl_verify)
+        """
+        return get_ssl_context(self._get_ssl_verify())
+
     def _validate_verify_ssl(self, value: Any) -> bool:
         """Validate and normalize verify_ssl configuration value.
 
@@ -1,8 +1,13 @@
 """Timeout configuration utilities for Esperanto providers."""
 
+import asyncio
 import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterator, Mapping, Optional, Union, cast
+
+import httpcore
+import httpx
 
 # Default timeout values by provider type (in seconds)
 DEFAULT_TIMEOUTS: Dict[str, float] = {
@@ -22,6 +27,25 @@ TIMEOUT_ENV_VARS: Dict[str, str] = {
     "text_to_speech": "ESPERANTO_TTS_TIMEOUT"
 }
 
+# httpx timeout phases that can be configured individually
+TIMEOUT_PHASES = ("connect", "read", "write", "pool")
+
+# A timeout accepted by config={"timeout": ...} and per-call timeout= arguments:
+# a single number for every phase, a dict of phases, or an httpx.Timeout
+TimeoutValue = Union[float, Dict[str, Optional[float]], httpx.Timeout]
+
+# Request extension holding the DeadlineTimeout of a call
+_DEADLINE_EXTENSION = "esperanto.deadline"
+
+
+def get_phase_timeout_env_var(env_var: str, phase: str) -> str:
+    """Get the per-phase environment variable name for a timeout variable.
+
+    Example: ("ESPERANTO_LLM_TIMEOUT", "connect") -> "ESPERANTO_LLM_CONNECT_TIMEOUT"
+    """
+    prefix = env_var[: -len("_TIMEOUT")] if env_var.endswith("_TIMEOUT") else env_var
+    return f"{prefix}_{phase.upper()}_TIMEOUT"
+
 
 class TimeoutMixin(ABC):
     """Mixin providing timeout configuration functionality.
@@ -47,37 +71,131 @@ class TimeoutMixin(ABC):
         """
         pass
 
-    def _get_timeout(self) -> float:
+    def _get_timeout(self) -> Union[float, httpx.Timeout]:
         """Get timeout value using priority hierarchy.
 
         Priority order (highest to lowest):
-        1. Config dict: config={"timeout": 120}
-        2. Environment variable: ESPERANTO_LLM_TIMEOUT=90
+        1. Config dict: config={"timeout": 120} or
+           config={"timeout": {"connect": 5, "read": 120}}
+        2. Environment variables: ESPERANTO_LLM_TIMEOUT=90, then per-phase
+           overrides such as ESPERANTO_LLM_CONNECT_TIMEOUT=5
         3. Provider type default: 60.0 for LLM, 300.0 for STT/TTS
 
+        Phases missing from a structured config fall back to the environment
+        and defaults, so config={"timeout": {"connect": 5}} only tightens the
+        connect phase.
+
         Returns:
-            float: Validated timeout value in seconds
+            float when every phase shares one value, otherwise an httpx.Timeout
+            with individual connect/read/write/pool values.
 
         Raises:
             ValueError: If timeout value is invalid
         """
-        # 1. Config dict (highest priority)
-        if hasattr(self, '_config') and "timeout" in self._config:
-            return self._validate_timeout(self._config["timeout"])
+        configured = getattr(self, "_config", {}).get("timeout")
 
-        # 2. Environment variable
+        # 1. Config dict with a single value (highest priority)
+        if configured is not None and not isinstance(configured, (Mapping, httpx.Timeout)):
+            return self._validate_timeout(configured)
+        if isinstance(configured, httpx.Timeout):
+            return self._validate_httpx_timeout(configured)
+
+        # 2. Environment variables, falling back to 3. provider type default
         env_var = self._get_timeout_env_var()
+        default = self._read_timeout_env_var(env_var)
+        if default is None:
+            default = self._get_default_timeout()
+
+        phases: Dict[str, Optional[float]] = {}
+        for phase in TIMEOUT_PHASES:
+            value = self._read_timeout_env_var(get_phase_timeout_env_var(env_var, phase))
+            if value is not None:
+                phases[phase] = value
+
+        # Structured config overrides individual phases
+        if configured is not None:
+            phases.update(self._validate_timeout_phases(configured))
+
+        if not phases:
+            return default
+        return httpx.Timeout(default, **phases)
+
+    def _read_timeout_env_var(self, env_var: str) -> Optional[float]:
+        """Read and validate a timeout environment variable, if set."""
         env_timeout = os.getenv(env_var)
-        if env_timeout:
-            try:
-                return self._validate_timeout(float(env_timeout))
-            except ValueError as e:
-                raise ValueError(
-                    f"Invalid timeout value in environment variable {env_var}={env_timeout}: {str(e)}"
-                ) from e
+        if not env_timeout:
+            return None
+        try:
+            return self._validate_timeout(float(env_timeout))
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid timeout value in environment variable {env_var}={env_timeout}: {str(e)}"
+            ) from e
+
+    def _validate_timeout_phases(
+        self, phases: Mapping[str, Any]
+    ) -> Dict[str, Optional[float]]:
+        """Validate a dict of per-phase timeouts.
+
+        None is accepted for a phase and disables that timeout, matching httpx.
+
+        Raises:
+            ValueError: If a phase name or value is invalid
+        """
+        unknown = set(phases) - set(TIMEOUT_PHASES)
+        if unknown:
+            raise ValueError(
+                f"Unknown timeout phase(s) {sorted(unknown)}. "
+                f"Must be one of: {list(TIMEOUT_PHASES)}"
+            )
+        return {
+            phase: None if value is None else self._validate_timeout(value)
+            for phase, value in phases.items()
+        }
+
+    def _validate_httpx_timeout(self, timeout: httpx.Timeout) -> httpx.Timeout:
+        """Validate every phase of an httpx.Timeout and return it unchanged."""
+        self._validate_timeout_phases(timeout.as_dict())
+        return timeout
+
+    def _get_request_timeout(
+        self,
+        timeout: Optional[TimeoutValue] = None,
+        deadline: Optional[float] = None,
+    ) -> Union[httpx.Timeout, Any]:
+        """Resolve a per-call timeout override for a single request.
 
-        # 3. Provider type default (lowest priority)
-        return self._get_default_timeout()
+        Args:
+            timeout: Overrides the client timeout for this call. A number sets
+                every phase; a dict overrides only the phases it names.
+            deadline: Total time budget in seconds for the request, from now
+                until the response body is read. See DeadlineTimeout.
+
+        Returns:
+            httpx.Timeout to pass as ``timeout=`` to the httpx request (a
+            DeadlineTimeout with a deadline), or httpx.USE_CLIENT_DEFAULT when
+            no override was given.
+
+        Raises:
+            ValueError: If timeout or deadline is invalid
+        """
+        if timeout is None and deadline is None:
+            return httpx.USE_CLIENT_DEFAULT
+
+        resolved = httpx.Timeout(self._get_timeout())
+        if isinstance(timeout, httpx.Timeout):
+            resolved = self._validate_httpx_timeout(timeout)
+        elif isinstance(timeout, Mapping):
+            phases = resolved.as_dict()
+            phases.update(self._validate_timeout_phases(timeout))
+            resolved = httpx.Timeout(**phases)
+        elif timeout is not None:
+            resolved = httpx.Timeout(self._validate_timeout(timeout))
+
+        if deadline is None:
+            return resolved
+
+        return DeadlineTimeout(resolved, self._validate_timeout(deadline))
 
     def _validate_timeout(self, timeout: Any) -> float:
         """Validate timeout value and return as float.
@@ -143,4 +261,195 @@ class TimeoutMixin(ABC):
                 f"Must be one of: {list(TIMEOUT_ENV_VARS.keys())}"
             )
 
-        return TIMEOUT_ENV_VARS[provider_type]
\ No newline at end of file
+        return TIMEOUT_ENV_VARS[provider_type]
+
+
+class DeadlineTimeout(httpx.Timeout):
+    """Per-phase timeouts of a request that must finish within a time budget.
+
+    As a plain httpx.Timeout it caps every phase at the budget. The clients
+    created by providers (DeadlineClient, AsyncDeadlineClient) also enforce
+    the budget as a wall-clock limit on the whole request, response body
+    included, raising httpx.TimeoutException once it is spent. Async
+    requests are cancelled at the deadline. Sync requests give each phase
+    only the time remaining when it starts and stop reading the body after
+    the chunk that crosses the deadline.
+    """
+
+    def __init__(self, timeout: httpx.Timeout, budget: float):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+        self._phases = timeout.as_dict()
+        super().__init__(
+            **{
+                phase: budget if value is None else min(value, budget)
+                for phase, value in self._phases.items()
+            }
+        )
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, negative once it has passed."""
+        return self.expires_at - time.monotonic()
+
+    def exceeded(self, request: httpx.Request) -> httpx.TimeoutException:
+        return httpx.TimeoutException(
+            f"Deadline of {self.budget}s exceeded", request=request
+        )
+
+    def limit_phases(self, request: httpx.Request) -> None:
+        """Cap the request's phase timeouts at the remaining budget.
+
+        Raises:
+            httpx.TimeoutException: If the deadline has passed.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.exceeded(request)
+        # httpcore reads each phase's timeout from this dict when the phase starts
+        request.extensions["timeout"] = {
+            phase: remaining if value is None else min(value, remaining)
+            for phase, value in self._phases.items()
+        }
+
+
+# httpcore trace steps, such as "http11.send_request_headers.started", that
+# read their timeout when they start
+_TIMED_STEPS = frozenset(
+    {
+        "send_request_headers",
+        "send_request_body",
+        "receive_response_headers",
+        "receive_response_body",
+    }
+)
+
+
+def _trace_phase(deadline: DeadlineTimeout, request: httpx.Request, event: str) -> None:
+    step, _, stage = event.rpartition(".")
+    if stage == "started" and step.rpartition(".")[2] in _TIMED_STEPS:
+        if deadline.remaining() <= 0:
+            # Mapped to httpx.TimeoutException by the transport
+            raise httpcore.TimeoutException(f"Deadline of {deadline.budget}s exceeded")
+        deadline.limit_phases(request)
+
+
+class _DeadlineByteStream(httpx.SyncByteStream):
+    """Response body that stops at the request's deadline."""
+
+    def __init__(
+        self, stream: httpx.SyncByteStream, deadline: DeadlineTimeout, request: httpx.Request
+    ):
+        self._stream = stream
+        self._deadline = deadline
+        self._request = request
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            if self._deadline.remaining() <= 0:
+                raise self._deadline.exceeded(self._request)
+            yield chunk
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _AsyncDeadlineByteStream(httpx.AsyncByteStream):
+    """Async response body cancelled at the request's deadline."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, deadline: DeadlineTimeout, request: httpx.Request
+    ):
+        self._stream = stream
+        self._deadline = deadline
+        self._request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        chunks = self._stream.__aiter__()
+        while True:
+            try:
+                chunk = await asyncio.wait_for(
+                    chunks.__anext__(), max(self._deadline.remaining(), 0)
+                )
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError:
+                raise self._deadline.exceeded(self._request) from None
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class DeadlineClient(httpx.Client):
+    """httpx.Client enforcing the deadline of requests with a DeadlineTimeout."""
+
+    def build_request(self, method: str, url: Any, **kwargs: Any) -> httpx.Request:
+        request = super().build_request(method, url, **kwargs)
+        timeout = kwargs.get("timeout")
+        if isinstance(timeout, DeadlineTimeout):
+            request.extensions[_DEADLINE_EXTENSION] = timeout
+        return request
+
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        deadline = request.extensions.get(_DEADLINE_EXTENSION)
+        if deadline is None:
+            return super().send(request, **kwargs)
+
+        stream = kwargs.pop("stream", False)
+        deadline.limit_phases(request)
+        existing_trace = request.extensions.get("trace")
+
+        def trace(event: str, info: Dict[str, Any]) -> None:
+            _trace_phase(deadline, request, event)
+            # Keep any callback set by the caller or another layer
+            if existing_trace is not None:
+                existing_trace(event, info)
+
+        request.extensions["trace"] = trace
+        response = super().send(request, stream=True, **kwargs)
+        response.stream = _DeadlineByteStream(
+            cast(httpx.SyncByteStream, response.stream), deadline, request
+        )
+        if not stream:
+            try:
+                response.read()
+            except BaseException:
+                response.close()
+                raise
+        return response
+
+
+class AsyncDeadlineClient(httpx.AsyncClient):
+    """httpx.AsyncClient enforcing the deadline of requests with a DeadlineTimeout."""
+
+    def build_request(self, method: str, url: Any, **kwargs: Any) -> httpx.Request:
+        request = super().build_request(method, url, **kwargs)
+        timeout = kwargs.get("timeout")
+        if isinstance(timeout, DeadlineTimeout):
+            request.extensions[_DEADLINE_EXTENSION] = timeout
+        return request
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        deadline = request.extensions.get(_DEADLINE_EXTENSION)
+        if deadline is None:
+            return await super().send(request, **kwargs)
+
+        stream = kwargs.pop("stream", False)
+        deadline.limit_phases(request)
+        try:
+            response = await asyncio.wait_for(
+                super().send(request, stream=True, **kwargs), deadline.remaining()
+            )
+        except asyncio.TimeoutError:
+            raise deadline.exceeded(request) from None
+        response.stream = _AsyncDeadlineByteStream(
+            cast(httpx.AsyncByteStream, response.stream), deadline, request
+        )
+        if not stream:
+            try:
+                await response.aread()
+            except BaseException:
+                await response.aclose()
+                raise
+        return response
+
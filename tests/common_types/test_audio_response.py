@@ -0,0 +1,120 @@
+"""Tests for AudioResponse buffer handling."""
+
+import gc
+import io
+import mmap
+import wave
+
+import pytest
+
+from esperanto.common_types import AudioResponse
+from esperanto.utils.audio import pcm_to_wav, wav_header
+
+PCM = bytes(range(256)) * 8
+
+
+def test_bytes_round_trip():
+    response = AudioResponse(audio_data=b"abc", content_type="audio/mp3")
+
+    assert response.audio_data == b"abc"
+    assert response.size == 3
+    assert response.model_dump()["audio_data"] == b"abc"
+
+
+def test_memoryview_kept_without_copy():
+    data = bytearray(b"abcdef")
+    response = AudioResponse(audio_data=memoryview(data))
+
+    data[0:1] = b"X"
+
+    assert bytes(response.buffer) == b"Xbcdef"
+    assert response.audio_data == b"Xbcdef"
+
+
+def test_parts_are_written_without_joining():
+    header = wav_header(len(PCM), 24000)
+    response = AudioResponse.from_parts([header, PCM], content_type="audio/wav")
+    sink = io.BytesIO()
+
+    response.write_to(sink)
+
+    assert response.size == len(header) + len(PCM)
+    assert sink.getvalue() == pcm_to_wav(PCM, 24000).getvalue()
+    assert response.audio_data == sink.getvalue()
+    with wave.open(io.BytesIO(response.audio_data), "rb") as wav:
+        assert wav.getframerate() == 24000
+        assert wav.readframes(wav.getnframes()) == PCM
+
+
+def test_iter_bytes_chunks_across_parts():
+    response = AudioResponse.from_parts([b"abc", memoryview(b"defgh")])
+
+    assert list(response.iter_bytes(chunk_size=2)) == [b"ab", b"c", b"de", b"fg", b"h"]
+
+
+def test_file_backed_response_is_memory_mapped(tmp_path):
+    path = tmp_path / "speech.mp3"
+    path.write_bytes(PCM)
+
+    response = AudioResponse.from_file(path, content_type="audio/mp3")
+
+    assert response.size == len(PCM)
+    assert b"".join(response.iter_bytes(1000)) == PCM
+    assert isinstance(response.buffer.obj, mmap.mmap)
+    assert response.audio_data == PCM
+    assert path.exists()
+
+
+def test_file_deleted_with_response(tmp_path):
+    path = tmp_path / "speech.tmp"
+    path.write_bytes(b"audio")
+
+    response = AudioResponse.from_file(path, delete=True)
+    assert response.save(tmp_path / "copy.mp3").endswith("copy.mp3")
+    del response
+    gc.collect()
+
+    assert not path.exists()
+    assert (tmp_path / "copy.mp3").read_bytes() == b"audio"
+
+
+def test_stream_consumed_once_and_replayable(tmp_path):
+    pulled = []
+
+    def chunks():
+        for chunk in (b"one-", b"two-", b"three"):
+            pulled.append(chunk)
+            yield chunk
+
+    response = AudioResponse.from_stream(chunks(), content_type="audio/mp3")
+    assert pulled == []
+
+    live = response.iter_bytes()
+    assert next(live) == b"one-"
+    assert pulled == [b"one-"]
+    list(live)
+
+    assert b"".join(response.iter_bytes()) == b"one-two-three"
+    assert response.size == 13
+    assert response.audio_data == b"one-two-three"
+    assert len(pulled) == 3
+
+
+def test_stream_saved_without_iterating_first(tmp_path):
+    response = AudioResponse.from_stream(iter([b"ab", b"cd"]))
+
+    path = response.save(tmp_path / "nested" / "out.wav")
+
+    assert open(path, "rb").read() == b"abcd"
+
+
+def test_missing_audio_data_raises():
+    with pytest.raises(TypeError):
+        AudioResponse(content_type="audio/mp3")  # type: ignore[call-arg]
+
+
+def test_wav_header_matches_wave_module():
+    for rate, width, channels in ((24000, 2, 1), (44100, 2, 2), (8000, 1, 1)):
+        pcm = PCM[: len(PCM) // (width * channels) * width * channels]
+        expected = pcm_to_wav(pcm, rate, width, channels).getvalue()
+        assert wav_header(len(pcm), rate, width, channels) + pcm == expected
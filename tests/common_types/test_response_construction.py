@@ -0,0 +1,142 @@
+"""Tests for constructing response models without validation."""
+
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from esperanto.common_types import (
+    ChatCompletion,
+    ChatCompletionChunk,
+    Choice,
+    DeltaMessage,
+    FunctionCall,
+    Message,
+    StreamChoice,
+    ToolCall,
+    Usage,
+)
+from esperanto.providers.llm.anthropic import AnthropicLanguageModel
+from esperanto.providers.llm.openai import OpenAILanguageModel
+
+TOOL_CALLS = [ToolCall(id="call_1", function=FunctionCall(name="f", arguments="{}"))]
+
+
+def assert_same(fast, validated):
+    assert type(fast) is type(validated)
+    assert fast == validated
+    assert repr(fast) == repr(validated)
+    assert fast.model_dump_json() == validated.model_dump_json()
+    assert fast.model_fields_set == validated.model_fields_set
+
+
+@pytest.mark.parametrize(
+    "cls, data",
+    [
+        (Message, {"content": "Hi", "role": "assistant"}),
+        (Message, {"content": None, "tool_calls": TOOL_CALLS}),
+        (DeltaMessage, {"content": "Hi", "thinking": None}),
+        (DeltaMessage, {"content": "Hi", "role": "assistant", "function_call": None, "tool_calls": None}),
+        (Usage, {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3}),
+        (Choice, {"index": 0, "message": Message(content="Hi"), "finish_reason": "stop"}),
+        (StreamChoice, {"index": 0, "delta": DeltaMessage(content="Hi"), "finish_reason": None}),
+        (
+            ChatCompletion,
+            {
+                "id": "1",
+                "choices": [Choice(index=0, message=Message(content="Hi"))],
+                "model": "m",
+                "provider": "p",
+                "created": 0,
+                "usage": Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+            },
+        ),
+        (
+            ChatCompletionChunk,
+            {
+                "id": "1",
+                "choices": [StreamChoice(index=0, delta=DeltaMessage(content="Hi"))],
+                "model": "m",
+                "created": 0,
+            },
+        ),
+    ],
+)
+def test_construct_matches_validation(cls, data):
+    assert_same(cls._construct(**data), cls(**data))
+
+
+@pytest.mark.parametrize(
+    "cls, data",
+    [
+        (Message, {"content": "Hi", "thinking": "Hmm"}),
+        (DeltaMessage, {"tool_calls": [{"id": "1", "function": {"name": "f", "arguments": "{}"}}]}),
+        (StreamChoice, {"index": 0, "delta": {"content": "Hi"}}),
+        (ChatCompletionChunk, {"id": "1", "choices": [{"index": 0, "delta": {}}], "model": "m", "created": 0}),
+    ],
+)
+def test_construct_validates_unnormalized_data(cls, data):
+    assert_same(cls._construct(**data), cls(**data))
+
+
+def test_construct_skips_validation():
+    # Trusted callers only: constraints are not checked, unlike the constructor
+    assert ChatCompletionChunk._construct(id="1", choices=[], model="m", created=-1).created == -1
+    with pytest.raises(ValidationError):
+        ChatCompletionChunk(id="1", choices=[], model="m", created=-1)
+
+
+def test_finish_reason_none_kept():
+    assert StreamChoice(index=0, delta=DeltaMessage(), finish_reason=None).finish_reason is None
+    assert Choice(index=0, message=Message(), finish_reason=None).finish_reason is None
+
+
+def test_constructed_models_are_frozen_and_copyable():
+    chunk = ChatCompletionChunk._construct(
+        id="1",
+        choices=[StreamChoice._construct(index=0, delta=DeltaMessage._construct(content="Hi"))],
+        model="m",
+        created=0,
+    )
+
+    with pytest.raises(ValidationError):
+        chunk.id = "2"
+    assert pickle.loads(pickle.dumps(chunk)) == chunk
+    assert copy.deepcopy(chunk) == chunk
+    assert chunk.model_copy(update={"id": "2"}).id == "2"
+
+
+def test_provider_normalizers_match_validation():
+    openai = OpenAILanguageModel(api_key="test-key")
+    chunk = openai._normalize_chunk(
+        {
+            "id": "chatcmpl-1",
+            "created": 1,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": "Hi"}, "finish_reason": None}],
+        }
+    )
+    assert_same(
+        chunk,
+        ChatCompletionChunk(
+            id="chatcmpl-1",
+            choices=[
+                StreamChoice(
+                    index=0,
+                    delta=DeltaMessage(
+                        content="Hi", role="assistant", function_call=None, tool_calls=None
+                    ),
+                    finish_reason=None,
+                )
+            ],
+            created=1,
+            model="gpt-4o-mini",
+        ),
+    )
+
+    anthropic = AnthropicLanguageModel(api_key="test-key")
+    event = {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hi"}}
+    chunk = anthropic._normalize_stream_event(event)
+    assert chunk.choices[0].delta.content == "Hi"
+    assert chunk == ChatCompletionChunk(**chunk.model_dump())
@@ -0,0 +1,238 @@
+"""Tests for assembling streamed chunks into a ChatCompletion."""
+
+import json
+
+import httpx
+import pytest
+
+from esperanto.common_types import (
+    ChatCompletionAccumulator,
+    ChatCompletionChunk,
+    Tool,
+    ToolCallValidationError,
+    ToolFunction,
+)
+from esperanto.providers.llm.anthropic import AnthropicLanguageModel
+from esperanto.providers.llm.google import GoogleLanguageModel
+from esperanto.providers.llm.openai import OpenAILanguageModel
+
+TOOLS = [
+    Tool(
+        function=ToolFunction(
+            name="get_weather",
+            description="Get the weather",
+            parameters={
+                "type": "object",
+                "properties": {"location": {"type": "string"}},
+                "required": ["location"],
+            },
+        )
+    )
+]
+
+
+def openai_chunk(delta, finish_reason=None, index=0):
+    return {
+        "id": "chatcmpl-1",
+        "created": 1,
+        "model": "gpt-4o-mini",
+        "choices": [{"index": index, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def openai_tool_stream(arguments):
+    """Chunks of an OpenAI stream calling get_weather with ``arguments`` split in two."""
+    middle = len(arguments) // 2
+    return [
+        openai_chunk(
+            {
+                "role": "assistant",
+                "tool_calls": [
+                    {
+                        "index": 0,
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "get_weather", "arguments": ""},
+                    }
+                ],
+            }
+        ),
+        openai_chunk({"tool_calls": [{"index": 0, "function": {"arguments": arguments[:middle]}}]}),
+        openai_chunk({"tool_calls": [{"index": 0, "function": {"arguments": arguments[middle:]}}]}),
+        openai_chunk({}, finish_reason="tool_calls"),
+    ]
+
+
+def sse(chunks):
+    return "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+
+
+class TestAccumulator:
+    def test_text_stream(self):
+        openai = OpenAILanguageModel(api_key="test-key")
+        chunks = [
+            openai._normalize_chunk(openai_chunk({"role": "assistant", "content": "Hel"})),
+            openai._normalize_chunk(openai_chunk({"content": "lo"})),
+            openai._normalize_chunk(openai_chunk({}, finish_reason="stop")),
+        ]
+        accumulator = ChatCompletionAccumulator(provider="openai")
+
+        assert list(accumulator.iter(chunks)) == chunks
+        completion = accumulator.completion
+        assert completion.id == "chatcmpl-1"
+        assert completion.provider == "openai"
+        assert completion.model == "gpt-4o-mini"
+        assert completion.content == "Hello"
+        assert completion.choices[0].message.role == "assistant"
+        assert completion.choices[0].finish_reason == "stop"
+        assert completion.usage is None
+
+    def test_openai_tool_call_deltas(self):
+        openai = OpenAILanguageModel(api_key="test-key")
+        accumulator = ChatCompletionAccumulator()
+        for data in openai_tool_stream('{"location": "Paris"}'):
+            accumulator.add(openai._normalize_chunk(data))
+
+        completion = accumulator.build()
+        (tool_call,) = completion.choices[0].message.tool_calls
+        assert tool_call.id == "call_1"
+        assert tool_call.function.name == "get_weather"
+        assert tool_call.function.arguments == '{"location": "Paris"}'
+        assert completion.choices[0].message.content is None
+        assert completion.choices[0].finish_reason == "tool_calls"
+
+    def test_anthropic_tool_call_events(self):
+        anthropic = AnthropicLanguageModel(api_key="test-key")
+        events = [
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Checking"}},
+            {
+                "type": "content_block_start",
+                "index": 1,
+                "content_block": {"type": "tool_use", "id": "toolu_1", "name": "get_weather"},
+            },
+            {"type": "content_block_delta", "index": 1, "delta": {"type": "input_json_delta", "partial_json": '{"loc'}},
+            {"type": "content_block_delta", "index": 1, "delta": {"type": "input_json_delta", "partial_json": 'ation": "Oslo"}'}},
+            {"type": "message_delta", "delta": {"stop_reason": "tool_use"}},
+        ]
+        accumulator = ChatCompletionAccumulator(provider="anthropic", tools=TOOLS)
+        for event in events:
+            chunk = anthropic._normalize_stream_event(event)
+            if chunk:
+                accumulator.add(chunk)
+
+        completion = accumulator.build()
+        message = completion.choices[0].message
+        assert message.content == "Checking"
+        (tool_call,) = message.tool_calls
+        assert tool_call.id == "toolu_1"
+        assert tool_call.function.arguments == '{"location": "Oslo"}'
+        assert completion.choices[0].finish_reason == "tool_calls"
+
+    def test_google_whole_tool_calls_in_separate_chunks(self):
+        google = GoogleLanguageModel(api_key="test-key")
+        accumulator = ChatCompletionAccumulator()
+        for location in ("Rome", "Lima"):
+            accumulator.add(
+                google._normalize_chunk(
+                    {
+                        "candidates": [
+                            {
+                                "content": {
+                                    "parts": [
+                                        {"functionCall": {"name": "get_weather", "args": {"location": location}}}
+                                    ]
+                                },
+                                "index": 0,
+                            }
+                        ]
+                    }
+                )
+            )
+
+        tool_calls = accumulator.build().choices[0].message.tool_calls
+        assert [json.loads(tc.function.arguments) for tc in tool_calls] == [
+            {"location": "Rome"},
+            {"location": "Lima"},
+        ]
+        assert tool_calls[0].id != tool_calls[1].id
+
+    def test_choices_kept_apart(self):
+        openai = OpenAILanguageModel(api_key="test-key")
+        accumulator = ChatCompletionAccumulator()
+        accumulator.add(openai._normalize_chunk(openai_chunk({"content": "b"}, index=1)))
+        accumulator.add(openai._normalize_chunk(openai_chunk({"content": "a"}, index=0)))
+
+        assert [c.message.content for c in accumulator.build().choices] == ["a", "b"]
+
+    def test_invalid_tool_call_raises_after_last_chunk(self):
+        pytest.importorskip("jsonschema")
+        openai = OpenAILanguageModel(api_key="test-key")
+        chunks = [openai._normalize_chunk(d) for d in openai_tool_stream('{"unit": "C"}')]
+        accumulator = ChatCompletionAccumulator(tools=TOOLS)
+        received = []
+
+        with pytest.raises(ToolCallValidationError):
+            for chunk in accumulator.iter(chunks):
+                received.append(chunk)
+
+        assert received == chunks
+        assert accumulator.completion.choices[0].message.tool_calls[0].function.name == "get_weather"
+
+    @pytest.mark.asyncio
+    async def test_aiter(self):
+        async def stream():
+            yield ChatCompletionChunk(
+                id="1",
+                choices=[{"index": 0, "delta": {"content": "Hi"}, "finish_reason": "stop"}],
+                model="m",
+                created=0,
+            )
+
+        accumulator = ChatCompletionAccumulator()
+        assert len([chunk async for chunk in accumulator.aiter(stream())]) == 1
+        assert accumulator.completion.content == "Hi"
+
+
+class TestStreamingValidation:
+    def model(self, arguments):
+        def handler(request):
+            return httpx.Response(200, text=sse(openai_tool_stream(arguments)))
+
+        model = OpenAILanguageModel(api_key="test-key", model_name="gpt-4o-mini")
+        model.client = httpx.Client(transport=httpx.MockTransport(handler))
+        model.async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return model
+
+    def test_valid_tool_calls_stream(self):
+        pytest.importorskip("jsonschema")
+        model = self.model('{"location": "Paris"}')
+
+        chunks = list(
+            model.chat_complete(
+                [{"role": "user", "content": "Weather?"}], tools=TOOLS, stream=True, validate_tool_calls=True
+            )
+        )
+
+        assert len(chunks) == 4
+
+    def test_invalid_tool_calls_raise(self):
+        pytest.importorskip("jsonschema")
+        model = self.model('{"unit": "C"}')
+
+        stream = model.chat_complete(
+            [{"role": "user", "content": "Weather?"}], tools=TOOLS, stream=True, validate_tool_calls=True
+        )
+        with pytest.raises(ToolCallValidationError):
+            list(stream)
+
+    @pytest.mark.asyncio
+    async def test_invalid_tool_calls_raise_async(self):
+        pytest.importorskip("jsonschema")
+        model = self.model('{"unit": "C"}')
+
+        stream = await model.achat_complete(
+            [{"role": "user", "content": "Weather?"}], tools=TOOLS, stream=True, validate_tool_calls=True
+        )
+        with pytest.raises(ToolCallValidationError):
+            async for _chunk in stream:
+                pass
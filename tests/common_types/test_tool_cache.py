@@ -0,0 +1,135 @@
+"""Tests for the per-tool cache of converted payloads and validators."""
+
+import gc
+
+import pytest
+
+from esperanto.common_types import (
+    FunctionCall,
+    Tool,
+    ToolCall,
+    ToolCallValidationError,
+    ToolFunction,
+    validate_tool_call,
+)
+from esperanto.common_types.tool_cache import ToolCache, tool_cache
+from esperanto.providers.llm.anthropic import AnthropicLanguageModel
+from esperanto.providers.llm.google import GoogleLanguageModel
+from esperanto.providers.llm.openai import OpenAILanguageModel
+
+
+def make_tool(name: str = "get_weather") -> Tool:
+    return Tool(
+        function=ToolFunction(
+            name=name,
+            description="Get the weather",
+            parameters={
+                "type": "object",
+                "properties": {"location": {"type": "string"}},
+                "required": ["location"],
+            },
+        )
+    )
+
+
+def make_call(arguments: str) -> ToolCall:
+    return ToolCall(id="call_1", function=FunctionCall(name="get_weather", arguments=arguments))
+
+
+class TestToolCache:
+    def test_computes_once_per_tool_and_kind(self):
+        cache = ToolCache()
+        tool = make_tool()
+        calls = []
+
+        def factory(t):
+            calls.append(t)
+            return {"name": t.function.name}
+
+        first = cache.get(tool, "openai", factory)
+        second = cache.get(tool, "openai", factory)
+        other_kind = cache.get(tool, "anthropic", factory)
+
+        assert first is second
+        assert other_kind is not first
+        assert len(calls) == 2
+
+    def test_keyed_by_identity(self):
+        cache = ToolCache()
+        tool, twin = make_tool(), make_tool()
+
+        assert tool == twin
+        assert cache.get(tool, "k", lambda t: object()) is not cache.get(
+            twin, "k", lambda t: object()
+        )
+
+    def test_entry_dropped_when_tool_collected(self):
+        cache = ToolCache()
+        tool = make_tool()
+        cache.get(tool, "k", lambda t: 1)
+        assert len(cache) == 1
+
+        del tool
+        gc.collect()
+
+        assert len(cache) == 0
+
+
+class TestProviderConversion:
+    def test_openai_payload_reused(self):
+        model = OpenAILanguageModel(api_key="test-key")
+        tools = [make_tool()]
+
+        first = model._convert_tools_to_openai(tools)
+        second = model._convert_tools_to_openai(tools)
+
+        assert first == second
+        assert first[0] is second[0]
+
+    def test_anthropic_payload_reused(self):
+        model = AnthropicLanguageModel(api_key="test-key")
+        tools = [make_tool()]
+
+        first = model._convert_tools_to_anthropic(tools)
+
+        assert first[0]["input_schema"] == tools[0].function.parameters
+        assert model._convert_tools_to_anthropic(tools)[0] is first[0]
+
+    def test_google_declarations_reused(self):
+        model = GoogleLanguageModel(api_key="test-key")
+        tools = [make_tool()]
+
+        first = model._convert_tools_to_google(tools)
+        second = model._convert_tools_to_google(tools)
+
+        assert first[0]["function_declarations"][0] is second[0]["function_declarations"][0]
+
+
+class TestCompiledValidator:
+    def test_validator_compiled_once(self):
+        tool = make_tool()
+
+        validate_tool_call(make_call('{"location": "NYC"}'), tool)
+        validator = tool_cache.get(tool, "validator", lambda t: None)
+        validate_tool_call(make_call('{"location": "Paris"}'), tool)
+
+        assert validator is not None
+        assert tool_cache.get(tool, "validator", lambda t: None) is validator
+
+    def test_validation_errors_still_reported(self):
+        tool = make_tool()
+        validate_tool_call(make_call('{"location": "NYC"}'), tool)
+
+        with pytest.raises(ToolCallValidationError, match="location"):
+            validate_tool_call(make_call("{}"), tool)
+
+    def test_invalid_schema_raises(self):
+        jsonschema = pytest.importorskip("jsonschema")
+        tool = Tool(
+            function=ToolFunction(
+                name="bad", description="bad", parameters={"type": "not-a-type"}
+            )
+        )
+
+        with pytest.raises(jsonschema.SchemaError):
+            validate_tool_call(make_call("{}"), tool)
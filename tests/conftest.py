@@ -4,6 +4,7 @@ import pytest
 
 from esperanto.providers.llm.anthropic import AnthropicLanguageModel
 from esperanto.providers.llm.openai import OpenAILanguageModel
+from esperanto.utils.google_auth import clear_google_credentials
 
 try:
     from esperanto.providers.llm.groq import GroqLanguageModel
@@ -11,6 +12,15 @@ try:
 except ImportError:
     HAS_GROQ = False
 
+
+@pytest.fixture(autouse=True)
+def isolated_google_credentials():
+    """Keep shared Google credentials and tokens from leaking between tests."""
+    clear_google_credentials()
+    yield
+    clear_google_credentials()
+
+
 @pytest.fixture
 def mock_openai_response():
     class Choice:
@@ -258,6 +258,7 @@ def vertex_embedding_model(mock_vertex_client):
         
         # Mock the instance method directly to prevent token calls during tests
         model._get_access_token = Mock(return_value="mock_access_token")
+        model._aget_access_token = AsyncMock(return_value="mock_access_token")
         return model
 
 
@@ -57,9 +57,9 @@ def azure_model(mock_env_vars):
     mock_async_client.stream = MagicMock()  # For streaming tests
 
     # Create model and replace clients before any HTTP calls
-    with patch('httpx.Client', return_value=mock_client), \
-         patch('httpx.AsyncClient', return_value=mock_async_client):
-        model = AzureLanguageModel(model_name="test-deployment")
+    model = AzureLanguageModel(model_name="test-deployment")
+    model.client = mock_client
+    model.async_client = mock_async_client
 
     return model
 
@@ -398,9 +398,9 @@ def azure_model_with_tool_response(mock_env_vars, mock_azure_tool_call_response)
     mock_async_client = MagicMock()
     mock_async_client.post = AsyncMock(return_value=mock_response)
 
-    with patch('httpx.Client', return_value=mock_client), \
-         patch('httpx.AsyncClient', return_value=mock_async_client):
-        model = AzureLanguageModel(model_name="test-deployment")
+    model = AzureLanguageModel(model_name="test-deployment")
+    model.client = mock_client
+    model.async_client = mock_async_client
 
     return model
 
@@ -0,0 +1,238 @@
+"""Tests for the failover language model."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from esperanto.common_types import (
+    AllProvidersFailedError,
+    ChatCompletion,
+    Choice,
+    Message,
+)
+from esperanto.providers.llm.base import LanguageModel
+from esperanto.providers.llm.failover import FailoverLanguageModel
+
+
+@dataclass
+class StubLanguageModel(LanguageModel):
+    """Language model that answers after a delay or raises."""
+
+    name: str = "stub"
+    delay: float = 0.0
+    error: Optional[Exception] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.calls = []
+
+    def _respond(self, **kwargs) -> ChatCompletion:
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        return ChatCompletion(
+            id=f"{self.name}-1",
+            choices=[Choice(index=0, message=Message(content=self.name, role="assistant"))],
+            model=self.get_model_name(),
+            provider=self.name,
+        )
+
+    def chat_complete(self, messages, **kwargs):
+        if self.delay:
+            time.sleep(self.delay)
+        return self._respond(**kwargs)
+
+    async def achat_complete(self, messages, **kwargs):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self._respond(**kwargs)
+
+    def _get_models(self):
+        return []
+
+    def _get_default_model(self):
+        return f"{self.name}-model"
+
+    @property
+    def provider(self):
+        return self.name
+
+    def to_langchain(self):
+        return None
+
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def test_requires_models():
+    with pytest.raises(ValueError, match="at least one model"):
+        FailoverLanguageModel(language_models=[])
+
+
+def test_primary_serves_request():
+    primary = StubLanguageModel(name="primary")
+    backup = StubLanguageModel(name="backup")
+    model = FailoverLanguageModel(language_models=[primary, backup])
+
+    response = model.chat_complete(MESSAGES)
+
+    assert response.content == "primary"
+    assert response.provider == "primary"
+    assert backup.calls == []
+
+
+def test_fails_over_on_error():
+    primary = StubLanguageModel(name="primary", error=RuntimeError("boom"))
+    backup = StubLanguageModel(name="backup")
+    model = FailoverLanguageModel(language_models=[primary, backup])
+
+    response = model.chat_complete(MESSAGES, max_tokens=10)
+
+    assert response.provider == "backup"
+    assert backup.calls[0]["max_tokens"] == 10
+
+
+def test_all_failed_raises_with_errors():
+    model = FailoverLanguageModel(
+        language_models=[
+            StubLanguageModel(name="a", error=RuntimeError("first")),
+            StubLanguageModel(name="b", error=RuntimeError("second")),
+        ]
+    )
+
+    with pytest.raises(AllProvidersFailedError) as exc_info:
+        model.chat_complete(MESSAGES)
+
+    assert [provider for provider, _ in exc_info.value.errors] == ["a", "b"]
+    assert "second" in str(exc_info.value)
+
+
+def test_hedged_request_takes_first_success():
+    primary = StubLanguageModel(name="primary", delay=0.5)
+    backup = StubLanguageModel(name="backup")
+    model = FailoverLanguageModel(language_models=[primary, backup], hedge_delay=0.05)
+
+    start = time.monotonic()
+    response = model.chat_complete(MESSAGES)
+
+    assert response.provider == "backup"
+    assert time.monotonic() - start < 0.4
+    model.close()
+
+
+def test_hedged_request_fails_over_immediately_on_error():
+    primary = StubLanguageModel(name="primary", error=RuntimeError("boom"))
+    backup = StubLanguageModel(name="backup")
+    model = FailoverLanguageModel(language_models=[primary, backup], hedge_delay=10.0)
+
+    assert model.chat_complete(MESSAGES).provider == "backup"
+    model.close()
+
+
+def test_hung_primary_does_not_block_later_calls():
+    primary = StubLanguageModel(name="primary", delay=0.5)
+    backup = StubLanguageModel(name="backup")
+    model = FailoverLanguageModel(language_models=[primary, backup], hedge_delay=0.05)
+
+    for _ in range(2):
+        start = time.monotonic()
+        assert model.chat_complete(MESSAGES).provider == "backup"
+        assert time.monotonic() - start < 0.3
+
+
+def test_failed_backup_replaced_immediately():
+    primary = StubLanguageModel(name="primary", delay=0.5)
+    backup = StubLanguageModel(name="backup", error=RuntimeError("boom"))
+    third = StubLanguageModel(name="third")
+    model = FailoverLanguageModel(
+        language_models=[primary, backup, third], hedge_delay=0.05, max_hedges=1
+    )
+
+    start = time.monotonic()
+    response = model.chat_complete(MESSAGES)
+
+    assert response.provider == "third"
+    assert time.monotonic() - start < 0.3
+
+
+def test_streaming_is_not_hedged():
+    primary = StubLanguageModel(name="primary", delay=0.1)
+    backup = StubLanguageModel(name="backup")
+    model = FailoverLanguageModel(language_models=[primary, backup], hedge_delay=0.01)
+
+    model.chat_complete(MESSAGES, stream=True)
+
+    assert backup.calls == []
+
+
+def test_model_name_and_provider():
+    model = FailoverLanguageModel(language_models=[StubLanguageModel(name="primary")])
+
+    assert model.provider == "failover"
+    assert model.get_model_name() == "primary-model"
+
+
+def test_hedge_delay_from_config():
+    model = FailoverLanguageModel(
+        language_models=[StubLanguageModel(name="primary")], config={"hedge_delay": 0.25}
+    )
+
+    assert model.hedge_delay == 0.25
+
+
+@pytest.mark.asyncio
+async def test_async_fails_over_on_error():
+    primary = StubLanguageModel(name="primary", error=RuntimeError("boom"))
+    backup = StubLanguageModel(name="backup")
+    model = FailoverLanguageModel(language_models=[primary, backup])
+
+    response = await model.achat_complete(MESSAGES)
+
+    assert response.provider == "backup"
+
+
+@pytest.mark.asyncio
+async def test_async_hedged_request_cancels_loser():
+    primary = StubLanguageModel(name="primary", delay=5.0)
+    backup = StubLanguageModel(name="backup")
+    model = FailoverLanguageModel(language_models=[primary, backup], hedge_delay=0.05)
+
+    start = time.monotonic()
+    response = await model.achat_complete(MESSAGES)
+
+    assert response.provider == "backup"
+    assert time.monotonic() - start < 1.0
+    assert primary.calls == []
+
+
+@pytest.mark.asyncio
+async def test_async_failed_backup_replaced_immediately():
+    primary = StubLanguageModel(name="primary", delay=0.5)
+    backup = StubLanguageModel(name="backup", error=RuntimeError("boom"))
+    third = StubLanguageModel(name="third")
+    model = FailoverLanguageModel(
+        language_models=[primary, backup, third], hedge_delay=0.05, max_hedges=1
+    )
+
+    start = time.monotonic()
+    response = await model.achat_complete(MESSAGES)
+
+    assert response.provider == "third"
+    assert time.monotonic() - start < 0.3
+
+
+@pytest.mark.asyncio
+async def test_async_all_failed_raises():
+    model = FailoverLanguageModel(
+        language_models=[
+            StubLanguageModel(name="a", error=RuntimeError("first")),
+            StubLanguageModel(name="b", error=RuntimeError("second")),
+        ],
+        hedge_delay=0.01,
+    )
+
+    with pytest.raises(AllProvidersFailedError):
+        await model.achat_complete(MESSAGES)
@@ -0,0 +1,203 @@
+"""Tests for precomputed request templates in LLM providers."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from esperanto.common_types import Tool
+from esperanto.providers.llm.anthropic import AnthropicLanguageModel
+from esperanto.providers.llm.google import GoogleLanguageModel
+from esperanto.providers.llm.mistral import MistralLanguageModel
+from esperanto.providers.llm.openai import OpenAILanguageModel
+from esperanto.providers.llm.openai_compatible import OpenAICompatibleLanguageModel
+
+OPENAI_RESPONSE = {
+    "id": "chatcmpl-1",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "ok"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+ANTHROPIC_RESPONSE = {
+    "id": "msg_1",
+    "model": "claude",
+    "content": [{"type": "text", "text": "ok"}],
+    "stop_reason": "end_turn",
+    "usage": {"input_tokens": 1, "output_tokens": 1},
+}
+
+GOOGLE_RESPONSE = {
+    "candidates": [{"content": {"parts": [{"text": "ok"}]}, "finishReason": "STOP"}],
+    "usageMetadata": {"promptTokenCount": 1, "candidatesTokenCount": 1},
+}
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def make_tool(name: str) -> Tool:
+    return Tool.model_validate(
+        {
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": f"{name} tool",
+                "parameters": {"type": "object", "properties": {}},
+            },
+        }
+    )
+
+
+def attach_client(model, response_data):
+    response = Mock(status_code=200)
+    response.json.return_value = response_data
+    model.client = Mock()
+    model.client.post.return_value = response
+    return model.client
+
+
+def sent(client):
+    return client.post.call_args
+
+
+class TestTemplateCaching:
+    def test_template_reused_across_calls(self):
+        model = OpenAILanguageModel(api_key="test-key")
+
+        assert model._get_request_template() is model._get_request_template()
+
+    def test_attribute_assignment_invalidates(self):
+        model = OpenAILanguageModel(api_key="test-key", temperature=0.2)
+        first = model._get_request_template()
+
+        model.temperature = 0.9
+        second = model._get_request_template()
+
+        assert second is not first
+        assert second.params["temperature"] == 0.9
+
+    def test_model_name_change_in_config_rebuilds(self):
+        model = OpenAILanguageModel(api_key="test-key")
+        assert model._get_request_template().extras["is_reasoning_model"] is False
+
+        model._config["model_name"] = "o1-mini"
+
+        template = model._get_request_template()
+        assert template.model_name == "o1-mini"
+        assert template.extras["is_reasoning_model"] is True
+        assert "temperature" not in template.params
+
+    def test_template_is_immutable(self):
+        model = OpenAILanguageModel(api_key="test-key")
+        template = model._get_request_template()
+
+        with pytest.raises(TypeError):
+            template.params["temperature"] = 0.0  # type: ignore[index]
+
+    def test_explicit_invalidation(self):
+        tools = [make_tool("search")]
+        model = OpenAILanguageModel(api_key="test-key", tools=tools)
+        model._get_request_template()
+
+        tools.append(make_tool("lookup"))
+        model._invalidate_request_template()
+
+        assert len(model._get_request_template().tools) == 2
+
+
+class TestOpenAITemplate:
+    def test_request_uses_template(self):
+        model = OpenAILanguageModel(
+            api_key="test-key", organization="org", tools=[make_tool("search")]
+        )
+        client = attach_client(model, OPENAI_RESPONSE)
+
+        model.chat_complete(MESSAGES)
+
+        call = sent(client)
+        assert call.args[0] == "https://api.openai.com/v1/chat/completions"
+        assert call.kwargs["headers"]["OpenAI-Organization"] == "org"
+        payload = call.kwargs["json"]
+        assert payload["model"] == "gpt-4o-mini"
+        assert payload["tools"][0]["function"]["name"] == "search"
+        assert payload["temperature"] == model.temperature
+
+    def test_per_call_overrides_merge(self):
+        model = OpenAILanguageModel(api_key="test-key", temperature=0.2)
+        client = attach_client(model, OPENAI_RESPONSE)
+
+        model.chat_complete(MESSAGES, temperature=0.7, tools=[make_tool("other")])
+        payload = sent(client).kwargs["json"]
+        assert payload["temperature"] == 0.7
+        assert payload["tools"][0]["function"]["name"] == "other"
+
+        model.chat_complete(MESSAGES)
+        assert sent(client).kwargs["json"]["temperature"] == 0.2
+
+    def test_empty_call_tools_disable_instance_tools(self):
+        model = OpenAILanguageModel(api_key="test-key", tools=[make_tool("search")])
+        client = attach_client(model, OPENAI_RESPONSE)
+
+        model.chat_complete(MESSAGES, tools=[])
+
+        assert "tools" not in sent(client).kwargs["json"]
+
+    def test_response_format_fallback_invalidates(self):
+        model = OpenAICompatibleLanguageModel(
+            api_key="test-key",
+            base_url="http://localhost:8000/v1",
+            model_name="local",
+            structured={"type": "json"},
+        )
+        assert "response_format" in model._get_request_template().params
+
+        model._response_format_unsupported = True
+        model._invalidate_request_template()
+
+        assert "response_format" not in model._get_request_template().params
+
+
+class TestOtherProviders:
+    def test_anthropic(self):
+        model = AnthropicLanguageModel(
+            api_key="test-key", temperature=0.5, tools=[make_tool("search")]
+        )
+        client = attach_client(model, ANTHROPIC_RESPONSE)
+
+        model.chat_complete(MESSAGES)
+        call = sent(client)
+        assert call.kwargs["headers"]["x-api-key"] == "test-key"
+        assert call.kwargs["json"]["temperature"] == 0.5
+        assert call.kwargs["json"]["tools"][0]["name"] == "search"
+
+        model.chat_complete(MESSAGES, max_tokens=42)
+        assert sent(client).kwargs["json"]["max_tokens"] == 42
+
+    def test_google_urls(self):
+        model = GoogleLanguageModel(api_key="test-key", model_name="gemini-test")
+        template = model._get_request_template()
+
+        assert template.url.endswith("/models/gemini-test:generateContent?key=test-key")
+        assert template.extras["stream_url"].endswith(
+            ":streamGenerateContent?alt=sse&key=test-key"
+        )
+
+        client = attach_client(model, GOOGLE_RESPONSE)
+        model.chat_complete(MESSAGES, top_p=0.5)
+        assert sent(client).kwargs["json"]["generationConfig"]["topP"] == 0.5
+
+    def test_mistral(self):
+        model = MistralLanguageModel(api_key="test-key", max_tokens=64)
+        client = attach_client(model, OPENAI_RESPONSE)
+
+        model.chat_complete(MESSAGES)
+
+        payload = sent(client).kwargs["json"]
+        assert payload["model"] == "mistral-large-latest"
+        assert payload["max_tokens"] == 64
@@ -874,6 +874,19 @@ class TestCredentials:
                     token = model._get_access_token()
                     assert token == "gcloud-token"
 
+    def test_failed_adc_is_retried(self, mock_google_auth):
+        """Test that an ADC error is not cached for later models."""
+        mock_default, mock_creds = mock_google_auth
+        with patch.dict(os.environ, {"VERTEX_PROJECT": "test-project"}, clear=False):
+            os.environ.pop("GOOGLE_APPLICATION_CREDENTIALS", None)
+            mock_default.side_effect = [Exception("metadata server timeout"), (mock_creds, "p")]
+            first = VertexLanguageModel(model_name="gemini-2.0-flash")
+            second = VertexLanguageModel(model_name="gemini-2.0-flash")
+
+        assert first._credentials is None
+        assert second._credentials is mock_creds
+        assert mock_default.call_count == 2
+
     def test_credentials_file_raises_on_invalid_file(self):
         """Test that an invalid credentials_file raises instead of silently falling back."""
         with patch.dict(os.environ, {"VERTEX_PROJECT": "test-project"}, clear=False):
@@ -129,7 +129,7 @@ async def test_azure_atranscribe(audio_file, mock_httpx_clients):
     model.async_client.post.assert_called_once()
     call_args = model.async_client.post.call_args
     assert "audio/transcriptions" in call_args[0][0]
-    assert "files" in call_args[1]
+    assert "content" in call_args[1]
 
     assert isinstance(response, TranscriptionResponse)
     assert response.text == "This is a test transcription"
@@ -208,7 +208,7 @@ async def test_azure_atranscribe_wav_content_type(wav_file, mock_httpx_clients):
     await model.atranscribe(wav_file)
 
     call_args = model.async_client.post.call_args
-    content_type = call_args[1]["files"]["file"][2]
+    content_type = call_args[1]["content"].content_type
     assert content_type == _guess_audio_content_type(wav_file)
     assert content_type.startswith("audio/")
 
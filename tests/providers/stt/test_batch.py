@@ -0,0 +1,189 @@
+"""Tests for batch transcription with bounded concurrency."""
+
+import asyncio
+import importlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+import httpx
+import pytest
+
+from esperanto.common_types import TranscriptionResponse
+from esperanto.factory import AIFactory
+from esperanto.providers.stt import BatchTranscription
+from esperanto.providers.stt.base import SpeechToTextModel
+
+FILES = [f"call_{i:03d}.wav" for i in range(10)]
+
+
+@dataclass
+class BatchModel(SpeechToTextModel):
+    """Model that echoes the file name, failing for names containing 'bad'."""
+
+    delay: float = 0.0
+    calls: List[str] = field(default_factory=list)
+    active: int = 0
+    peak: int = 0
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._lock = threading.Lock()
+
+    def _enter(self, audio_file):
+        with self._lock:
+            self.calls.append(audio_file)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def _leave(self):
+        with self._lock:
+            self.active -= 1
+
+    @staticmethod
+    def _respond(audio_file) -> TranscriptionResponse:
+        if "bad" in audio_file:
+            raise RuntimeError(f"cannot decode {audio_file}")
+        return TranscriptionResponse(text=audio_file, provider="test")
+
+    def transcribe(self, audio_file, language=None, prompt=None, *, timeout=None, deadline=None):
+        self._enter(audio_file)
+        try:
+            time.sleep(self.delay * (1 + len(self.calls) % 3))
+        finally:
+            self._leave()
+        return self._respond(audio_file)
+
+    async def atranscribe(
+        self, audio_file, language=None, prompt=None, *, timeout=None, deadline=None
+    ):
+        self._enter(audio_file)
+        try:
+            await asyncio.sleep(self.delay * (1 + len(self.calls) % 3))
+        finally:
+            self._leave()
+        return self._respond(audio_file)
+
+    @property
+    def provider(self) -> str:
+        return "test"
+
+    def _get_default_model(self) -> str:
+        return "test-model"
+
+    def _get_models(self):
+        return []
+
+
+class TestTranscribeMany:
+    def test_every_input_reported_once(self):
+        model = BatchModel(delay=0.01)
+
+        results = list(model.transcribe_many(FILES, max_concurrency=3))
+
+        assert sorted(r.index for r in results) == list(range(len(FILES)))
+        for r in results:
+            assert r.ok
+            assert r.result.text == r.input == FILES[r.index]
+            assert r.elapsed > 0
+        assert model.peak == 3
+
+    def test_failures_do_not_stop_the_batch(self):
+        model = BatchModel()
+
+        results = list(model.transcribe_many(["a.wav", "bad.wav", "c.wav"]))
+
+        failed = [r for r in results if not r.ok]
+        assert [r.input for r in failed] == ["bad.wav"]
+        assert isinstance(failed[0].result, RuntimeError)
+        assert len(results) == 3
+
+    def test_inputs_consumed_lazily(self):
+        model = BatchModel(delay=0.01)
+        pulled = []
+
+        def files():
+            for name in FILES:
+                pulled.append(name)
+                yield name
+
+        batch = model.transcribe_many(files(), max_concurrency=2)
+        next(batch)
+        batch.close()
+
+        assert len(pulled) <= 3
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            list(BatchModel().transcribe_many(FILES, max_concurrency=0))
+
+
+class TestAsyncTranscribeMany:
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_timing(self):
+        model = BatchModel(delay=0.01)
+
+        results = [r async for r in model.atranscribe_many(FILES, max_concurrency=4)]
+
+        assert sorted(r.index for r in results) == list(range(len(FILES)))
+        assert all(isinstance(r, BatchTranscription) and r.ok for r in results)
+        assert all(r.elapsed >= 0.01 for r in results)
+        assert model.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_accepts_async_iterable_and_reports_errors(self):
+        model = BatchModel()
+
+        async def files():
+            for name in ("a.wav", "bad.wav"):
+                yield name
+
+        results = {r.input: r async for r in model.atranscribe_many(files())}
+
+        assert results["a.wav"].ok
+        assert isinstance(results["bad.wav"].result, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_in_flight_requests(self):
+        model = BatchModel(delay=0.2)
+
+        batch = model.atranscribe_many(FILES, max_concurrency=3)
+        await asyncio.wait_for(batch.__anext__(), timeout=5)
+        await batch.aclose()
+
+        assert model.active == 0
+        assert len(model.calls) < len(FILES)
+
+
+@pytest.mark.parametrize(
+    "provider", sorted(AIFactory._provider_modules["speech_to_text"])
+)
+def test_available_for_every_provider(provider):
+    module_path, class_name = AIFactory._provider_modules["speech_to_text"][provider].split(":")
+    model_class = getattr(importlib.import_module(module_path), class_name)
+
+    assert model_class.transcribe_many is SpeechToTextModel.transcribe_many
+    assert model_class.atranscribe_many is SpeechToTextModel.atranscribe_many
+
+
+@pytest.mark.asyncio
+async def test_factory_model_uses_shared_async_client(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"clip_{i}.mp3"
+        path.write_bytes(b"audio-%d" % i)
+        paths.append(str(path))
+
+    async def handler(request):
+        body = await request.aread()
+        return httpx.Response(200, json={"text": "clip %s" % body.split(b"audio-")[1][:1].decode()})
+
+    model = AIFactory.create_speech_to_text("openai", config={"api_key": "test-key"})
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    model.async_client = client
+
+    results = [r async for r in model.atranscribe_many(paths, max_concurrency=2)]
+
+    assert model.async_client is client
+    assert {r.result.text for r in results} == {f"clip {i}" for i in range(5)}
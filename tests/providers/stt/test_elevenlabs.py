@@ -123,7 +123,7 @@ async def test_elevenlabs_atranscribe(audio_file, mock_httpx_clients):
     model.async_client.post.assert_called_once()
     call_args = model.async_client.post.call_args
     assert call_args[0][0] == "https://api.elevenlabs.io/v1/speech-to-text"
-    assert "files" in call_args[1]
+    assert "content" in call_args[1]
 
     assert isinstance(response, TranscriptionResponse)
     assert response.text == "This is a test transcription"
@@ -202,7 +202,7 @@ async def test_elevenlabs_atranscribe_wav_content_type(wav_file, mock_httpx_clie
     await model.atranscribe(wav_file)
 
     call_args = model.async_client.post.call_args
-    content_type = call_args[1]["files"]["file"][2]
+    content_type = call_args[1]["content"].content_type
     assert content_type == _guess_audio_content_type(wav_file)
     assert content_type.startswith("audio/")
 
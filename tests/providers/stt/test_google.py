@@ -1,5 +1,8 @@
 """Tests for Google speech-to-text provider."""
 
+import base64
+import io
+import json
 import os
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -7,9 +10,20 @@ import pytest
 
 from esperanto.common_types import TranscriptionResponse
 from esperanto.factory import AIFactory
+from esperanto.providers.stt import google as google_stt
 from esperanto.providers.stt.google import GoogleSpeechToTextModel
 
 
+def read_body(call_args):
+    """Decode the streamed JSON body of a generateContent call."""
+    return json.loads(b"".join(call_args[1]["content"]))
+
+
+async def aread_body(call_args):
+    """Decode the async streamed JSON body of a generateContent call."""
+    return json.loads(b"".join([chunk async for chunk in call_args[1]["content"]]))
+
+
 @pytest.fixture
 def audio_file(tmp_path):
     """Create a temporary audio file for testing."""
@@ -255,7 +269,7 @@ class TestGoogleSpeechToTextModel:
             assert response.language == "pt"
             # Verify language was included in request
             call_args = client.post.call_args
-            request_json = call_args[1]["json"]
+            request_json = read_body(call_args)
             prompt_text = request_json["contents"][0]["parts"][0]["text"]
             assert "pt language" in prompt_text
 
@@ -272,7 +286,7 @@ class TestGoogleSpeechToTextModel:
 
             # Verify custom prompt was included in request
             call_args = client.post.call_args
-            request_json = call_args[1]["json"]
+            request_json = read_body(call_args)
             prompt_text = request_json["contents"][0]["parts"][0]["text"]
             assert "Focus on names" in prompt_text
 
@@ -331,7 +345,7 @@ class TestGoogleSpeechToTextModel:
             assert response.language == "fr"
             # Verify parameters were included in request
             call_args = async_client.post.call_args
-            request_json = call_args[1]["json"]
+            request_json = await aread_body(call_args)
             prompt_text = request_json["contents"][0]["parts"][0]["text"]
             assert "fr language" in prompt_text
             assert "Technical terms" in prompt_text
@@ -366,3 +380,147 @@ class TestGoogleSpeechToTextModel:
         """Test Google appears in available providers."""
         providers = AIFactory.get_available_providers()
         assert "google" in providers["speech_to_text"]
+
+
+class NonSeekable(io.RawIOBase):
+    """Read-only stream without seek support."""
+
+    def __init__(self, data: bytes):
+        self._data = io.BytesIO(data)
+        self.name = "stream.wav"
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._data.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class TestStreamingBody:
+    """Tests for the streamed inline request body and Files API fallback."""
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, google_stt._ENCODE_CHUNK_SIZE + 1])
+    def test_inline_body_round_trip(self, tmp_path, size):
+        audio = os.urandom(size)
+        path = tmp_path / "clip.wav"
+        path.write_bytes(audio)
+
+        body = google_stt._InlineAudioBody(
+            google_stt._AudioSource(str(path)), 'Say "hi"', "audio/wav"
+        )
+        raw = b"".join(body)
+
+        assert len(raw) == len(body)
+        part = json.loads(raw)["contents"][0]["parts"][1]["inline_data"]
+        assert part["mime_type"] == "audio/wav"
+        assert base64.b64decode(part["data"]) == audio
+
+    def test_non_seekable_stream(self, mock_gemini_transcription_response):
+        audio = os.urandom(1000)
+        sent = {}
+
+        def post(url, **kwargs):
+            sent["body"] = b"".join(kwargs["content"])
+            sent["length"] = kwargs["headers"]["Content-Length"]
+            return Mock(status_code=200, json=Mock(return_value=mock_gemini_transcription_response))
+
+        with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key"}):
+            model = GoogleSpeechToTextModel()
+            model.client = Mock(post=Mock(side_effect=post))
+            model.transcribe(io.BufferedReader(NonSeekable(audio)))
+
+        assert sent["length"] == str(len(sent["body"]))
+        data = json.loads(sent["body"])["contents"][0]["parts"][1]["inline_data"]["data"]
+        assert base64.b64decode(data) == audio
+
+    def test_peak_memory_independent_of_file_size(self, tmp_path):
+        import tracemalloc
+
+        path = tmp_path / "long.wav"
+        path.write_bytes(os.urandom(8 * 1024 * 1024))
+        body = google_stt._InlineAudioBody(google_stt._AudioSource(str(path)), "p", "audio/wav")
+
+        tracemalloc.start()
+        try:
+            for _ in body:
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 2 * 1024 * 1024
+
+    def _files_api_handler(self, requests, states):
+        import httpx
+
+        def handler(request):
+            requests.append(request)
+            url = str(request.url)
+            if request.headers.get("X-Goog-Upload-Command") == "start":
+                return httpx.Response(200, headers={"x-goog-upload-url": "https://upload.test/session"})
+            if url.startswith("https://upload.test/session"):
+                return httpx.Response(
+                    200, json={"file": {"name": "files/abc", "uri": "gs://files/abc", "state": states.pop(0)}}
+                )
+            if request.method == "GET":
+                return httpx.Response(200, json={"name": "files/abc", "uri": "gs://files/abc", "state": states.pop(0)})
+            return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": "uploaded"}]}}]})
+
+        return handler
+
+    def test_large_audio_uses_files_api(self, audio_file, monkeypatch):
+        import httpx
+
+        monkeypatch.setattr(google_stt, "MAX_INLINE_REQUEST_BYTES", 16)
+        monkeypatch.setattr(google_stt, "_FILE_POLL_INTERVAL", 0)
+        requests = []
+        handler = self._files_api_handler(requests, ["PROCESSING", "ACTIVE"])
+
+        with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key"}):
+            model = GoogleSpeechToTextModel()
+            model.client = httpx.Client(transport=httpx.MockTransport(handler))
+            response = model.transcribe(audio_file)
+
+        assert response.text == "uploaded"
+        start, upload, poll, generate = requests
+        assert "/upload/v1beta/files" in str(start.url)
+        assert start.headers["X-Goog-Upload-Header-Content-Length"] == "18"
+        assert upload.content == b"mock audio content"
+        assert poll.url.path.endswith("/files/abc")
+        part = json.loads(generate.content)["contents"][0]["parts"][1]
+        assert part == {"file_data": {"mime_type": "audio/mp3", "file_uri": "gs://files/abc"}}
+
+    @pytest.mark.asyncio
+    async def test_async_large_audio_uses_files_api(self, audio_file, monkeypatch):
+        import httpx
+
+        monkeypatch.setattr(google_stt, "MAX_INLINE_REQUEST_BYTES", 16)
+        requests = []
+        sync_handler = self._files_api_handler(requests, ["ACTIVE"])
+
+        async def handler(request):
+            await request.aread()
+            return sync_handler(request)
+
+        with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key"}):
+            model = GoogleSpeechToTextModel()
+            model.async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            response = await model.atranscribe(audio_file)
+
+        assert response.text == "uploaded"
+        assert len(requests) == 3
+        assert requests[1].content == b"mock audio content"
+
+    def test_failed_upload_raises(self, audio_file, monkeypatch):
+        import httpx
+
+        monkeypatch.setattr(google_stt, "MAX_INLINE_REQUEST_BYTES", 16)
+        handler = self._files_api_handler([], ["FAILED"])
+
+        with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key"}):
+            model = GoogleSpeechToTextModel()
+            model.client = httpx.Client(transport=httpx.MockTransport(handler))
+            with pytest.raises(RuntimeError, match="failed"):
+                model.transcribe(audio_file)
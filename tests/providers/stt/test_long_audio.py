@@ -0,0 +1,310 @@
+"""Tests for long-form transcription with silence-aware chunking."""
+
+import asyncio
+import io
+import math
+import struct
+import threading
+import time
+import wave
+from dataclasses import dataclass, field
+from typing import BinaryIO, List, Optional, Union
+
+import pytest
+
+from esperanto.common_types import TranscriptionResponse
+from esperanto.providers.stt.base import SpeechToTextModel
+from esperanto.utils import audio
+from esperanto.utils.audio import (
+    offset_segments,
+    open_audio_source,
+    plan_chunks,
+    stitch_transcripts,
+)
+
+RATE = 8000
+
+
+def make_wav(path, pattern):
+    """Write a mono 16-bit WAV of alternating tone/silence spans in seconds."""
+    frames = bytearray()
+    for seconds, loud in pattern:
+        for i in range(int(seconds * RATE)):
+            value = int(12000 * math.sin(2 * math.pi * 440 * i / RATE)) if loud else 0
+            frames += struct.pack("<h", value)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(bytes(frames))
+    return str(path)
+
+
+@pytest.fixture
+def long_wav(tmp_path):
+    # Silences centred at 3.0s and 6.0s
+    return make_wav(
+        tmp_path / "long.wav",
+        [(2.8, True), (0.4, False), (2.6, True), (0.4, False), (2.8, True)],
+    )
+
+
+@dataclass
+class RecordingModel(SpeechToTextModel):
+    """Model returning a canned transcript per chunk and tracking concurrency."""
+
+    texts: List[str] = field(default_factory=list)
+    delay: float = 0.0
+    calls: List[dict] = field(default_factory=list)
+    active: int = 0
+    peak: int = 0
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _index(audio_file) -> int:
+        if isinstance(audio_file, str):
+            return 0
+        return int(audio_file.name.split("_")[1].split(".")[0])
+
+    def _respond(self, audio_file) -> TranscriptionResponse:
+        index = self._index(audio_file)
+        with wave.open(audio_file, "rb") as wav:
+            duration = wav.getnframes() / wav.getframerate()
+        self.calls.append({"index": index, "duration": duration, "file": audio_file})
+        text = self.texts[index]
+        return TranscriptionResponse(
+            text=text,
+            language="en",
+            metadata={"segments": [{"start": 0.0, "end": duration, "text": text}]},
+        )
+
+    def transcribe(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        *,
+        timeout=None,
+        deadline=None,
+    ) -> TranscriptionResponse:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            return self._respond(audio_file)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    async def atranscribe(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        *,
+        timeout=None,
+        deadline=None,
+    ) -> TranscriptionResponse:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            # Finish later chunks first to check results keep chunk order
+            await asyncio.sleep(self.delay * (len(self.texts) - self._index(audio_file)))
+            return self._respond(audio_file)
+        finally:
+            self.active -= 1
+
+    @property
+    def provider(self) -> str:
+        return "test"
+
+    @property
+    def _get_models(self):
+        return []
+
+    def _get_default_model(self) -> str:
+        return "test-model"
+
+
+CHUNK_TEXTS = [
+    "the quick brown fox",
+    "brown fox jumps over the",
+    "jumps over the lazy dog",
+]
+
+
+class TestPlanChunks:
+    def test_cuts_land_in_silence(self, long_wav):
+        with open_audio_source(long_wav) as source:
+            chunks = plan_chunks(source, chunk_seconds=4.0, overlap_seconds=0.1)
+
+        assert len(chunks) == 3
+        assert 2.8 <= chunks[0].end <= 3.2
+        assert 5.8 <= chunks[1].end <= 6.2
+        assert chunks[-1].end == pytest.approx(9.0)
+
+    def test_chunks_overlap(self, long_wav):
+        with open_audio_source(long_wav) as source:
+            chunks = plan_chunks(source, chunk_seconds=4.0, overlap_seconds=0.1)
+
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.start == pytest.approx(previous.end - 0.1)
+
+    def test_byte_limit_caps_chunk_length(self, long_wav):
+        with open_audio_source(long_wav) as source:
+            chunks = plan_chunks(
+                source, chunk_seconds=60.0, overlap_seconds=0.1, max_chunk_bytes=RATE * 2 * 4
+            )
+
+        assert all(c.end - c.start <= 4.0 for c in chunks)
+        assert len(chunks) == 3
+
+    def test_exported_chunks_fit_byte_limit(self, tmp_path):
+        path = make_wav(tmp_path / "tone.wav", [(4.0, True)])
+        limit = RATE * 2 * 4
+
+        with open_audio_source(path) as source:
+            chunks = plan_chunks(
+                source, chunk_seconds=60.0, overlap_seconds=0.1, max_chunk_bytes=limit
+            )
+            sizes = [len(source.export(chunk).getvalue()) for chunk in chunks]
+
+        assert len(chunks) == 2
+        assert max(sizes) <= limit
+
+    def test_single_chunk_when_short(self, long_wav):
+        with open_audio_source(long_wav) as source:
+            chunks = plan_chunks(source)
+
+        assert len(chunks) == 1
+        assert chunks[0].start == 0.0
+
+    def test_overlap_too_large(self, long_wav):
+        with open_audio_source(long_wav) as source:
+            with pytest.raises(ValueError, match="twice the overlap"):
+                plan_chunks(source, chunk_seconds=1.0, overlap_seconds=0.5)
+
+    def test_export_is_valid_wav(self, long_wav):
+        with open_audio_source(long_wav) as source:
+            chunk = plan_chunks(source, chunk_seconds=4.0, overlap_seconds=0.1)[1]
+            buffer = source.export(chunk)
+
+        assert buffer.name == "chunk_0001.wav"
+        with wave.open(buffer, "rb") as wav:
+            assert wav.getnframes() == chunk.end_frame - chunk.start_frame
+
+
+class TestStitching:
+    def test_overlap_removed(self):
+        assert stitch_transcripts(CHUNK_TEXTS) == (
+            "the quick brown fox jumps over the lazy dog"
+        )
+
+    def test_partial_leading_word_skipped(self):
+        text = stitch_transcripts(["we went to the market", "ket to the market today"])
+        assert text == "we went to the market today"
+
+    def test_no_overlap_concatenates(self):
+        assert stitch_transcripts(["hello there", "", "general kenobi"]) == (
+            "hello there general kenobi"
+        )
+
+    def test_offset_segments(self):
+        segments = [{"start": 0.0, "end": 0.2}, {"start": 1.0, "end": 2.0}]
+
+        shifted = offset_segments(segments, offset=5.0, after=5.5)
+
+        assert shifted == [{"start": 6.0, "end": 7.0}]
+
+
+class TestTranscribeLong:
+    def test_sync_stitches_in_order(self, long_wav):
+        model = RecordingModel(texts=CHUNK_TEXTS)
+
+        result = model.transcribe_long(long_wav, chunk_seconds=4.0, overlap_seconds=0.1)
+
+        assert result.text == "the quick brown fox jumps over the lazy dog"
+        assert result.duration == pytest.approx(9.0)
+        assert result.provider == "test"
+        assert [c["index"] for c in result.metadata["chunks"]] == [0, 1, 2]
+
+    def test_sync_concurrency_bound(self, long_wav):
+        model = RecordingModel(texts=CHUNK_TEXTS, delay=0.05)
+
+        model.transcribe_long(
+            long_wav, chunk_seconds=4.0, overlap_seconds=0.1, max_concurrency=2
+        )
+
+        assert model.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_async_results_keep_chunk_order(self, long_wav):
+        model = RecordingModel(texts=CHUNK_TEXTS, delay=0.02)
+
+        result = await model.atranscribe_long(
+            long_wav, chunk_seconds=4.0, overlap_seconds=0.1
+        )
+
+        assert [c["index"] for c in model.calls] == [2, 1, 0]
+        assert result.text == "the quick brown fox jumps over the lazy dog"
+        assert result.language == "en"
+
+    @pytest.mark.asyncio
+    async def test_async_concurrency_bound(self, long_wav):
+        model = RecordingModel(texts=CHUNK_TEXTS, delay=0.02)
+
+        await model.atranscribe_long(
+            long_wav, chunk_seconds=4.0, overlap_seconds=0.1, max_concurrency=1
+        )
+
+        assert model.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_segments_offset_to_recording(self, long_wav):
+        model = RecordingModel(texts=CHUNK_TEXTS)
+
+        result = await model.atranscribe_long(
+            long_wav, chunk_seconds=4.0, overlap_seconds=0.1
+        )
+
+        chunks = result.metadata["chunks"]
+        starts = [s["start"] for s in result.metadata["segments"]]
+        assert starts == [pytest.approx(c["start"]) for c in chunks]
+        assert result.metadata["segments"][-1]["end"] == pytest.approx(9.0)
+
+    def test_short_file_passed_through(self, long_wav):
+        model = RecordingModel(texts=CHUNK_TEXTS)
+
+        result = model.transcribe_long(long_wav)
+
+        assert model.calls[0]["file"] == long_wav
+        assert result.text == CHUNK_TEXTS[0]
+
+    def test_file_object_input(self, long_wav):
+        model = RecordingModel(texts=CHUNK_TEXTS)
+        with open(long_wav, "rb") as f:
+            data = io.BytesIO(f.read())
+
+        result = model.transcribe_long(data, chunk_seconds=4.0, overlap_seconds=0.1)
+
+        assert len(model.calls) == 3
+        assert result.text == "the quick brown fox jumps over the lazy dog"
+
+    def test_invalid_concurrency(self, long_wav):
+        model = RecordingModel(texts=CHUNK_TEXTS)
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            model.transcribe_long(long_wav, max_concurrency=0)
+
+    def test_non_wav_without_ffmpeg(self, tmp_path, monkeypatch):
+        path = tmp_path / "audio.mp3"
+        path.write_bytes(b"ID3" + b"\x00" * 64)
+        monkeypatch.setattr(audio.shutil, "which", lambda name: None)
+        model = RecordingModel(texts=CHUNK_TEXTS)
+
+        with pytest.raises(RuntimeError, match="ffmpeg"):
+            model.transcribe_long(str(path))
@@ -146,9 +146,9 @@ async def test_mistral_atranscribe(audio_file, mock_httpx_clients):
     assert headers["Authorization"] == "Bearer test-key"
     assert headers["Accept"] == "application/json"
 
-    assert "files" in call_args[1]
-    assert "data" in call_args[1]
-    assert call_args[1]["data"]["model"] == "voxtral-mini-latest"
+    assert "content" in call_args[1]
+    assert "multipart/form-data" in call_args[1]["headers"]["Content-Type"]
+    assert ("model", "voxtral-mini-latest") in call_args[1]["content"].fields
 
     assert isinstance(response, TranscriptionResponse)
     assert response.text == "This is a test transcription"
@@ -303,6 +303,6 @@ async def test_mistral_atranscribe_wav_content_type(wav_file, mock_httpx_clients
     await model.atranscribe(wav_file)
 
     call_args = model.async_client.post.call_args
-    content_type = call_args[1]["files"]["file"][2]
+    content_type = call_args[1]["content"].content_type
     assert content_type == _guess_audio_content_type(wav_file)
     assert content_type.startswith("audio/")
@@ -1,7 +1,7 @@
 """Tests for OpenAI speech-to-text provider."""
 
 import os
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -192,9 +192,9 @@ async def test_openai_atranscribe(audio_file, mock_httpx_clients):
     assert headers["Authorization"] == "Bearer test-key"
     
     # Check files and data
-    assert "files" in call_args[1]
-    assert "data" in call_args[1]
-    assert call_args[1]["data"]["model"] == "whisper-1"
+    assert "content" in call_args[1]
+    assert "multipart/form-data" in call_args[1]["headers"]["Content-Type"]
+    assert ("model", "whisper-1") in call_args[1]["content"].fields
     
     # Check response
     assert isinstance(response, TranscriptionResponse)
@@ -351,6 +351,98 @@ async def test_openai_atranscribe_wav_content_type(wav_file, mock_httpx_clients)
     await model.atranscribe(wav_file)
 
     call_args = model.async_client.post.call_args
-    content_type = call_args[1]["files"]["file"][2]
+    content_type = call_args[1]["content"].content_type
     assert content_type == _guess_audio_content_type(wav_file)
     assert content_type.startswith("audio/")
+
+
+@pytest.fixture
+def long_wav_file(tmp_path):
+    """Nine seconds of silent 8 kHz mono WAV."""
+    import wave
+
+    path = tmp_path / "long.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(b"\x00\x00" * 8000 * 9)
+    return str(path)
+
+
+@pytest.fixture
+def mock_openai_transcription_response_with_segments():
+    """Mock verbose_json response with segment timestamps."""
+    return {
+        "text": "hello there",
+        "language": "english",
+        "duration": 3.0,
+        "segments": [
+            {"id": 0, "start": 0.0, "end": 1.0, "text": "hello"},
+            {"id": 1, "start": 1.0, "end": 2.0, "text": "there"},
+        ],
+    }
+
+
+def test_openai_transcribe_long_requests_segment_timestamps(
+    long_wav_file, mock_httpx_clients, mock_openai_transcription_response_with_segments
+):
+    """Long-form transcription asks Whisper for timestamps and offsets them."""
+    model = OpenAISpeechToTextModel(api_key="test-key")
+    model.client, model.async_client = mock_httpx_clients
+    model.client.post.side_effect = lambda url, **kwargs: Mock(
+        status_code=200,
+        json=Mock(return_value=mock_openai_transcription_response_with_segments),
+    )
+
+    result = model.transcribe_long(long_wav_file, chunk_seconds=4.0, overlap_seconds=0.1)
+
+    assert model.client.post.call_count == 3
+    for call in model.client.post.call_args_list:
+        assert call[1]["data"]["response_format"] == "verbose_json"
+    chunk_starts = [c["start"] for c in result.metadata["chunks"]]
+    segments = result.metadata["segments"]
+    assert len(segments) == 6
+    assert [s["start"] for s in segments[::2]] == [pytest.approx(s) for s in chunk_starts]
+    assert segments[1] == {
+        "start": pytest.approx(chunk_starts[0] + 1.0),
+        "end": pytest.approx(chunk_starts[0] + 2.0),
+        "text": "there",
+    }
+
+
+@pytest.mark.asyncio
+async def test_openai_atranscribe_long_requests_segment_timestamps(
+    long_wav_file, mock_httpx_clients, mock_openai_transcription_response_with_segments
+):
+    """Async long-form transcription asks Whisper for timestamps."""
+    model = OpenAISpeechToTextModel(api_key="test-key")
+    model.client, model.async_client = mock_httpx_clients
+
+    async def post(url, **kwargs):
+        return Mock(
+            status_code=200,
+            json=Mock(return_value=mock_openai_transcription_response_with_segments),
+        )
+
+    model.async_client.post.side_effect = post
+
+    result = await model.atranscribe_long(
+        long_wav_file, chunk_seconds=4.0, overlap_seconds=0.1
+    )
+
+    for call in model.async_client.post.call_args_list:
+        assert ("response_format", "verbose_json") in call[1]["content"].fields
+    assert len(result.metadata["segments"]) == 6
+
+
+def test_openai_transcribe_long_without_timestamp_support(long_wav_file, mock_httpx_clients):
+    """Models without verbose_json are sent the default response format."""
+    model = OpenAISpeechToTextModel(api_key="test-key", model_name="gpt-4o-transcribe")
+    model.client, model.async_client = mock_httpx_clients
+
+    result = model.transcribe_long(long_wav_file, chunk_seconds=4.0, overlap_seconds=0.1)
+
+    for call in model.client.post.call_args_list:
+        assert "response_format" not in call[1]["data"]
+    assert "segments" not in result.metadata
@@ -0,0 +1,262 @@
+"""Tests for streaming speech-to-text against a local stand-in server."""
+
+import asyncio
+import io
+import json
+import math
+import struct
+import threading
+import wave
+from dataclasses import dataclass
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import BinaryIO, Optional, Union
+
+import pytest
+
+from esperanto.common_types import TranscriptionResponse
+from esperanto.providers.stt.base import SpeechToTextModel
+from esperanto.providers.stt.openai import OpenAISpeechToTextModel
+from esperanto.utils.audio import SpeechSegmenter
+
+RATE = 16000
+
+
+def pcm(pattern):
+    """Mono 16-bit PCM of (seconds, loud) spans."""
+    frames = bytearray()
+    for seconds, loud in pattern:
+        for i in range(int(seconds * RATE)):
+            value = int(10000 * math.sin(2 * math.pi * 300 * i / RATE)) if loud else 0
+            frames += struct.pack("<h", value)
+    return bytes(frames)
+
+
+TWO_UTTERANCES = pcm([(0.5, False), (1.0, True), (1.0, False), (0.5, True), (1.0, False)])
+
+
+async def chunks(data, size=3200, delay=0.0):
+    for offset in range(0, len(data), size):
+        if delay:
+            await asyncio.sleep(delay)
+        yield data[offset:offset + size]
+
+
+def wav_duration(fileobj) -> float:
+    with wave.open(fileobj, "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+class TranscriptionHandler(BaseHTTPRequestHandler):
+    """Stand-in for an OpenAI-style /audio/transcriptions endpoint."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + body
+        )
+        fields = {
+            part.get_param("name", header="content-disposition"): part
+            for part in message.iter_parts()
+        }
+        duration = wav_duration(io.BytesIO(fields["file"].get_payload(decode=True)))
+        text = f"speech {duration:.1f}"
+        self.server.requests.append(fields["model"].get_content())
+
+        if fields.get("stream") and fields["stream"].get_content() == "true":
+            events = [{"type": "transcript.text.delta", "delta": word + " "} for word in text.split()]
+            events.append({"type": "transcript.text.done", "text": text})
+            payload = "".join(f"data: {json.dumps(e)}\n\n" for e in events).encode()
+            content_type = "text/event-stream"
+        else:
+            payload = json.dumps({"text": text}).encode()
+            content_type = "application/json"
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), TranscriptionHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def openai_model(server, model_name="whisper-1"):
+    return OpenAISpeechToTextModel(
+        api_key="test-key",
+        model_name=model_name,
+        base_url=f"http://127.0.0.1:{server.server_port}/v1",
+    )
+
+
+@dataclass
+class DurationModel(SpeechToTextModel):
+    """Model that transcribes a WAV as its duration."""
+
+    def transcribe(self, audio_file, language=None, prompt=None, *, timeout=None, deadline=None):
+        raise NotImplementedError
+
+    async def atranscribe(
+        self,
+        audio_file: Union[str, BinaryIO],
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        *,
+        timeout=None,
+        deadline=None,
+    ) -> TranscriptionResponse:
+        return TranscriptionResponse(text=f"{wav_duration(audio_file):.2f}")
+
+    @property
+    def provider(self) -> str:
+        return "test"
+
+    def _get_models(self):
+        return []
+
+    def _get_default_model(self) -> str:
+        return "test-model"
+
+
+class TestSpeechSegmenter:
+    def test_finds_utterances(self):
+        segmenter = SpeechSegmenter(RATE, partial_interval_seconds=None)
+
+        segments = segmenter.feed(TWO_UTTERANCES) + segmenter.flush()
+
+        assert [s.is_final for s in segments] == [True, True]
+        first, second = segments
+        # Pre-roll reaches a little before the speech onset at 0.5s
+        assert 0.25 <= first.start < 0.5
+        assert first.end == pytest.approx(1.5 + 0.6, abs=0.05)
+        assert 2.25 <= second.start < 2.5
+        assert len(first.audio) == int((first.end - first.start) * RATE) * 2
+
+    def test_feed_size_does_not_matter(self):
+        whole = SpeechSegmenter(RATE, partial_interval_seconds=None)
+        pieces = SpeechSegmenter(RATE, partial_interval_seconds=None)
+
+        expected = whole.feed(TWO_UTTERANCES) + whole.flush()
+        actual = []
+        for offset in range(0, len(TWO_UTTERANCES), 777):
+            actual += pieces.feed(TWO_UTTERANCES[offset:offset + 777])
+        actual += pieces.flush()
+
+        assert expected == actual
+
+    def test_partials_grow_until_final(self):
+        segmenter = SpeechSegmenter(RATE, partial_interval_seconds=0.3)
+
+        segments = segmenter.feed(pcm([(1.0, True), (1.0, False)]))
+
+        partials = [s for s in segments if not s.is_final]
+        assert len(partials) >= 3
+        assert all(a.end < b.end for a, b in zip(partials, partials[1:]))
+        assert segments[-1].is_final and segments[-1].index == partials[0].index
+
+    def test_max_segment_forces_cut(self):
+        segmenter = SpeechSegmenter(
+            RATE, min_silence_seconds=0.5, max_segment_seconds=1.0, partial_interval_seconds=None
+        )
+
+        segments = segmenter.feed(pcm([(2.5, True)])) + segmenter.flush()
+
+        assert [s.index for s in segments] == [0, 1, 2]
+        assert segments[0].end - segments[0].start == pytest.approx(1.0, abs=0.05)
+
+    def test_silence_yields_nothing(self):
+        segmenter = SpeechSegmenter(RATE)
+        assert segmenter.feed(pcm([(2.0, False)])) + segmenter.flush() == []
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError, match="sample_width"):
+            SpeechSegmenter(RATE, sample_width=5)
+        with pytest.raises(ValueError, match="max_segment_seconds"):
+            SpeechSegmenter(RATE, min_silence_seconds=2.0, max_segment_seconds=1.0)
+
+
+class TestStreamingFallback:
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_per_utterance(self, server):
+        model = openai_model(server)
+
+        results = [
+            r async for r in model.atranscribe_stream(chunks(TWO_UTTERANCES), partial_interval=None)
+        ]
+
+        assert [r.is_final for r in results] == [True, True]
+        assert [r.metadata["index"] for r in results] == [0, 1]
+        assert results[0].text.startswith("speech 1.")
+        assert results[1].metadata["start"] > results[0].metadata["end"]
+        assert server.requests == ["whisper-1", "whisper-1"]
+
+    @pytest.mark.asyncio
+    async def test_partials_precede_final(self):
+        model = DurationModel()
+        audio = pcm([(1.5, True), (1.0, False)])
+
+        results = [
+            r
+            async for r in model.atranscribe_stream(
+                chunks(audio, size=1600, delay=0.002), partial_interval=0.25
+            )
+        ]
+
+        assert results[-1].is_final
+        partials = results[:-1]
+        assert partials and not any(r.is_final for r in partials)
+        lengths = [float(r.text) for r in results]
+        assert lengths == sorted(lengths)
+
+    @pytest.mark.asyncio
+    async def test_superseded_partials_skipped(self):
+        model = DurationModel()
+        audio = pcm([(1.5, True), (1.0, False)])
+
+        # All audio arrives at once, so every partial is stale by the time
+        # the consumer reaches it
+        results = [r async for r in model.atranscribe_stream(chunks(audio, size=len(audio)))]
+
+        assert [r.is_final for r in results] == [True]
+
+    @pytest.mark.asyncio
+    async def test_source_errors_propagate(self):
+        model = DurationModel()
+
+        async def broken():
+            yield pcm([(0.5, True)])
+            raise OSError("microphone unplugged")
+
+        with pytest.raises(OSError, match="unplugged"):
+            async for _ in model.atranscribe_stream(broken()):
+                pass
+
+
+class TestNativeStreaming:
+    @pytest.mark.asyncio
+    async def test_openai_streams_deltas(self, server):
+        model = openai_model(server, "gpt-4o-mini-transcribe")
+
+        results = [
+            r async for r in model.atranscribe_stream(chunks(TWO_UTTERANCES), partial_interval=None)
+        ]
+
+        first = [r for r in results if r.metadata["index"] == 0]
+        assert [r.is_final for r in first] == [False, False, True]
+        assert first[0].text.strip() == "speech"
+        assert first[-1].text.startswith("speech 1.")
+        assert first[-1].provider == "openai"
+        assert sum(r.is_final for r in results) == 2
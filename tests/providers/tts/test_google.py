@@ -139,3 +139,29 @@ def test_available_voices():
     assert voices["charon"].name == "UpbeatCharon"
     assert voices["charon"].id == "charon"
     assert voices["charon"].gender == "MALE"
+
+
+def test_generate_speech_writes_wav_file(tmp_path):
+    """The PCM is wrapped in a WAV header and saved to the output file."""
+    import io
+    import wave
+
+    model = GoogleTextToSpeechModel(api_key="test-key")
+    pcm = b"\x01\x02" * 50
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "candidates": [
+            {"content": {"parts": [{"inlineData": {"data": base64.b64encode(pcm).decode()}}]}}
+        ]
+    }
+    model.client = Mock()
+    model.client.post.return_value = mock_response
+    target = tmp_path / "out" / "speech.wav"
+
+    response = model.generate_speech(text="Hello", voice="Kore", output_file=target)
+
+    assert target.read_bytes() == response.audio_data
+    with wave.open(io.BytesIO(response.audio_data), "rb") as wav:
+        assert wav.getframerate() == 24000
+        assert wav.readframes(wav.getnframes()) == pcm
@@ -0,0 +1,310 @@
+"""Tests for long-text speech synthesis with sentence pipelining."""
+
+import asyncio
+import io
+import struct
+import threading
+import time
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pytest
+
+from esperanto.common_types import AudioResponse
+from esperanto.common_types.tts import Voice
+from esperanto.providers.tts.base import TextToSpeechModel
+from esperanto.utils import speech
+from esperanto.utils.audio import pcm_to_wav
+from esperanto.utils.speech import can_concat_audio, concat_audio, split_text
+
+SENTENCES = [f"This is sentence number {i} of the story." for i in range(12)]
+TEXT = " ".join(SENTENCES)
+
+
+def wav_for(text: str) -> bytes:
+    """A WAV whose frames encode the text, so order can be checked after joining."""
+    return pcm_to_wav(text.encode().ljust(len(text) + len(text) % 2), 8000).getvalue()
+
+
+def wav_frames(data: bytes) -> bytes:
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        return wav.readframes(wav.getnframes())
+
+
+@dataclass
+class SegmentModel(TextToSpeechModel):
+    """Model returning a WAV per request and tracking concurrency."""
+
+    delay: float = 0.0
+    content_type: str = "audio/wav"
+    calls: List[str] = field(default_factory=list)
+    active: int = 0
+    peak: int = 0
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._lock = threading.Lock()
+
+    def _respond(self, text: str) -> AudioResponse:
+        self.calls.append(text)
+        return AudioResponse(
+            audio_data=wav_for(text),
+            content_type=self.content_type,
+            duration=1.0,
+            voice="v",
+            provider="test",
+        )
+
+    def generate_speech(
+        self,
+        text: str,
+        voice: str,
+        output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout=None,
+        deadline=None,
+        **kwargs,
+    ) -> AudioResponse:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            response = self._respond(text)
+            if output_file:
+                self.save_audio(response.audio_data, output_file)
+            return response
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    async def agenerate_speech(
+        self,
+        text: str,
+        voice: str,
+        output_file: Optional[Union[str, Path]] = None,
+        *,
+        timeout=None,
+        deadline=None,
+        **kwargs,
+    ) -> AudioResponse:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            # Later segments finish first, to check results keep text order
+            await asyncio.sleep(self.delay * (len(TEXT) - TEXT.find(text)) / len(TEXT))
+            return self._respond(text)
+        finally:
+            self.active -= 1
+
+    @property
+    def available_voices(self) -> Dict[str, Voice]:
+        return {}
+
+    def _get_models(self):
+        return []
+
+
+class TestSplitText:
+    def test_sentences_packed_under_limit(self):
+        segments = split_text(TEXT, max_chars=100)
+
+        assert all(len(s) <= 100 for s in segments)
+        assert " ".join(segments) == TEXT
+        assert all(s.endswith("story.") for s in segments)
+
+    def test_short_text_is_one_segment(self):
+        assert split_text("Hello there.  ") == ["Hello there."]
+
+    def test_long_sentence_split_at_clauses_then_words(self):
+        sentence = "one, " * 30 + "and " * 30 + "done."
+
+        segments = split_text(sentence, max_chars=40)
+
+        assert all(len(s) <= 40 for s in segments)
+        assert " ".join(segments).split() == sentence.split()
+        assert segments[0].endswith(",")
+
+    def test_ssml_rewrapped_and_not_split_inside_elements(self):
+        ssml = (
+            '<speak version="1.0">'
+            + "".join(f"<p>Paragraph {i}. It has <emphasis>two. Sentences.</emphasis></p>" for i in range(6))
+            + "</speak>"
+        )
+
+        segments = split_text(ssml, max_chars=160)
+
+        assert len(segments) > 1
+        for segment in segments:
+            assert segment.startswith('<speak version="1.0"><p>')
+            assert segment.endswith("</p></speak>")
+            assert len(segment) <= 160
+            assert segment.count("<p>") == segment.count("</p>")
+
+    def test_budget_too_small_for_wrapper(self):
+        with pytest.raises(ValueError, match="max_chars"):
+            split_text("<speak>Hi.</speak>", max_chars=10)
+
+
+class TestConcatAudio:
+    def test_wav_header_rewritten(self):
+        joined = concat_audio([wav_for("ab"), wav_for("cdef")], "audio/wav")
+
+        with wave.open(io.BytesIO(joined), "rb") as wav:
+            assert wav.getnframes() == 3
+            assert wav.getframerate() == 8000
+        assert wav_frames(joined) == b"abcdef"
+
+    def test_wav_formats_must_match(self):
+        other = pcm_to_wav(b"\x00\x00", 16000).getvalue()
+
+        with pytest.raises(ValueError, match="different formats"):
+            concat_audio([wav_for("ab"), other], "audio/wav")
+
+    def test_mp3_frames_joined_without_tags(self):
+        # MPEG-1 layer III, 128 kbps, 44.1 kHz, no padding: 417-byte frames
+        header = bytes([0xFF, 0xFB, 0x90, 0x00])
+        info = header + b"\x00" * 32 + b"Info" + b"\x00" * 377
+        id3 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"TIT2!"
+        id3v1 = b"TAG" + b"\x00" * 125
+
+        def mp3(fill: bytes) -> bytes:
+            return id3 + info + header + fill * 413 + id3v1
+
+        joined = concat_audio([mp3(b"a"), mp3(b"b")], "audio/mpeg")
+
+        assert joined == id3 + header + b"a" * 413 + header + b"b" * 413
+
+    def test_ogg_opus_remuxed_into_one_stream(self):
+        def page(serial, sequence, granule, packets, flags=0):
+            lacing = bytes(len(p) for p in packets)
+            data = bytearray(
+                struct.pack("<4sBBqIIIB", b"OggS", 0, flags, granule, serial, sequence, 0, len(lacing))
+            )
+            data += lacing + b"".join(packets)
+            struct.pack_into("<I", data, 22, speech._ogg_crc(data))
+            return bytes(data)
+
+        def opus(serial, audio):
+            return (
+                page(serial, 0, 0, [b"OpusHead" + b"\x01" * 11], flags=0x02)
+                + page(serial, 1, 0, [b"OpusTags" + b"\x00" * 8])
+                + page(serial, 2, 960, [audio])
+                + page(serial, 3, 1920, [audio], flags=0x04)
+            )
+
+        joined = concat_audio([opus(1, b"x"), opus(2, b"y")], "audio/opus")
+
+        pages = speech._ogg_pages(joined)
+        assert [p[3] for p in pages[2:]] == [b"x", b"x", b"y", b"y"]
+        assert [p[1] for p in pages] == [0, 0, 960, 1920, 2880, 3840]
+        assert [p[0] for p in pages] == [0x02, 0, 0, 0, 0, 0x04]
+        offset = 0
+        for sequence in range(len(pages)):
+            serial, number = struct.unpack_from("<II", joined, offset + 14)
+            assert (serial, number) == (1, sequence)
+            size = 27 + joined[offset + 26] + sum(pages[sequence][2])
+            data = bytearray(joined[offset:offset + size])
+            crc = struct.unpack_from("<I", data, 22)[0]
+            struct.pack_into("<I", data, 22, 0)
+            assert speech._ogg_crc(data) == crc
+            offset += size
+
+    def test_ogg_crc_matches_reference(self):
+        # CRC-32/CKSUM check value without its final inversion
+        assert speech._ogg_crc(b"123456789") ^ 0xFFFFFFFF == 0x765E7680
+
+    def test_unsupported_format(self):
+        assert not can_concat_audio("audio/flac")
+        with pytest.raises(ValueError, match="audio/flac"):
+            concat_audio([b"fLaC", b"fLaC"], "audio/flac")
+
+
+class TestGenerateSpeechLong:
+    def test_sync_joins_in_order(self, tmp_path):
+        model = SegmentModel()
+        target = tmp_path / "story.wav"
+
+        result = model.generate_speech_long(TEXT, "v", target, max_chars=100)
+
+        segments = split_text(TEXT, max_chars=100)
+        assert result.metadata["segments"] == segments
+        assert wav_frames(result.audio_data).rstrip(b" ") == b"".join(
+            s.encode().ljust(len(s) + len(s) % 2) for s in segments
+        ).rstrip(b" ")
+        assert result.duration == len(segments)
+        assert target.read_bytes() == result.audio_data
+
+    def test_sync_concurrency_bound(self):
+        model = SegmentModel(delay=0.02)
+
+        model.generate_speech_long(TEXT, "v", max_chars=100, max_concurrency=2)
+
+        assert model.peak == 2
+
+    def test_first_segment_available_before_the_rest(self):
+        model = SegmentModel(delay=0.05)
+
+        segments = model.generate_speech_segments(TEXT, "v", max_chars=60, max_concurrency=2)
+        next(segments)
+        started = len(model.calls)
+        segments.close()
+
+        assert started < len(split_text(TEXT, max_chars=60))
+
+    def test_short_text_passed_through(self, tmp_path):
+        model = SegmentModel()
+        target = tmp_path / "hi.wav"
+
+        result = model.generate_speech_long("Hello there.", "v", target)
+
+        assert model.calls == ["Hello there."]
+        assert result.metadata is None
+        assert target.exists()
+
+    def test_unsupported_format_raises(self):
+        model = SegmentModel(content_type="audio/flac")
+
+        with pytest.raises(ValueError, match="audio/flac"):
+            model.generate_speech_long(TEXT, "v", max_chars=100)
+
+    def test_invalid_arguments(self):
+        model = SegmentModel()
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            model.generate_speech_long(TEXT, "v", max_concurrency=0)
+        with pytest.raises(ValueError, match="non-empty"):
+            model.generate_speech_long("   ", "v")
+
+    @pytest.mark.asyncio
+    async def test_async_keeps_text_order(self):
+        model = SegmentModel(delay=0.05)
+
+        result = await model.agenerate_speech_long(TEXT, "v", max_chars=100, max_concurrency=8)
+
+        segments = split_text(TEXT, max_chars=100)
+        assert model.calls[0] == segments[-1]
+        assert result.metadata["segments"] == segments
+        assert wav_frames(result.audio_data).startswith(segments[0].encode())
+
+    @pytest.mark.asyncio
+    async def test_async_concurrency_bound(self):
+        model = SegmentModel(delay=0.02)
+
+        await model.agenerate_speech_long(TEXT, "v", max_chars=100, max_concurrency=3)
+
+        assert model.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_async_close_cancels_pending_segments(self):
+        model = SegmentModel(delay=0.5)
+
+        segments = model.agenerate_speech_segments(TEXT, "v", max_chars=60)
+        first = await asyncio.wait_for(segments.__anext__(), timeout=5)
+        await segments.aclose()
+
+        assert first.provider == "test"
+        assert model.active == 0
+        assert len(model.calls) < len(split_text(TEXT, max_chars=60))
@@ -0,0 +1,160 @@
+"""Tests for streaming text-to-speech output."""
+
+import io
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from esperanto.common_types import AudioResponse
+from esperanto.providers.tts.elevenlabs import ElevenLabsTextToSpeechModel
+from esperanto.providers.tts.google import GoogleTextToSpeechModel
+from esperanto.providers.tts.openai import OpenAITextToSpeechModel
+from esperanto.providers.tts.xai import XAITextToSpeechModel
+
+PIECES = [b"ID3", b"frame-1", b"frame-2", b"frame-3"]
+AUDIO = b"".join(PIECES)
+
+
+class AsyncPieces(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        for piece in PIECES:
+            yield piece
+
+
+def streaming_transport(requests, status_code=200):
+    def handler(request):
+        requests.append(request)
+        if status_code >= 400:
+            return httpx.Response(status_code, json={"error": {"message": "bad voice"}})
+        return httpx.Response(status_code, stream=httpx.ByteStream(AUDIO))
+
+    return httpx.MockTransport(handler)
+
+
+def async_streaming_transport(requests):
+    async def handler(request):
+        requests.append(request)
+        return httpx.Response(200, stream=AsyncPieces())
+
+    return httpx.MockTransport(handler)
+
+
+def openai_model(requests, status_code=200):
+    model = OpenAITextToSpeechModel(api_key="test-key")
+    model.client = httpx.Client(transport=streaming_transport(requests, status_code))
+    return model
+
+
+class TestGenerateSpeechStream:
+    def test_yields_audio_chunks(self):
+        requests = []
+        model = openai_model(requests)
+
+        chunks = list(model.generate_speech_stream("Hello", "nova", chunk_size=4, speed=1.2))
+
+        assert b"".join(chunks) == AUDIO
+        assert max(len(c) for c in chunks) <= 4
+        request = requests[0]
+        assert request.url.path == "/v1/audio/speech"
+        payload = json.loads(request.content)
+        assert payload == {
+            "model": "tts-1",
+            "voice": "nova",
+            "input": "Hello",
+            "response_format": "mp3",
+            "speed": 1.2,
+        }
+
+    def test_writes_file_incrementally(self, tmp_path):
+        model = openai_model([])
+        target = tmp_path / "out" / "speech.mp3"
+
+        stream = model.generate_speech_stream("Hello", "nova", output_file=target, chunk_size=4)
+        next(stream)
+        assert not target.exists()
+        assert (tmp_path / "out" / "speech.mp3.part").exists()
+
+        list(stream)
+
+        assert target.read_bytes() == AUDIO
+        assert not (tmp_path / "out" / "speech.mp3.part").exists()
+
+    def test_abandoned_stream_leaves_no_file(self, tmp_path):
+        model = openai_model([])
+        target = tmp_path / "speech.mp3"
+
+        stream = model.generate_speech_stream("Hello", "nova", output_file=target, chunk_size=4)
+        next(stream)
+        stream.close()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_writes_to_file_object(self):
+        model = openai_model([])
+        sink = io.BytesIO()
+
+        list(model.generate_speech_stream("Hello", "nova", output_file=sink))
+
+        assert sink.getvalue() == AUDIO
+
+    def test_http_error_raises(self, tmp_path):
+        model = openai_model([], status_code=400)
+
+        with pytest.raises(RuntimeError, match="bad voice"):
+            list(model.generate_speech_stream("Hello", "nova", output_file=tmp_path / "x.mp3"))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_elevenlabs_uses_stream_endpoint(self):
+        requests = []
+        model = ElevenLabsTextToSpeechModel(api_key="test-key")
+        model.client = httpx.Client(transport=streaming_transport(requests))
+
+        assert b"".join(model.generate_speech_stream("Hi", "voice-1")) == AUDIO
+        assert requests[0].url.path == "/v1/text-to-speech/voice-1/stream"
+        assert requests[0].headers["xi-api-key"] == "test-key"
+
+    def test_xai_payload_matches_generate_speech(self):
+        requests = []
+        model = XAITextToSpeechModel(api_key="test-key")
+        model.client = httpx.Client(transport=streaming_transport(requests))
+
+        list(model.generate_speech_stream("Hi", "eve", response_format="wav", sample_rate=24000))
+
+        payload = json.loads(requests[0].content)
+        assert payload["output_format"] == {"codec": "wav", "sample_rate": 24000}
+        assert payload["voice_id"] == "eve"
+
+    def test_json_providers_fall_back_to_single_chunk(self, tmp_path):
+        model = GoogleTextToSpeechModel(api_key="test-key")
+        response = AudioResponse(audio_data=AUDIO, content_type="audio/wav")
+        target = tmp_path / "speech.wav"
+
+        with patch.object(model, "generate_speech", return_value=response) as generate:
+            chunks = list(model.generate_speech_stream("Hi", "Kore", output_file=target))
+
+        assert chunks == [AUDIO]
+        assert target.read_bytes() == AUDIO
+        assert generate.call_args.kwargs.get("output_file") is None
+
+
+class TestAsyncGenerateSpeechStream:
+    @pytest.mark.asyncio
+    async def test_yields_chunks_as_they_arrive(self, tmp_path):
+        requests = []
+        model = OpenAITextToSpeechModel(api_key="test-key")
+        model.async_client = httpx.AsyncClient(transport=async_streaming_transport(requests))
+        target = tmp_path / "speech.mp3"
+
+        chunks = [
+            chunk
+            async for chunk in model.agenerate_speech_stream(
+                "Hello", "nova", output_file=target, response_format="opus"
+            )
+        ]
+
+        assert chunks == PIECES
+        assert target.read_bytes() == AUDIO
+        assert json.loads(requests[0].content)["response_format"] == "opus"
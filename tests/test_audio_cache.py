@@ -0,0 +1,224 @@
+"""Tests for the content-addressed text-to-speech audio cache."""
+
+import json
+
+import httpx
+import pytest
+
+from esperanto.common_types import AudioResponse
+from esperanto.providers.tts.elevenlabs import ElevenLabsTextToSpeechModel
+from esperanto.providers.tts.openai import OpenAITextToSpeechModel
+from esperanto.utils.audio_cache import (
+    AUDIO_CACHE_DIR_ENV_VAR,
+    AUDIO_CACHE_ENV_VAR,
+    AudioCache,
+    AudioCacheConfig,
+    audio_cache_key,
+    audio_caches,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    monkeypatch.delenv(AUDIO_CACHE_ENV_VAR, raising=False)
+    monkeypatch.delenv(AUDIO_CACHE_DIR_ENV_VAR, raising=False)
+    audio_caches.clear()
+    yield
+    audio_caches.clear()
+
+
+def counting_transport(requests):
+    def handler(request):
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, content=f"audio-{len(requests)}".encode())
+
+    return httpx.MockTransport(handler)
+
+
+def openai_model(requests, audio_cache=True, **config):
+    model = OpenAITextToSpeechModel(api_key="test-key", audio_cache=audio_cache, **config)
+    model.client = httpx.Client(transport=counting_transport(requests))
+    model.async_client = httpx.AsyncClient(transport=counting_transport(requests))
+    return model
+
+
+def response(data: bytes) -> AudioResponse:
+    return AudioResponse(audio_data=data, content_type="audio/mp3", voice="nova")
+
+
+class TestAudioCache:
+    def test_memory_lru_eviction_by_size(self):
+        cache = AudioCache(AudioCacheConfig(memory_max_bytes=10))
+
+        cache.put("a", response(b"aaaa"))
+        cache.put("b", response(b"bbbb"))
+        assert cache.get("a") is not None
+        cache.put("c", response(b"cccc"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        stats = cache.stats()
+        assert (stats.memory_entries, stats.memory_bytes) == (2, 8)
+        assert (stats.memory_hits, stats.misses) == (2, 1)
+
+    def test_oversized_entry_not_kept_in_memory(self):
+        cache = AudioCache(AudioCacheConfig(memory_max_bytes=3))
+
+        cache.put("a", response(b"aaaa"))
+
+        assert cache.get("a") is None
+
+    def test_disk_hit_is_memory_mapped(self, tmp_path):
+        config = AudioCacheConfig(memory_max_bytes=0, directory=str(tmp_path))
+        AudioCache(config).put("k" * 64, response(b"hello audio"))
+
+        # A fresh cache (e.g. another process) finds the entry on disk
+        cache = AudioCache(config)
+        hit = cache.get("k" * 64)
+
+        assert hit is not None
+        assert hit.buffer.obj.__class__.__name__ == "mmap"
+        assert hit.audio_data == b"hello audio"
+        assert hit.voice == "nova"
+        assert cache.stats().disk_hits == 1
+
+    def test_disk_eviction_removes_oldest_files(self, tmp_path):
+        probe = AudioCache(AudioCacheConfig(directory=str(tmp_path / "probe")))
+        probe.put_disk("p" * 64, response(b"x" * 100))
+        entry_size = probe.stats().disk_bytes
+
+        cache = AudioCache(
+            AudioCacheConfig(directory=str(tmp_path / "cache"), disk_max_bytes=entry_size * 2)
+        )
+        for key in ("a", "b", "c"):
+            cache.put_disk(key * 64, response(b"x" * 100))
+
+        stats = cache.stats()
+        assert stats.disk_entries == 2
+        assert stats.disk_bytes <= entry_size * 2
+        assert not (tmp_path / "cache" / "aa" / ("a" * 64)).exists()
+        assert cache.get_disk("c" * 64) is not None
+
+    def test_clear_removes_disk_entries(self, tmp_path):
+        cache = AudioCache(AudioCacheConfig(directory=str(tmp_path)))
+        cache.put("k" * 64, response(b"data"))
+
+        cache.clear()
+
+        assert cache.get("k" * 64) is None
+        assert not [path for path in tmp_path.rglob("*") if path.is_file()]
+
+    def test_key_covers_every_parameter(self):
+        base = ("openai", "https://api", "tts-1", "generate_speech", "Hi")
+
+        key = audio_cache_key(*base, {"voice": "nova", "speed": 1.0})
+
+        assert key == audio_cache_key(*base, {"speed": 1.0, "voice": "nova"})
+        assert key != audio_cache_key(*base, {"voice": "nova", "speed": 1.2})
+        assert audio_cache_key(*base, {"voice": object()}) is None
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError, match="memory_max_bytes"):
+            AudioCacheConfig(memory_max_bytes=-1)
+
+
+class TestCachedSynthesis:
+    def test_repeated_phrase_served_from_cache(self, tmp_path):
+        requests = []
+        model = openai_model(requests)
+
+        first = model.generate_speech("Your call is important to us.", "nova")
+        second = model.generate_speech(
+            "Your call is important to us.", "nova", output_file=tmp_path / "x.mp3", timeout=5
+        )
+
+        assert len(requests) == 1
+        assert second.audio_data == first.audio_data == b"audio-1"
+        assert (tmp_path / "x.mp3").read_bytes() == b"audio-1"
+        assert model.audio_cache_stats.memory_hits == 1
+
+    def test_parameters_change_the_key(self):
+        requests = []
+        model = openai_model(requests)
+
+        model.generate_speech("Hello", "nova")
+        model.generate_speech("Hello", "alloy")
+        model.generate_speech("Hello", "nova", speed=1.5)
+
+        assert len(requests) == 3
+
+    def test_models_with_same_config_share_cache(self):
+        requests = []
+
+        openai_model(requests).generate_speech("Hello", "nova")
+        openai_model(requests).generate_speech("Hello", "nova")
+
+        assert len(requests) == 1
+
+    def test_disabled_by_default(self):
+        requests = []
+        model = openai_model(requests, audio_cache=False)
+
+        model.generate_speech("Hello", "nova")
+        model.generate_speech("Hello", "nova")
+
+        assert len(requests) == 2
+        assert model.audio_cache_stats is None
+
+    def test_env_var_enables_disk_tier(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(AUDIO_CACHE_DIR_ENV_VAR, str(tmp_path))
+        requests = []
+        model = OpenAITextToSpeechModel(api_key="test-key")
+        model.client = httpx.Client(transport=counting_transport(requests))
+
+        model.generate_speech("Hello", "nova")
+        audio_caches._caches.clear()  # forget the memory tier, as in a new process
+        hit = model.generate_speech("Hello", "nova")
+
+        assert len(requests) == 1
+        assert hit.audio_data == b"audio-1"
+        assert model.audio_cache_stats.disk_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_async_shares_entries_with_sync(self, tmp_path):
+        requests = []
+        model = openai_model(requests, audio_cache={"directory": str(tmp_path)})
+
+        first = await model.agenerate_speech("Hello", "nova")
+        second = model.generate_speech("Hello", "nova")
+        third = await model.agenerate_speech("Hello", "nova", output_file=tmp_path / "o.mp3")
+
+        assert len(requests) == 1
+        assert first.audio_data == second.audio_data == third.audio_data
+        assert (tmp_path / "o.mp3").read_bytes() == b"audio-1"
+
+    def test_failed_calls_are_not_cached(self):
+        model = OpenAITextToSpeechModel(api_key="test-key", audio_cache=True)
+        model.client = httpx.Client(
+            transport=httpx.MockTransport(lambda r: httpx.Response(500, json={"error": {"message": "boom"}}))
+        )
+
+        with pytest.raises(RuntimeError):
+            model.generate_speech("Hello", "nova")
+
+        assert model.audio_cache_stats.memory_entries == 0
+
+    def test_multi_speaker_speech_is_cached(self):
+        requests = []
+        model = ElevenLabsTextToSpeechModel(api_key="test-key", audio_cache=True)
+        model.client = httpx.Client(transport=counting_transport(requests))
+        speakers = [{"speaker": "Joe", "voice": "v1"}, {"speaker": "Jane", "voice": "v2"}]
+
+        model.generate_multi_speaker_speech("Joe: Hi\nJane: Hello", speakers)
+        model.generate_multi_speaker_speech("Joe: Hi\nJane: Hello", speakers)
+        model.generate_multi_speaker_speech(
+            "Joe: Hi\nJane: Hello", [{"speaker": "Joe", "voice": "v3"}, speakers[1]]
+        )
+
+        assert len(requests) == 2
+
+    def test_invalid_setting(self):
+        model = OpenAITextToSpeechModel(api_key="test-key", audio_cache="yes")
+
+        with pytest.raises(ValueError, match="audio_cache"):
+            model.generate_speech("Hello", "nova")
@@ -0,0 +1,319 @@
+"""Tests for circuit breaker and endpoint health tracking."""
+
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from esperanto.common_types import CircuitOpenError
+from esperanto.providers.llm.azure import AzureLanguageModel
+from esperanto.providers.llm.openai import OpenAILanguageModel
+from esperanto.utils.circuit_breaker import (
+    AsyncCircuitBreakerClient,
+    CircuitBreaker,
+    CircuitBreakerClient,
+    CircuitBreakerConfig,
+    CircuitState,
+    circuit_breakers,
+    get_circuit_breaker_states,
+    reset_circuit_breakers,
+)
+from esperanto.utils.json_codec import JSONClient
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    circuit_breakers.clear()
+    yield
+    circuit_breakers.clear()
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    defaults = {"minimum_calls": 4, "recovery_timeout": 0.05}
+    defaults.update(kwargs)
+    return CircuitBreaker("test:https://api.test.com", CircuitBreakerConfig(**defaults))
+
+
+class TestCircuitBreaker:
+    def test_starts_closed(self):
+        breaker = make_breaker()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.before_call()
+
+    def test_opens_after_error_rate_threshold(self):
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record(False, 0.1)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.key == "test:https://api.test.com"
+        assert exc_info.value.retry_after <= 0.05
+
+    def test_stays_closed_below_minimum_calls(self):
+        breaker = make_breaker(minimum_calls=10)
+        for _ in range(5):
+            breaker.record(False, 0.1)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_stays_closed_below_error_rate(self):
+        breaker = make_breaker(failure_rate_threshold=0.5)
+        for ok in (True, True, True, False):
+            breaker.record(ok, 0.1)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_opens_on_latency_threshold(self):
+        breaker = make_breaker(latency_threshold=1.0)
+        for _ in range(4):
+            breaker.record(True, 2.0)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_probe_success_closes(self):
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record(False, 0.1)
+        time.sleep(0.06)
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+        # Only one probe allowed at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record(True, 0.1)
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.stats().calls == 1
+
+    def test_half_open_probe_failure_reopens(self):
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record(False, 0.1)
+        time.sleep(0.06)
+
+        breaker.before_call()
+        breaker.record(False, 0.1)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_old_outcomes_leave_window(self):
+        breaker = make_breaker(window_seconds=0.05, minimum_calls=2)
+        breaker.record(False, 0.1)
+        time.sleep(0.06)
+        breaker.record(False, 0.1)
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.stats().calls == 1
+
+    def test_stats_percentiles(self):
+        breaker = make_breaker(minimum_calls=1000)
+        for latency in range(1, 101):
+            breaker.record(latency != 100, latency / 100)
+
+        stats = breaker.stats()
+        assert stats.calls == 100
+        assert stats.failures == 1
+        assert stats.error_rate == pytest.approx(0.01)
+        assert stats.latency_p50 == pytest.approx(0.5)
+        assert stats.latency_p95 == pytest.approx(0.95)
+        assert stats.latency_p99 == pytest.approx(0.99)
+
+    def test_reset(self):
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record(False, 0.1)
+
+        breaker.reset()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.stats().calls == 0
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError, match="failure_rate_threshold"):
+            CircuitBreakerConfig(failure_rate_threshold=0)
+
+
+class TestCircuitBreakerClients:
+    def test_sync_client_records_outcomes(self):
+        breaker = make_breaker()
+        statuses = iter([200, 503, 400])
+
+        def handler(request):
+            return httpx.Response(next(statuses))
+
+        with CircuitBreakerClient(breaker, transport=httpx.MockTransport(handler)) as client:
+            client.get("https://api.test.com/a")
+            client.get("https://api.test.com/b")
+            client.get("https://api.test.com/c")
+
+        stats = breaker.stats()
+        assert stats.calls == 3
+        # 400 is a caller error, not an endpoint failure
+        assert stats.failures == 1
+
+    def test_sync_client_records_transport_errors(self):
+        breaker = make_breaker()
+
+        def handler(request):
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        with CircuitBreakerClient(breaker, transport=httpx.MockTransport(handler)) as client:
+            for _ in range(4):
+                with pytest.raises(httpx.ConnectTimeout):
+                    client.get("https://api.test.com")
+            with pytest.raises(CircuitOpenError):
+                client.get("https://api.test.com")
+
+        assert breaker.stats().rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_async_client_fails_fast_when_open(self):
+        breaker = make_breaker()
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500)
+
+        async with AsyncCircuitBreakerClient(
+            breaker, transport=httpx.MockTransport(handler)
+        ) as client:
+            for _ in range(4):
+                await client.get("https://api.test.com")
+            with pytest.raises(CircuitOpenError):
+                await client.get("https://api.test.com")
+
+        assert len(calls) == 4
+
+
+    def test_sync_probe_error_releases_slot(self):
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record(False, 0.1)
+        time.sleep(0.06)
+
+        def handler(request):
+            raise RuntimeError("hook failed")
+
+        with CircuitBreakerClient(breaker, transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(RuntimeError):
+                client.get("https://api.test.com")
+
+        # The failed probe counted no outcome and freed its slot
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+
+    @pytest.mark.asyncio
+    async def test_async_cancelled_probe_releases_slot(self):
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record(False, 0.1)
+        time.sleep(0.06)
+        started = asyncio.Event()
+
+        async def handler(request):
+            if not started.is_set():
+                started.set()
+                await asyncio.sleep(10)
+            return httpx.Response(200)
+
+        async with AsyncCircuitBreakerClient(
+            breaker, transport=httpx.MockTransport(handler)
+        ) as client:
+            probe = asyncio.create_task(client.get("https://api.test.com"))
+            await started.wait()
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+            response = await client.get("https://api.test.com")
+
+        assert response.status_code == 200
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestProviderIntegration:
+    def test_disabled_by_default(self):
+        model = OpenAILanguageModel(api_key="test-key")
+
+        assert type(model.client) is JSONClient
+        assert model.circuit_breaker_stats is None
+
+    def test_enabled_via_config(self):
+        model = OpenAILanguageModel(
+            api_key="test-key",
+            config={"circuit_breaker": {"failure_rate_threshold": 0.3}},
+        )
+
+        assert isinstance(model.client, CircuitBreakerClient)
+        assert isinstance(model.async_client, AsyncCircuitBreakerClient)
+        assert model.client.circuit_breaker.config.failure_rate_threshold == 0.3
+        assert model.circuit_breaker_stats.key == "openai:https://api.openai.com/v1"
+
+    def test_enabled_via_env(self):
+        with patch.dict(os.environ, {"ESPERANTO_CIRCUIT_BREAKER": "true"}):
+            model = OpenAILanguageModel(api_key="test-key")
+
+        assert isinstance(model.client, CircuitBreakerClient)
+
+    def test_config_overrides_env(self):
+        with patch.dict(os.environ, {"ESPERANTO_CIRCUIT_BREAKER": "true"}):
+            model = OpenAILanguageModel(
+                api_key="test-key", config={"circuit_breaker": False}
+            )
+
+        assert type(model.client) is JSONClient
+
+    def test_invalid_config_value(self):
+        with pytest.raises(ValueError, match="circuit_breaker"):
+            OpenAILanguageModel(api_key="test-key", config={"circuit_breaker": "yes"})
+
+    def test_instances_share_breaker_per_endpoint(self):
+        config = {"circuit_breaker": True}
+        first = OpenAILanguageModel(api_key="a", config=config)
+        second = OpenAILanguageModel(api_key="b", config=config)
+        other = OpenAILanguageModel(
+            api_key="c", base_url="https://proxy.test.com/v1", config=config
+        )
+
+        assert first.client.circuit_breaker is second.client.circuit_breaker
+        assert first.client.circuit_breaker is not other.client.circuit_breaker
+        assert set(get_circuit_breaker_states()) == {
+            "openai:https://api.openai.com/v1",
+            "openai:https://proxy.test.com/v1",
+        }
+
+    def test_azure_endpoints_get_separate_breakers(self):
+        config = {"circuit_breaker": True, "api_version": "2024-10-21"}
+        east = AzureLanguageModel(
+            api_key="a",
+            model_name="gpt-4o",
+            config={**config, "azure_endpoint": "https://east.openai.azure.com/"},
+        )
+        with patch.dict(
+            os.environ, {"AZURE_OPENAI_ENDPOINT": "https://west.openai.azure.com"}
+        ):
+            west = AzureLanguageModel(api_key="b", model_name="gpt-4o", config=config)
+
+        assert east.client.circuit_breaker is not west.client.circuit_breaker
+        assert set(get_circuit_breaker_states()) == {
+            "azure:https://east.openai.azure.com",
+            "azure:https://west.openai.azure.com",
+        }
+
+    def test_reset_circuit_breakers(self):
+        model = OpenAILanguageModel(api_key="a", config={"circuit_breaker": True})
+        breaker = model.client.circuit_breaker
+        for _ in range(10):
+            breaker.record(False, 0.1)
+        assert breaker.state is CircuitState.OPEN
+
+        reset_circuit_breakers("openai:https://api.openai.com/v1")
+
+        assert breaker.state is CircuitState.CLOSED
@@ -0,0 +1,286 @@
+"""Tests for connection warmup, keep-alive pings and DNS caching."""
+
+import asyncio
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from esperanto.providers.llm.openai import OpenAILanguageModel
+from esperanto.utils.circuit_breaker import (
+    AsyncCircuitBreakerClient,
+    CircuitBreakerClient,
+    CircuitState,
+    circuit_breakers,
+)
+from esperanto.utils.dns import DEFAULT_DNS_TTL, clear_dns_cache, dns_cache
+
+
+class HeadHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), HeadHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_dns(monkeypatch):
+    monkeypatch.delenv("ESPERANTO_DNS_CACHE", raising=False)
+    clear_dns_cache()
+    yield
+    clear_dns_cache()
+
+
+class Recorder:
+    """MockTransport handler recording the requests it receives."""
+
+    def __init__(self, fail=False):
+        self.requests = []
+        self.fail = fail
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.fail:
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(404)
+
+
+def mock_model(recorder, **config):
+    model = OpenAILanguageModel(api_key="test-key", base_url="https://api.test.com/v1", config=config)
+    model.client = httpx.Client(transport=httpx.MockTransport(recorder))
+    model.async_client = httpx.AsyncClient(transport=httpx.MockTransport(recorder))
+    return model
+
+
+def pool_size(client):
+    return len(client._transport._pool.connections)
+
+
+class TestWarmup:
+    def test_sends_head_requests_to_base_url(self):
+        recorder = Recorder()
+        model = mock_model(recorder)
+
+        assert model.warmup(connections=3) == 3
+
+        assert [(r.method, str(r.url)) for r in recorder.requests] == [
+            ("HEAD", "https://api.test.com/v1")
+        ] * 3
+
+    def test_url_override(self):
+        recorder = Recorder()
+        model = mock_model(recorder)
+
+        model.warmup(url="https://other.test.com/health")
+
+        assert str(recorder.requests[0].url) == "https://other.test.com/health"
+
+    def test_failures_are_not_raised(self):
+        model = mock_model(Recorder(fail=True))
+
+        assert model.warmup(connections=2) == 0
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"connections": 0}, "connections"),
+            ({"connections": 21}, "connections"),
+            ({"keepalive": 0}, "keepalive"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, match):
+        model = mock_model(Recorder())
+
+        with pytest.raises(ValueError, match=match):
+            model.warmup(**kwargs)
+
+    def test_opens_pooled_connections(self, server_url):
+        model = OpenAILanguageModel(api_key="test-key", base_url=server_url)
+
+        assert model.warmup(connections=3) == 3
+
+        assert pool_size(model.client) == 3
+        model.close()
+
+    @pytest.mark.asyncio
+    async def test_async_opens_pooled_connections(self, server_url):
+        model = OpenAILanguageModel(api_key="test-key", base_url=server_url)
+
+        assert await model.awarmup(connections=3) == 3
+
+        assert pool_size(model.async_client) == 3
+        await model.aclose()
+
+
+class TestKeepalive:
+    def test_pings_until_closed(self):
+        recorder = Recorder()
+        model = mock_model(recorder)
+
+        model.warmup(connections=2, keepalive=0.02)
+        time.sleep(0.15)
+        model.close()
+        pinged = len(recorder.requests)
+        time.sleep(0.06)
+
+        assert pinged >= 6
+        assert len(recorder.requests) == pinged
+
+    def test_keeps_connections_past_expiry(self, server_url):
+        model = OpenAILanguageModel(
+            api_key="test-key", base_url=server_url, config={"keepalive_expiry": 0.2}
+        )
+
+        model.warmup(connections=2, keepalive=0.05)
+        time.sleep(0.5)
+
+        assert pool_size(model.client) == 2
+        model.close()
+
+    @pytest.mark.asyncio
+    async def test_async_pings_until_closed(self):
+        recorder = Recorder()
+        model = mock_model(recorder)
+
+        await model.awarmup(keepalive=0.02)
+        await asyncio.sleep(0.1)
+        await model.aclose()
+        pinged = len(recorder.requests)
+        await asyncio.sleep(0.05)
+
+        assert pinged >= 3
+        assert len(recorder.requests) == pinged
+
+
+class TestWithCircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def clean_registry(self):
+        circuit_breakers.clear()
+        yield
+        circuit_breakers.clear()
+
+    def breaker_model(self, recorder):
+        model = OpenAILanguageModel(
+            api_key="test-key",
+            base_url="https://api.test.com/v1",
+            config={"circuit_breaker": {"minimum_calls": 2, "recovery_timeout": 60}},
+        )
+        breaker = model.client.circuit_breaker
+        model.client = CircuitBreakerClient(breaker, transport=httpx.MockTransport(recorder))
+        model.async_client = AsyncCircuitBreakerClient(
+            breaker, transport=httpx.MockTransport(recorder)
+        )
+        return model, breaker
+
+    def test_pings_do_not_close_an_open_circuit(self):
+        recorder = Recorder()
+        model, breaker = self.breaker_model(recorder)
+        breaker.record(False, 0.1)
+        breaker.record(False, 0.1)
+
+        assert model.warmup(connections=2) == 2
+
+        assert len(recorder.requests) == 2
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.stats().calls == 2
+
+    @pytest.mark.asyncio
+    async def test_keepalive_pings_not_recorded(self):
+        recorder = Recorder()
+        model, breaker = self.breaker_model(recorder)
+
+        await model.awarmup(keepalive=0.02)
+        await asyncio.sleep(0.1)
+        await model.aclose()
+
+        assert len(recorder.requests) >= 3
+        assert breaker.stats().calls == 0
+
+
+class TestConnectionConfig:
+    def test_keepalive_expiry_applied(self):
+        model = OpenAILanguageModel(api_key="test-key", config={"keepalive_expiry": 30})
+
+        assert model.client._transport._pool._keepalive_expiry == 30
+
+    def test_invalid_keepalive_expiry(self):
+        with pytest.raises(ValueError, match="keepalive_expiry"):
+            OpenAILanguageModel(api_key="test-key", config={"keepalive_expiry": -1})
+
+    @pytest.mark.parametrize(
+        "setting, ttl", [(True, DEFAULT_DNS_TTL), (60, 60.0), (False, None)]
+    )
+    def test_dns_cache_config(self, setting, ttl):
+        model = OpenAILanguageModel(api_key="test-key", config={"dns_cache": setting})
+
+        assert model._get_dns_cache_ttl() == ttl
+
+    @pytest.mark.parametrize(
+        "value, ttl", [("true", DEFAULT_DNS_TTL), ("120", 120.0), ("false", None)]
+    )
+    def test_dns_cache_environment(self, monkeypatch, value, ttl):
+        monkeypatch.setenv("ESPERANTO_DNS_CACHE", value)
+
+        assert OpenAILanguageModel(api_key="test-key")._get_dns_cache_ttl() == ttl
+
+    def test_invalid_dns_cache(self):
+        with pytest.raises(ValueError, match="dns_cache"):
+            OpenAILanguageModel(api_key="test-key", config={"dns_cache": "sometimes"})
+
+
+class TestDNSCache:
+    def test_resolved_once_across_clients(self, server_url, monkeypatch):
+        calls = []
+        getaddrinfo = socket.getaddrinfo
+
+        def counting_getaddrinfo(host, *args, **kwargs):
+            calls.append(host)
+            return getaddrinfo(host, *args, **kwargs)
+
+        monkeypatch.setattr(socket, "getaddrinfo", counting_getaddrinfo)
+        first = OpenAILanguageModel(api_key="test-key", base_url=server_url, config={"dns_cache": True})
+        second = OpenAILanguageModel(api_key="test-key", base_url=server_url, config={"dns_cache": True})
+
+        assert first.warmup() == 1
+        assert second.warmup() == 1
+
+        # Connecting passes the numeric address through getaddrinfo as well
+        assert calls.count("localhost") == 1
+        first.close()
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_cache(self, server_url):
+        model = OpenAILanguageModel(api_key="test-key", base_url=server_url, config={"dns_cache": 60})
+
+        assert await model.awarmup() == 1
+
+        port = int(server_url.rsplit(":", 1)[1])
+        assert dns_cache._lookup(("localhost", port))
+        await model.aclose()
+
+    def test_unresolvable_host(self):
+        model = OpenAILanguageModel(
+            api_key="test-key", base_url="http://host.invalid", config={"dns_cache": True}
+        )
+
+        with pytest.raises(httpx.ConnectError):
+            model.client.get("http://host.invalid/")
@@ -0,0 +1,166 @@
+"""Tests for shared, refresh-ahead Google Cloud access tokens."""
+
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from esperanto.providers.embedding.vertex import VertexEmbeddingModel
+from esperanto.providers.llm.vertex import VertexLanguageModel
+from esperanto.providers.tts.vertex import VertexTextToSpeechModel
+from esperanto.utils.google_auth import (
+    REFRESH_AHEAD_SECONDS,
+    GoogleAccessToken,
+    google_credentials,
+)
+
+
+class FakeCredentials:
+    """google-auth style credentials whose refresh is slow and counted."""
+
+    def __init__(self, lifetime=3600.0, delay=0.0, token=None):
+        self.lifetime = lifetime
+        self.delay = delay
+        self.refreshes = 0
+        self.threads = []
+        self.token = token
+        self.valid = token is not None
+        self.expiry = self._expiry(lifetime) if token else None
+
+    @staticmethod
+    def _expiry(seconds):
+        return datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=seconds)
+
+    def refresh(self, request):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        self.expiry = self._expiry(self.lifetime)
+        self.valid = True
+
+
+class TestGoogleAccessToken:
+    def test_concurrent_callers_share_one_refresh(self):
+        credentials = FakeCredentials(delay=0.1)
+        token = GoogleAccessToken(credentials)
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(token.token())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["token-1"] * 8
+        assert credentials.refreshes == 1
+        assert credentials.threads == ["esperanto-google-auth"]
+
+    @pytest.mark.asyncio
+    async def test_async_refresh_does_not_block_the_loop(self):
+        credentials = FakeCredentials(delay=0.2)
+        token = GoogleAccessToken(credentials)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        try:
+            results = await asyncio.gather(*(token.atoken() for _ in range(5)))
+        finally:
+            task.cancel()
+
+        assert results == ["token-1"] * 5
+        assert credentials.refreshes == 1
+        assert ticks >= 5
+
+    def test_valid_credentials_used_without_refresh(self):
+        credentials = FakeCredentials(token="existing")
+
+        assert GoogleAccessToken(credentials).token() == "existing"
+        assert credentials.refreshes == 0
+
+    def test_refreshes_in_background_before_expiry(self):
+        credentials = FakeCredentials(token="old", delay=0.05, lifetime=REFRESH_AHEAD_SECONDS - 60)
+        token = GoogleAccessToken(credentials)
+
+        # Inside the refresh-ahead window the current token is still returned
+        assert token.token() == "old"
+        for _ in range(100):
+            if credentials.refreshes:
+                break
+            time.sleep(0.01)
+
+        assert token.token() == "token-1"
+        assert credentials.refreshes == 1
+
+    def test_failed_refresh_raises_and_is_retried(self):
+        credentials = Mock(valid=False, token=None, expiry=None)
+        credentials.refresh.side_effect = [Exception("invalid_grant"), None]
+        token = GoogleAccessToken(credentials)
+
+        with pytest.raises(RuntimeError, match="invalid_grant"):
+            token.token()
+        credentials.token = "second-try"
+
+        assert token.token() == "second-try"
+
+    def test_gcloud_token_cached(self):
+        with patch("subprocess.run") as run:
+            run.return_value = Mock(stdout="gcloud-token\n")
+            token = GoogleAccessToken()
+
+            assert token.token() == token.token() == "gcloud-token"
+
+        run.assert_called_once()
+
+
+class TestSharedCredentials:
+    def test_service_account_loaded_once_per_file(self):
+        credentials = FakeCredentials(token="sa-token")
+        with patch.dict(os.environ, {"VERTEX_PROJECT": "test-project"}):
+            with patch(
+                "google.oauth2.service_account.Credentials.from_service_account_file",
+                return_value=credentials,
+            ) as from_file:
+                first = VertexLanguageModel(credentials_file="/path/sa.json")
+                second = VertexLanguageModel(credentials_file="/path/../path/sa.json")
+
+        from_file.assert_called_once()
+        assert first._credentials is second._credentials
+        assert first._get_access_token() == second._get_access_token() == "sa-token"
+
+    def test_gcloud_token_shared_by_all_vertex_models(self):
+        with patch("subprocess.run") as run, patch.dict(os.environ, {"VERTEX_PROJECT": "p"}):
+            run.return_value = Mock(stdout="shared-token")
+            embedding = VertexEmbeddingModel()
+            speech = VertexTextToSpeechModel()
+
+            assert embedding._get_access_token() == "shared-token"
+            assert speech._get_access_token() == "shared-token"
+
+        run.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_headers_use_shared_token(self):
+        credentials = FakeCredentials(delay=0.05)
+        with patch.dict(os.environ, {"VERTEX_PROJECT": "test-project"}):
+            with patch(
+                "google.oauth2.service_account.Credentials.from_service_account_file",
+                return_value=credentials,
+            ):
+                models = [VertexLanguageModel(credentials_file="/sa.json") for _ in range(3)]
+
+        headers = await asyncio.gather(*(m._aget_headers() for m in models))
+
+        assert {h["Authorization"] for h in headers} == {"Bearer token-1"}
+        assert credentials.refreshes == 1
+        assert google_credentials.access_token(credentials).credentials is credentials
@@ -227,9 +227,10 @@ class TestSyncContextManager:
         """Test that sync context manager closes client on exit."""
         model = model_class()
         with model:
-            pass
+            client = model.client
         # Client should be closed after context manager exit
-        assert model.client.is_closed
+        assert client.is_closed
+        assert model.client is client
         # Async client should still be open (only sync client is closed)
         assert not model.async_client.is_closed
 
@@ -245,11 +246,12 @@ class TestSyncContextManager:
         model = model_class()
         try:
             with model:
+                client = model.client
                 raise ValueError("Test exception")
         except ValueError:
             pass
         # Client should still be closed even if exception occurred
-        assert model.client.is_closed
+        assert client.is_closed
 
 
 class TestAsyncContextManager:
@@ -283,9 +285,10 @@ class TestAsyncContextManager:
         """Test that async context manager closes async client on exit."""
         model = model_class()
         async with model:
-            pass
+            async_client = model.async_client
         # Async client should be closed after context manager exit
-        assert model.async_client.is_closed
+        assert async_client.is_closed
+        assert model.async_client is async_client
         # Sync client should still be open (only async client is closed)
         assert not model.client.is_closed
 
@@ -302,11 +305,12 @@ class TestAsyncContextManager:
         model = model_class()
         try:
             async with model:
+                async_client = model.async_client
                 raise ValueError("Test exception")
         except ValueError:
             pass
         # Async client should still be closed even if exception occurred
-        assert model.async_client.is_closed
+        assert async_client.is_closed
 
 
 class TestManualClose:
@@ -338,6 +342,7 @@ class TestManualClose:
     def test_manual_close_idempotent(self, model_class):
         """Test that calling close() multiple times is safe."""
         model = model_class()
+        model.client
         model.close()
         assert model.client.is_closed
         # Calling close again should not raise an error
@@ -386,6 +391,7 @@ class TestManualClose:
     async def test_manual_aclose_idempotent(self, model_class):
         """Test that calling aclose() multiple times is safe."""
         model = model_class()
+        model.async_client
         await model.aclose()
         assert model.async_client.is_closed
         # Calling aclose again should not raise an error
@@ -589,3 +595,55 @@ class TestEdgeCases:
 
         # Async client should be closed after second context
         assert model.async_client.is_closed
+
+
+class TestLazyClients:
+    """Test that clients are only created when first used."""
+
+    def test_construction_creates_no_clients(self):
+        model = MockLanguageModel()
+
+        assert model._client is None
+        assert model._async_client is None
+
+    def test_clients_created_per_mode(self):
+        model = MockLanguageModel()
+
+        client = model.client
+
+        assert model.client is client
+        assert model._async_client is None
+
+    def test_close_does_not_create_clients(self):
+        model = MockLanguageModel()
+
+        model.close()
+
+        assert model._client is None
+        assert model._async_client is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_does_not_create_clients(self):
+        model = MockLanguageModel()
+
+        await model.aclose()
+
+        assert model._async_client is None
+
+    def test_assigned_client_is_used(self):
+        model = MockLanguageModel()
+        replacement = object()
+
+        model.client = replacement
+
+        assert model.client is replacement
+
+    def test_ssl_context_shared_across_instances(self):
+        from unittest.mock import patch
+
+        with patch("esperanto.utils.connect.JSONClient") as mock_client:
+            MockLanguageModel().client
+            MockEmbeddingModel().client
+
+        first, second = mock_client.call_args_list
+        assert first.kwargs["verify"] is second.kwargs["verify"]
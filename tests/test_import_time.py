@@ -0,0 +1,70 @@
+"""Guard the cold-start cost of ``import esperanto``."""
+
+import os
+import subprocess
+import sys
+
+import esperanto
+
+# Generous enough for slow CI machines; typically well under half of this.
+# Most of it is pydantic and httpx, which the base types need.
+IMPORT_BUDGET_SECONDS = 1.5
+
+# Only these provider modules may be loaded by ``import esperanto``
+ALLOWED_PROVIDER_MODULES = {
+    "esperanto.providers.embedding.base",
+    "esperanto.providers.llm.base",
+    "esperanto.providers.llm.failover",
+    "esperanto.providers.llm.profiles",
+    "esperanto.providers.reranker.base",
+    "esperanto.providers.stt.base",
+    "esperanto.providers.tts.base",
+}
+
+
+def import_times():
+    """Run ``python -X importtime -c 'import esperanto'`` in a fresh interpreter.
+
+    Returns:
+        Mapping of module name to cumulative import time in microseconds.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import esperanto"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_loads_no_provider_implementations():
+    times = import_times()
+
+    providers = {
+        name for name in times
+        if name.startswith("esperanto.providers.") and name.count(".") >= 3
+    }
+    assert providers <= ALLOWED_PROVIDER_MODULES
+    assert "torch" not in times
+    assert "transformers" not in times
+
+
+def test_import_within_budget():
+    times = import_times()
+
+    assert times["esperanto"] / 1e6 < IMPORT_BUDGET_SECONDS
+
+
+def test_provider_classes_resolve_lazily():
+    assert esperanto.OpenAILanguageModel.__name__ == "OpenAILanguageModel"
+    assert "OpenAILanguageModel" in esperanto.provider_classes
+    assert "MistralSpeechToTextModel" in dir(esperanto)
+    assert set(esperanto.provider_classes) <= set(esperanto.__all__)
@@ -0,0 +1,293 @@
+"""Tests for provider call metrics and tracing hooks."""
+
+import json
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from esperanto.providers.embedding.openai import OpenAIEmbeddingModel
+from esperanto.providers.llm.openai import OpenAILanguageModel
+from esperanto.providers.llm.openai_compatible import OpenAICompatibleLanguageModel
+from esperanto.providers.tts.openai import OpenAITextToSpeechModel
+from esperanto.utils.instrumentation import (
+    ASYNC_HTTP_EVENT_HOOKS,
+    HTTP_EVENT_HOOKS,
+    CallMetrics,
+    add_call_hook,
+    clear_instrumentation,
+    enable_tracing,
+    instrumentation,
+    remove_call_hook,
+)
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {"index": 0, "message": {"role": "assistant", "content": "Hello"}, "finish_reason": "stop"}
+    ],
+    "usage": {"prompt_tokens": 7, "completion_tokens": 3, "total_tokens": 10},
+}
+
+
+def sse_body(*contents):
+    events = [
+        {
+            "id": "chatcmpl-1",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+        }
+        for text in contents
+    ]
+    return "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+
+
+def transports(handler):
+    return (
+        httpx.Client(transport=httpx.MockTransport(handler), event_hooks=HTTP_EVENT_HOOKS),
+        httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), event_hooks=ASYNC_HTTP_EVENT_HOOKS
+        ),
+    )
+
+
+def openai_model(handler, model_class=OpenAILanguageModel, **kwargs):
+    model = model_class(api_key="test-key", model_name="gpt-4o-mini", **kwargs)
+    model.client, model.async_client = transports(handler)
+    return model
+
+
+def completion_handler(request):
+    return httpx.Response(200, content=json.dumps(COMPLETION).encode())
+
+
+@pytest.fixture(autouse=True)
+def isolated_instrumentation(monkeypatch):
+    monkeypatch.delenv("ESPERANTO_OTEL_TRACING", raising=False)
+    clear_instrumentation()
+    yield
+    clear_instrumentation()
+
+
+@pytest.fixture
+def events():
+    recorded = []
+    add_call_hook(recorded.append)
+    return recorded
+
+
+class TestCallEvents:
+    def test_chat_complete_recorded(self, events):
+        model = openai_model(completion_handler)
+
+        model.chat_complete(MESSAGES)
+
+        (event,) = events
+        assert event.operation == "chat_complete"
+        assert event.provider == "openai"
+        assert event.model == "gpt-4o-mini"
+        assert event.status == "ok"
+        assert event.stream is False
+        assert event.latency > 0
+        assert (event.input_tokens, event.output_tokens, event.total_tokens) == (7, 3, 10)
+        assert event.bytes_sent > 0
+        assert event.bytes_received == len(json.dumps(COMPLETION))
+
+    def test_error_recorded_and_raised(self, events):
+        model = openai_model(lambda r: httpx.Response(500, json={"error": {"message": "boom"}}))
+
+        with pytest.raises(RuntimeError):
+            model.chat_complete(MESSAGES)
+
+        (event,) = events
+        assert event.status == "error"
+        assert isinstance(event.error, RuntimeError)
+        assert event.latency is not None
+
+    def test_stream_recorded_when_consumed(self, events):
+        model = openai_model(lambda r: httpx.Response(200, text=sse_body("a", "b", "c")))
+
+        stream = model.chat_complete(MESSAGES, stream=True)
+        assert events == []
+        chunks = list(stream)
+
+        (event,) = events
+        assert len(chunks) == 3
+        assert event.stream is True
+        assert event.chunks == 3
+        assert event.latency > 0
+        assert event.bytes_received == len(sse_body("a", "b", "c"))
+
+    def test_stream_closed_early_is_cancelled(self, events):
+        model = openai_model(lambda r: httpx.Response(200, text=sse_body("a", "b")))
+
+        stream = model.chat_complete(MESSAGES, stream=True)
+        next(stream)
+        stream.close()
+
+        (event,) = events
+        assert event.status == "cancelled"
+        assert event.chunks == 1
+
+    @pytest.mark.asyncio
+    async def test_async_calls_recorded(self, events):
+        model = openai_model(completion_handler)
+
+        await model.achat_complete(MESSAGES)
+
+        (event,) = events
+        assert event.operation == "achat_complete"
+        assert event.output_tokens == 3
+        assert event.bytes_received == len(json.dumps(COMPLETION))
+
+    @pytest.mark.asyncio
+    async def test_async_stream_recorded(self, events):
+        model = openai_model(lambda r: httpx.Response(200, text=sse_body("a", "b")))
+
+        stream = await model.achat_complete(MESSAGES, stream=True)
+        chunks = [chunk async for chunk in stream]
+
+        (event,) = events
+        assert len(chunks) == event.chunks == 2
+        assert event.stream is True
+
+    def test_super_call_recorded_once(self, events):
+        model = openai_model(
+            completion_handler,
+            model_class=OpenAICompatibleLanguageModel,
+            base_url="http://localhost:1234/v1",
+        )
+
+        model.chat_complete(MESSAGES)
+
+        assert [e.operation for e in events] == ["chat_complete"]
+
+    def test_embed_and_speech_recorded(self, events):
+        embedding = OpenAIEmbeddingModel(api_key="test-key", model_name="text-embedding-3-small")
+        embedding.client, _ = transports(
+            lambda r: httpx.Response(200, json={"data": [{"index": 0, "embedding": [0.1]}]})
+        )
+        speech = OpenAITextToSpeechModel(api_key="test-key")
+        speech.client, _ = transports(lambda r: httpx.Response(200, content=b"mp3-bytes"))
+
+        embedding.embed(["text"])
+        speech.generate_speech("Hello", voice="nova")
+
+        assert [(e.provider, e.operation) for e in events] == [
+            ("openai", "embed"),
+            ("openai", "generate_speech"),
+        ]
+        assert events[1].bytes_received == len(b"mp3-bytes")
+
+    def test_failing_hook_does_not_break_calls(self, events):
+        add_call_hook(Mock(side_effect=ValueError("broken hook")))
+        model = openai_model(completion_handler)
+
+        assert model.chat_complete(MESSAGES).content == "Hello"
+        assert len(events) == 1
+
+    def test_inactive_without_hooks(self):
+        hook = Mock()
+        add_call_hook(hook)
+        remove_call_hook(hook)
+        model = openai_model(completion_handler)
+
+        model.chat_complete(MESSAGES)
+
+        assert instrumentation.active is False
+        hook.assert_not_called()
+
+    def test_provider_clients_carry_event_hooks(self):
+        model = OpenAILanguageModel(api_key="test-key")
+
+        assert model.client.event_hooks == HTTP_EVENT_HOOKS
+        assert model.async_client.event_hooks == ASYNC_HTTP_EVENT_HOOKS
+
+
+class TestCallMetrics:
+    def test_counters_and_histograms(self):
+        metrics = add_call_hook(CallMetrics(buckets=(0.5, 1.0)))
+        model = openai_model(completion_handler)
+
+        model.chat_complete(MESSAGES)
+        model.chat_complete(MESSAGES)
+        text = metrics.render()
+
+        labels = 'provider="openai",model="gpt-4o-mini",operation="chat_complete"'
+        assert "# TYPE esperanto_calls_total counter" in text
+        assert f'esperanto_calls_total{{{labels},status="ok"}} 2' in text
+        assert f'esperanto_tokens_total{{{labels},type="input"}} 14' in text
+        assert f'esperanto_tokens_total{{{labels},type="output"}} 6' in text
+        assert f'esperanto_call_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"esperanto_call_duration_seconds_count{{{labels}}} 2" in text
+
+    def test_reset(self):
+        metrics = add_call_hook(CallMetrics())
+        openai_model(completion_handler).chat_complete(MESSAGES)
+
+        metrics.reset()
+
+        assert metrics.render() == ""
+
+
+class TestTracing:
+    def test_span_per_call(self):
+        tracer = Mock()
+        span = tracer.start_span.return_value
+        enable_tracing(tracer)
+        model = openai_model(completion_handler)
+
+        model.chat_complete(MESSAGES)
+
+        name = tracer.start_span.call_args.args[0]
+        attributes = tracer.start_span.call_args.kwargs["attributes"]
+        assert name == "chat_complete gpt-4o-mini"
+        assert attributes["gen_ai.system"] == "openai"
+        assert span.set_attributes.call_args.args[0]["gen_ai.usage.output_tokens"] == 3
+        span.set_status.assert_not_called()
+        span.end.assert_called_once()
+
+    def test_span_records_errors(self):
+        tracer = Mock()
+        span = tracer.start_span.return_value
+        enable_tracing(tracer)
+        model = openai_model(lambda r: httpx.Response(400, json={"error": {"message": "bad"}}))
+
+        with pytest.raises(RuntimeError):
+            model.chat_complete(MESSAGES)
+
+        span.record_exception.assert_called_once()
+        span.set_status.assert_called_once()
+        span.end.assert_called_once()
+
+    def test_span_is_current_during_call(self):
+        from opentelemetry import trace
+
+        span = trace.NonRecordingSpan(
+            trace.SpanContext(trace_id=1, span_id=2, is_remote=False)
+        )
+        tracer = Mock()
+        tracer.start_span.return_value = span
+        enable_tracing(tracer)
+        seen = []
+
+        def handler(request):
+            seen.append(trace.get_current_span())
+            return completion_handler(request)
+
+        openai_model(handler).chat_complete(MESSAGES)
+
+        assert seen == [span]
+        assert trace.get_current_span() is not span
+
+    def test_enabled_from_environment(self, monkeypatch):
+        monkeypatch.setenv("ESPERANTO_OTEL_TRACING", "true")
+
+        clear_instrumentation()
+
+        assert instrumentation.active is True
@@ -0,0 +1,231 @@
+"""Tests for the pluggable JSON codec used for request and response bodies."""
+
+import importlib.util
+import json
+
+import httpx
+import pytest
+
+from esperanto.providers.llm.openai import OpenAILanguageModel
+from esperanto.utils import json_codec
+from esperanto.utils.json_codec import (
+    STDLIB_CODEC,
+    AsyncJSONClient,
+    JSONClient,
+    JSONCodec,
+    get_json_codec,
+    set_json_codec,
+)
+
+BACKENDS = ["json"] + [
+    name for name in ("orjson", "msgspec") if importlib.util.find_spec(name)
+]
+
+PAYLOAD = {
+    "model": "gpt-4o-mini",
+    "messages": [{"role": "user", "content": "Grüße, 世界 \"quoted\"\n"}],
+    "temperature": 0.5,
+    "max_tokens": 10,
+    "stream": False,
+    "tools": None,
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_codec(monkeypatch):
+    monkeypatch.delenv("ESPERANTO_JSON_BACKEND", raising=False)
+    set_json_codec(None)
+    yield
+    set_json_codec(None)
+
+
+def recording_codec(calls):
+    def dumps(obj):
+        calls.append("dumps")
+        return STDLIB_CODEC.dumps(obj)
+
+    def loads(data):
+        calls.append("loads")
+        return STDLIB_CODEC.loads(data)
+
+    return JSONCodec("recording", dumps, loads)
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_encodes_like_httpx(self, backend):
+        set_json_codec(backend)
+
+        expected = httpx.Request("POST", "https://api.test.com", json=PAYLOAD).content
+        assert json_codec.dumps(PAYLOAD) == expected
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("data", [b'{"a": [1, 2.5, "\xc3\xa9"]}', '{"a": [1, 2.5, "é"]}'])
+    def test_decodes_str_and_bytes(self, backend, data):
+        set_json_codec(backend)
+
+        assert json_codec.loads(data) == {"a": [1, 2.5, "é"]}
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_invalid_json_raises_json_decode_error(self, backend):
+        set_json_codec(backend)
+
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads('{"a": ')
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_floats_rejected(self, backend, value):
+        set_json_codec(backend)
+
+        with pytest.raises(ValueError):
+            json_codec.dumps({"embedding": [0.5, value], "stop": None})
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_null_values_still_encode(self, backend):
+        set_json_codec(backend)
+
+        assert json_codec.dumps({"a": None, "b": [1.5, None]}) == b'{"a":null,"b":[1.5,null]}'
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_types_the_backend_rejects_fall_back_to_stdlib(self, backend):
+        set_json_codec(backend)
+
+        assert json_codec.dumps({"n": 2**70}) == b'{"n":1180591620717411303424}'
+        with pytest.raises(TypeError):
+            json_codec.dumps({"value": object()})
+
+
+class TestSelection:
+    def test_auto_prefers_installed_backend(self):
+        expected = "orjson" if "orjson" in BACKENDS else BACKENDS[-1]
+
+        assert get_json_codec().name == expected
+
+    def test_environment_variable(self, monkeypatch):
+        monkeypatch.setenv("ESPERANTO_JSON_BACKEND", "json")
+
+        assert get_json_codec() is STDLIB_CODEC
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            set_json_codec("yaml")
+
+    def test_missing_backend(self):
+        if importlib.util.find_spec("msgspec"):
+            pytest.skip("msgspec is installed")
+
+        with pytest.raises(ImportError, match=r"pip install esperanto\[msgspec\]"):
+            set_json_codec("msgspec")
+
+    def test_custom_codec(self):
+        calls = []
+        set_json_codec(recording_codec(calls))
+
+        json_codec.loads(json_codec.dumps([1]))
+
+        assert calls == ["dumps", "loads"]
+
+
+class TestClients:
+    def test_request_body_encoded_with_codec(self):
+        calls = []
+        set_json_codec(recording_codec(calls))
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        client = JSONClient(transport=httpx.MockTransport(handler))
+        response = client.post("https://api.test.com", json=PAYLOAD)
+
+        assert response.json() == {"ok": True}
+        assert calls == ["dumps", "loads"]
+        assert received[0].headers["Content-Type"] == "application/json"
+        assert json.loads(received[0].content) == PAYLOAD
+
+    def test_explicit_content_type_kept(self):
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(200)
+
+        client = JSONClient(transport=httpx.MockTransport(handler))
+        client.post(
+            "https://api.test.com",
+            json={"a": 1},
+            headers={"Content-Type": "application/json; charset=utf-8"},
+        )
+
+        assert received[0].headers["Content-Type"] == "application/json; charset=utf-8"
+
+    @pytest.mark.asyncio
+    async def test_async_client(self):
+        calls = []
+        set_json_codec(recording_codec(calls))
+
+        def handler(request):
+            return httpx.Response(200, content=request.content)
+
+        client = AsyncJSONClient(transport=httpx.MockTransport(handler))
+        response = await client.post("https://api.test.com", json={"a": 1})
+
+        assert response.json() == {"a": 1}
+        assert calls == ["dumps", "loads"]
+
+    def test_provider_clients_use_codec(self):
+        model = OpenAILanguageModel(api_key="test-key")
+
+        assert isinstance(model.client, JSONClient)
+        assert isinstance(model.async_client, AsyncJSONClient)
+
+
+class TestProviders:
+    def model(self, body):
+        def handler(request):
+            return httpx.Response(200, content=body)
+
+        model = OpenAILanguageModel(api_key="test-key", model_name="gpt-4o-mini")
+        model.client = JSONClient(transport=httpx.MockTransport(handler))
+        return model
+
+    def test_chat_complete(self):
+        calls = []
+        set_json_codec(recording_codec(calls))
+        model = self.model(
+            json.dumps(
+                {
+                    "id": "chatcmpl-1",
+                    "created": 0,
+                    "model": "gpt-4o-mini",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "Hi"},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                }
+            ).encode()
+        )
+
+        assert model.chat_complete([{"role": "user", "content": "Hello"}]).content == "Hi"
+        assert calls == ["dumps", "loads"]
+
+    def test_stream_events_decoded_with_codec(self):
+        calls = []
+        set_json_codec(recording_codec(calls))
+        chunk = {
+            "id": "chatcmpl-1",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": "Hi"}, "finish_reason": None}],
+        }
+        model = self.model(f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n".encode())
+
+        chunks = list(model.chat_complete([{"role": "user", "content": "Hello"}], stream=True))
+
+        assert [c.choices[0].delta.content for c in chunks] == ["Hi"]
+        assert calls == ["dumps", "loads"]
@@ -1,7 +1,7 @@
 """Tests for Message.thinking and Message.cleaned_content properties."""
 
 
-from esperanto.common_types import Message
+from esperanto.common_types import Message, ThinkingSplitter
 
 
 class TestMessageThinkingProperty:
@@ -235,3 +235,64 @@ Age: 34
         # Properties should parse it differently
         assert msg.thinking == "Reasoning"
         assert msg.cleaned_content == "Result"
+
+    def test_parsed_once_per_content(self):
+        """Test that repeated reads reuse the parsed values."""
+        msg = Message(content="<think>Reasoning</think>\n\nResult", role="assistant")
+        assert msg.thinking is msg.thinking
+        assert msg.cleaned_content is msg.cleaned_content
+
+    def test_model_copy_reparses_updated_content(self):
+        """Test that a copy with new content does not return cached values."""
+        msg = Message(content="<think>Old</think>\n\nOld answer", role="assistant")
+        assert msg.thinking == "Old"
+
+        copy = msg.model_copy(update={"content": "<think>New</think>\n\nNew answer"})
+        assert copy.thinking == "New"
+        assert copy.cleaned_content == "New answer"
+
+
+def split_stream(pieces):
+    """Feed pieces to a ThinkingSplitter and return all reasoning and answer text."""
+    splitter = ThinkingSplitter()
+    thinking, answer = [], []
+    for piece in pieces:
+        t, a = splitter.feed(piece)
+        thinking.append(t)
+        answer.append(a)
+    t, a = splitter.flush()
+    return "".join(thinking) + t, "".join(answer) + a
+
+
+class TestThinkingSplitter:
+    """Tests for splitting streamed content into reasoning and answer."""
+
+    def test_routes_text_as_it_arrives(self):
+        splitter = ThinkingSplitter()
+        assert splitter.feed("<think>Let me") == ("Let me", "")
+        assert splitter.in_thinking is True
+        assert splitter.feed(" see</think>The answer") == (" see", "The answer")
+        assert splitter.in_thinking is False
+        assert splitter.feed(" is 42.") == ("", " is 42.")
+
+    def test_tags_split_across_chunks(self):
+        content = "<think>Reasoning</think>\n\nThe answer"
+        for size in range(1, len(content) + 1):
+            pieces = [content[i:i + size] for i in range(0, len(content), size)]
+            assert split_stream(pieces) == ("Reasoning", "\n\nThe answer")
+
+    def test_partial_tag_held_until_resolved(self):
+        splitter = ThinkingSplitter()
+        assert splitter.feed("a <thi") == ("", "a ")
+        assert splitter.feed("s is not a tag") == ("", "<this is not a tag")
+
+    def test_flush_returns_held_text(self):
+        splitter = ThinkingSplitter()
+        assert splitter.feed("<think>Still going </thi") == ("Still going ", "")
+        assert splitter.flush() == ("</thi", "")
+
+    def test_multiple_blocks(self):
+        assert split_stream(["<think>A</think>x<th", "ink>B</think>y"]) == ("AB", "xy")
+
+    def test_content_without_tags(self):
+        assert split_stream(["Plain ", "answer < 3"]) == ("", "Plain answer < 3")
@@ -0,0 +1,128 @@
+"""Tests for streaming multipart uploads used by async transcription."""
+
+import io
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+
+import httpx
+import pytest
+
+from esperanto.providers.stt.openai import OpenAISpeechToTextModel
+from esperanto.utils.multipart import AsyncMultipartUpload
+
+AUDIO = bytes(range(256)) * 40
+
+
+class RecordingBytesIO(io.BytesIO):
+    """BytesIO recording the thread and size of every read."""
+
+    def __init__(self, data: bytes, name: str = "clip.wav"):
+        super().__init__(data)
+        self.name = name
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append((threading.get_ident(), size))
+        return super().read(size)
+
+
+async def collect(upload) -> bytes:
+    return b"".join([chunk async for chunk in upload])
+
+
+def parse(body: bytes, content_type: str):
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part
+        for part in message.iter_parts()
+    }
+
+
+@pytest.mark.asyncio
+async def test_body_is_valid_multipart():
+    upload = AsyncMultipartUpload(
+        io.BytesIO(AUDIO),
+        data={"model": "whisper-1", "flag": True, "granularity": ["word", "segment"]},
+        filename="clip.wav",
+        content_type="audio/wav",
+    )
+
+    body = await collect(upload)
+
+    assert int(upload.headers["Content-Length"]) == len(body)
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {upload.headers['Content-Type']}\r\n\r\n".encode() + body
+    )
+    parts = list(message.iter_parts())
+    assert [p.get_content() for p in parts[:4]] == ["whisper-1", "true", "word", "segment"]
+    file_part = parts[-1]
+    assert file_part.get_filename() == "clip.wav"
+    assert file_part.get_content_type() == "audio/wav"
+    assert file_part.get_payload(decode=True) == AUDIO
+
+
+@pytest.mark.asyncio
+async def test_reads_bounded_chunks_off_event_loop():
+    stream = RecordingBytesIO(AUDIO)
+    upload = AsyncMultipartUpload(stream, chunk_size=1024)
+
+    await collect(upload)
+
+    loop_thread = threading.get_ident()
+    assert stream.reads
+    assert all(size == 1024 for _, size in stream.reads)
+    assert all(thread != loop_thread for thread, _ in stream.reads)
+
+
+@pytest.mark.asyncio
+async def test_reiterable_from_start_position():
+    stream = io.BytesIO(b"skip" + AUDIO)
+    stream.seek(4)
+    upload = AsyncMultipartUpload(stream)
+
+    first = await collect(upload)
+    second = await collect(upload)
+
+    assert first == second
+    assert int(upload.headers["Content-Length"]) == len(first)
+
+
+@pytest.mark.asyncio
+async def test_path_input_uses_basename(tmp_path):
+    path = tmp_path / "recording.mp3"
+    path.write_bytes(AUDIO)
+    upload = AsyncMultipartUpload(str(path))
+
+    body = await collect(upload)
+
+    assert upload.filename == "recording.mp3"
+    assert int(upload.headers["Content-Length"]) == len(body)
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError, match="chunk_size"):
+        AsyncMultipartUpload(io.BytesIO(AUDIO), chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_openai_atranscribe_streams_upload():
+    received = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received["body"] = await request.aread()
+        received["content_type"] = request.headers["Content-Type"]
+        return httpx.Response(200, json={"text": "hello"})
+
+    model = OpenAISpeechToTextModel(api_key="test-key")
+    model.async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    response = await model.atranscribe(RecordingBytesIO(AUDIO), language="en")
+
+    assert response.text == "hello"
+    parts = parse(received["body"], received["content_type"])
+    assert parts["model"].get_content() == "whisper-1"
+    assert parts["language"].get_content() == "en"
+    assert parts["file"].get_payload(decode=True) == AUDIO
@@ -0,0 +1,253 @@
+"""Tests for per-stage profiling of provider calls."""
+
+import json
+import logging
+import time
+
+import httpx
+import pytest
+
+from esperanto.providers.llm.openai import OpenAILanguageModel
+from esperanto.utils import instrumentation as instrumentation_module
+from esperanto.utils.instrumentation import (
+    ASYNC_HTTP_EVENT_HOOKS,
+    HTTP_EVENT_HOOKS,
+    add_call_hook,
+    clear_instrumentation,
+    instrumentation,
+)
+from esperanto.utils.profiling import (
+    ProfileReport,
+    _configure_from_env,
+    disable_profiling,
+    enable_profiling,
+    get_profile_report,
+    profile,
+)
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {"index": 0, "message": {"role": "assistant", "content": "Hello"}, "finish_reason": "stop"}
+    ],
+    "usage": {"prompt_tokens": 7, "completion_tokens": 3, "total_tokens": 10},
+}
+
+STREAM = "".join(
+    "data: "
+    + json.dumps(
+        {
+            "id": "chatcmpl-1",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+        }
+    )
+    + "\n\n"
+    for text in ("a", "b")
+) + "data: [DONE]\n\n"
+
+
+def openai_model(handler):
+    model = OpenAILanguageModel(api_key="test-key", model_name="gpt-4o-mini")
+    model.client = httpx.Client(
+        transport=httpx.MockTransport(handler), event_hooks=HTTP_EVENT_HOOKS
+    )
+    model.async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), event_hooks=ASYNC_HTTP_EVENT_HOOKS
+    )
+    return model
+
+
+def completion_handler(request):
+    return httpx.Response(200, json=COMPLETION)
+
+
+def slow_handler(request):
+    time.sleep(0.02)
+    return completion_handler(request)
+
+
+@pytest.fixture(autouse=True)
+def isolated_profiling(monkeypatch):
+    monkeypatch.delenv("ESPERANTO_PROFILE", raising=False)
+    disable_profiling()
+    clear_instrumentation()
+    yield
+    disable_profiling()
+    clear_instrumentation()
+
+
+class TestProfile:
+    def test_stages_recorded(self):
+        events = []
+        add_call_hook(events.append)
+        model = openai_model(slow_handler)
+
+        with profile() as report:
+            model.chat_complete(MESSAGES)
+
+        (event,) = events
+        assert set(event.stages) == {"payload", "network", "normalize"}
+        assert event.stages["network"] >= 0.02
+        assert sum(event.stages.values()) <= event.latency
+
+        stats = report.stats()[("openai", "gpt-4o-mini", "chat_complete")]
+        assert stats["total"].calls == 1
+        assert stats["total"].total == event.latency
+        assert stats["network"].share > 0.5
+        assert stats["other"].total >= 0
+
+    def test_stream_stages(self):
+        model = openai_model(lambda r: httpx.Response(200, text=STREAM))
+
+        with profile() as report:
+            chunks = list(model.chat_complete(MESSAGES, stream=True))
+
+        assert len(chunks) == 2
+        stats = report.stats()[("openai", "gpt-4o-mini", "chat_complete")]
+        assert stats["sse_parse"].total > 0
+        assert stats["normalize"].total > 0
+
+    @pytest.mark.asyncio
+    async def test_async_calls_profiled(self):
+        model = openai_model(completion_handler)
+
+        with profile() as report:
+            await model.achat_complete(MESSAGES)
+
+        stats = report.stats()[("openai", "gpt-4o-mini", "achat_complete")]
+        assert stats["network"].total > 0
+        assert stats["normalize"].total > 0
+
+    def test_zero_sample_rate_records_nothing(self):
+        events = []
+        add_call_hook(events.append)
+        model = openai_model(completion_handler)
+
+        with profile(sample_rate=0.0) as report:
+            model.chat_complete(MESSAGES)
+
+        assert report.stats() == {}
+        assert events[0].stages is None
+
+    def test_unsampled_calls_create_no_event(self, monkeypatch):
+        begun = []
+        monkeypatch.setattr(
+            instrumentation, "_begin", lambda *args: begun.append(args)
+        )
+        model = openai_model(completion_handler)
+
+        with profile(sample_rate=0.0):
+            response = model.chat_complete(MESSAGES)
+
+        assert response.content == "Hello"
+        assert begun == []
+
+    def test_nested_call_of_unsampled_call_not_sampled(self, monkeypatch):
+        class WrappingModel(OpenAILanguageModel):
+            def chat_complete(self, messages, **kwargs):
+                return super().chat_complete(messages, **kwargs)
+
+        draws = iter([0.9, 0.0])
+        monkeypatch.setattr(instrumentation_module.random, "random", lambda: next(draws))
+        model = WrappingModel(api_key="test-key", model_name="gpt-4o-mini")
+        model.client = httpx.Client(transport=httpx.MockTransport(completion_handler))
+
+        with profile(sample_rate=0.5) as report:
+            model.chat_complete(MESSAGES)
+
+        assert report.stats() == {}
+
+    def test_calls_outside_block_not_profiled(self):
+        model = openai_model(completion_handler)
+
+        with profile() as report:
+            pass
+        model.chat_complete(MESSAGES)
+
+        assert report.stats() == {}
+        assert instrumentation.active is False
+
+    def test_invalid_sample_rate(self):
+        with pytest.raises(ValueError, match="sample_rate"):
+            with profile(sample_rate=2):
+                pass
+
+
+class TestProcessProfiling:
+    def test_enable_and_disable(self):
+        model = openai_model(completion_handler)
+
+        report = enable_profiling()
+        model.chat_complete(MESSAGES)
+        model.chat_complete(MESSAGES)
+        disable_profiling()
+        model.chat_complete(MESSAGES)
+
+        assert get_profile_report() is None
+        assert report.stats()[("openai", "gpt-4o-mini", "chat_complete")]["total"].calls == 2
+
+    def test_profile_block_takes_precedence(self):
+        model = openai_model(completion_handler)
+        process_report = enable_profiling()
+
+        with profile() as report:
+            model.chat_complete(MESSAGES)
+
+        assert len(report.stats()) == 1
+        assert process_report.stats() == {}
+
+    def test_enabled_from_environment(self, monkeypatch):
+        monkeypatch.setenv("ESPERANTO_PROFILE", "0.5")
+
+        _configure_from_env()
+
+        assert get_profile_report() is not None
+        assert instrumentation._profiler.sample_rate == 0.5
+
+    def test_true_environment_value_profiles_every_call(self, monkeypatch):
+        monkeypatch.setenv("ESPERANTO_PROFILE", "true")
+
+        _configure_from_env()
+
+        assert instrumentation._profiler.sample_rate == 1.0
+
+    def test_invalid_environment_value_logs_warning(self, monkeypatch, caplog):
+        monkeypatch.setenv("ESPERANTO_PROFILE", "always")
+
+        with caplog.at_level(logging.WARNING, logger="esperanto.utils.profiling"):
+            _configure_from_env()
+
+        assert get_profile_report() is None
+        assert "ESPERANTO_PROFILE" in caplog.text
+
+
+class TestProfileReport:
+    def test_render_and_reset(self):
+        model = openai_model(completion_handler)
+
+        with profile() as report:
+            model.chat_complete(MESSAGES)
+        text = report.render()
+
+        assert text.startswith("openai/gpt-4o-mini chat_complete (1 calls)")
+        assert "network" in text and "other" in text
+        report.reset()
+        assert report.render() == ""
+
+    def test_samples_bounded(self):
+        model = openai_model(completion_handler)
+        report = ProfileReport(max_samples=2)
+
+        with profile(report=report):
+            for _ in range(3):
+                model.chat_complete(MESSAGES)
+
+        key = ("openai", "gpt-4o-mini", "chat_complete")
+        assert report.stats()[key]["total"].calls == 3
+        assert len(report._samples[key]["total"]) == 2
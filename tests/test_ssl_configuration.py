@@ -1,13 +1,21 @@
 """Tests for SSL verification configuration functionality."""
 
 import os
+import shutil
+import ssl
 import tempfile
 import warnings
 from unittest.mock import patch
 
+import certifi
 import pytest
 
-from esperanto.utils.ssl import SSL_CA_BUNDLE_ENV_VAR, SSL_VERIFY_ENV_VAR, SSLMixin
+from esperanto.utils.ssl import (
+    SSL_CA_BUNDLE_ENV_VAR,
+    SSL_VERIFY_ENV_VAR,
+    SSLMixin,
+    get_ssl_context,
+)
 
 
 class MockSSLModel(SSLMixin):
@@ -53,7 +61,7 @@ class TestSSLVerifyConfig:
         """Test that ssl_ca_bundle returns the path to CA bundle."""
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pem") as f:
             ca_path = f.name
-            f.write(b"fake ca bundle content")
+        shutil.copyfile(certifi.where(), ca_path)
 
         try:
             model = MockSSLModel(config={"ssl_ca_bundle": ca_path})
@@ -65,7 +73,7 @@ class TestSSLVerifyConfig:
         """Test that ssl_ca_bundle takes precedence over verify_ssl."""
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pem") as f:
             ca_path = f.name
-            f.write(b"fake ca bundle content")
+        shutil.copyfile(certifi.where(), ca_path)
 
         try:
             # Even with verify_ssl=False, ssl_ca_bundle should be used
@@ -115,7 +123,7 @@ class TestSSLVerifyEnvironmentVariables:
         """Test that ESPERANTO_SSL_CA_BUNDLE env var returns path."""
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pem") as f:
             ca_path = f.name
-            f.write(b"fake ca bundle content")
+        shutil.copyfile(certifi.where(), ca_path)
 
         try:
             model = MockSSLModel(config={})
@@ -128,7 +136,7 @@ class TestSSLVerifyEnvironmentVariables:
         """Test that CA bundle env var takes precedence over verify env var."""
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pem") as f:
             ca_path = f.name
-            f.write(b"fake ca bundle content")
+        shutil.copyfile(certifi.where(), ca_path)
 
         try:
             model = MockSSLModel(config={})
@@ -265,7 +273,7 @@ class TestCABundleValidation:
         """Test that valid CA bundle path is accepted."""
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pem") as f:
             ca_path = f.name
-            f.write(b"fake ca bundle content")
+        shutil.copyfile(certifi.where(), ca_path)
 
         try:
             model = MockSSLModel()
@@ -327,7 +335,7 @@ class TestSSLWarning:
         """Test that no warning is emitted when using CA bundle."""
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pem") as f:
             ca_path = f.name
-            f.write(b"fake ca bundle content")
+        shutil.copyfile(certifi.where(), ca_path)
 
         try:
             model = MockSSLModel(config={"ssl_ca_bundle": ca_path})
@@ -413,18 +421,21 @@ class TestHTTPClientCreation:
             def to_langchain(self):
                 pass
 
-        with patch("httpx.Client") as mock_client, \
-             patch("httpx.AsyncClient") as mock_async_client:
+        with patch("esperanto.utils.connect.JSONClient") as mock_client, \
+             patch("esperanto.utils.connect.AsyncJSONClient") as mock_async_client:
             with warnings.catch_warnings(record=True):
                 warnings.simplefilter("always")
                 model = TestLanguageModel()
                 model._create_http_clients()
+            model.client
+            model.async_client
 
-            # Verify httpx clients were called with verify=False
+            # Verify httpx clients were called with an unverified SSL context
             mock_client.assert_called_once()
             mock_async_client.assert_called_once()
-            assert mock_client.call_args.kwargs["verify"] is False
-            assert mock_async_client.call_args.kwargs["verify"] is False
+            assert mock_client.call_args.kwargs["verify"] is get_ssl_context(False)
+            assert mock_async_client.call_args.kwargs["verify"] is get_ssl_context(False)
+            assert get_ssl_context(False).verify_mode == ssl.CERT_NONE
 
     def test_http_client_created_with_ca_bundle(self):
         """Test that _create_http_clients passes CA bundle path to httpx clients."""
@@ -434,7 +445,7 @@ class TestHTTPClientCreation:
 
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pem") as f:
             ca_path = f.name
-            f.write(b"fake ca bundle content")
+        shutil.copyfile(certifi.where(), ca_path)
 
         try:
             class TestEmbeddingModel(EmbeddingModel):
@@ -461,16 +472,19 @@ class TestHTTPClientCreation:
                 def _get_models(self):
                     return []
 
-            with patch("httpx.Client") as mock_client, \
-                 patch("httpx.AsyncClient") as mock_async_client:
+            with patch("esperanto.utils.connect.JSONClient") as mock_client, \
+                 patch("esperanto.utils.connect.AsyncJSONClient") as mock_async_client:
                 model = TestEmbeddingModel(ca_bundle_path=ca_path)
                 model._create_http_clients()
+                model.client
+                model.async_client
 
-                # Verify httpx clients were called with the CA bundle path
+                # Verify httpx clients were called with the CA bundle's context
                 mock_client.assert_called_once()
                 mock_async_client.assert_called_once()
-                assert mock_client.call_args.kwargs["verify"] == ca_path
-                assert mock_async_client.call_args.kwargs["verify"] == ca_path
+                assert mock_client.call_args.kwargs["verify"] is get_ssl_context(ca_path)
+                assert mock_async_client.call_args.kwargs["verify"] is get_ssl_context(ca_path)
+                assert get_ssl_context(ca_path) is not get_ssl_context(True)
         finally:
             os.unlink(ca_path)
 
@@ -507,13 +521,64 @@ class TestHTTPClientCreation:
             def to_langchain(self):
                 pass
 
-        with patch("httpx.Client") as mock_client, \
-             patch("httpx.AsyncClient") as mock_async_client:
+        with patch("esperanto.utils.connect.JSONClient") as mock_client, \
+             patch("esperanto.utils.connect.AsyncJSONClient") as mock_async_client:
             model = TestRerankerModel()
             model._create_http_clients()
+            model.client
+            model.async_client
 
-            # Verify httpx clients were called with verify=True (default)
+            # Verify httpx clients were called with the default SSL context
             mock_client.assert_called_once()
             mock_async_client.assert_called_once()
-            assert mock_client.call_args.kwargs["verify"] is True
-            assert mock_async_client.call_args.kwargs["verify"] is True
+            assert mock_client.call_args.kwargs["verify"] is get_ssl_context(True)
+            assert mock_async_client.call_args.kwargs["verify"] is get_ssl_context(True)
+            assert get_ssl_context(True).verify_mode == ssl.CERT_REQUIRED
+
+    def test_clients_not_created_at_construction(self):
+        """Test that _create_http_clients defers client creation to first use."""
+        from esperanto.providers.llm.openai import OpenAILanguageModel
+
+        with patch("esperanto.utils.connect.JSONClient") as mock_client, \
+             patch("esperanto.utils.connect.AsyncJSONClient") as mock_async_client:
+            model = OpenAILanguageModel(api_key="test-key")
+
+            mock_client.assert_not_called()
+            mock_async_client.assert_not_called()
+            model.async_client
+            mock_client.assert_not_called()
+            mock_async_client.assert_called_once()
+
+
+class TestSSLContextCache:
+    """Test that SSL contexts are shared per verify setting."""
+
+    def test_context_shared_per_setting(self):
+        assert get_ssl_context(True) is get_ssl_context(True)
+        assert get_ssl_context(False) is get_ssl_context(False)
+        assert get_ssl_context(True) is not get_ssl_context(False)
+
+    def test_ca_bundle_context_reloaded_when_file_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ca_path = os.path.join(directory, "ca.pem")
+            shutil.copyfile(certifi.where(), ca_path)
+            first = get_ssl_context(ca_path)
+            assert get_ssl_context(ca_path) is first
+
+            os.utime(ca_path, ns=(0, 0))
+
+            assert get_ssl_context(ca_path) is not first
+
+    def test_ca_directory_supported(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                context = get_ssl_context(directory)
+
+        assert context.verify_mode == ssl.CERT_REQUIRED
+
+    def test_cert_env_vars_respected(self):
+        with patch.dict(os.environ, {"SSL_CERT_FILE": certifi.where()}):
+            context = get_ssl_context(True)
+
+        assert context is not get_ssl_context(True)
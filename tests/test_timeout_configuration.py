@@ -1,11 +1,25 @@
 """Tests for timeout configuration functionality."""
 
+import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 
+import httpx
 import pytest
 
-from esperanto.utils.timeout import DEFAULT_TIMEOUTS, TIMEOUT_ENV_VARS, TimeoutMixin
+from esperanto.providers.embedding.openai import OpenAIEmbeddingModel
+from esperanto.providers.llm.openai import OpenAILanguageModel
+from esperanto.utils.timeout import (
+    DEFAULT_TIMEOUTS,
+    TIMEOUT_ENV_VARS,
+    DeadlineClient,
+    DeadlineTimeout,
+    TimeoutMixin,
+    get_phase_timeout_env_var,
+)
 
 
 class MockTimeoutModel(TimeoutMixin):
@@ -172,6 +186,263 @@ class TestTimeoutResolution:
                 model._get_timeout()
 
 
+class TestStructuredTimeouts:
+    """Test per-phase (connect/read/write/pool) timeout configuration."""
+
+    def test_phase_env_var_names(self):
+        """Test that per-phase env var names derive from the base variable."""
+        assert get_phase_timeout_env_var("ESPERANTO_LLM_TIMEOUT", "connect") == "ESPERANTO_LLM_CONNECT_TIMEOUT"
+        assert get_phase_timeout_env_var("ESPERANTO_STT_TIMEOUT", "pool") == "ESPERANTO_STT_POOL_TIMEOUT"
+
+    def test_config_dict_overrides_phases(self):
+        """Test that a phase dict overrides only the phases it names."""
+        model = MockTimeoutModel("language", {"timeout": {"connect": 5, "read": 120}})
+
+        with patch.dict(os.environ, {}, clear=True):
+            timeout = model._get_timeout()
+
+        assert timeout == httpx.Timeout(60.0, connect=5.0, read=120.0)
+
+    def test_config_httpx_timeout(self):
+        """Test that an httpx.Timeout is accepted as-is."""
+        configured = httpx.Timeout(30.0, connect=2.0)
+        model = MockTimeoutModel("language", {"timeout": configured})
+
+        assert model._get_timeout() is configured
+
+    def test_phase_environment_variables(self):
+        """Test that per-phase env vars override the total timeout."""
+        model = MockTimeoutModel("embedding", {})
+        env = {"ESPERANTO_EMBEDDING_TIMEOUT": "90", "ESPERANTO_EMBEDDING_CONNECT_TIMEOUT": "3"}
+
+        with patch.dict(os.environ, env, clear=True):
+            assert model._get_timeout() == httpx.Timeout(90.0, connect=3.0)
+
+    def test_config_phases_override_environment(self):
+        """Test that config phases take precedence over env phases."""
+        model = MockTimeoutModel("language", {"timeout": {"connect": 1}})
+        env = {"ESPERANTO_LLM_CONNECT_TIMEOUT": "3", "ESPERANTO_LLM_READ_TIMEOUT": "30"}
+
+        with patch.dict(os.environ, env, clear=True):
+            assert model._get_timeout() == httpx.Timeout(60.0, connect=1.0, read=30.0)
+
+    def test_none_phase_disables_timeout(self):
+        """Test that None disables a single phase, matching httpx."""
+        model = MockTimeoutModel("language", {"timeout": {"pool": None}})
+
+        with patch.dict(os.environ, {}, clear=True):
+            assert model._get_timeout().pool is None
+
+    def test_unknown_phase(self):
+        """Test that unknown phase names raise clear errors."""
+        model = MockTimeoutModel("language", {"timeout": {"total": 5}})
+
+        with pytest.raises(ValueError, match="Unknown timeout phase"):
+            model._get_timeout()
+
+    def test_invalid_phase_value(self):
+        """Test that phase values are validated like a single timeout."""
+        model = MockTimeoutModel("language", {"timeout": {"read": -1}})
+
+        with pytest.raises(ValueError, match="Timeout must be positive"):
+            model._get_timeout()
+
+    def test_invalid_phase_environment_variable(self):
+        """Test that invalid per-phase env vars raise clear errors."""
+        model = MockTimeoutModel("language", {})
+
+        with patch.dict(os.environ, {"ESPERANTO_LLM_READ_TIMEOUT": "soon"}):
+            with pytest.raises(ValueError, match="ESPERANTO_LLM_READ_TIMEOUT"):
+                model._get_timeout()
+
+
+class TestRequestTimeout:
+    """Test per-call timeout and deadline overrides."""
+
+    def test_no_override_uses_client_default(self):
+        model = MockTimeoutModel("language", {})
+        assert model._get_request_timeout() is httpx.USE_CLIENT_DEFAULT
+
+    def test_numeric_override(self):
+        model = MockTimeoutModel("language", {})
+        assert model._get_request_timeout(timeout=5) == httpx.Timeout(5.0)
+
+    def test_phase_override_keeps_instance_phases(self):
+        model = MockTimeoutModel("language", {"timeout": 90})
+        assert model._get_request_timeout(timeout={"connect": 2}) == httpx.Timeout(90.0, connect=2.0)
+
+    def test_deadline_caps_every_phase(self):
+        model = MockTimeoutModel("language", {"timeout": {"connect": 1, "pool": None}})
+
+        with patch.dict(os.environ, {}, clear=True):
+            timeout = model._get_request_timeout(deadline=10)
+
+        assert isinstance(timeout, DeadlineTimeout)
+        assert timeout.as_dict() == httpx.Timeout(10.0, connect=1.0).as_dict()
+        assert timeout.budget == 10.0
+
+    def test_invalid_deadline(self):
+        model = MockTimeoutModel("language", {})
+
+        with pytest.raises(ValueError, match="Timeout must be positive"):
+            model._get_request_timeout(deadline=0)
+
+
+class TestProviderTimeouts:
+    """Test that providers apply structured and per-call timeouts to requests."""
+
+    @staticmethod
+    def _capture(model, response_json):
+        seen = []
+
+        def handler(request):
+            seen.append(request.extensions["timeout"])
+            return httpx.Response(200, json=response_json)
+
+        model.client = httpx.Client(
+            timeout=model._get_timeout(), transport=httpx.MockTransport(handler)
+        )
+        model.async_client = httpx.AsyncClient(
+            timeout=model._get_timeout(), transport=httpx.MockTransport(handler)
+        )
+        return seen
+
+    def test_structured_config_reaches_client(self):
+        model = OpenAILanguageModel(
+            api_key="test-key", config={"timeout": {"connect": 2, "read": 45}}
+        )
+
+        assert model.client.timeout == httpx.Timeout(60.0, connect=2.0, read=45.0)
+
+    def test_chat_complete_per_call_timeout(self):
+        model = OpenAILanguageModel(api_key="test-key")
+        seen = self._capture(
+            model,
+            {
+                "id": "chatcmpl-1",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "hi"},
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        )
+        messages = [{"role": "user", "content": "Hello"}]
+
+        model.chat_complete(messages)
+        model.chat_complete(messages, timeout={"read": 5}, deadline=3)
+
+        assert seen[0]["read"] == 60.0
+        assert seen[1] == {"connect": 3.0, "read": 3.0, "write": 3.0, "pool": 3.0}
+
+    @pytest.mark.asyncio
+    async def test_aembed_per_call_timeout(self):
+        model = OpenAIEmbeddingModel(api_key="test-key")
+        seen = self._capture(model, {"data": [{"embedding": [0.1, 0.2]}]})
+
+        await model.aembed(["hello"], timeout=7)
+
+        assert seen[0] == {"connect": 7.0, "read": 7.0, "write": 7.0, "pool": 7.0}
+
+
+class SlowEmbeddingHandler(BaseHTTPRequestHandler):
+    """Sends an embeddings response in 10 pieces, 0.1 seconds apart."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"data": [{"embedding": [0.5] * 200}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        piece = len(body) // 10 + 1
+        try:
+            for start in range(0, len(body), piece):
+                self.wfile.write(body[start:start + piece])
+                self.wfile.flush()
+                time.sleep(0.1)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def slow_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowEmbeddingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestDeadline:
+    """The deadline bounds the whole request, not each network read."""
+
+    def model(self, url):
+        return OpenAIEmbeddingModel(api_key="test-key", base_url=url, config={"timeout": 5})
+
+    def test_embed_cut_off_at_deadline(self, slow_server):
+        model = self.model(slow_server)
+        start = time.monotonic()
+
+        with pytest.raises(httpx.TimeoutException, match="Deadline"):
+            model.embed(["text"], deadline=0.35)
+
+        # Each read takes 0.1s, so a sync read stops within one of the deadline
+        assert time.monotonic() - start < 0.6
+        model.close()
+
+    @pytest.mark.asyncio
+    async def test_aembed_cut_off_at_deadline(self, slow_server):
+        model = self.model(slow_server)
+        start = time.monotonic()
+
+        with pytest.raises(httpx.TimeoutException, match="Deadline"):
+            await model.aembed(["text"], deadline=0.35)
+
+        assert time.monotonic() - start < 0.5
+        await model.aclose()
+
+    def test_embed_within_deadline(self, slow_server):
+        model = self.model(slow_server)
+
+        assert model.embed(["text"], deadline=3) == [[0.5] * 200]
+        model.close()
+
+    @pytest.mark.asyncio
+    async def test_aembed_within_deadline(self, slow_server):
+        model = self.model(slow_server)
+
+        assert await model.aembed(["text"], deadline=3) == [[0.5] * 200]
+        await model.aclose()
+
+    def test_existing_trace_callback_kept(self, slow_server):
+        events = []
+        client = DeadlineClient()
+        request = client.build_request(
+            "POST",
+            f"{slow_server}/embeddings",
+            json={"input": ["text"]},
+            timeout=DeadlineTimeout(httpx.Timeout(5), budget=3),
+            extensions={"trace": lambda event, info: events.append(event)},
+        )
+
+        response = client.send(request)
+
+        assert response.status_code == 200
+        assert "http11.receive_response_headers.started" in events
+        client.close()
+
+
 class TestConstants:
     """Test timeout constants are properly defined."""
 
@@ -12,6 +12,7 @@ from esperanto.providers.llm.base import LanguageModel
 from esperanto.providers.reranker.base import RerankerModel
 from esperanto.providers.stt.base import SpeechToTextModel
 from esperanto.providers.tts.base import TextToSpeechModel
+from esperanto.utils.ssl import get_ssl_context
 
 
 class TestAIFactoryTimeoutIntegration:
@@ -396,8 +397,8 @@ class TestHTTPClientTimeoutIntegration:
 class TestRealProviderTimeoutIntegration:
     """Test timeout integration with real providers (mocked to avoid API keys)."""
 
-    @patch("httpx.Client")
-    @patch("httpx.AsyncClient")
+    @patch("esperanto.utils.connect.JSONClient")
+    @patch("esperanto.utils.connect.AsyncJSONClient")
     def test_openai_language_model_timeout_integration(self, mock_async_client, mock_client):
         """Test OpenAI language model uses timeout configuration."""
         try:
@@ -405,52 +406,64 @@ class TestRealProviderTimeoutIntegration:
 
             # Mock environment variable for API key
             with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
-                OpenAILanguageModel(
+                model = OpenAILanguageModel(
                     model_name="gpt-3.5-turbo",
                     config={"timeout": 150.0}
                 )
+                model.client
+                model.async_client
 
-                # Verify httpx clients were called with correct timeout and SSL verify
-                mock_client.assert_called_once_with(timeout=150.0, verify=True)
-                mock_async_client.assert_called_once_with(timeout=150.0, verify=True)
+                # Verify httpx clients were created with correct timeout and SSL context
+                for client_class in (mock_client, mock_async_client):
+                    client_class.assert_called_once()
+                    assert client_class.call_args.kwargs["timeout"] == 150.0
+                    assert client_class.call_args.kwargs["verify"] is get_ssl_context(True)
 
         except ImportError:
             pytest.skip("OpenAI provider not available")
 
-    @patch("httpx.Client")
-    @patch("httpx.AsyncClient")
+    @patch("esperanto.utils.connect.JSONClient")
+    @patch("esperanto.utils.connect.AsyncJSONClient")
     def test_openai_embedding_model_timeout_integration(self, mock_async_client, mock_client):
         """Test OpenAI embedding model uses timeout configuration."""
         try:
             from esperanto.providers.embedding.openai import OpenAIEmbeddingModel
 
             with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
-                OpenAIEmbeddingModel(
+                model = OpenAIEmbeddingModel(
                     model_name="text-embedding-3-small",
                     config={"timeout": 180.0}
                 )
+                model.client
+                model.async_client
 
-                mock_client.assert_called_once_with(timeout=180.0, verify=True)
-                mock_async_client.assert_called_once_with(timeout=180.0, verify=True)
+                for client_class in (mock_client, mock_async_client):
+                    client_class.assert_called_once()
+                    assert client_class.call_args.kwargs["timeout"] == 180.0
+                    assert client_class.call_args.kwargs["verify"] is get_ssl_context(True)
 
         except ImportError:
             pytest.skip("OpenAI provider not available")
 
-    @patch("httpx.Client")
-    @patch("httpx.AsyncClient")
+    @patch("esperanto.utils.connect.JSONClient")
+    @patch("esperanto.utils.connect.AsyncJSONClient")
     def test_stt_model_timeout_integration(self, mock_async_client, mock_client):
         """Test STT model uses timeout configuration."""
         try:
             from esperanto.providers.stt.openai import OpenAISpeechToTextModel
 
             with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
-                OpenAISpeechToTextModel(
+                model = OpenAISpeechToTextModel(
                     model_name="whisper-1",
                     timeout=450.0  # STT uses direct parameter
                 )
+                model.client
+                model.async_client
 
-                mock_client.assert_called_once_with(timeout=450.0, verify=True)
-                mock_async_client.assert_called_once_with(timeout=450.0, verify=True)
+                for client_class in (mock_client, mock_async_client):
+                    client_class.assert_called_once()
+                    assert client_class.call_args.kwargs["timeout"] == 450.0
+                    assert client_class.call_args.kwargs["verify"] is get_ssl_context(True)
 
         except ImportError:
             pytest.skip("OpenAI STT provider not available")